@@ -0,0 +1,29 @@
+"""add feed_items created_at index
+
+Revision ID: 6f0b2c9e41d7
+Revises: 294c820cfdad
+Create Date: 2026-10-19 10:12:44.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6f0b2c9e41d7'
+down_revision: Union[str, Sequence[str], None] = '294c820cfdad'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX ix_feed_items_active_feed_id_created_at "
+        "ON feed_items (feed_id, created_at) WHERE is_active = TRUE;"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX ix_feed_items_active_feed_id_created_at;")
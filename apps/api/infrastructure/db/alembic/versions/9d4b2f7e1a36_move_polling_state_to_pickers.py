@@ -0,0 +1,74 @@
+"""move polling state to pickers
+
+Revision ID: 9d4b2f7e1a36
+Revises: a7c3e9f1d284
+Create Date: 2026-10-19 19:24:06.517302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4b2f7e1a36'
+down_revision: Union[str, Sequence[str], None] = 'a7c3e9f1d284'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE pickers
+            ADD COLUMN poll_interval INTEGER,
+            ADD COLUMN last_entry_at TIMESTAMP WITHOUT TIME ZONE;
+
+        UPDATE pickers
+        SET poll_interval = sources.poll_interval, last_entry_at = sources.last_entry_at
+        FROM sources
+        WHERE sources.id = pickers.source_id AND pickers.min_poll_interval IS NOT NULL;
+
+        ALTER TABLE sources
+            DROP COLUMN last_entry_at,
+            DROP COLUMN poll_interval;
+
+        -- every adaptive run stores its polling state, which is no reason to reload the jobs
+        DROP TRIGGER pickers_notify_changes ON pickers;
+        CREATE TRIGGER pickers_notify_changes
+        AFTER INSERT OR DELETE OR TRUNCATE
+            OR UPDATE OF source_id, feed_id, cronjob, min_poll_interval, max_poll_interval
+        ON pickers
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_picker_changes();
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        DROP TRIGGER pickers_notify_changes ON pickers;
+        CREATE TRIGGER pickers_notify_changes
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON pickers
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_picker_changes();
+
+        ALTER TABLE sources
+            ADD COLUMN poll_interval INTEGER,
+            ADD COLUMN last_entry_at TIMESTAMP WITHOUT TIME ZONE;
+
+        UPDATE sources
+        SET poll_interval = polling.poll_interval, last_entry_at = polling.last_entry_at
+        FROM (
+            SELECT source_id, MIN(poll_interval) AS poll_interval,
+                MAX(last_entry_at) AS last_entry_at
+            FROM pickers
+            GROUP BY source_id
+        ) AS polling
+        WHERE polling.source_id = sources.id;
+
+        ALTER TABLE pickers
+            DROP COLUMN last_entry_at,
+            DROP COLUMN poll_interval;
+        """
+    )
@@ -0,0 +1,46 @@
+"""create picker runs table
+
+Revision ID: a7c3e9f1d284
+Revises: f2a4c7d9e513
+Create Date: 2026-10-19 21:05:12.418305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e9f1d284'
+down_revision: Union[str, Sequence[str], None] = 'f2a4c7d9e513'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE picker_runs (
+            id BIGSERIAL PRIMARY KEY,
+            picker_id INT NOT NULL REFERENCES pickers(id) ON DELETE CASCADE,
+            source_id INT NOT NULL REFERENCES sources(id) ON DELETE CASCADE,
+            started_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            finished_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            entries_fetched INT NOT NULL DEFAULT 0,
+            entries_new INT NOT NULL DEFAULT 0,
+            entries_filtered INT NOT NULL DEFAULT 0,
+            entries_extracted INT NOT NULL DEFAULT 0,
+            entries_inserted INT NOT NULL DEFAULT 0,
+            bytes_downloaded BIGINT NOT NULL DEFAULT 0,
+            status_code INT,
+            error TEXT
+        );
+        """
+    )
+    op.execute("CREATE INDEX ix_picker_runs_picker_id ON picker_runs (picker_id, started_at);")
+    op.execute("CREATE INDEX ix_picker_runs_started_at ON picker_runs (started_at);")
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE picker_runs;")
@@ -0,0 +1,44 @@
+"""notify picker changes
+
+Revision ID: b3d8e5a1f2c4
+Revises: 6f0b2c9e41d7
+Create Date: 2026-10-19 11:02:17.904126
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3d8e5a1f2c4'
+down_revision: Union[str, Sequence[str], None] = '6f0b2c9e41d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE FUNCTION notify_picker_changes() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('picker_changes', TG_OP);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+
+        CREATE TRIGGER pickers_notify_changes
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON pickers
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_picker_changes();
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        DROP TRIGGER pickers_notify_changes ON pickers;
+        DROP FUNCTION notify_picker_changes();
+        """
+    )
@@ -0,0 +1,51 @@
+"""add adaptive polling columns
+
+Revision ID: c4e9a7d2b615
+Revises: b3d8e5a1f2c4
+Create Date: 2026-10-19 15:41:52.318406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e9a7d2b615'
+down_revision: Union[str, Sequence[str], None] = 'b3d8e5a1f2c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE pickers
+            ADD COLUMN min_poll_interval INTEGER,
+            ADD COLUMN max_poll_interval INTEGER,
+            ADD CONSTRAINT pickers_poll_interval_bounds CHECK (
+                (min_poll_interval IS NULL AND max_poll_interval IS NULL)
+                OR (0 < min_poll_interval AND min_poll_interval <= max_poll_interval)
+            );
+
+        ALTER TABLE sources
+            ADD COLUMN poll_interval INTEGER,
+            ADD COLUMN last_entry_at TIMESTAMP WITHOUT TIME ZONE;
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE sources
+            DROP COLUMN last_entry_at,
+            DROP COLUMN poll_interval;
+
+        ALTER TABLE pickers
+            DROP CONSTRAINT pickers_poll_interval_bounds,
+            DROP COLUMN max_poll_interval,
+            DROP COLUMN min_poll_interval;
+        """
+    )
@@ -0,0 +1,40 @@
+"""create websub subscriptions table
+
+Revision ID: e1f3b6c8d402
+Revises: c4e9a7d2b615
+Create Date: 2026-10-19 17:26:08.559113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1f3b6c8d402'
+down_revision: Union[str, Sequence[str], None] = 'c4e9a7d2b615'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE websub_subscriptions (
+            id SERIAL PRIMARY KEY,
+            external_id UUID NOT NULL UNIQUE DEFAULT gen_random_uuid(),
+            source_id INT NOT NULL UNIQUE REFERENCES sources(id) ON DELETE CASCADE,
+            hub_url TEXT NOT NULL,
+            topic_url TEXT NOT NULL,
+            secret TEXT NOT NULL,
+            lease_expires_at TIMESTAMP WITHOUT TIME ZONE,
+            requested_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT CURRENT_TIMESTAMP
+        );
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE websub_subscriptions;")
@@ -0,0 +1,49 @@
+"""create export jobs table
+
+Revision ID: e5b7c1a9d340
+Revises: 9d4b2f7e1a36
+Create Date: 2026-10-19 22:41:37.205814
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b7c1a9d340'
+down_revision: Union[str, Sequence[str], None] = '9d4b2f7e1a36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE export_jobs (
+            id SERIAL PRIMARY KEY,
+            external_id UUID NOT NULL UNIQUE DEFAULT gen_random_uuid(),
+            feed_id INT NOT NULL REFERENCES feeds(id) ON DELETE CASCADE,
+            file_type TEXT NOT NULL,
+            start_time TIMESTAMP WITH TIME ZONE NOT NULL,
+            end_time TIMESTAMP WITH TIME ZONE NOT NULL,
+            feed_version TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            error TEXT,
+            file_path TEXT,
+            file_name TEXT,
+            media_type TEXT,
+            images_bytes_saved BIGINT NOT NULL DEFAULT 0,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            completed_at TIMESTAMP WITH TIME ZONE,
+            last_used_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            UNIQUE (feed_id, start_time, end_time, file_type, feed_version)
+        );
+        """
+    )
+    op.execute("CREATE INDEX ix_export_jobs_last_used_at ON export_jobs (last_used_at);")
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE export_jobs;")
@@ -0,0 +1,38 @@
+"""create apscheduler jobs table
+
+Revision ID: f2a4c7d9e513
+Revises: e1f3b6c8d402
+Create Date: 2026-10-19 18:42:31.207845
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a4c7d9e513'
+down_revision: Union[str, Sequence[str], None] = 'e1f3b6c8d402'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # same layout as APScheduler's SQLAlchemyJobStore, which then leaves the table as is
+    op.execute(
+        """
+        CREATE TABLE apscheduler_jobs (
+            id VARCHAR(191) PRIMARY KEY,
+            next_run_time DOUBLE PRECISION,
+            job_state BYTEA NOT NULL
+        );
+        """
+    )
+    op.execute(
+        "CREATE INDEX ix_apscheduler_jobs_next_run_time ON apscheduler_jobs (next_run_time);"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE apscheduler_jobs;")
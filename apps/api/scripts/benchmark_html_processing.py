@@ -0,0 +1,87 @@
+"""Compare the HTML processors on stored articles.
+
+Run from apps/api with the usual environment loaded:
+
+    python -m scripts.benchmark_html_processing --limit 500
+
+or point it at a directory of saved ``.html`` articles with ``--html-dir``.
+"""
+import argparse
+import time
+from pathlib import Path
+
+from src.domain.handlers.html import HTML_PROCESSORS, HtmlProcessor, get_html_processor
+from src.domain.handlers.pdf import BLOCK_STYLES
+
+BASELINE_PROCESSOR = "beautifulsoup"
+
+
+def load_stored_articles(limit: int) -> list[str]:
+    from sqlalchemy import text
+    from src.configs.database import SessionLocal
+
+    sql = text(
+        "SELECT content FROM feed_items "
+        "WHERE content IS NOT NULL AND content <> '' "
+        "ORDER BY created_at DESC "
+        "LIMIT :limit;"
+    )
+    with SessionLocal() as db:
+        return [row.content for row in db.execute(sql, {"limit": limit})]
+
+
+def load_html_files(html_dir: Path, limit: int) -> list[str]:
+    return [path.read_text("utf-8") for path in sorted(html_dir.glob("*.html"))[:limit]]
+
+
+def process_articles(html_processor: HtmlProcessor, articles: list[str]):
+    # the same steps an EPUB and a PDF export run for every article
+    for content in articles:
+        sources = html_processor.get_image_sources(content)
+        html_processor.rewrite_image_sources(
+            content,
+            {source: f"images/{index}.jpeg" for index, source in enumerate(sources)}
+        )
+        html_processor.get_blocks(content, list(BLOCK_STYLES))
+
+
+def benchmark(html_processor: HtmlProcessor, articles: list[str], rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        process_articles(html_processor, articles)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--limit", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--html-dir", type=Path)
+    args = parser.parse_args()
+
+    if args.html_dir:
+        articles = load_html_files(args.html_dir, args.limit)
+    else:
+        articles = load_stored_articles(args.limit)
+    if not articles:
+        print("No articles to benchmark")
+        return
+
+    corpus_size = sum(len(content) for content in articles)
+    print(f"{len(articles)} articles, {corpus_size / 1024:.0f} KiB, best of {args.rounds} rounds")
+    results = {
+        name: benchmark(get_html_processor(name), articles, args.rounds)
+        for name in HTML_PROCESSORS
+    }
+    for name, seconds in results.items():
+        print(
+            f"{name:>15}: {seconds:8.3f}s "
+            f"{seconds / len(articles) * 1000:8.2f}ms/article "
+            f"{results[BASELINE_PROCESSOR] / seconds:6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
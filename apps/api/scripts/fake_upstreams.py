@@ -0,0 +1,272 @@
+"""Serve stand-ins for RSS sources and the Wallabag API.
+
+Run from apps/api to point a local worker at them:
+
+    python -m scripts.fake_upstreams --rss-port 8090 --wallabag-port 8091 --error-rate 0.05
+
+Source ``n`` is served at ``/sources/<n>.xml`` and publishes new entries every tick.
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from email.utils import format_datetime
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from xml.sax.saxutils import escape
+
+from pydantic import BaseModel, ConfigDict
+
+WORDS = (
+    "python rust release security kernel database postgres cloud model open source "
+    "performance benchmark network browser linux update research privacy design api"
+).split()
+SOURCE_PATH = re.compile(r"^/sources/(\d+)\.xml$")
+
+
+class RssProfile(BaseModel):
+    # hashable, source documents are cached per profile
+    model_config = ConfigDict(frozen=True)
+
+    entries: int = 50
+    new_entries: int = 5
+    tick: float = 60
+    entry_size: int = 300
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    error_rate: float = 0.0
+    not_modified_rate: float = 0.0
+
+
+class WallabagProfile(BaseModel):
+    paragraphs: int = 10
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    error_rate: float = 0.0
+
+
+class RequestCounter:
+    """Responses sent by the fake upstreams, by upstream and status code."""
+
+    def __init__(self):
+        self.counts: Counter[tuple[str, int]] = Counter()
+        self.lock = threading.Lock()
+
+    def count(self, upstream: str, status_code: int):
+        with self.lock:
+            self.counts[upstream, status_code] += 1
+
+    def snapshot(self) -> dict[tuple[str, int], int]:
+        with self.lock:
+            return dict(self.counts)
+
+
+def build_sentence(rng: random.Random, length: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(length))
+
+
+def build_article(paragraphs: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    return "".join(
+        f"<h2>{build_sentence(rng, 5)}</h2><p>{build_sentence(rng, 80)}</p>"
+        f"<blockquote><p>{build_sentence(rng, 20)}</p></blockquote>"
+        for _ in range(paragraphs)
+    )
+
+
+@lru_cache(maxsize=4096)
+def build_source_rss(source_id: int, tick: int, profile: RssProfile) -> bytes:
+    # the newest entries of the source at this tick, each tick publishes new_entries more
+    newest = tick * profile.new_entries
+    items = []
+    for index in range(newest, newest - profile.entries, -1):
+        rng = random.Random(f"{source_id}:{index}")
+        published = datetime.fromtimestamp(
+            (index / max(profile.new_entries, 1)) * profile.tick, UTC
+        )
+        description = build_sentence(rng, max(profile.entry_size // 8, 1))
+        items.append(
+            "<item>"
+            f"<guid>urn:source:{source_id}:{index}</guid>"
+            f"<link>https://example.com/{source_id}/articles/{index}</link>"
+            # titles are unique, pickers of one feed drop entries with a known title
+            f"<title>{build_sentence(rng, 8).capitalize()} ({source_id}-{index})</title>"
+            f"<description>{escape(description)}</description>"
+            f"<pubDate>{format_datetime(published)}</pubDate>"
+            f"<category>{rng.choice(WORDS)}</category>"
+            "</item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?><rss version="2.0"><channel>'
+        f"<title>Synthetic source {source_id}</title><link>https://example.com/</link>"
+        f"<description>Synthetic source</description>{''.join(items)}</channel></rss>"
+    ).encode()
+
+
+class FakeUpstreamHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    upstream = ""
+    profile: RssProfile | WallabagProfile
+    counter: RequestCounter | None = None
+
+    def delay(self):
+        latency = self.profile.latency + random.uniform(
+            -self.profile.latency_jitter, self.profile.latency_jitter
+        )
+        if latency > 0:
+            time.sleep(latency)
+
+    def reply(self, status_code: int, body: bytes = b"", content_type: str = "application/json"):
+        self.send_response(status_code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        if self.counter:
+            self.counter.count(self.upstream, status_code)
+
+    def log_message(self, *args):
+        pass
+
+
+def build_rss_handler(
+    profile: RssProfile,
+    counter: RequestCounter | None = None,
+    render: Callable[[int, int], bytes] | None = None
+) -> type[BaseHTTPRequestHandler]:
+    render = render or (lambda source_id, tick: build_source_rss(source_id, tick, profile))
+
+    class RssHandler(FakeUpstreamHandler):
+        def do_GET(self):
+            self.delay()
+            match = SOURCE_PATH.match(self.path)
+            source_id = int(match.group(1)) if match else 0
+            if random.random() < profile.error_rate:
+                self.reply(503)
+            elif random.random() < profile.not_modified_rate:
+                self.reply(304)
+            else:
+                tick = int(time.time() // profile.tick)
+                self.reply(200, render(source_id, tick), "application/rss+xml")
+
+    RssHandler.upstream = "rss"
+    RssHandler.profile = profile
+    RssHandler.counter = counter
+    return RssHandler
+
+
+def build_wallabag_handler(
+    profile: WallabagProfile,
+    counter: RequestCounter | None = None
+) -> type[BaseHTTPRequestHandler]:
+    entry = json.dumps({
+        "id": 1,
+        "title": "Synthetic article",
+        "content": build_article(profile.paragraphs),
+        "preview_picture": None,
+        "reading_time": 3,
+    }).encode("utf-8")
+    token = json.dumps({"access_token": "token"}).encode("utf-8")
+
+    class WallabagHandler(FakeUpstreamHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            self.delay()
+            if random.random() < profile.error_rate:
+                self.reply(500)
+            else:
+                self.reply(200, token if self.path == "/oauth/v2/token" else entry)
+
+        def do_DELETE(self):
+            self.delay()
+            self.reply(200, b"{}")
+
+    WallabagHandler.upstream = "wallabag"
+    WallabagHandler.profile = profile
+    WallabagHandler.counter = counter
+    return WallabagHandler
+
+
+@contextmanager
+def serve(handler: type[BaseHTTPRequestHandler], port: int = 0) -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser):
+    rss = parser.add_argument_group("RSS sources")
+    rss.add_argument("--entries", type=int, default=50, help="entries in each source document")
+    rss.add_argument("--new-entries", type=int, default=5, help="entries published per tick")
+    rss.add_argument("--tick", type=float, default=60, help="seconds between publications")
+    rss.add_argument("--entry-size", type=int, default=300, help="bytes of description")
+    rss.add_argument("--latency", type=float, default=0.0)
+    rss.add_argument("--latency-jitter", type=float, default=0.0)
+    rss.add_argument("--error-rate", type=float, default=0.0)
+    rss.add_argument("--not-modified-rate", type=float, default=0.0)
+    wallabag = parser.add_argument_group("Wallabag")
+    wallabag.add_argument("--article-paragraphs", type=int, default=10)
+    wallabag.add_argument("--wallabag-latency", type=float, default=0.0)
+    wallabag.add_argument("--wallabag-latency-jitter", type=float, default=0.0)
+    wallabag.add_argument("--wallabag-error-rate", type=float, default=0.0)
+
+
+def build_profiles(args: argparse.Namespace) -> tuple[RssProfile, WallabagProfile]:
+    return (
+        RssProfile(
+            entries=args.entries,
+            new_entries=args.new_entries,
+            tick=args.tick,
+            entry_size=args.entry_size,
+            latency=args.latency,
+            latency_jitter=args.latency_jitter,
+            error_rate=args.error_rate,
+            not_modified_rate=args.not_modified_rate,
+        ),
+        WallabagProfile(
+            paragraphs=args.article_paragraphs,
+            latency=args.wallabag_latency,
+            latency_jitter=args.wallabag_latency_jitter,
+            error_rate=args.wallabag_error_rate,
+        ),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rss-port", type=int, default=8090)
+    parser.add_argument("--wallabag-port", type=int, default=8091)
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    rss_profile, wallabag_profile = build_profiles(args)
+
+    counter = RequestCounter()
+    rss_handler = build_rss_handler(rss_profile, counter)
+    wallabag_handler = build_wallabag_handler(wallabag_profile, counter)
+    with (
+        serve(rss_handler, args.rss_port) as rss_url,
+        serve(wallabag_handler, args.wallabag_port) as wallabag_url
+    ):
+        print(f"RSS sources at {rss_url}/sources/<n>.xml, Wallabag at {wallabag_url}")
+        try:
+            while True:
+                time.sleep(60)
+                print(f"Responses: {counter.snapshot()}")
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
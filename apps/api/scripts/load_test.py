@@ -0,0 +1,313 @@
+"""Drive the real scheduler against seeded pickers and fake upstreams.
+
+Run from apps/api against a scratch database, since every picker in it gets scheduled:
+
+    python -m scripts.load_test --sources 500 --pickers-per-source 2 --duration 600
+
+Sources, feeds, pickers and filters are seeded under the ``loadtest`` name, served by
+the fake upstreams of ``scripts.fake_upstreams``, and removed afterwards unless ``--keep``
+is given. The script exits with status 1 when a picker run raised.
+"""
+import argparse
+import os
+import resource
+import statistics
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+from apscheduler.events import EVENT_JOB_ERROR, JobExecutionEvent
+from scripts.fake_upstreams import (
+    WORDS,
+    RequestCounter,
+    add_profile_arguments,
+    build_profiles,
+    build_rss_handler,
+    build_wallabag_handler,
+    serve,
+)
+from src.domain.models.job import PickerRunStats
+from src.domain.models.picker import Picker
+from src.domain.models.source import Source
+from src.domain.ports.metrics_port import MetricsPort
+
+MARKER = "loadtest"
+
+SEED_STATEMENTS = [
+    (
+        "INSERT INTO feeds (name) SELECT :marker FROM generate_series(1, :feeds);"
+    ),
+    (
+        "INSERT INTO sources (url, name) "
+        "SELECT :rss_url || '/sources/' || n || '.xml', :marker "
+        "FROM generate_series(1, :sources) AS n;"
+    ),
+    (
+        "INSERT INTO feed_items (feed_id, title, link, description, author, content, "
+        "reading_time, created_at, is_active) "
+        "SELECT f.id, 'Seeded item ' || n, 'https://example.com/seeded/' || f.id || '/' || n, "
+        "'Seeded item', :marker, '<p>Seeded item</p>', 1, NOW() - n * INTERVAL '1 minute', TRUE "
+        "FROM feeds f CROSS JOIN generate_series(1, :feed_items) AS n "
+        "WHERE f.name = :marker;"
+    ),
+    (
+        # the pickers of a source go to different feeds, so every feed mixes several sources
+        "WITH s AS (SELECT id, ROW_NUMBER() OVER (ORDER BY id) - 1 AS position "
+        "FROM sources WHERE name = :marker), "
+        "f AS (SELECT id, ROW_NUMBER() OVER (ORDER BY id) - 1 AS position "
+        "FROM feeds WHERE name = :marker) "
+        "INSERT INTO pickers (source_id, feed_id, cronjob) "
+        "SELECT s.id, f.id, :cronjob "
+        "FROM s CROSS JOIN generate_series(0, :pickers_per_source - 1) AS k "
+        "JOIN f ON f.position = (s.position * :pickers_per_source + k) % :feeds;"
+    ),
+    (
+        # a topic to keep and noise to drop, the topic keeps about a third of the entries
+        "INSERT INTO filters (picker_id, operation, args) "
+        "SELECT p.id, 'title_contains', "
+        "'[''' || (CAST(:words AS TEXT[]))[1 + p.id % :word_count] || ''', 1]' "
+        "FROM pickers p JOIN sources s ON s.id = p.source_id WHERE s.name = :marker;"
+    ),
+    (
+        "INSERT INTO filters (picker_id, operation, args) "
+        "SELECT p.id, 'title_does_not_contain', '[''sponsored'', 1]' "
+        "FROM pickers p JOIN sources s ON s.id = p.source_id WHERE s.name = :marker;"
+    ),
+]
+
+CLEANUP_STATEMENTS = [
+    "DELETE FROM filters WHERE picker_id IN (SELECT p.id FROM pickers p "
+    "JOIN sources s ON s.id = p.source_id WHERE s.name = :marker);",
+    "DELETE FROM pickers WHERE source_id IN (SELECT id FROM sources WHERE name = :marker);",
+    "DELETE FROM feed_items WHERE feed_id IN (SELECT id FROM feeds WHERE name = :marker);",
+    "DELETE FROM feeds WHERE name = :marker;",
+    "DELETE FROM sources WHERE name = :marker;",
+]
+
+
+class RunCollector(MetricsPort):
+    """Keeps the stats of every picker run of the load test."""
+
+    def __init__(self):
+        self.runs: list[PickerRunStats] = []
+        self.errors = 0
+        self.lock = threading.Lock()
+
+    def observe_picker_run(self, picker: Picker, source: Source, stats: PickerRunStats) -> None:
+        with self.lock:
+            self.runs.append(stats)
+
+    def count_error(self, event: JobExecutionEvent):
+        with self.lock:
+            self.errors += 1
+
+    def snapshot(self) -> list[PickerRunStats]:
+        with self.lock:
+            return list(self.runs)
+
+
+def execute(statements: list[str], params: dict):
+    from sqlalchemy import text
+    from src.configs.database import SessionLocal
+
+    with SessionLocal() as db:
+        for statement in statements:
+            db.execute(text(statement), params)
+        db.commit()
+
+
+def get_lag() -> tuple[float, int]:
+    from src.adapters.prometheus_metrics import SCHEDULER_JOB_LAG
+
+    samples = {
+        sample.name: sample.value
+        for metric in SCHEDULER_JOB_LAG.collect()
+        for sample in metric.samples
+    }
+    count = int(samples.get("nebulapicker_scheduler_job_lag_seconds_count", 0))
+    return samples.get("nebulapicker_scheduler_job_lag_seconds_sum", 0.0), count
+
+
+def get_cpu_time() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100, method="inclusive")[round(fraction * 100) - 1]
+
+
+def print_progress(elapsed: float, collector: RunCollector, scheduling_service, cpu_time: float):
+    runs = collector.snapshot()
+    metrics = scheduling_service.get_metrics()
+    lag_sum, lag_count = get_lag()
+    print(
+        f"[{elapsed:6.0f}s] runs {len(runs):6d} "
+        f"inserted {sum(run.entries_inserted for run in runs):7d} "
+        f"queued {metrics.queued_runs:4d} running {metrics.running_runs:3d} "
+        f"lag mean {lag_sum / lag_count if lag_count else 0.0:6.2f}s "
+        f"max {metrics.max_start_delay:6.2f}s "
+        f"cpu {cpu_time / elapsed:6.1%} threads {threading.active_count():3d}",
+        flush=True
+    )
+
+
+def print_report(
+    elapsed: float,
+    collector: RunCollector,
+    scheduling_service,
+    counter: RequestCounter,
+    cpu_time: float
+):
+    from src.configs.database import engine
+
+    runs = collector.snapshot()
+    metrics = scheduling_service.get_metrics()
+    lag_sum, lag_count = get_lag()
+    durations = [sum(run.durations.values()) for run in runs]
+    stages: dict[str, float] = {}
+    for run in runs:
+        for stage, duration in run.durations.items():
+            stages[stage] = stages.get(stage, 0.0) + duration
+    failed = sum(1 for run in runs if run.status_code is None or run.status_code >= 400)
+    not_modified = sum(1 for run in runs if run.status_code == 304)
+
+    print(f"\nLoad test ran for {elapsed:.0f}s")
+    print(
+        f"Picker runs: {len(runs)} ({len(runs) / elapsed * 60:.1f}/min), "
+        f"{collector.errors} failed with an error, {failed} failed fetches, "
+        f"{not_modified} not modified"
+    )
+    print(
+        "Entries: "
+        f"{sum(run.entries_fetched for run in runs)} fetched, "
+        f"{sum(run.entries_new for run in runs)} new, "
+        f"{sum(run.entries_filtered for run in runs)} filtered out, "
+        f"{sum(run.entries_extracted for run in runs)} extracted, "
+        f"{sum(run.entries_inserted for run in runs)} inserted "
+        f"({sum(run.entries_inserted for run in runs) / elapsed:.1f}/s)"
+    )
+    print(
+        f"Run duration: p50 {percentile(durations, 0.5):.3f}s, "
+        f"p95 {percentile(durations, 0.95):.3f}s, max {max(durations, default=0.0):.3f}s"
+    )
+    total = sum(stages.values()) or 1.0
+    print("Time per stage: " + ", ".join(
+        f"{stage} {duration:.1f}s ({duration / total:.0%})"
+        for stage, duration in sorted(stages.items(), key=lambda item: -item[1])
+    ))
+    print(
+        f"Scheduler: lag mean {lag_sum / lag_count if lag_count else 0.0:.2f}s, "
+        f"max {metrics.max_start_delay:.2f}s, {metrics.late_runs} late, "
+        f"{metrics.missed_runs} missed, {metrics.skipped_runs} skipped runs"
+    )
+    print(
+        f"Resources: cpu {cpu_time:.1f}s ({cpu_time / elapsed:.1%}), "
+        f"max rss {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MiB, "
+        f"db pool {engine.pool.status()}"
+    )
+    print("Upstream responses: " + ", ".join(
+        f"{upstream} {status_code}: {count}"
+        for (upstream, status_code), count in sorted(counter.snapshot().items())
+    ))
+
+
+def run(args: argparse.Namespace, rss_url: str, counter: RequestCounter) -> bool:
+    # the settings are read on import, so the application is only imported once they are set
+    from src.adapters.query_counter import count_queries
+    from src.adapters.scheduler import Scheduler
+    from src.configs.dependencies.services import build_scheduling_service, job_service_scope
+    from src.configs.settings import settings
+    from src.domain.handlers.seen_entries import SeenEntries
+
+    params = {
+        "marker": MARKER,
+        "rss_url": rss_url,
+        "sources": args.sources,
+        "pickers_per_source": args.pickers_per_source,
+        "feeds": args.feeds,
+        "feed_items": args.feed_items,
+        "cronjob": args.cronjob,
+        "words": WORDS,
+        "word_count": len(WORDS),
+    }
+    print(
+        f"Seeding {args.sources} sources, {args.sources * args.pickers_per_source} pickers "
+        f"and {args.feeds} feeds of {args.feed_items} items"
+    )
+    execute(SEED_STATEMENTS, params)
+
+    count_queries()
+    collector = RunCollector()
+    scheduler = Scheduler()
+    scheduler.scheduler.add_listener(collector.count_error, EVENT_JOB_ERROR)
+    seen_entries = SeenEntries(settings.PICKER_SEEN_ENTRIES_WINDOW)
+
+    @contextmanager
+    def job_service_factory():
+        # the worker's per-run job services, reporting to the collector
+        with job_service_scope(scheduler, seen_entries) as job_service:
+            job_service.metrics = collector
+            yield job_service
+
+    scheduling_service = build_scheduling_service(job_service_factory, scheduler)
+    started_at = time.monotonic()
+    cpu_started_at = get_cpu_time()
+    try:
+        scheduling_service.start()
+        while (elapsed := time.monotonic() - started_at) < args.duration:
+            time.sleep(min(args.report_interval, args.duration - elapsed))
+            print_progress(
+                time.monotonic() - started_at,
+                collector,
+                scheduling_service,
+                get_cpu_time() - cpu_started_at
+            )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        scheduling_service.stop()
+        print_report(
+            time.monotonic() - started_at,
+            collector,
+            scheduling_service,
+            counter,
+            get_cpu_time() - cpu_started_at
+        )
+        if not args.keep:
+            execute(CLEANUP_STATEMENTS, params)
+    # a picker run that raised is a failure of the load test, failed fetches are expected
+    return collector.errors == 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sources", type=int, default=100)
+    parser.add_argument("--pickers-per-source", type=int, default=2)
+    parser.add_argument("--feeds", type=int, default=20)
+    parser.add_argument("--feed-items", type=int, default=1000, help="items already in each feed")
+    parser.add_argument("--cronjob", default="* * * * *")
+    parser.add_argument("--duration", type=float, default=300, help="seconds to run")
+    parser.add_argument("--report-interval", type=float, default=30)
+    parser.add_argument("--wallabag", action=argparse.BooleanOptionalAction, default=True)
+    parser.add_argument("--keep", action="store_true", help="keep the seeded data")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    rss_profile, wallabag_profile = build_profiles(args)
+
+    counter = RequestCounter()
+    rss_handler = build_rss_handler(rss_profile, counter)
+    wallabag_handler = build_wallabag_handler(wallabag_profile, counter)
+    with serve(rss_handler) as rss_url, serve(wallabag_handler) as wallabag_url:
+        os.environ["WALLABAG_ENABLED"] = str(args.wallabag)
+        os.environ["WALLABAG_URL"] = wallabag_url
+        passed = run(args, rss_url, counter)
+    if not passed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ from uuid import UUID
 from pydantic import BaseModel, field_validator
 from src.adapters.entrypoints.v1.models.picker import FullFeedPickerResponse
 from src.configs.settings import Settings
+from src.domain.models.export import ExportJob, ExportJobStatus
 from src.domain.models.feed import DetailedFeed, Feed, FeedItem, FeedRequest
 
 settings: Settings = Settings()
@@ -106,6 +107,19 @@ class ExportFeedItemsRequest(BaseModel):
     end_time: datetime
 
 
+class ExportJobResponse(BaseModel):
+    external_id: UUID
+    feed_external_id: UUID
+    file_type: ExportFileType
+    start_time: datetime
+    end_time: datetime
+    status: ExportJobStatus
+    created_at: datetime
+    completed_at: datetime | None
+    error: str | None
+    images_bytes_saved: int
+
+
 def map_create_feed_request_to_feed_request(
     create_feed_request: CreateFeedRequest
 ) -> FeedRequest:
@@ -179,3 +193,20 @@ def map_feed_item_to_get_feed_item_response(
         content=feed_item.content,
         reading_time=feed_item.reading_time
     )
+
+
+def map_export_job_to_export_job_response(
+    export_job: ExportJob
+) -> ExportJobResponse:
+    return ExportJobResponse(
+        external_id=export_job.external_id,
+        feed_external_id=export_job.feed_external_id,
+        file_type=export_job.file_type,
+        start_time=export_job.start_time,
+        end_time=export_job.end_time,
+        status=export_job.status,
+        created_at=export_job.created_at,
+        completed_at=export_job.completed_at,
+        error=export_job.error,
+        images_bytes_saved=export_job.images_bytes_saved
+    )
@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+from src.adapters.entrypoints.v1.models.scheduler import SchedulerStatusResponse
+
+
+class LivenessResponse(BaseModel):
+    status: str = "alive"
+
+
+class ReadinessResponse(BaseModel):
+    ready: bool
+    scheduler: SchedulerStatusResponse | None = None
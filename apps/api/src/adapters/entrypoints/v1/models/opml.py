@@ -0,0 +1,46 @@
+from uuid import UUID
+
+from pydantic import BaseModel
+from src.adapters.entrypoints.v1.models.picker import (
+    MAX_NUMBER_OF_PICKERS_IN_BULK,
+    FullPickerResponse,
+    map_picker_details_to_full_picker_response,
+)
+from src.domain.models.opml import OpmlImport, OpmlOutlineStatus
+
+# every imported outline may become a picker, so imports share the bulk picker limit
+MAX_NUMBER_OF_OPML_OUTLINES = MAX_NUMBER_OF_PICKERS_IN_BULK
+
+
+class OpmlOutlineResponse(BaseModel):
+    url: str
+    title: str | None
+    category: str | None
+    status: OpmlOutlineStatus
+    source_external_id: UUID | None
+    feed_type: str | None
+    hub_url: str | None
+    error: str | None
+
+
+class OpmlImportResponse(BaseModel):
+    sources_created: int
+    sources_existing: int
+    sources_invalid: int
+    outlines: list[OpmlOutlineResponse]
+    pickers: list[FullPickerResponse]
+
+
+def map_opml_import_to_opml_import_response(opml_import: OpmlImport) -> OpmlImportResponse:
+    statuses = [outline.status for outline in opml_import.outlines]
+    return OpmlImportResponse(
+        sources_created=statuses.count(OpmlOutlineStatus.created),
+        sources_existing=statuses.count(OpmlOutlineStatus.existing),
+        sources_invalid=statuses.count(OpmlOutlineStatus.invalid),
+        outlines=[
+            OpmlOutlineResponse(**outline.model_dump()) for outline in opml_import.outlines
+        ],
+        pickers=[
+            map_picker_details_to_full_picker_response(picker) for picker in opml_import.pickers
+        ]
+    )
@@ -1,9 +1,14 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, model_validator
+from apscheduler.triggers.cron import CronTrigger
+from pydantic import BaseModel, Field, field_validator, model_validator
 from src.adapters.entrypoints.v1.exceptions import NoFiltersError
-from src.adapters.entrypoints.v1.models.filter import FilterItem
+from src.adapters.entrypoints.v1.models.filter import FilterItem, map_filter_to_filter_item
+from src.domain.models.filter import FilterDefinition
+from src.domain.models.picker import PickerDefinition, PickerDetails
+
+MAX_NUMBER_OF_PICKERS_IN_BULK = 1000
 
 
 class CreateFullPickerRequest(BaseModel):
@@ -12,6 +17,13 @@ class CreateFullPickerRequest(BaseModel):
     filters: list[FilterItem]
     feed_external_id: UUID | None = None
     feed_name: str | None = None
+    min_poll_interval: int | None = None
+    max_poll_interval: int | None = None
+
+    @field_validator("cronjob")
+    def cronjob_must_be_a_crontab(cls, v: str):  # noqa: N805
+        # pickers are scheduled after they are committed, a bad cronjob must fail before
+        return validate_cronjob(v)
 
     @model_validator(mode="after")
     def check_filters_not_empty(self):
@@ -19,6 +31,25 @@ class CreateFullPickerRequest(BaseModel):
             raise NoFiltersError(type(self), self.filters)
         return self
 
+    @model_validator(mode="after")
+    def check_poll_interval_bounds(self):
+        bounds = (self.min_poll_interval, self.max_poll_interval)
+        if bounds == (None, None):
+            return self
+        if None in bounds or not 0 < self.min_poll_interval <= self.max_poll_interval:
+            raise ValueError(
+                "min_poll_interval and max_poll_interval must be set together, "
+                "with 0 < min_poll_interval <= max_poll_interval"
+            )
+        return self
+
+
+class CreateFullPickersRequest(BaseModel):
+    pickers: list[CreateFullPickerRequest] = Field(
+        min_length=1,
+        max_length=MAX_NUMBER_OF_PICKERS_IN_BULK
+    )
+
 
 class FullPickerResponse(BaseModel):
     cronjob: str
@@ -27,6 +58,12 @@ class FullPickerResponse(BaseModel):
     feed_external_id: UUID
     external_id: UUID
     created_at: datetime
+    min_poll_interval: int | None = None
+    max_poll_interval: int | None = None
+
+
+class FullPickersResponse(BaseModel):
+    pickers: list[FullPickerResponse]
 
 
 class FullFeedPickerResponse(BaseModel):
@@ -35,3 +72,51 @@ class FullFeedPickerResponse(BaseModel):
     filters: list[FilterItem]
     external_id: UUID
     created_at: datetime
+    min_poll_interval: int | None = None
+    max_poll_interval: int | None = None
+
+
+def validate_cronjob(cronjob: str) -> str:
+    # parsed the way the scheduler parses it
+    try:
+        CronTrigger.from_crontab(cronjob)
+    except ValueError as error:
+        raise ValueError(f"Invalid cronjob: {error}") from error
+    return cronjob
+
+
+def get_source_name(source_url: str) -> str:
+    return source_url.split('//')[1].split('/')[0]
+
+
+def map_create_full_picker_request_to_picker_definition(
+    create_full_picker_request: CreateFullPickerRequest
+) -> PickerDefinition:
+    return PickerDefinition(
+        cronjob=create_full_picker_request.cronjob,
+        source_url=create_full_picker_request.source_url,
+        source_name=get_source_name(create_full_picker_request.source_url),
+        filters=[
+            FilterDefinition(operation=filter_item.operation, args=filter_item.args)
+            for filter_item in create_full_picker_request.filters
+        ],
+        feed_external_id=create_full_picker_request.feed_external_id,
+        feed_name=create_full_picker_request.feed_name,
+        min_poll_interval=create_full_picker_request.min_poll_interval,
+        max_poll_interval=create_full_picker_request.max_poll_interval
+    )
+
+
+def map_picker_details_to_full_picker_response(
+    picker_details: PickerDetails
+) -> FullPickerResponse:
+    return FullPickerResponse(
+        external_id=picker_details.external_id,
+        cronjob=picker_details.cronjob,
+        source_url=picker_details.source_url,
+        feed_external_id=picker_details.feed_external_id,
+        created_at=picker_details.created_at,
+        filters=[map_filter_to_filter_item(f) for f in picker_details.filters],
+        min_poll_interval=picker_details.min_poll_interval,
+        max_poll_interval=picker_details.max_poll_interval
+    )
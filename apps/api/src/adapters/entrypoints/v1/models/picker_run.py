@@ -0,0 +1,112 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel
+from src.domain.models.picker_run import (
+    PickerRun,
+    PickerRunJob,
+    PickerRunJobStatus,
+    SourceRunStats,
+)
+
+
+class PickerRunResponse(BaseModel):
+    started_at: datetime
+    finished_at: datetime
+    duration: float
+    entries_fetched: int
+    entries_new: int
+    entries_filtered: int
+    entries_extracted: int
+    entries_inserted: int
+    bytes_downloaded: int
+    status_code: int | None
+    error: str | None
+
+
+class PickerRunsResponse(BaseModel):
+    runs: list[PickerRunResponse]
+
+
+class SourceRunStatsResponse(BaseModel):
+    source_external_id: UUID
+    source_url: str
+    runs: int
+    failed_runs: int
+    p50_duration: float
+    p95_duration: float
+    max_duration: float
+    entries_inserted: int
+    bytes_downloaded: int
+    last_run_at: datetime
+    last_error: str | None
+
+
+class SourceRunStatsListResponse(BaseModel):
+    sources: list[SourceRunStatsResponse]
+
+
+class PickerRunJobResponse(BaseModel):
+    external_id: UUID
+    backfill: bool
+    status: PickerRunJobStatus
+    pickers: int
+    pickers_completed: int
+    pickers_failed: int
+    entries_inserted: int
+    entries_extracted: int
+    created_at: datetime
+    completed_at: datetime | None
+    error: str | None
+
+
+def map_picker_run_to_picker_run_response(picker_run: PickerRun) -> PickerRunResponse:
+    return PickerRunResponse(
+        started_at=picker_run.started_at,
+        finished_at=picker_run.finished_at,
+        duration=(picker_run.finished_at - picker_run.started_at).total_seconds(),
+        entries_fetched=picker_run.entries_fetched,
+        entries_new=picker_run.entries_new,
+        entries_filtered=picker_run.entries_filtered,
+        entries_extracted=picker_run.entries_extracted,
+        entries_inserted=picker_run.entries_inserted,
+        bytes_downloaded=picker_run.bytes_downloaded,
+        status_code=picker_run.status_code,
+        error=picker_run.error
+    )
+
+
+def map_source_run_stats_to_source_run_stats_response(
+    source_run_stats: SourceRunStats
+) -> SourceRunStatsResponse:
+    return SourceRunStatsResponse(
+        source_external_id=source_run_stats.source_external_id,
+        source_url=source_run_stats.source_url,
+        runs=source_run_stats.runs,
+        failed_runs=source_run_stats.failed_runs,
+        p50_duration=source_run_stats.p50_duration,
+        p95_duration=source_run_stats.p95_duration,
+        max_duration=source_run_stats.max_duration,
+        entries_inserted=source_run_stats.entries_inserted,
+        bytes_downloaded=source_run_stats.bytes_downloaded,
+        last_run_at=source_run_stats.last_run_at,
+        last_error=source_run_stats.last_error
+    )
+
+
+def map_picker_run_job_to_picker_run_job_response(
+    picker_run_job: PickerRunJob
+) -> PickerRunJobResponse:
+    return PickerRunJobResponse(
+        external_id=picker_run_job.external_id,
+        backfill=picker_run_job.backfill,
+        status=picker_run_job.status,
+        pickers=len(picker_run_job.picker_ids),
+        pickers_completed=picker_run_job.pickers_completed,
+        pickers_failed=picker_run_job.pickers_failed,
+        entries_inserted=picker_run_job.entries_inserted,
+        entries_extracted=picker_run_job.entries_extracted,
+        created_at=picker_run_job.created_at,
+        completed_at=picker_run_job.completed_at,
+        error=picker_run_job.error
+    )
@@ -0,0 +1,44 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+from src.domain.models.job import SchedulerMetrics, SchedulerStatus
+
+
+class SchedulerMetricsResponse(BaseModel):
+    queued_runs: int
+    running_runs: int
+    skipped_runs: int
+    missed_runs: int
+    late_runs: int
+    max_start_delay: float
+
+
+class SchedulerStatusResponse(BaseModel):
+    state: str
+    scheduled_jobs: int
+    started_at: datetime | None
+    ready_at: datetime | None
+
+
+def map_scheduler_metrics_to_scheduler_metrics_response(
+    metrics: SchedulerMetrics
+) -> SchedulerMetricsResponse:
+    return SchedulerMetricsResponse(
+        queued_runs=metrics.queued_runs,
+        running_runs=metrics.running_runs,
+        skipped_runs=metrics.skipped_runs,
+        missed_runs=metrics.missed_runs,
+        late_runs=metrics.late_runs,
+        max_start_delay=metrics.max_start_delay
+    )
+
+
+def map_scheduler_status_to_scheduler_status_response(
+    scheduler_status: SchedulerStatus
+) -> SchedulerStatusResponse:
+    return SchedulerStatusResponse(
+        state=scheduler_status.state,
+        scheduled_jobs=scheduler_status.scheduled_jobs,
+        started_at=scheduler_status.started_at,
+        ready_at=scheduler_status.ready_at
+    )
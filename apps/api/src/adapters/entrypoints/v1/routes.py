@@ -1,9 +1,20 @@
 import datetime
 import secrets
+from typing import BinaryIO
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
-from fastapi.responses import StreamingResponse
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from fastapi.security import OAuth2PasswordBearer
 from src.adapters.entrypoints.v1.models.authentication import LoginRequest
 from src.adapters.entrypoints.v1.models.feeds import (
@@ -11,12 +22,14 @@ from src.adapters.entrypoints.v1.models.feeds import (
     CreateFeedItemResponse,
     CreateFeedRequest,
     ExportFeedItemsRequest,
+    ExportJobResponse,
     ExternalUpdateFeedRequest,
     FeedResponse,
     FullCompleteFeed,
     GetFeedItemResponse,
     ListFeedsResponse,
     map_detailed_feeds_list_to_list_feeds_response,
+    map_export_job_to_export_job_response,
     map_feed_item_to_create_feed_item_response,
     map_feed_item_to_external_feed_item,
     map_feed_item_to_get_feed_item_response,
@@ -27,10 +40,35 @@ from src.adapters.entrypoints.v1.models.filter import (
     map_filter_item_to_create_filter_request,
     map_filter_to_filter_item,
 )
+from src.adapters.entrypoints.v1.models.health import LivenessResponse, ReadinessResponse
+from src.adapters.entrypoints.v1.models.opml import (
+    MAX_NUMBER_OF_OPML_OUTLINES,
+    OpmlImportResponse,
+    map_opml_import_to_opml_import_response,
+)
 from src.adapters.entrypoints.v1.models.picker import (
     CreateFullPickerRequest,
+    CreateFullPickersRequest,
     FullFeedPickerResponse,
     FullPickerResponse,
+    FullPickersResponse,
+    get_source_name,
+    map_create_full_picker_request_to_picker_definition,
+    map_picker_details_to_full_picker_response,
+    validate_cronjob,
+)
+from src.adapters.entrypoints.v1.models.picker_run import (
+    PickerRunJobResponse,
+    PickerRunsResponse,
+    SourceRunStatsListResponse,
+    map_picker_run_job_to_picker_run_job_response,
+    map_picker_run_to_picker_run_response,
+    map_source_run_stats_to_source_run_stats_response,
+)
+from src.adapters.entrypoints.v1.models.scheduler import (
+    SchedulerMetricsResponse,
+    map_scheduler_metrics_to_scheduler_metrics_response,
+    map_scheduler_status_to_scheduler_status_response,
 )
 from src.adapters.entrypoints.v1.models.source import (
     ExternalSourceRequest,
@@ -41,21 +79,39 @@ from src.adapters.entrypoints.v1.models.source import (
 )
 from src.adapters.entrypoints.v1.models.welcome import WelcomeResponse
 from src.configs.dependencies.services import (
+    get_export_service,
     get_feed_service,
     get_filter_service,
     get_job_service,
+    get_job_service_factory,
+    get_opml_service,
+    get_picker_run_job_service,
+    get_picker_run_service,
     get_picker_service,
+    get_profiler,
+    get_run_job_service_factory,
+    get_scheduling_service,
     get_source_service,
+    get_websub_service,
 )
 from src.configs.settings import Settings
+from src.domain.handlers.job_processors import process_pushed_entries
 from src.domain.models.feed import FeedItemRequest, FeedRequest, UpdateFeedRequest
 from src.domain.models.picker import PickerRequest
+from src.domain.models.profile import Profile, ProfileFormat
 from src.domain.models.source import SourceRequest
+from src.domain.ports.profiler_port import ProfilerPort
+from src.domain.services.export_service import ExportService
 from src.domain.services.feed_service import FeedService
 from src.domain.services.filter_service import FilterService
-from src.domain.services.job_service import JobService
+from src.domain.services.job_service import JobService, JobServiceFactory
+from src.domain.services.opml_service import OpmlService, parse_opml
+from src.domain.services.picker_run_job_service import PickerRunJobService
+from src.domain.services.picker_run_service import PickerRunService
 from src.domain.services.picker_service import PickerService
+from src.domain.services.scheduling_service import SchedulingService
 from src.domain.services.source_service import SourceService
+from src.domain.services.websub_service import WebSubService
 
 settings: Settings = Settings()
 
@@ -75,6 +131,27 @@ def authenticate(token: str = Depends(oauth2_scheme)):
         )
 
 
+def iter_file(file: BinaryIO):
+    with file:
+        while chunk := file.read(settings.EXPORT_CHUNK_SIZE):
+            yield chunk
+
+
+def check_profiling_enabled():
+    if not settings.PROFILING_ENABLED:
+        raise HTTPException(status_code=404, detail="Profiling is disabled")
+
+
+def build_profile_response(profile: Profile | None) -> Response:
+    if profile is None:
+        raise HTTPException(status_code=409, detail="Another profile is being captured")
+    return Response(
+        content=profile.content,
+        media_type=profile.media_type,
+        headers={"Content-Disposition": f"attachment; filename={profile.file_name}"}
+    )
+
+
 router = APIRouter(prefix="/v1")
 
 
@@ -169,6 +246,91 @@ def create_source(
     return map_source_to_create_source_response(created_source)
 
 
+@router.get(
+    "/sources/opml",
+    summary="Export sources as OPML",
+    description=(
+        "Stream every source as an OPML subscription list, grouped in folders named after "
+        "the feeds their pickers write to."
+    ),
+    tags=["Sources"],
+    responses={
+        200: {
+            "description": "OPML subscription list",
+            "content": {"text/x-opml": {}},
+        }
+    }
+)
+def export_sources_opml(
+    _: str = Depends(authenticate),  # noqa: B008
+    opml_service: OpmlService = Depends(get_opml_service),  # noqa: B008
+):
+    return StreamingResponse(
+        opml_service.export_opml(),
+        media_type="text/x-opml",
+        headers={"Content-Disposition": "attachment; filename=sources.opml"}
+    )
+
+
+@router.post(
+    "/sources/opml",
+    summary="Import sources from OPML",
+    description=(
+        "Create a source for every feed of an OPML subscription list sent as the request "
+        "body. New urls are probed concurrently, and only reachable feeds are stored, all in "
+        "one transaction. Given a cronjob, a picker keeping every entry is also created for "
+        "each source, writing to a feed named after its OPML folder."
+    ),
+    response_model=OpmlImportResponse,
+    tags=["Sources"],
+    responses={
+        200: {
+            "description": "Import report",
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "$ref": "#/components/schemas/OpmlImportResponse"
+                    }
+                }
+            }
+        },
+        400: {"description": "Invalid OPML or cronjob"}
+    }
+)
+async def import_sources_opml(
+    request: Request,
+    probe: bool = Query(default=True, description="Check new urls are reachable feeds"),  # noqa: B008
+    cronjob: str | None = Query(default=None, description="Schedule of new pickers"),  # noqa: B008
+    _: str = Depends(authenticate),  # noqa: B008
+    opml_service: OpmlService = Depends(get_opml_service),  # noqa: B008
+    job_service: JobService = Depends(get_job_service),  # noqa: B008
+) -> OpmlImportResponse:
+    if cronjob is not None:
+        # checked before anything is probed or stored, the pickers are scheduled after commit
+        try:
+            validate_cronjob(cronjob)
+        except ValueError as error:
+            raise HTTPException(status_code=400, detail=str(error)) from error
+    outlines = await run_in_threadpool(parse_opml, await request.body())
+    if outlines is None:
+        raise HTTPException(status_code=400, detail="Invalid OPML")
+    if len(outlines) > MAX_NUMBER_OF_OPML_OUTLINES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"OPML has more than {MAX_NUMBER_OF_OPML_OUTLINES} outlines"
+        )
+
+    opml_import = await run_in_threadpool(
+        opml_service.import_outlines,
+        outlines,
+        probe,
+        cronjob
+    )
+    if opml_import.pickers:
+        await run_in_threadpool(job_service.add_cronjobs, opml_import.pickers)
+    return map_opml_import_to_opml_import_response(opml_import)
+
+
 @router.get(
     "/sources/{source_external_id}",
     status_code=status.HTTP_200_OK,
@@ -394,17 +556,12 @@ def delete_feed(
         raise HTTPException(status_code=404, detail="Feed not found")
 
     pickers = picker_service.get_pickers_by_feed_id(feed.id)
+    filter_service.delete_filters_by_picker_ids([picker.id for picker in pickers])
+    picker_service.delete_pickers_by_feed_id(feed.id)
     for picker in pickers:
-        for filter in filter_service.get_filters_by_picker_id(
-            picker_id=picker.id
-        ):
-            filter_service.delete_filter(filter.id)
-        picker_service.delete_picker(picker_id=picker.id)
         job_service.delete_cronjob(picker)
 
-    feed_items = feed_service.get_feed_items(feed.id)
-    for feed_item in feed_items:
-        feed_service.delete_feed_item(feed_item.id)
+    feed_service.delete_feed_items_by_feed_id(feed.id)
     feed_service.delete_feed(feed.id)
     return None
 
@@ -483,11 +640,14 @@ def get_feed(
 
     # build pickers list
     pickers = picker_service.get_pickers_by_feed_id(feed.id)
+    sources = source_service.get_sources_by_ids([picker.source_id for picker in pickers])
+    filters_by_picker_id = filter_service.get_filters_by_picker_ids(
+        [picker.id for picker in pickers]
+    )
     picker_items = []
     for picker in pickers:
-        source_url = source_service.get_source_by_id(picker.source_id).url
-        filters = filter_service.get_filters_by_picker_id(picker.id)
-        filter_items = [map_filter_to_filter_item(f) for f in filters]
+        source_url = sources[picker.source_id].url
+        filter_items = [map_filter_to_filter_item(f) for f in filters_by_picker_id[picker.id]]
         picker_items.append(
             FullFeedPickerResponse(
                 cronjob=picker.cronjob,
@@ -495,6 +655,8 @@ def get_feed(
                 filters=filter_items,
                 external_id=picker.external_id,
                 created_at=picker.created_at,
+                min_poll_interval=picker.min_poll_interval,
+                max_poll_interval=picker.max_poll_interval,
             )
         )
 
@@ -635,36 +797,110 @@ def delete_feed_item(
 
 @router.post(
     "/feeds/{feed_external_id}/export",
-    status_code=status.HTTP_200_OK,
-    summary="Exported feed items file",
-    description="Exported feed items file.",
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Export feed items",
+    description=(
+        "Start a background export of the feed items in the given time range. "
+        "Identical requests for an unchanged feed reuse the cached export."
+    ),
+    response_model=ExportJobResponse,
     tags=["Feeds"],
     responses={
-        200: {
-            "description": "Export feed items file",
-            "content": {"application/epub+zip": {}},
-        }
+        202: {
+            "description": "Export job",
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "$ref": "#/components/schemas/ExportJobResponse"
+                    }
+                }
+            }
+        },
+        404: {"description": "Feed not found"}
     }
 )
 def export_feed_items(
     feed_external_id: UUID,
     export_feed_items_request: ExportFeedItemsRequest,
     _: str = Depends(authenticate),  # noqa: B008
-    feed_service: FeedService = Depends(get_feed_service),  # noqa: B008
-):
-    buffer = feed_service.export_file(
+    export_service: ExportService = Depends(get_export_service),  # noqa: B008
+) -> ExportJobResponse:
+    export_job = export_service.create_export_job(
         feed_external_id,
         export_feed_items_request.file_type,
         export_feed_items_request.start_time,
         export_feed_items_request.end_time
     )
-    buffer.seek(0)
+    if export_job is None:
+        raise HTTPException(status_code=404, detail="Feed not found")
+    return map_export_job_to_export_job_response(export_job)
+
+
+@router.get(
+    "/feeds/{feed_external_id}/export/{export_job_external_id}",
+    summary="Get export job",
+    description="Return the status of an export job.",
+    response_model=ExportJobResponse,
+    tags=["Feeds"],
+    responses={
+        200: {
+            "description": "Export job",
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "$ref": "#/components/schemas/ExportJobResponse"
+                    }
+                }
+            }
+        },
+        404: {"description": "Export job not found"}
+    }
+)
+def get_export_job(
+    feed_external_id: UUID,
+    export_job_external_id: UUID,
+    _: str = Depends(authenticate),  # noqa: B008
+    export_service: ExportService = Depends(get_export_service),  # noqa: B008
+) -> ExportJobResponse:
+    export_job = export_service.get_export_job(export_job_external_id)
+    if not export_job or export_job.feed_external_id != feed_external_id:
+        raise HTTPException(status_code=404, detail="Export job not found")
+    return map_export_job_to_export_job_response(export_job)
+
+
+@router.get(
+    "/feeds/{feed_external_id}/export/{export_job_external_id}/file",
+    summary="Download exported file",
+    description="Download the file of a completed export job.",
+    tags=["Feeds"],
+    responses={
+        200: {
+            "description": "Exported feed items file",
+            "content": {"application/epub+zip": {}},
+        },
+        404: {"description": "Export job not found"},
+        409: {"description": "Export job not completed"}
+    }
+)
+def download_export_file(
+    feed_external_id: UUID,
+    export_job_external_id: UUID,
+    _: str = Depends(authenticate),  # noqa: B008
+    export_service: ExportService = Depends(get_export_service),  # noqa: B008
+):
+    export_job = export_service.get_export_job(export_job_external_id)
+    if not export_job or export_job.feed_external_id != feed_external_id:
+        raise HTTPException(status_code=404, detail="Export job not found")
+    export_file = export_service.open_export_file(export_job)
+    if export_file is None:
+        raise HTTPException(status_code=409, detail="Export job not completed")
 
     return StreamingResponse(
-        buffer,
-        media_type="application/epub+zip",
+        iter_file(export_file),
+        media_type=export_job.media_type,
         headers={
-            "Content-Disposition": "attachment; filename=export.epub"
+            "Content-Disposition": f"attachment; filename={export_job.file_name}",
+            "X-Export-Images-Bytes-Saved": str(export_job.images_bytes_saved),
         }
     )
 
@@ -724,12 +960,10 @@ def add_picker(
         create_full_picker_request.source_url
     )
     if not source:
-        url = create_full_picker_request.source_url
-        source_name = url.split('//')[1].split('/')[0]
         source = source_service.create_source(
             SourceRequest(
                 url=create_full_picker_request.source_url,
-                name=source_name
+                name=get_source_name(create_full_picker_request.source_url)
             )
         )
 
@@ -738,7 +972,9 @@ def add_picker(
         PickerRequest(
             cronjob=create_full_picker_request.cronjob,
             source_id=source.id,
-            feed_id=feed.id
+            feed_id=feed.id,
+            min_poll_interval=create_full_picker_request.min_poll_interval,
+            max_poll_interval=create_full_picker_request.max_poll_interval
         )
     )
 
@@ -768,10 +1004,49 @@ def add_picker(
         source_url=source.url,
         feed_external_id=feed.external_id,
         created_at=created_picker.created_at,
-        filters=filters_response
+        filters=filters_response,
+        min_poll_interval=created_picker.min_poll_interval,
+        max_poll_interval=created_picker.max_poll_interval
     )
 
 
+@router.post(
+    "/pickers/bulk",
+    status_code=status.HTTP_201_CREATED,
+    summary="Create pickers in bulk",
+    description=(
+        "Create many pickers and their dependencies in one transaction: sources are reused "
+        "by url, pickers naming the same new feed share it, and nothing is created if any "
+        "picker fails. The pickers are scheduled once they are all stored."
+    ),
+    response_model=FullPickersResponse,
+    tags=["Pickers"],
+    responses={
+        201: {"description": "Pickers created"},
+        400: {"description": "Bad request / validation error"}
+    }
+)
+def add_pickers(
+    create_full_pickers_request: CreateFullPickersRequest,
+    _: str = Depends(authenticate),  # noqa: B008
+    picker_service: PickerService = Depends(get_picker_service),  # noqa: B008
+    job_service: JobService = Depends(get_job_service),  # noqa: B008
+) -> FullPickersResponse:
+    created_pickers = picker_service.create_pickers([
+        map_create_full_picker_request_to_picker_definition(create_full_picker_request)
+        for create_full_picker_request in create_full_pickers_request.pickers
+    ])
+    if created_pickers is None:
+        raise HTTPException(status_code=400, detail="Feed not found")
+
+    job_service.add_cronjobs(created_pickers)
+
+    return FullPickersResponse(pickers=[
+        map_picker_details_to_full_picker_response(created_picker)
+        for created_picker in created_pickers
+    ])
+
+
 @router.get(
     "/pickers/{picker_external_id}",
     status_code=status.HTTP_200_OK,
@@ -819,6 +1094,8 @@ def get_picker(
         feed_external_id=feed.external_id,
         created_at=picker.created_at,
         filters=filter_items,
+        min_poll_interval=picker.min_poll_interval,
+        max_poll_interval=picker.max_poll_interval,
     )
 
 
@@ -847,3 +1124,357 @@ def delete_picker(
     job_service.delete_cronjob(picker)
     picker_service.delete_picker(picker_id=picker.id)
     return None
+
+
+@router.post(
+    "/pickers/{picker_external_id}/profile",
+    summary="Profile a picker run",
+    description=(
+        "Run the picker once in this process and return a sampling profile of the run, "
+        "as a speedscope or pstats file. The run ingests new entries like a scheduled one."
+    ),
+    tags=["Profiling"],
+    dependencies=[Depends(check_profiling_enabled)],
+    responses={
+        200: {"description": "Profile of the picker run"},
+        404: {"description": "Picker not found or profiling disabled"},
+        409: {"description": "Another profile is being captured"}
+    }
+)
+def profile_picker_run(
+    picker_external_id: UUID,
+    profile_format: ProfileFormat = Query(default=ProfileFormat.speedscope, alias="format"),  # noqa: B008
+    _: str = Depends(authenticate),  # noqa: B008
+    picker_service: PickerService = Depends(get_picker_service),  # noqa: B008
+    job_service_factory: JobServiceFactory = Depends(get_run_job_service_factory),  # noqa: B008
+    profiler: ProfilerPort = Depends(get_profiler),  # noqa: B008
+) -> Response:
+    picker = picker_service.get_picker_by_external_id(external_id=picker_external_id)
+    if not picker:
+        raise HTTPException(status_code=404, detail="Picker not found")
+
+    def run_picker():
+        # a session of its own, as a run-now would, shared state is left alone
+        with job_service_factory() as job_service:
+            job_service.process(picker.id)
+
+    return build_profile_response(profiler.profile_call(
+        run_picker,
+        f"picker-{picker_external_id}",
+        profile_format
+    ))
+
+
+@router.get(
+    "/pickers/{picker_external_id}/runs",
+    summary="List picker runs",
+    description=(
+        "Return the latest runs of a picker, newest first, with their entry counts, "
+        "HTTP status and error."
+    ),
+    response_model=PickerRunsResponse,
+    tags=["Pickers"],
+    responses={
+        200: {"description": "Picker runs"},
+        404: {"description": "Picker not found"}
+    }
+)
+def list_picker_runs(
+    picker_external_id: UUID,
+    limit: int = Query(default=50, ge=1, le=1000),  # noqa: B008
+    _: str = Depends(authenticate),  # noqa: B008
+    picker_service: PickerService = Depends(get_picker_service),  # noqa: B008
+    picker_run_service: PickerRunService = Depends(get_picker_run_service),  # noqa: B008
+) -> PickerRunsResponse:
+    picker = picker_service.get_picker_by_external_id(external_id=picker_external_id)
+    if not picker:
+        raise HTTPException(status_code=404, detail="Picker not found")
+    return PickerRunsResponse(runs=[
+        map_picker_run_to_picker_run_response(picker_run)
+        for picker_run in picker_run_service.get_picker_runs(picker.id, limit)
+    ])
+
+
+@router.get(
+    "/picker-runs/stats",
+    summary="Get picker run stats per source",
+    description=(
+        "Aggregate the picker runs of the last hours per source: run and failure counts, "
+        "p50, p95 and max run duration, and the last error. Slowest sources come first."
+    ),
+    response_model=SourceRunStatsListResponse,
+    tags=["Pickers"],
+    responses={200: {"description": "Picker run stats per source"}}
+)
+def get_picker_run_stats(
+    hours: int = Query(default=24, ge=1, le=24 * 365),  # noqa: B008
+    _: str = Depends(authenticate),  # noqa: B008
+    picker_run_service: PickerRunService = Depends(get_picker_run_service),  # noqa: B008
+) -> SourceRunStatsListResponse:
+    return SourceRunStatsListResponse(sources=[
+        map_source_run_stats_to_source_run_stats_response(source_run_stats)
+        for source_run_stats in picker_run_service.get_source_run_stats(hours)
+    ])
+
+
+@router.post(
+    "/pickers/{picker_external_id}/run",
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Run picker now",
+    description=(
+        "Queue an immediate run of the picker and return a job to poll. With backfill, "
+        "the whole source window is inserted in batches and the content of the new items "
+        "is extracted once they are in the feed."
+    ),
+    response_model=PickerRunJobResponse,
+    tags=["Pickers"],
+    responses={
+        202: {"description": "Picker run job"},
+        404: {"description": "Picker not found"}
+    }
+)
+def run_picker(
+    picker_external_id: UUID,
+    backfill: bool = False,
+    _: str = Depends(authenticate),  # noqa: B008
+    picker_service: PickerService = Depends(get_picker_service),  # noqa: B008
+    picker_run_job_service: PickerRunJobService = Depends(get_picker_run_job_service),  # noqa: B008
+) -> PickerRunJobResponse:
+    picker = picker_service.get_picker_by_external_id(external_id=picker_external_id)
+    if not picker:
+        raise HTTPException(status_code=404, detail="Picker not found")
+    return map_picker_run_job_to_picker_run_job_response(
+        picker_run_job_service.create_picker_run_job([picker.id], backfill)
+    )
+
+
+@router.post(
+    "/feeds/{feed_external_id}/run",
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Run feed pickers now",
+    description=(
+        "Queue an immediate run of every picker of the feed and return a job to poll. "
+        "Backfill works as for a single picker."
+    ),
+    response_model=PickerRunJobResponse,
+    tags=["Pickers"],
+    responses={
+        202: {"description": "Picker run job"},
+        400: {"description": "Feed has no pickers"},
+        404: {"description": "Feed not found"}
+    }
+)
+def run_feed_pickers(
+    feed_external_id: UUID,
+    backfill: bool = False,
+    _: str = Depends(authenticate),  # noqa: B008
+    feed_service: FeedService = Depends(get_feed_service),  # noqa: B008
+    picker_service: PickerService = Depends(get_picker_service),  # noqa: B008
+    picker_run_job_service: PickerRunJobService = Depends(get_picker_run_job_service),  # noqa: B008
+) -> PickerRunJobResponse:
+    feed = feed_service.get_feed_by_external_id(feed_external_id)
+    if not feed:
+        raise HTTPException(status_code=404, detail="Feed not found")
+    pickers = picker_service.get_pickers_by_feed_id(feed.id)
+    if not pickers:
+        raise HTTPException(status_code=400, detail="Feed has no pickers")
+    return map_picker_run_job_to_picker_run_job_response(
+        picker_run_job_service.create_picker_run_job(
+            sorted(picker.id for picker in pickers),
+            backfill
+        )
+    )
+
+
+@router.get(
+    "/picker-run-jobs/{picker_run_job_external_id}",
+    summary="Get picker run job",
+    description="Return the status and entry counts of a picker run job.",
+    response_model=PickerRunJobResponse,
+    tags=["Pickers"],
+    responses={
+        200: {"description": "Picker run job"},
+        404: {"description": "Picker run job not found"}
+    }
+)
+def get_picker_run_job(
+    picker_run_job_external_id: UUID,
+    _: str = Depends(authenticate),  # noqa: B008
+    picker_run_job_service: PickerRunJobService = Depends(get_picker_run_job_service),  # noqa: B008
+) -> PickerRunJobResponse:
+    picker_run_job = picker_run_job_service.get_picker_run_job(picker_run_job_external_id)
+    if not picker_run_job:
+        raise HTTPException(status_code=404, detail="Picker run job not found")
+    return map_picker_run_job_to_picker_run_job_response(picker_run_job)
+
+
+@router.get(
+    "/scheduler/metrics",
+    summary="Get scheduler metrics",
+    description=(
+        "Return the run queue and the number of skipped, missed and late picker runs "
+        "of the scheduler running in this process."
+    ),
+    response_model=SchedulerMetricsResponse,
+    tags=["Scheduler"],
+    responses={
+        200: {"description": "Scheduler metrics"},
+        404: {"description": "Scheduler not running in this process"}
+    }
+)
+def get_scheduler_metrics(
+    _: str = Depends(authenticate),  # noqa: B008
+    scheduling_service: SchedulingService | None = Depends(get_scheduling_service),  # noqa: B008
+) -> SchedulerMetricsResponse:
+    if scheduling_service is None:
+        raise HTTPException(status_code=404, detail="Scheduler not running in this process")
+    return map_scheduler_metrics_to_scheduler_metrics_response(scheduling_service.get_metrics())
+
+
+@router.get(
+    "/profiling/cpu",
+    summary="Profile the process",
+    description=(
+        "Sample the stacks of every thread of this process, API and scheduler threads alike, "
+        "for the given number of seconds and return them as a speedscope or pstats file."
+    ),
+    tags=["Profiling"],
+    dependencies=[Depends(check_profiling_enabled)],
+    responses={
+        200: {"description": "Sampling profile"},
+        404: {"description": "Profiling disabled"},
+        409: {"description": "Another profile is being captured"}
+    }
+)
+def profile_cpu(
+    seconds: float = Query(default=10, gt=0, le=settings.PROFILING_MAX_DURATION),  # noqa: B008
+    profile_format: ProfileFormat = Query(default=ProfileFormat.speedscope, alias="format"),  # noqa: B008
+    _: str = Depends(authenticate),  # noqa: B008
+    profiler: ProfilerPort = Depends(get_profiler),  # noqa: B008
+) -> Response:
+    return build_profile_response(profiler.profile_cpu(seconds, profile_format))
+
+
+@router.get(
+    "/profiling/memory",
+    summary="Profile memory allocations",
+    description=(
+        "Trace memory allocations of this process for the given number of seconds and return "
+        "the memory still held at the end, by allocation stack, as a speedscope file."
+    ),
+    tags=["Profiling"],
+    dependencies=[Depends(check_profiling_enabled)],
+    responses={
+        200: {"description": "Memory snapshot diff"},
+        404: {"description": "Profiling disabled"},
+        409: {"description": "Another profile is being captured"}
+    }
+)
+def profile_memory(
+    seconds: float = Query(default=10, gt=0, le=settings.PROFILING_MAX_DURATION),  # noqa: B008
+    _: str = Depends(authenticate),  # noqa: B008
+    profiler: ProfilerPort = Depends(get_profiler),  # noqa: B008
+) -> Response:
+    return build_profile_response(profiler.profile_memory(seconds))
+
+
+@router.get(
+    "/health/live",
+    summary="Liveness probe",
+    description="Report that the API process is up and serving requests.",
+    response_model=LivenessResponse,
+    tags=["Health"],
+    responses={200: {"description": "API is alive"}}
+)
+def get_liveness() -> LivenessResponse:
+    return LivenessResponse()
+
+
+@router.get(
+    "/health/ready",
+    summary="Readiness probe",
+    description=(
+        "Report whether the scheduler running in this process has loaded its jobs, "
+        "along with the number of jobs scheduled so far while it warms up."
+    ),
+    response_model=ReadinessResponse,
+    tags=["Health"],
+    responses={
+        200: {"description": "API is ready"},
+        503: {"description": "Scheduler is still loading its jobs or failed to start"}
+    }
+)
+def get_readiness(
+    response: Response,
+    scheduling_service: SchedulingService | None = Depends(get_scheduling_service),  # noqa: B008
+) -> ReadinessResponse:
+    if scheduling_service is None:
+        return ReadinessResponse(ready=True)
+    scheduler_status = scheduling_service.get_status()
+    ready = scheduler_status.state == "ready"
+    if not ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return ReadinessResponse(
+        ready=ready,
+        scheduler=map_scheduler_status_to_scheduler_status_response(scheduler_status)
+    )
+
+
+@router.get(
+    "/websub/{subscription_external_id}",
+    summary="Verify WebSub intent",
+    description="Confirm a subscription request a WebSub hub is verifying.",
+    response_class=PlainTextResponse,
+    tags=["WebSub"],
+    responses={
+        200: {"description": "Intent confirmed, the challenge is echoed"},
+        404: {"description": "Subscription not found"}
+    }
+)
+def verify_websub_intent(
+    subscription_external_id: UUID,
+    mode: str = Query(alias="hub.mode"),  # noqa: B008
+    topic: str = Query(alias="hub.topic"),  # noqa: B008
+    challenge: str | None = Query(default=None, alias="hub.challenge"),  # noqa: B008
+    lease_seconds: int | None = Query(default=None, alias="hub.lease_seconds"),  # noqa: B008
+    websub_service: WebSubService = Depends(get_websub_service),  # noqa: B008
+) -> PlainTextResponse:
+    response = websub_service.verify_intent(
+        subscription_external_id,
+        mode,
+        topic,
+        challenge,
+        lease_seconds
+    )
+    if response is None:
+        raise HTTPException(status_code=404, detail="Subscription not found")
+    return PlainTextResponse(response)
+
+
+@router.post(
+    "/websub/{subscription_external_id}",
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Receive WebSub content",
+    description=(
+        "Receive the entries a WebSub hub pushes and run the pickers of the source on them. "
+        "Content with an invalid signature is acknowledged and ignored."
+    ),
+    tags=["WebSub"],
+    responses={202: {"description": "Content accepted"}}
+)
+async def receive_websub_content(
+    subscription_external_id: UUID,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    websub_service: WebSubService = Depends(get_websub_service),  # noqa: B008
+    job_service_factory: JobServiceFactory = Depends(get_job_service_factory),  # noqa: B008
+) -> Response:
+    pushed = await run_in_threadpool(
+        websub_service.get_pushed_entries,
+        subscription_external_id,
+        await request.body(),
+        request.headers.get("X-Hub-Signature")
+    )
+    if pushed is not None:
+        background_tasks.add_task(process_pushed_entries, *pushed, job_service_factory)
+    return Response(status_code=status.HTTP_202_ACCEPTED)
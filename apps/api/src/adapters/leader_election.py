@@ -0,0 +1,100 @@
+import logging
+import threading
+from collections.abc import Callable
+
+from sqlalchemy import Connection, create_engine, text
+from sqlalchemy.pool import NullPool
+from src.domain.ports.leader_election_port import LeaderElectionPort
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresLeaderElection(LeaderElectionPort):
+    """Leadership is a session level advisory lock held on a dedicated connection.
+
+    Postgres releases the lock as soon as the leader's session ends, so a standby polling
+    every ``interval`` seconds takes over shortly after the leader dies.
+    """
+
+    def __init__(self, database_url: str, lock_id: int, interval: int):
+        self.lock_id = lock_id
+        self.interval = interval
+        self.engine = create_engine(
+            database_url,
+            poolclass=NullPool,
+            connect_args={
+                # let both ends notice a dead peer within a few intervals
+                "keepalives": 1,
+                "keepalives_idle": interval,
+                "keepalives_interval": interval,
+                "keepalives_count": 3,
+                "options": (
+                    f"-c tcp_keepalives_idle={interval} "
+                    f"-c tcp_keepalives_interval={interval} "
+                    "-c tcp_keepalives_count=3"
+                ),
+            },
+        )
+        self.connection: Connection | None = None
+        self.leader = False
+        self.stop_event = threading.Event()
+        self.thread: threading.Thread | None = None
+        self.on_elected: Callable[[], None] = lambda: None
+        self.on_revoked: Callable[[], None] = lambda: None
+
+    def start(self, on_elected: Callable[[], None], on_revoked: Callable[[], None]) -> None:
+        self.on_elected = on_elected
+        self.on_revoked = on_revoked
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, name="leader-election", daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join()
+        self.engine.dispose()
+
+    def is_leader(self) -> bool:
+        return self.leader
+
+    def _run(self):
+        while not self.stop_event.is_set():
+            try:
+                self._campaign()
+            except Exception:
+                logger.exception("Leader election failed, stepping down")
+                self._step_down()
+            self.stop_event.wait(self.interval)
+        self._step_down()
+
+    def _campaign(self):
+        if self.connection is None:
+            self.connection = self.engine.connect().execution_options(
+                isolation_level="AUTOCOMMIT"
+            )
+        if self.leader:
+            # the lock lives as long as the session, so a live session keeps leadership
+            self.connection.execute(text("SELECT 1"))
+            return
+        acquired = self.connection.execute(
+            text("SELECT pg_try_advisory_lock(:lock_id)"),
+            {"lock_id": self.lock_id}
+        ).scalar()
+        if acquired:
+            logger.info("Elected as scheduler leader")
+            self.leader = True
+            self.on_elected()
+
+    def _step_down(self):
+        if self.leader:
+            logger.info("Stepping down as scheduler leader")
+            self.leader = False
+            self.on_revoked()
+        if self.connection is not None:
+            try:
+                # closing the session releases the advisory lock
+                self.connection.close()
+            except Exception:
+                logger.exception("Could not close the leader election connection")
+            self.connection = None
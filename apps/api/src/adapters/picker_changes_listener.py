@@ -0,0 +1,53 @@
+import logging
+import threading
+from collections.abc import Callable
+
+import psycopg
+from sqlalchemy.engine import make_url
+from src.domain.ports.picker_changes_port import PickerChangesPort
+
+logger = logging.getLogger(__name__)
+
+PICKER_CHANGES_CHANNEL = "picker_changes"
+
+
+class PostgresPickerChangesListener(PickerChangesPort):
+    """Listens to the notifications the pickers table trigger sends on every change."""
+
+    def __init__(self, database_url: str, interval: int):
+        self.conninfo = make_url(database_url).set(drivername="postgresql").render_as_string(
+            hide_password=False
+        )
+        self.interval = interval
+        self.stop_event = threading.Event()
+        self.thread: threading.Thread | None = None
+        self.on_change: Callable[[], None] = lambda: None
+
+    def start(self, on_change: Callable[[], None]) -> None:
+        self.on_change = on_change
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, name="picker-changes", daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join()
+
+    def _run(self):
+        while not self.stop_event.is_set():
+            try:
+                self._listen()
+            except Exception:
+                logger.exception("Picker changes listener failed, reconnecting")
+                self.stop_event.wait(self.interval)
+
+    def _listen(self):
+        with psycopg.connect(self.conninfo, autocommit=True) as connection:
+            connection.execute(f"LISTEN {PICKER_CHANGES_CHANNEL}")
+            # changes made while disconnected were not notified
+            self.on_change()
+            while not self.stop_event.is_set():
+                # a burst of changes within one interval triggers a single reload
+                if list(connection.notifies(timeout=self.interval)):
+                    self.on_change()
@@ -0,0 +1,38 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from sqlalchemy import URL, create_engine, text
+from sqlalchemy.pool import NullPool
+from src.domain.ports.picker_locks_port import PickerLocksPort
+
+
+class PostgresPickerLocks(PickerLocksPort):
+    """A picker is locked by a session level advisory lock on a connection of its own.
+
+    Runs of a picker are serialized across the API and the worker processes. The run's own
+    session hands its connection back to the pool on every commit, so it cannot hold the lock,
+    and Postgres releases the lock if the process holding it dies.
+    """
+
+    def __init__(self, database_url: str | URL, lock_id: int):
+        self.lock_id = lock_id
+        self.engine = create_engine(database_url, poolclass=NullPool)
+
+    @contextmanager
+    def hold(self, picker_id: int, wait: bool) -> Iterator[bool]:
+        params = {"lock_id": self.lock_id, "picker_id": picker_id}
+        with self.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            if wait:
+                connection.execute(text("SELECT pg_advisory_lock(:lock_id, :picker_id)"), params)
+                acquired = True
+            else:
+                acquired = connection.execute(
+                    text("SELECT pg_try_advisory_lock(:lock_id, :picker_id)"), params
+                ).scalar()
+            try:
+                yield acquired
+            finally:
+                if acquired:
+                    connection.execute(
+                        text("SELECT pg_advisory_unlock(:lock_id, :picker_id)"), params
+                    )
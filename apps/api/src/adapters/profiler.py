@@ -0,0 +1,230 @@
+import json
+import marshal
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+from src.configs.settings import Settings
+from src.domain.models.profile import Profile, ProfileFormat
+from src.domain.ports.profiler_port import ProfilerPort
+
+settings: Settings = Settings()
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+# (file, line, function) as in pstats, stacks go from the outermost frame to the innermost
+FrameKey = tuple[str, int, str]
+Stack = tuple[FrameKey, ...]
+
+
+class StackSampler(threading.Thread):
+    """Records the stack of every thread at a fixed interval, weighted by wall-clock time."""
+
+    def __init__(self, interval: float, thread_ids: set[int] | None = None):
+        super().__init__(name="profiler-sampler", daemon=True)
+        self.interval = interval
+        self.thread_ids = thread_ids
+        # when sampling every thread the caller is left out, it only waits for the profile
+        self.ignored_thread_ids = {threading.get_ident()} if thread_ids is None else set()
+        self.samples: dict[tuple[int, Stack], float] = defaultdict(float)
+        self.thread_names: dict[int, str] = {}
+        self.stopped = threading.Event()
+
+    def run(self):
+        self.ignored_thread_ids.add(threading.get_ident())
+        sampled_at = time.perf_counter()
+        while not self.stopped.wait(self.interval):
+            now = time.perf_counter()
+            self.sample(now - sampled_at)
+            sampled_at = now
+
+    def sample(self, weight: float):
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id in self.ignored_thread_ids:
+                continue
+            if self.thread_ids is not None and thread_id not in self.thread_ids:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_filename, code.co_firstlineno, code.co_qualname))
+                frame = frame.f_back
+            self.samples[thread_id, tuple(reversed(stack))] += weight
+        for thread in threading.enumerate():
+            self.thread_names[thread.ident] = thread.name
+
+    def stop(self) -> dict[tuple[int, Stack], float]:
+        self.stopped.set()
+        self.join()
+        return dict(self.samples)
+
+
+def to_speedscope(
+    samples: dict[tuple[int, Stack], float],
+    thread_names: dict[int, str],
+    name: str,
+    unit: str = "seconds"
+) -> bytes:
+    frames: list[dict] = []
+    frame_indexes: dict[FrameKey, int] = {}
+    profiles: dict[int, dict] = {}
+    for (thread_id, stack), weight in samples.items():
+        profile = profiles.setdefault(thread_id, {"samples": [], "weights": []})
+        indexes = []
+        for frame in stack:
+            if frame not in frame_indexes:
+                frame_indexes[frame] = len(frames)
+                frames.append({"name": frame[2], "file": frame[0], "line": frame[1]})
+            indexes.append(frame_indexes[frame])
+        profile["samples"].append(indexes)
+        profile["weights"].append(weight)
+    return json.dumps({
+        "$schema": SPEEDSCOPE_SCHEMA,
+        "name": name,
+        "exporter": settings.APP_NAME,
+        "activeProfileIndex": 0,
+        "shared": {"frames": frames},
+        "profiles": [
+            {
+                "type": "sampled",
+                "name": thread_names.get(thread_id, str(thread_id)),
+                "unit": unit,
+                "startValue": 0,
+                "endValue": sum(profile["weights"]),
+                "samples": profile["samples"],
+                "weights": profile["weights"],
+            }
+            for thread_id, profile in sorted(profiles.items(), key=lambda item: str(item[0]))
+        ],
+    }).encode("utf-8")
+
+
+def to_pstats(samples: dict[tuple[int, Stack], float]) -> bytes:
+    # call counts are sample counts, the times are the sampled wall-clock times
+    stats: dict[FrameKey, list] = {}
+    for (_, stack), weight in samples.items():
+        seen = set()
+        for position, frame in enumerate(stack):
+            entry = stats.setdefault(frame, [0, 0, 0.0, 0.0, {}])
+            # a recursive function counts once towards its cumulative time
+            if frame not in seen:
+                seen.add(frame)
+                entry[0] += 1
+                entry[1] += 1
+                entry[3] += weight
+            if position:
+                caller = stack[position - 1]
+                calls, primitive_calls, total, cumulative = entry[4].get(caller, (0, 0, 0.0, 0.0))
+                entry[4][caller] = (
+                    calls + 1,
+                    primitive_calls + 1,
+                    total + (weight if position == len(stack) - 1 else 0.0),
+                    cumulative + weight,
+                )
+        stats[stack[-1]][2] += weight
+    return marshal.dumps({frame: tuple(entry) for frame, entry in stats.items()})
+
+
+class SamplingProfiler(ProfilerPort):
+    """Profiles the running process, one profile at a time."""
+
+    def __init__(self, interval: float = settings.PROFILING_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.lock = threading.Lock()
+
+    def profile_cpu(self, seconds: float, profile_format: ProfileFormat) -> Profile | None:
+        if not self.lock.acquire(blocking=False):
+            return None
+        try:
+            sampler = StackSampler(self.interval)
+            sampler.start()
+            time.sleep(seconds)
+            samples = sampler.stop()
+            return _build_profile("cpu", samples, sampler.thread_names, profile_format)
+        finally:
+            self.lock.release()
+
+    def profile_memory(self, seconds: float) -> Profile | None:
+        if not self.lock.acquire(blocking=False):
+            return None
+        # tracing might have been started with PYTHONTRACEMALLOC, it is left running then
+        started = not tracemalloc.is_tracing()
+        try:
+            if started:
+                tracemalloc.start(settings.PROFILING_TRACEMALLOC_FRAMES)
+            before = tracemalloc.take_snapshot()
+            time.sleep(seconds)
+            after = tracemalloc.take_snapshot()
+        finally:
+            if started:
+                tracemalloc.stop()
+            self.lock.release()
+        ignored = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        samples = {
+            (0, _allocation_stack(statistic.traceback)): float(statistic.size_diff)
+            for statistic in after.filter_traces(ignored).compare_to(
+                before.filter_traces(ignored), "traceback"
+            )
+            # a flame graph only shows what grew, freed memory has no stack to attribute to
+            if statistic.size_diff > 0
+        }
+        return Profile(
+            file_name=f"memory-{_timestamp()}.speedscope.json",
+            media_type="application/json",
+            content=to_speedscope(samples, {0: "allocations"}, "memory", unit="bytes")
+        )
+
+    def profile_call(
+        self,
+        func: Callable[[], object],
+        name: str,
+        profile_format: ProfileFormat
+    ) -> Profile | None:
+        if not self.lock.acquire(blocking=False):
+            return None
+        try:
+            sampler = StackSampler(self.interval, thread_ids={threading.get_ident()})
+            sampler.start()
+            try:
+                func()
+            finally:
+                samples = sampler.stop()
+            return _build_profile(name, samples, sampler.thread_names, profile_format)
+        finally:
+            self.lock.release()
+
+
+def _build_profile(
+    name: str,
+    samples: dict[tuple[int, Stack], float],
+    thread_names: dict[int, str],
+    profile_format: ProfileFormat
+) -> Profile:
+    if profile_format is ProfileFormat.pstats:
+        return Profile(
+            file_name=f"{name}-{_timestamp()}.pstats",
+            media_type="application/octet-stream",
+            content=to_pstats(samples)
+        )
+    return Profile(
+        file_name=f"{name}-{_timestamp()}.speedscope.json",
+        media_type="application/json",
+        content=to_speedscope(samples, thread_names, name)
+    )
+
+
+def _allocation_stack(traceback: tracemalloc.Traceback) -> Stack:
+    # tracemalloc only records files and lines, so frames are named after them
+    return tuple(
+        (frame.filename, frame.lineno, f"{os.path.basename(frame.filename)}:{frame.lineno}")
+        for frame in traceback
+    )
+
+
+def _timestamp() -> str:
+    return datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
@@ -0,0 +1,135 @@
+from prometheus_client import REGISTRY, Counter, Histogram
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import Collector
+from sqlalchemy import Engine
+from src.domain.models.job import PickerRunStats
+from src.domain.models.picker import Picker
+from src.domain.models.source import Source
+from src.domain.ports.metrics_port import MetricsPort
+from src.domain.ports.scheduler_port import SchedulerPort
+
+PICKER_STAGE_DURATION = Histogram(
+    "nebulapicker_picker_stage_duration_seconds",
+    "Time spent in each stage of a picker run.",
+    ["stage", "source", "picker"]
+)
+PICKER_ENTRIES = Counter(
+    "nebulapicker_picker_entries",
+    "Entries seen by picker runs, by outcome.",
+    ["outcome", "source", "picker"]
+)
+PICKER_DOWNLOADED_BYTES = Counter(
+    "nebulapicker_picker_downloaded_bytes",
+    "Bytes downloaded from sources by picker runs.",
+    ["source", "picker"]
+)
+PICKER_RUNS = Counter(
+    "nebulapicker_picker_runs",
+    "Picker runs, by the HTTP status of the source.",
+    ["status", "source", "picker"]
+)
+SCHEDULER_JOB_LAG = Histogram(
+    "nebulapicker_scheduler_job_lag_seconds",
+    "Delay between the scheduled and the actual start of a job run.",
+    buckets=(0.1, 0.5, 1, 5, 10, 30, 60, 120, 300, 600, float("inf"))
+)
+EXTRACTOR_DURATION = Histogram(
+    "nebulapicker_extractor_duration_seconds",
+    "Time spent waiting on the content extractor.",
+    ["operation"]
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "nebulapicker_http_request_duration_seconds",
+    "Time spent serving API requests.",
+    ["method", "route", "status"]
+)
+
+ENTRY_OUTCOMES = ("fetched", "new", "filtered", "extracted", "inserted")
+
+
+class PrometheusMetrics(MetricsPort):
+
+    def observe_picker_run(self, picker: Picker, source: Source, stats: PickerRunStats) -> None:
+        labels = {"source": str(source.external_id), "picker": str(picker.external_id)}
+        for stage, duration in stats.durations.items():
+            PICKER_STAGE_DURATION.labels(stage=stage, **labels).observe(duration)
+        for outcome in ENTRY_OUTCOMES:
+            PICKER_ENTRIES.labels(outcome=outcome, **labels).inc(
+                getattr(stats, f"entries_{outcome}")
+            )
+        PICKER_DOWNLOADED_BYTES.labels(**labels).inc(stats.bytes_downloaded)
+        PICKER_RUNS.labels(status=str(stats.status_code or "none"), **labels).inc()
+
+
+class SchedulerCollector(Collector):
+    """Reads the run counters of the scheduler when metrics are scraped."""
+
+    def __init__(self):
+        self.scheduler: SchedulerPort | None = None
+
+    def collect(self):
+        if self.scheduler is None:
+            return
+        metrics = self.scheduler.get_metrics()
+        yield GaugeMetricFamily(
+            "nebulapicker_scheduler_jobs", "Scheduled jobs.",
+            value=self.scheduler.get_job_count()
+        )
+        yield GaugeMetricFamily(
+            "nebulapicker_scheduler_queued_runs", "Runs waiting for an executor thread.",
+            value=metrics.queued_runs
+        )
+        yield GaugeMetricFamily(
+            "nebulapicker_scheduler_running_runs", "Runs being executed.",
+            value=metrics.running_runs
+        )
+        yield CounterMetricFamily(
+            "nebulapicker_scheduler_skipped_runs", "Runs skipped because the queue was full.",
+            value=metrics.skipped_runs
+        )
+        yield CounterMetricFamily(
+            "nebulapicker_scheduler_missed_runs", "Runs dropped after the misfire grace time.",
+            value=metrics.missed_runs
+        )
+        yield CounterMetricFamily(
+            "nebulapicker_scheduler_late_runs", "Runs started after the late run threshold.",
+            value=metrics.late_runs
+        )
+
+
+class DatabasePoolCollector(Collector):
+    """Reads the connection pool usage of the engine when metrics are scraped."""
+
+    def __init__(self):
+        self.engine: Engine | None = None
+
+    def collect(self):
+        if self.engine is None:
+            return
+        pool = self.engine.pool
+        yield GaugeMetricFamily(
+            "nebulapicker_db_pool_size", "Connections kept by the pool.",
+            value=pool.size()
+        )
+        yield GaugeMetricFamily(
+            "nebulapicker_db_pool_checked_out", "Connections in use.",
+            value=pool.checkedout()
+        )
+        yield GaugeMetricFamily(
+            "nebulapicker_db_pool_overflow", "Connections opened beyond the pool size.",
+            value=max(pool.overflow(), 0)
+        )
+
+
+scheduler_collector = SchedulerCollector()
+database_pool_collector = DatabasePoolCollector()
+REGISTRY.register(scheduler_collector)
+REGISTRY.register(database_pool_collector)
+
+
+def track_scheduler(scheduler: SchedulerPort):
+    scheduler_collector.scheduler = scheduler
+
+
+def track_database_pool(engine: Engine):
+    database_pool_collector.engine = engine
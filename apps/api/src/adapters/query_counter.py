@@ -0,0 +1,70 @@
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from pydantic import BaseModel
+from sqlalchemy import Engine, event
+from src.configs.settings import Settings
+
+settings: Settings = Settings()
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStats(BaseModel):
+    count: int = 0
+    duration: float = 0.0
+
+
+# sync routes run in a copy of the request context, so they update the same stats
+_current_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def report_queries(operation: str, stats: QueryStats):
+    if (
+        stats.count > settings.QUERY_COUNT_THRESHOLD
+        or stats.duration > settings.QUERY_DURATION_THRESHOLD
+    ):
+        logger.warning(
+            "%s ran %d SQL statements taking %.3fs",
+            operation, stats.count, stats.duration
+        )
+
+
+def count_queries():
+    # listening on the class covers every engine, including the ones tests create
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(Engine, "handle_error", _handle_error)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started_at = conn.info["query_started_at"].pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.duration += time.perf_counter() - started_at
+
+
+def _handle_error(context):
+    # failed statements never reach after_cursor_execute
+    started_at = context.connection.info.get("query_started_at") if context.connection else None
+    if started_at:
+        started_at.pop()
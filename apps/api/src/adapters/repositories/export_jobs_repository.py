@@ -0,0 +1,91 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from src.adapters.tracing import traced
+from src.domain.models.export import ExportJob, ExportJobRequest
+from src.domain.ports.export_jobs_port import ExportJobsPort
+
+EXPORT_JOB_KEY = "(feed_id, start_time, end_time, file_type, feed_version)"
+
+
+@traced
+class ExportJobsRepository(ExportJobsPort):
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_or_create_export_job(
+        self,
+        export_job_request: ExportJobRequest,
+        stale_before: datetime
+    ) -> tuple[ExportJob, bool]:
+        # a failed job, or one left unfinished by a worker that went away, is replaced by a new
+        # job, any other job of the same export is reused
+        sql = text(
+            "INSERT INTO export_jobs (feed_id, file_type, start_time, end_time, feed_version) "
+            "VALUES (:feed_id, :file_type, :start_time, :end_time, :feed_version) "
+            f"ON CONFLICT {EXPORT_JOB_KEY} DO UPDATE SET "
+            "external_id = gen_random_uuid(), status = 'pending', error = NULL, "
+            "file_path = NULL, file_name = NULL, media_type = NULL, images_bytes_saved = 0, "
+            "created_at = now(), completed_at = NULL, last_used_at = now() "
+            "WHERE export_jobs.status = 'failed' "
+            "OR (export_jobs.status IN ('pending', 'running') "
+            "AND export_jobs.created_at < :stale_before) "
+            "RETURNING external_id;"
+        )
+        params = {**export_job_request.model_dump(), "stale_before": stale_before}
+        external_id = self.db.execute(sql, params).scalar()
+        created = external_id is not None
+        if not created:
+            sql = text(
+                "UPDATE export_jobs SET last_used_at = now() "
+                f"WHERE {EXPORT_JOB_KEY} = "
+                "(:feed_id, :start_time, :end_time, :file_type, :feed_version) "
+                "RETURNING external_id;"
+            )
+            external_id = self.db.execute(sql, params).scalar_one()
+        self.db.commit()
+        return self.get_export_job(external_id), created
+
+    def get_export_job(self, external_id: UUID) -> ExportJob | None:
+        sql = text(
+            "SELECT j.external_id, f.external_id AS feed_external_id, j.file_type, "
+            "j.start_time, j.end_time, j.status, j.created_at, j.completed_at, j.error, "
+            "j.file_path, j.file_name, j.media_type, j.images_bytes_saved "
+            "FROM export_jobs j JOIN feeds f ON f.id = j.feed_id "
+            "WHERE j.external_id = :external_id;"
+        )
+        row = self.db.execute(sql, {"external_id": external_id}).mappings().first()
+        return ExportJob(**row) if row else None
+
+    def update_export_job(self, export_job: ExportJob) -> bool:
+        sql = text(
+            "UPDATE export_jobs SET status = :status, error = :error, file_path = :file_path, "
+            "file_name = :file_name, media_type = :media_type, "
+            "images_bytes_saved = :images_bytes_saved, completed_at = :completed_at "
+            "WHERE external_id = :external_id;"
+        )
+        result = self.db.execute(sql, {
+            "external_id": export_job.external_id,
+            "status": export_job.status.value,
+            "error": export_job.error,
+            "file_path": export_job.file_path,
+            "file_name": export_job.file_name,
+            "media_type": export_job.media_type,
+            "images_bytes_saved": export_job.images_bytes_saved,
+            "completed_at": export_job.completed_at,
+        })
+        self.db.commit()
+        return result.rowcount == 1
+
+    def delete_least_recently_used_export_jobs(self, keep: int) -> list[str]:
+        sql = text(
+            "DELETE FROM export_jobs WHERE id IN ("
+            "SELECT id FROM export_jobs ORDER BY last_used_at DESC, id DESC OFFSET :keep) "
+            "RETURNING file_path;"
+        )
+        file_paths = self.db.execute(sql, {"keep": keep}).scalars().all()
+        self.db.commit()
+        return [file_path for file_path in file_paths if file_path]
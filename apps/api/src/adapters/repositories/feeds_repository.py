@@ -1,14 +1,18 @@
 import datetime
+from collections.abc import Iterator
 from uuid import UUID
 
 from sqlalchemy import text
 from sqlalchemy.orm import Session
+from src.adapters.tracing import traced
 from src.domain.models.feed import Feed, FeedItem, FeedItemRequest, FeedRequest, UpdateFeedRequest
 from src.domain.ports.feeds_port import FeedsPort
 
 MAX_NUMBER_OF_ITEMS = 250
+STREAM_BATCH_SIZE = 50
 
 
+@traced
 class FeedsRepository(FeedsPort):
 
     def __init__(self, db: Session):
@@ -134,6 +138,34 @@ class FeedsRepository(FeedsPort):
 
         return [FeedItem(**feed_item) for feed_item in result]
 
+    def get_active_feed_items_by_feed_id_and_period(
+        self,
+        feed_id: int,
+        start_time: datetime.datetime,
+        end_time: datetime.datetime
+    ) -> Iterator[FeedItem]:
+        sql = text(
+            "SELECT id, feed_id, external_id, link, title, description, author, created_at, "
+            "content, reading_time, image_url "
+            "FROM feed_items "
+            "WHERE feed_id = :feed_id AND is_active = TRUE "
+            "AND created_at > :start_time AND created_at < :end_time "
+            "ORDER BY created_at DESC;"
+        )
+        # rows are fetched in batches through a server-side cursor
+        result = self.db.execute(
+            sql,
+            {
+                "feed_id": feed_id,
+                "start_time": start_time.astimezone(datetime.UTC).replace(tzinfo=None),
+                "end_time": end_time.astimezone(datetime.UTC).replace(tzinfo=None),
+            },
+            execution_options={"yield_per": STREAM_BATCH_SIZE}
+        ).mappings()
+
+        for feed_item in result:
+            yield FeedItem(**feed_item)
+
     def get_feed_item_by_feed_item_external_id(
         self,
         feed_item_external_id: UUID
@@ -192,12 +224,90 @@ class FeedsRepository(FeedsPort):
             image_url=data["image_url"]
         )
 
+    def create_feed_items(self, feed_item_requests: list[FeedItemRequest]) -> list[int]:
+        # one statement for the whole batch, rows are inserted in the order of the requests
+        sql = text(
+            "INSERT INTO feed_items (feed_id, link, title, description, author, content, "
+            "reading_time, created_at, image_url) "
+            "SELECT feed_id, link, title, description, author, content, reading_time, "
+            "created_at, image_url FROM UNNEST("
+            "CAST(:feed_ids AS INTEGER[]), CAST(:links AS TEXT[]), CAST(:titles AS TEXT[]), "
+            "CAST(:descriptions AS TEXT[]), CAST(:authors AS TEXT[]), "
+            "CAST(:contents AS TEXT[]), CAST(:reading_times AS INTEGER[]), "
+            "CAST(:created_ats AS TIMESTAMP[]), CAST(:image_urls AS TEXT[])"
+            ") WITH ORDINALITY AS requests (feed_id, link, title, description, author, "
+            "content, reading_time, created_at, image_url, position) "
+            "ORDER BY position "
+            "RETURNING id"
+        )
+        now = datetime.datetime.now()
+        result = self.db.execute(
+            sql,
+            {
+                "feed_ids": [request.feed_id for request in feed_item_requests],
+                "links": [request.link for request in feed_item_requests],
+                "titles": [request.title for request in feed_item_requests],
+                "descriptions": [request.description for request in feed_item_requests],
+                "authors": [request.author for request in feed_item_requests],
+                "contents": [request.content for request in feed_item_requests],
+                "reading_times": [request.reading_time for request in feed_item_requests],
+                "created_ats": [request.created_at or now for request in feed_item_requests],
+                "image_urls": [request.image_url for request in feed_item_requests],
+            }
+        )
+        # so their serial ids are too, whatever order RETURNING uses
+        ids = sorted(row.id for row in result)
+        self.db.commit()
+        return ids
+
+    def update_feed_item_content(
+        self,
+        feed_item_id: int,
+        content: str,
+        reading_time: int,
+        image_url: str | None
+    ) -> bool:
+        sql = text(
+            "UPDATE feed_items "
+            "SET content = :content, reading_time = :reading_time, image_url = :image_url "
+            "WHERE id = :id "
+            "RETURNING id"
+        )
+        result = self.db.execute(
+            sql,
+            {
+                "id": feed_item_id,
+                "content": content,
+                "reading_time": reading_time,
+                "image_url": image_url
+            }
+        ).first()
+        self.db.commit()
+        return result is not None
+
     def delete_feed_item(self, feed_item_id: int) -> bool:
-        sql = text("DELETE FROM feed_items WHERE id = :id RETURNING id")
+        # the feed's updated_at versions its exports, so it moves with every item change
+        sql = text(
+            "WITH deleted AS (DELETE FROM feed_items WHERE id = :id RETURNING id, feed_id), "
+            "touched AS (UPDATE feeds SET updated_at = CURRENT_TIMESTAMP "
+            "WHERE id IN (SELECT feed_id FROM deleted)) "
+            "SELECT id FROM deleted"
+        )
         result = self.db.execute(sql, {"id": feed_item_id}).first()
         self.db.commit()
         return result is not None
 
+    def delete_feed_items_by_feed_id(self, feed_id: int) -> int:
+        sql = text(
+            "WITH deleted AS (DELETE FROM feed_items WHERE feed_id = :feed_id RETURNING id), "
+            "touched AS (UPDATE feeds SET updated_at = CURRENT_TIMESTAMP "
+            "WHERE id = :feed_id AND EXISTS (SELECT 1 FROM deleted)) "
+            "SELECT COUNT(*) FROM deleted"
+        )
+        result = self.db.execute(sql, {"feed_id": feed_id}).scalar()
+        self.db.commit()
+        return result
+
     def get_number_of_feed_items_by_feed_id(self, feed_id: int):
         sql = text("""
             SELECT COUNT(*)
@@ -210,10 +320,11 @@ class FeedsRepository(FeedsPort):
 
     def set_feed_item_as_inactive(self, feed_item_id: int):
         sql = text(
-            "UPDATE feed_items "
-            "SET is_active = FALSE "
-            "WHERE id = :id "
-            "RETURNING id"
+            "WITH deactivated AS (UPDATE feed_items SET is_active = FALSE "
+            "WHERE id = :id RETURNING id, feed_id), "
+            "touched AS (UPDATE feeds SET updated_at = CURRENT_TIMESTAMP "
+            "WHERE id IN (SELECT feed_id FROM deactivated)) "
+            "SELECT id FROM deactivated"
         )
         result = self.db.execute(sql, {"id": feed_item_id}).first()
         self.db.commit()
@@ -1,9 +1,11 @@
 from sqlalchemy import text
 from sqlalchemy.orm import Session
+from src.adapters.tracing import traced
 from src.domain.models.filter import Filter, FilterRequest
 from src.domain.ports.filters_port import FiltersPort
 
 
+@traced
 class FiltersRepository(FiltersPort):
 
     def __init__(self, db: Session):
@@ -51,3 +53,20 @@ class FiltersRepository(FiltersPort):
         return [
             Filter(**item._mapping) for item in result
         ]
+
+    def get_filters_by_picker_ids(self, picker_ids: list[int]) -> list[Filter]:
+        sql = text(
+            "SELECT id, picker_id, operation, args, created_at "
+            "FROM filters WHERE picker_id = ANY(:picker_ids) ORDER BY id;"
+        )
+        result = self.db.execute(sql, {"picker_ids": picker_ids})
+
+        return [
+            Filter(**item._mapping) for item in result
+        ]
+
+    def delete_filters_by_picker_ids(self, picker_ids: list[int]) -> int:
+        sql = text("DELETE FROM filters WHERE picker_id = ANY(:picker_ids)")
+        result = self.db.execute(sql, {"picker_ids": picker_ids})
+        self.db.commit()
+        return result.rowcount
@@ -0,0 +1,73 @@
+from datetime import datetime
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from src.adapters.tracing import traced
+from src.domain.models.picker_run import PickerRun, PickerRunRequest, SourceRunStats
+from src.domain.ports.picker_runs_port import PickerRunsPort
+
+
+@traced
+class PickerRunsRepository(PickerRunsPort):
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def create_picker_run(self, picker_run_request: PickerRunRequest) -> None:
+        # runs are recorded last on the run's session, every write of the run is committed by
+        # then and a run that failed on the database left its transaction aborted
+        self.db.rollback()
+        sql = text(
+            "INSERT INTO picker_runs "
+            "(picker_id, source_id, started_at, finished_at, entries_fetched, entries_new, "
+            "entries_filtered, entries_extracted, entries_inserted, bytes_downloaded, "
+            "status_code, error) "
+            "VALUES (:picker_id, :source_id, :started_at, :finished_at, :entries_fetched, "
+            ":entries_new, :entries_filtered, :entries_extracted, :entries_inserted, "
+            ":bytes_downloaded, :status_code, :error)"
+        )
+        self.db.execute(sql, picker_run_request.model_dump())
+        self.db.commit()
+
+    def get_picker_runs_by_picker_id(self, picker_id: int, limit: int) -> list[PickerRun]:
+        sql = text(
+            "SELECT id, picker_id, source_id, started_at, finished_at, entries_fetched, "
+            "entries_new, entries_filtered, entries_extracted, entries_inserted, "
+            "bytes_downloaded, status_code, error "
+            "FROM picker_runs WHERE picker_id = :picker_id "
+            "ORDER BY started_at DESC LIMIT :limit;"
+        )
+        result = self.db.execute(sql, {"picker_id": picker_id, "limit": limit}).mappings()
+        return [PickerRun(**row) for row in result]
+
+    def get_source_run_stats(self, since: datetime) -> list[SourceRunStats]:
+        # slowest sources first, the last error is the one of the latest failed run
+        sql = text(
+            "WITH runs AS ("
+            "SELECT source_id, started_at, error, entries_inserted, bytes_downloaded, "
+            "EXTRACT(EPOCH FROM finished_at - started_at) AS duration, "
+            "(error IS NOT NULL OR status_code >= 400) AS failed "
+            "FROM picker_runs WHERE started_at >= :since) "
+            "SELECT s.external_id AS source_external_id, s.url AS source_url, "
+            "COUNT(*) AS runs, "
+            "COUNT(*) FILTER (WHERE runs.failed) AS failed_runs, "
+            "PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY runs.duration) AS p50_duration, "
+            "PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY runs.duration) AS p95_duration, "
+            "MAX(runs.duration) AS max_duration, "
+            "SUM(runs.entries_inserted) AS entries_inserted, "
+            "SUM(runs.bytes_downloaded) AS bytes_downloaded, "
+            "MAX(runs.started_at) AS last_run_at, "
+            "(ARRAY_AGG(runs.error ORDER BY runs.started_at DESC) "
+            "FILTER (WHERE runs.error IS NOT NULL))[1] AS last_error "
+            "FROM runs JOIN sources s ON s.id = runs.source_id "
+            "GROUP BY s.id "
+            "ORDER BY p95_duration DESC;"
+        )
+        result = self.db.execute(sql, {"since": since}).mappings()
+        return [SourceRunStats(**row) for row in result]
+
+    def delete_picker_runs_before(self, before: datetime) -> int:
+        sql = text("DELETE FROM picker_runs WHERE started_at < :before")
+        result = self.db.execute(sql, {"before": before})
+        self.db.commit()
+        return result.rowcount
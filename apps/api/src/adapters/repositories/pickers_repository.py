@@ -1,11 +1,15 @@
+from datetime import datetime
 from uuid import UUID
 
 from sqlalchemy import text
 from sqlalchemy.orm import Session
-from src.domain.models.picker import Picker, PickerRequest
+from src.adapters.tracing import traced
+from src.domain.models.filter import Filter
+from src.domain.models.picker import Picker, PickerDefinition, PickerDetails, PickerRequest
 from src.domain.ports.pickers_port import PickersPort
 
 
+@traced
 class PickersRepository(PickersPort):
 
     def __init__(self, db: Session):
@@ -13,16 +17,20 @@ class PickersRepository(PickersPort):
 
     def create_picker(self, picker_request: PickerRequest) -> Picker:
         sql = text(
-            "INSERT INTO pickers (source_id, feed_id, cronjob) "
-            "VALUES (:source_id, :feed_id, :cronjob) "
-            "RETURNING id, external_id, source_id, feed_id, cronjob, created_at"
+            "INSERT INTO pickers "
+            "(source_id, feed_id, cronjob, min_poll_interval, max_poll_interval) "
+            "VALUES (:source_id, :feed_id, :cronjob, :min_poll_interval, :max_poll_interval) "
+            "RETURNING id, external_id, source_id, feed_id, cronjob, created_at, "
+            "min_poll_interval, max_poll_interval, poll_interval, last_entry_at"
         )
         result = self.db.execute(
             sql,
             {
                 "source_id": picker_request.source_id,
                 "feed_id": picker_request.feed_id,
-                "cronjob": picker_request.cronjob
+                "cronjob": picker_request.cronjob,
+                "min_poll_interval": picker_request.min_poll_interval,
+                "max_poll_interval": picker_request.max_poll_interval
             }
         ).first()
 
@@ -36,17 +44,200 @@ class PickersRepository(PickersPort):
             feed_id=data["feed_id"],
             cronjob=data["cronjob"],
             created_at=data["created_at"],
+            min_poll_interval=data["min_poll_interval"],
+            max_poll_interval=data["max_poll_interval"],
+            poll_interval=data["poll_interval"],
+            last_entry_at=data["last_entry_at"],
         )
 
+    def create_pickers(
+        self,
+        picker_definitions: list[PickerDefinition]
+    ) -> list[PickerDetails] | None:
+        # one transaction for everything, each table gets a single multi-row statement;
+        # rows are inserted in the order of the arrays, so sorted ids follow that order
+        try:
+            feeds = self._resolve_feeds(picker_definitions)
+            if feeds is None:
+                return None
+            source_ids = self._resolve_sources(picker_definitions)
+
+            result = self.db.execute(
+                text(
+                    "INSERT INTO pickers "
+                    "(source_id, feed_id, cronjob, min_poll_interval, max_poll_interval) "
+                    "SELECT source_id, feed_id, cronjob, min_poll_interval, max_poll_interval "
+                    "FROM UNNEST(CAST(:source_ids AS INTEGER[]), CAST(:feed_ids AS INTEGER[]), "
+                    "CAST(:cronjobs AS TEXT[]), CAST(:min_poll_intervals AS INTEGER[]), "
+                    "CAST(:max_poll_intervals AS INTEGER[])) "
+                    "WITH ORDINALITY AS definitions (source_id, feed_id, cronjob, "
+                    "min_poll_interval, max_poll_interval, position) "
+                    "ORDER BY position "
+                    "RETURNING id, external_id, source_id, feed_id, cronjob, created_at, "
+                    "min_poll_interval, max_poll_interval, poll_interval, last_entry_at"
+                ),
+                {
+                    "source_ids": [source_ids[d.source_url] for d in picker_definitions],
+                    "feed_ids": [feed[0] for feed in feeds],
+                    "cronjobs": [d.cronjob for d in picker_definitions],
+                    "min_poll_intervals": [d.min_poll_interval for d in picker_definitions],
+                    "max_poll_intervals": [d.max_poll_interval for d in picker_definitions],
+                }
+            ).mappings()
+            pickers = sorted((Picker(**row) for row in result), key=lambda picker: picker.id)
+
+            filter_rows = [
+                (picker.id, filter_definition)
+                for picker, definition in zip(pickers, picker_definitions, strict=True)
+                for filter_definition in definition.filters
+            ]
+            result = self.db.execute(
+                text(
+                    "INSERT INTO filters (picker_id, operation, args) "
+                    "SELECT picker_id, operation, args "
+                    "FROM UNNEST(CAST(:picker_ids AS INTEGER[]), "
+                    "CAST(:operations AS operation[]), CAST(:args AS TEXT[])) "
+                    "WITH ORDINALITY AS definitions (picker_id, operation, args, position) "
+                    "ORDER BY position "
+                    "RETURNING id, picker_id, operation, args, created_at"
+                ),
+                {
+                    "picker_ids": [picker_id for picker_id, _ in filter_rows],
+                    "operations": [f.operation.value for _, f in filter_rows],
+                    "args": [f.args for _, f in filter_rows],
+                }
+            ).mappings()
+            filters: dict[int, list[Filter]] = {}
+            for filter in sorted((Filter(**row) for row in result), key=lambda f: f.id):
+                filters.setdefault(filter.picker_id, []).append(filter)
+
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        return [
+            PickerDetails(
+                **picker.model_dump(),
+                source_url=definition.source_url,
+                feed_external_id=feed[1],
+                filters=filters.get(picker.id, [])
+            )
+            for picker, definition, feed in zip(pickers, picker_definitions, feeds, strict=True)
+        ]
+
+    def _resolve_feeds(
+        self,
+        picker_definitions: list[PickerDefinition]
+    ) -> list[tuple[int, UUID]] | None:
+        # the (id, external_id) of the feed of every definition, None if a given one is missing;
+        # definitions naming the same new feed share it, unnamed ones get a feed each; an empty
+        # name is no name, as in add_picker
+        keys = []
+        for index, definition in enumerate(picker_definitions):
+            if definition.feed_external_id is not None:
+                keys.append(("existing", definition.feed_external_id))
+            elif definition.feed_name:
+                keys.append(("named", definition.feed_name))
+            else:
+                keys.append(("unnamed", index))
+
+        feeds: dict[tuple, tuple[int, UUID]] = {}
+        external_ids = {value for kind, value in keys if kind == "existing"}
+        if external_ids:
+            result = self.db.execute(
+                text(
+                    "SELECT id, external_id FROM feeds "
+                    "WHERE external_id = ANY(CAST(:external_ids AS UUID[]))"
+                ),
+                {"external_ids": list(external_ids)}
+            )
+            feeds = {("existing", row.external_id): (row.id, row.external_id) for row in result}
+            if len(feeds) < len(external_ids):
+                return None
+
+        new_keys = list(dict.fromkeys(key for key in keys if key[0] != "existing"))
+        if new_keys:
+            result = self.db.execute(
+                text(
+                    "INSERT INTO feeds (name) "
+                    "SELECT name FROM UNNEST(CAST(:names AS TEXT[])) "
+                    "WITH ORDINALITY AS definitions (name, position) "
+                    "ORDER BY position "
+                    "RETURNING id, external_id"
+                ),
+                {"names": [value if kind == "named" else None for kind, value in new_keys]}
+            )
+            rows = sorted(result, key=lambda row: row.id)
+            feeds.update({
+                key: (row.id, row.external_id) for key, row in zip(new_keys, rows, strict=True)
+            })
+
+        return [feeds[key] for key in keys]
+
+    def _resolve_sources(self, picker_definitions: list[PickerDefinition]) -> dict[str, int]:
+        # existing sources are reused by url, the first one wins as in get_source_by_url
+        names = {d.source_url: d.source_name for d in reversed(picker_definitions)}
+        result = self.db.execute(
+            text(
+                "SELECT DISTINCT ON (url) id, url FROM sources "
+                "WHERE url = ANY(CAST(:urls AS TEXT[])) ORDER BY url, id"
+            ),
+            {"urls": list(names)}
+        )
+        source_ids = {row.url: row.id for row in result}
+        new_urls = [url for url in names if url not in source_ids]
+        if new_urls:
+            result = self.db.execute(
+                text(
+                    "INSERT INTO sources (url, name) "
+                    "SELECT url, name FROM UNNEST(CAST(:urls AS TEXT[]), CAST(:names AS TEXT[])) "
+                    "WITH ORDINALITY AS definitions (url, name, position) "
+                    "ORDER BY position "
+                    "RETURNING id"
+                ),
+                {"urls": new_urls, "names": [names[url] for url in new_urls]}
+            )
+            source_ids.update(zip(new_urls, sorted(row.id for row in result), strict=True))
+        return source_ids
+
+    def update_picker_polling(
+        self,
+        picker_id: int,
+        poll_interval: int,
+        last_entry_at: datetime | None
+    ) -> None:
+        sql = text(
+            "UPDATE pickers "
+            "SET poll_interval = :poll_interval, last_entry_at = :last_entry_at "
+            "WHERE id = :id"
+        )
+        self.db.execute(
+            sql,
+            {
+                "id": picker_id,
+                "poll_interval": poll_interval,
+                "last_entry_at": last_entry_at
+            }
+        )
+        self.db.commit()
+
     def delete_picker(self, picker_id: int) -> bool:
         sql = text("DELETE FROM pickers WHERE id = :id RETURNING id")
         result = self.db.execute(sql, {"id": picker_id}).first()
         self.db.commit()
         return result is not None
 
+    def delete_pickers_by_feed_id(self, feed_id: int) -> int:
+        sql = text("DELETE FROM pickers WHERE feed_id = :feed_id")
+        result = self.db.execute(sql, {"feed_id": feed_id})
+        self.db.commit()
+        return result.rowcount
+
     def get_picker_by_external_id(self, external_id: UUID) -> Picker | None:
         sql = text(
-            "SELECT id, external_id, source_id, feed_id, cronjob, created_at "
+            "SELECT id, external_id, source_id, feed_id, cronjob, created_at, "
+            "min_poll_interval, max_poll_interval, poll_interval, last_entry_at "
             "FROM pickers WHERE external_id = :external_id;"
         )
         result = self.db.execute(sql, {"external_id": external_id}).mappings().first()
@@ -57,7 +248,8 @@ class PickersRepository(PickersPort):
 
     def get_picker_by_id(self, picker_id: int) -> Picker | None:
         sql = text(
-            "SELECT id, external_id, source_id, feed_id, cronjob, created_at "
+            "SELECT id, external_id, source_id, feed_id, cronjob, created_at, "
+            "min_poll_interval, max_poll_interval, poll_interval, last_entry_at "
             "FROM pickers WHERE id = :picker_id;"
         )
         result = self.db.execute(sql, {"picker_id": picker_id}).mappings().first()
@@ -71,7 +263,8 @@ class PickersRepository(PickersPort):
         feed_id: int
     ) -> list[Picker]:
         sql = text(
-            "SELECT id, external_id, source_id, feed_id, cronjob, created_at "
+            "SELECT id, external_id, source_id, feed_id, cronjob, created_at, "
+            "min_poll_interval, max_poll_interval, poll_interval, last_entry_at "
             "FROM pickers WHERE feed_id = :feed_id;"
         )
         result = self.db.execute(sql, {"feed_id": feed_id}).mappings()
@@ -80,7 +273,8 @@ class PickersRepository(PickersPort):
 
     def get_all_pickers(self) -> list[Picker]:
         sql = text(
-            "SELECT id, external_id, source_id, feed_id, cronjob, created_at "
+            "SELECT id, external_id, source_id, feed_id, cronjob, created_at, "
+            "min_poll_interval, max_poll_interval, poll_interval, last_entry_at "
             "FROM pickers;"
         )
         result = self.db.execute(sql).mappings()
@@ -89,7 +283,8 @@ class PickersRepository(PickersPort):
 
     def get_picker_by_source_id(self, source_id: int) -> list[Picker]:
         sql = text(
-            "SELECT id, external_id, source_id, feed_id, cronjob, created_at "
+            "SELECT id, external_id, source_id, feed_id, cronjob, created_at, "
+            "min_poll_interval, max_poll_interval, poll_interval, last_entry_at "
             "FROM pickers WHERE source_id = :source_id;"
         )
         result = self.db.execute(sql, {"source_id": source_id}).mappings()
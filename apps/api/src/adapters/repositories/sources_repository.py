@@ -2,10 +2,13 @@ from uuid import UUID
 
 from sqlalchemy import text
 from sqlalchemy.orm import Session
+from src.adapters.tracing import traced
+from src.domain.models.opml import OpmlOutline
 from src.domain.models.source import Source, SourceRequest
 from src.domain.ports.sources_port import SourcePort
 
 
+@traced
 class SourcesRepository(SourcePort):
 
     def __init__(self, db: Session):
@@ -35,6 +38,27 @@ class SourcesRepository(SourcePort):
             created_at=result["created_at"],
         )
 
+    def create_sources(self, source_requests: list[SourceRequest]) -> list[Source]:
+        # a single multi-row statement, rows are inserted in the order of the arrays
+        sql = text(
+            "INSERT INTO sources (url, name) "
+            "SELECT url, name "
+            "FROM UNNEST(CAST(:urls AS TEXT[]), CAST(:names AS TEXT[])) "
+            "WITH ORDINALITY AS requests (url, name, position) "
+            "ORDER BY position "
+            "RETURNING id, external_id, url, name, created_at"
+        )
+        result = self.db.execute(
+            sql,
+            {
+                "urls": [source_request.url for source_request in source_requests],
+                "names": [source_request.name for source_request in source_requests],
+            }
+        ).mappings()
+        sources = sorted((Source(**row) for row in result), key=lambda source: source.id)
+        self.db.commit()
+        return sources
+
     def update_source(self, source_id: int, source_request: SourceRequest) -> Source:
         sql = text(
             "UPDATE sources "
@@ -67,7 +91,10 @@ class SourcesRepository(SourcePort):
         return result is not None
 
     def get_all_sources(self) -> list[Source]:
-        sql = text("SELECT id, external_id, url, name, created_at FROM sources")
+        sql = text(
+            "SELECT id, external_id, url, name, created_at "
+            "FROM sources"
+        )
         result = self.db.execute(sql)
 
         if result:
@@ -115,3 +142,41 @@ class SourcesRepository(SourcePort):
         if result:
             return Source(**result)
         return None
+
+    def get_sources_by_ids(self, ids: list[int]) -> list[Source]:
+        sql = text(
+            "SELECT id, external_id, url, name, created_at "
+            "FROM sources WHERE id = ANY(:ids);"
+        )
+        result = self.db.execute(sql, {"ids": ids})
+
+        return [
+            Source(**item._mapping) for item in result
+        ]
+
+    def get_sources_by_urls(self, urls: list[str]) -> list[Source]:
+        sql = text(
+            "SELECT id, external_id, url, name, created_at "
+            "FROM sources WHERE url = ANY(:urls) ORDER BY id;"
+        )
+        result = self.db.execute(sql, {"urls": urls})
+
+        return [
+            Source(**item._mapping) for item in result
+        ]
+
+    def get_source_outlines(self) -> list[OpmlOutline]:
+        # a source is listed under the name of every feed its pickers write to
+        sql = text(
+            "SELECT DISTINCT s.id, s.url, s.name AS title, f.name AS category "
+            "FROM sources s "
+            "LEFT JOIN pickers p ON p.source_id = s.id "
+            "LEFT JOIN feeds f ON f.id = p.feed_id "
+            "ORDER BY category NULLS FIRST, s.id;"
+        )
+        result = self.db.execute(sql).mappings()
+
+        return [
+            OpmlOutline(url=row["url"], title=row["title"], category=row["category"])
+            for row in result
+        ]
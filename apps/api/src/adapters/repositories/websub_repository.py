@@ -0,0 +1,83 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from src.adapters.tracing import traced
+from src.domain.models.websub import WebSubSubscription, WebSubSubscriptionRequest
+from src.domain.ports.websub_port import WebSubPort
+
+
+@traced
+class WebSubRepository(WebSubPort):
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def save_subscription(
+        self,
+        subscription_request: WebSubSubscriptionRequest
+    ) -> WebSubSubscription:
+        # a source has a single subscription, renewing it keeps the current lease until verified
+        sql = text(
+            "INSERT INTO websub_subscriptions "
+            "(source_id, hub_url, topic_url, secret, requested_at) "
+            "VALUES (:source_id, :hub_url, :topic_url, :secret, :requested_at) "
+            "ON CONFLICT (source_id) DO UPDATE SET "
+            "hub_url = EXCLUDED.hub_url, topic_url = EXCLUDED.topic_url, "
+            "secret = EXCLUDED.secret, requested_at = EXCLUDED.requested_at "
+            "RETURNING id, external_id, source_id, hub_url, topic_url, secret, "
+            "lease_expires_at, requested_at, created_at"
+        )
+        result = self.db.execute(
+            sql,
+            {
+                "source_id": subscription_request.source_id,
+                "hub_url": subscription_request.hub_url,
+                "topic_url": subscription_request.topic_url,
+                "secret": subscription_request.secret,
+                "requested_at": subscription_request.requested_at
+            }
+        ).mappings().first()
+        self.db.commit()
+
+        return WebSubSubscription(**result)
+
+    def get_subscription_by_source_id(self, source_id: int) -> WebSubSubscription | None:
+        sql = text(
+            "SELECT id, external_id, source_id, hub_url, topic_url, secret, "
+            "lease_expires_at, requested_at, created_at "
+            "FROM websub_subscriptions WHERE source_id = :source_id;"
+        )
+        result = self.db.execute(sql, {"source_id": source_id}).mappings().first()
+
+        if result:
+            return WebSubSubscription(**result)
+        return None
+
+    def get_subscription_by_external_id(
+        self,
+        external_id: UUID
+    ) -> WebSubSubscription | None:
+        sql = text(
+            "SELECT id, external_id, source_id, hub_url, topic_url, secret, "
+            "lease_expires_at, requested_at, created_at "
+            "FROM websub_subscriptions WHERE external_id = :external_id;"
+        )
+        result = self.db.execute(sql, {"external_id": external_id}).mappings().first()
+
+        if result:
+            return WebSubSubscription(**result)
+        return None
+
+    def set_lease_expires_at(
+        self,
+        subscription_id: int,
+        lease_expires_at: datetime | None
+    ) -> None:
+        sql = text(
+            "UPDATE websub_subscriptions SET lease_expires_at = :lease_expires_at "
+            "WHERE id = :id"
+        )
+        self.db.execute(sql, {"id": subscription_id, "lease_expires_at": lease_expires_at})
+        self.db.commit()
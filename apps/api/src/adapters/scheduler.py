@@ -1,49 +1,344 @@
-from apscheduler.jobstores.base import JobLookupError
+import logging
+import threading
+import zlib
+from concurrent import futures
+from datetime import UTC, datetime, timedelta
+
+from apscheduler.events import EVENT_JOB_MAX_INSTANCES, EVENT_JOB_MISSED, JobEvent
+from apscheduler.executors.base import MaxInstancesReachedError, run_job
+from apscheduler.executors.pool import BasePoolExecutor
+from apscheduler.jobstores.base import BaseJobStore, JobLookupError
+from apscheduler.jobstores.memory import MemoryJobStore
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.base import STATE_STOPPED
+from apscheduler.triggers.base import BaseTrigger
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+from src.adapters.prometheus_metrics import SCHEDULER_JOB_LAG
+from src.adapters.query_counter import report_queries, track_queries
+from src.adapters.tracing import tracer
+from src.configs.settings import Settings
 from src.domain.handlers import HANDLERS
-from src.domain.models.job import Job
+from src.domain.models.job import Job, SchedulerMetrics
 from src.domain.ports.scheduler_port import SchedulerPort
 
+settings: Settings = Settings()
+
+logger = logging.getLogger(__name__)
+
+INTERVAL_SAMPLES = 16
+JOBSTORE_TABLE = "apscheduler_jobs"
+
+# persisted jobs reference their handler by name, the running process provides its dependencies
+_handler_dependencies: dict = {}
+
+
+def run_handler(func_name: str, *args):
+    attributes = {"job.args": [str(arg) for arg in args]}
+    with (
+        tracer.start_as_current_span(func_name, attributes=attributes),
+        track_queries() as query_stats
+    ):
+        HANDLERS[func_name](*args, **_handler_dependencies)
+    report_queries(f"Job {func_name}{tuple(args)}", query_stats)
+
+
+class OffsetTrigger(BaseTrigger):
+    """Fires a fixed number of seconds after every fire time of the wrapped trigger."""
+
+    def __init__(self, trigger: BaseTrigger, offset: float):
+        self.trigger = trigger
+        self.offset = offset
+
+    def get_next_fire_time(self, previous_fire_time, now):
+        delta = timedelta(seconds=self.offset)
+        next_fire_time = self.trigger.get_next_fire_time(
+            previous_fire_time - delta if previous_fire_time else None,
+            now - delta
+        )
+        return next_fire_time + delta if next_fire_time else None
+
+    def __str__(self):
+        return f"{self.trigger} + {self.offset:g}s"
+
+    def __repr__(self):
+        return f"<OffsetTrigger ({self.trigger!r}, offset={self.offset:g})>"
+
+
+class StoppableBackgroundScheduler(BackgroundScheduler):
+    """Background scheduler that leaves due jobs alone once it is shut down."""
+
+    def _process_jobs(self):
+        # APScheduler goes through due jobs once more after shutdown, and since the executors
+        # are gone by then, their runs would be dropped from a persistent job store
+        if self.state == STATE_STOPPED:
+            return None
+        return super()._process_jobs()
+
+
+class BoundedThreadPoolExecutor(BasePoolExecutor):
+    """Thread pool that skips runs once too many are waiting for a free thread."""
+
+    def __init__(self, max_workers: int, max_queued_runs: int, late_run_threshold: float):
+        super().__init__(futures.ThreadPoolExecutor(max_workers))
+        self.max_queued_runs = max_queued_runs
+        self.late_run_threshold = late_run_threshold
+        self.metrics = SchedulerMetrics()
+        self.metrics_lock = threading.Lock()
+
+    def submit_job(self, job, run_times):
+        if self.metrics.queued_runs >= self.max_queued_runs:
+            logger.warning('Run queue is full, skipping job "%s"', job)
+            # the scheduler reports it like any other skipped run
+            raise MaxInstancesReachedError(job)
+        super().submit_job(job, run_times)
+
+    def _do_submit_job(self, job, run_times):
+        def callback(future):
+            exc = future.exception()
+            if exc:
+                self._run_job_error(job.id, exc, exc.__traceback__)
+            else:
+                self._run_job_success(job.id, future.result())
+
+        self.count("queued_runs")
+        self._pool.submit(self._run_job, job, run_times).add_done_callback(callback)
+
+    def _run_job(self, job, run_times):
+        delay = (datetime.now(UTC) - run_times[-1]).total_seconds()
+        SCHEDULER_JOB_LAG.observe(max(delay, 0))
+        with self.metrics_lock:
+            self.metrics.queued_runs -= 1
+            self.metrics.running_runs += 1
+            self.metrics.max_start_delay = max(self.metrics.max_start_delay, delay)
+            # runs beyond the misfire grace time are dropped by run_job and counted as missed
+            grace_time = job.misfire_grace_time
+            if self.late_run_threshold < delay and (grace_time is None or delay <= grace_time):
+                self.metrics.late_runs += 1
+        try:
+            return run_job(job, job._jobstore_alias, run_times, self._logger.name)
+        finally:
+            self.count("running_runs", -1)
+
+    def count(self, metric: str, value: int = 1):
+        with self.metrics_lock:
+            setattr(self.metrics, metric, getattr(self.metrics, metric) + value)
+
+    def get_metrics(self) -> SchedulerMetrics:
+        with self.metrics_lock:
+            return self.metrics.model_copy()
+
 
 class Scheduler(SchedulerPort):
-    def __init__(self):
-        self.scheduler = BackgroundScheduler()
+    def __init__(
+        self,
+        jitter_mode: str = settings.SCHEDULER_JITTER_MODE,
+        max_jitter: int = settings.SCHEDULER_MAX_JITTER,
+        jobstore: str = settings.SCHEDULER_JOBSTORE
+    ):
+        self.executor = BoundedThreadPoolExecutor(
+            max_workers=settings.SCHEDULER_EXECUTOR_THREADS,
+            max_queued_runs=settings.SCHEDULER_MAX_QUEUED_RUNS,
+            late_run_threshold=settings.SCHEDULER_LATE_RUN_THRESHOLD
+        )
+        self.scheduler = StoppableBackgroundScheduler(
+            jobstores={"default": _build_jobstore(jobstore)},
+            executors={"default": self.executor},
+            job_defaults={
+                "max_instances": settings.SCHEDULER_MAX_INSTANCES,
+                "coalesce": settings.SCHEDULER_COALESCE,
+                "misfire_grace_time": settings.SCHEDULER_MISFIRE_GRACE_TIME,
+            }
+        )
+        self.scheduler.add_listener(
+            self._on_run_dropped,
+            EVENT_JOB_MAX_INSTANCES | EVENT_JOB_MISSED
+        )
+        self.jitter_mode = jitter_mode
+        self.max_jitter = max_jitter
+        # jobs change from request handlers, the picker changes listener and running jobs
+        self.lock = threading.RLock()
+        self.schedules: dict[str, str] = {}
+        self.intervals: dict[str, int | None] = {}
+        self.jitter_keys: dict[str, str] = {}
+        self.offsets: dict[str, float] = {}
+        self.adopted_persisted_jobs = False
 
-    def start(self):
-        self.scheduler.start()
+    def start(self, paused: bool = False):
+        self.scheduler.start(paused=paused)
 
     def shutdown(self):
         self.scheduler.shutdown()
 
+    def pause(self):
+        self.scheduler.pause()
+
+    def resume(self):
+        self.scheduler.resume()
+
+    def get_metrics(self) -> SchedulerMetrics:
+        return self.executor.get_metrics()
+
+    def get_job_count(self) -> int:
+        return len(self.schedules)
+
+    def set_handler_dependencies(self, **dependencies) -> None:
+        _handler_dependencies.update(dependencies)
+
+    def _on_run_dropped(self, event: JobEvent):
+        self.executor.count("missed_runs" if event.code == EVENT_JOB_MISSED else "skipped_runs")
+
     def _build_job_id(self, job: Job) -> str:
         args_str = "_".join(map(str, job.args)) if job.args else "noargs"
         return f"{job.func_name}_{args_str}".replace(" ", "_")
 
     def add_job(self, job: Job) -> None:
-        func = HANDLERS.get(job.func_name)
-        if not func:
-            print(f"Function {job.func_name} not found")
-            return
+        with self.lock:
+            if self._add_job(job) and self.jitter_mode == "spread":
+                self._spread(job.schedule)
+
+    def load_jobs(self, jobs: list[Job]) -> None:
+        # only jobs that are new, changed or gone touch the scheduler, so reloading is cheap
+        jobs_by_id = {self._build_job_id(job): job for job in jobs}
+        changed_schedules = set()
+        with self.lock:
+            if not self.adopted_persisted_jobs:
+                self._adopt_persisted_jobs(jobs_by_id)
+                self.adopted_persisted_jobs = True
+                changed_schedules.update(self.schedules.values())
+            for job_id in set(self.schedules) - set(jobs_by_id):
+                changed_schedules.add(self.schedules[job_id])
+                self._remove_job(job_id)
+            for job_id, job in jobs_by_id.items():
+                if (
+                    self.schedules.get(job_id) != job.schedule
+                    or self.intervals.get(job_id) != job.interval
+                ):
+                    changed_schedules.add(self.schedules.get(job_id))
+                    if self._add_job(job):
+                        changed_schedules.add(job.schedule)
+            if self.jitter_mode == "spread":
+                for schedule in changed_schedules - {None}:
+                    self._spread(schedule)
 
+    def delete_job(self, job: Job) -> None:
         job_id = self._build_job_id(job)
+        with self.lock:
+            schedule = self.schedules.get(job_id)
+            self._remove_job(job_id)
+            if schedule and self.jitter_mode == "spread":
+                self._spread(schedule)
 
+    def _add_job(self, job: Job) -> bool:
+        if job.func_name not in HANDLERS:
+            print(f"Function {job.func_name} not found")
+            return False
+
+        job_id = self._build_job_id(job)
+        trigger, offset = self._build_trigger(job)
         self.scheduler.add_job(
-            func=func,
-            trigger=CronTrigger.from_crontab(job.schedule),
-            args=job.args,
+            func=f"{__name__}:run_handler",
+            trigger=OffsetTrigger(trigger, offset) if offset else trigger,
+            args=[job.func_name, *job.args],
             id=job_id,
             replace_existing=True,
         )
+        self._track_job(job_id, job, offset)
+        return True
 
-    def load_jobs(self, jobs: list[Job]) -> None:
-        for job in jobs:
-            self.add_job(job)
+    def _build_trigger(self, job: Job) -> tuple[BaseTrigger, float]:
+        if job.interval:
+            # adaptive jobs run at an interval measured from when they were (re)scheduled
+            return IntervalTrigger(seconds=job.interval), 0.0
+        trigger = CronTrigger.from_crontab(job.schedule)
+        offset = 0.0
+        if self.jitter_mode == "jitter":
+            offset = self._jitter(self._jitter_key(job), min(self.max_jitter, _interval(trigger)))
+        return trigger, offset
 
-    def delete_job(self, job: Job) -> None:
-        job_id = self._build_job_id(job)
+    def _track_job(self, job_id: str, job: Job, offset: float) -> None:
+        self.schedules[job_id] = job.schedule
+        self.intervals[job_id] = job.interval
+        self.jitter_keys[job_id] = self._jitter_key(job)
+        self.offsets[job_id] = offset
+
+    @staticmethod
+    def _jitter_key(job: Job) -> str:
+        # the first argument is the picker id, which unlike the job id is stable across processes
+        return str(job.args[0]) if job.args else job.func_name
+
+    def _adopt_persisted_jobs(self, jobs_by_id: dict[str, Job]) -> None:
+        # unchanged jobs keep their next run time, so runs missed while stopped still happen
+        for persisted_job in self.scheduler.get_jobs():
+            job = jobs_by_id.get(persisted_job.id)
+            if job is None:
+                self._remove_job(persisted_job.id)
+                continue
+            trigger, offset = persisted_job.trigger, 0.0
+            if isinstance(trigger, OffsetTrigger):
+                trigger, offset = trigger.trigger, trigger.offset
+            expected_trigger, expected_offset = self._build_trigger(job)
+            if str(trigger) != str(expected_trigger):
+                continue
+            if self.jitter_mode != "spread" and offset != expected_offset:
+                continue
+            self._track_job(persisted_job.id, job, offset)
+
+    def _spread(self, schedule: str) -> None:
+        # jobs sharing a schedule are placed evenly across its interval, ordered by their key
+        job_ids = sorted(
+            (
+                job_id for job_id, other in self.schedules.items()
+                if other == schedule and not self.intervals[job_id]
+            ),
+            key=lambda job_id: (self.jitter_keys[job_id], job_id)
+        )
+        if not job_ids:
+            return
+        trigger = CronTrigger.from_crontab(schedule)
+        step = _interval(trigger) / len(job_ids)
+        for index, job_id in enumerate(job_ids):
+            offset = index * step
+            if self.offsets[job_id] == offset:
+                continue
+            self.scheduler.reschedule_job(
+                job_id,
+                trigger=OffsetTrigger(trigger, offset) if offset else trigger
+            )
+            self.offsets[job_id] = offset
+
+    @staticmethod
+    def _jitter(jitter_key: str, max_jitter: float) -> float:
+        return zlib.crc32(jitter_key.encode("utf-8")) / 2**32 * max_jitter
+
+    def _remove_job(self, job_id: str) -> None:
+        self.schedules.pop(job_id, None)
+        self.intervals.pop(job_id, None)
+        self.jitter_keys.pop(job_id, None)
+        self.offsets.pop(job_id, None)
         try:
             self.scheduler.remove_job(job_id)
             print(f"Removed job: {job_id}")
         except JobLookupError:
             print(f"Job {job_id} not found in scheduler.")
+
+
+def _build_jobstore(jobstore: str) -> BaseJobStore:
+    if jobstore == "sqlalchemy":
+        return SQLAlchemyJobStore(url=settings.DATABASE_URL, tablename=JOBSTORE_TABLE)
+    return MemoryJobStore()
+
+
+def _interval(trigger: CronTrigger) -> float:
+    # the shortest gap between fire times, sampled from a fixed date so every process agrees
+    fire_time = trigger.get_next_fire_time(None, datetime(2000, 1, 3, tzinfo=trigger.timezone))
+    shortest = None
+    for _ in range(INTERVAL_SAMPLES):
+        next_fire_time = trigger.get_next_fire_time(fire_time, fire_time)
+        if next_fire_time is None:
+            break
+        gap = (next_fire_time - fire_time).total_seconds()
+        shortest = gap if shortest is None else min(shortest, gap)
+        fire_time = next_fire_time
+    return shortest or 0.0
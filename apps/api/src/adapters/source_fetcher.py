@@ -0,0 +1,48 @@
+import logging
+
+import feedparser
+import requests
+from opentelemetry.trace import SpanKind
+from src.adapters.tracing import tracer
+from src.configs.settings import Settings
+from src.domain.models.source import SourceResponse
+from src.domain.ports.source_fetcher_port import SourceFetcherPort
+
+settings: Settings = Settings()
+
+logger = logging.getLogger(__name__)
+
+# sources see the same client as when feedparser fetched them itself, they are third parties
+# and get no trace context
+HEADERS = {
+    "User-Agent": feedparser.USER_AGENT,
+    "Accept": feedparser.http.ACCEPT_HEADER,
+}
+
+
+class HttpSourceFetcher(SourceFetcherPort):
+
+    def fetch(self, url: str) -> SourceResponse | None:
+        with tracer.start_as_current_span(
+            "source.fetch", kind=SpanKind.CLIENT, attributes={"url.full": url}
+        ) as span:
+            try:
+                response = requests.get(
+                    url,
+                    headers=HEADERS,
+                    timeout=settings.SOURCE_FETCH_TIMEOUT
+                )
+            except requests.RequestException as error:
+                logger.warning("Fetching source %s failed: %s", url, error)
+                span.record_exception(error)
+                return None
+            span.set_attribute("http.response.status_code", response.status_code)
+            span.set_attribute("http.response.body.size", len(response.content))
+        headers = {name.lower(): value for name, value in response.headers.items()}
+        # feedparser resolves relative links against it, as it did with the url
+        headers.setdefault("content-location", response.url)
+        return SourceResponse(
+            status_code=response.status_code,
+            content=response.content,
+            headers=headers
+        )
@@ -0,0 +1,67 @@
+import functools
+import inspect
+import os
+
+from opentelemetry import propagate, trace
+from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    ConsoleSpanExporter,
+    SpanExporter,
+)
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+from src.configs.settings import Settings
+
+settings: Settings = Settings()
+
+# spans are dropped by the no-op provider until configure_tracing installs one
+tracer = trace.get_tracer("nebulapicker")
+
+
+def configure_tracing(service_name: str) -> TracerProvider | None:
+    if settings.TRACING_EXPORTER == "none":
+        return None
+    provider = TracerProvider(
+        resource=Resource.create({SERVICE_NAME: service_name}),
+        # a sampled API request keeps every span of the work it triggers
+        sampler=ParentBased(TraceIdRatioBased(settings.TRACING_SAMPLE_RATIO))
+    )
+    provider.add_span_processor(BatchSpanProcessor(_build_exporter()))
+    trace.set_tracer_provider(provider)
+    return provider
+
+
+def _build_exporter() -> SpanExporter:
+    if settings.TRACING_EXPORTER == "file":
+        # one span per line, for offline analysis
+        return ConsoleSpanExporter(
+            out=open(settings.TRACING_FILE_PATH, "a", encoding="utf-8"),
+            formatter=lambda span: span.to_json(indent=None) + os.linesep
+        )
+    # the exporter pulls in protobuf, so it is only imported when used
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+    return OTLPSpanExporter(endpoint=settings.TRACING_OTLP_ENDPOINT)
+
+
+def inject_context(headers: dict[str, str]) -> dict[str, str]:
+    propagate.inject(headers)
+    return headers
+
+
+def traced(cls: type) -> type:
+    """Runs each public method of the class in a span named after it."""
+    for name, method in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(method):
+            continue
+        setattr(cls, name, _traced_method(f"{cls.__name__}.{name}", method))
+    return cls
+
+
+def _traced_method(span_name: str, method):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        with tracer.start_as_current_span(span_name):
+            return method(*args, **kwargs)
+    return wrapper
@@ -1,5 +1,6 @@
 import requests
-from ftfy import fix_text
+from src.adapters.prometheus_metrics import EXTRACTOR_DURATION
+from src.adapters.tracing import inject_context, traced
 from src.configs.settings import Settings
 from src.domain.models.feed import (
     FeedItemContent,
@@ -13,6 +14,7 @@ settings: Settings = Settings()
 MINIMUM_CONTENT_LEN = 200
 
 
+@traced
 class WallabagExtractor(ExtractorPort):
     def __init__(self):
         self.access_token = ""
@@ -25,9 +27,12 @@ class WallabagExtractor(ExtractorPort):
     def get_feed_item_content(self,
         feed_item_content_request: GetFeedItemContentRequest
     ) -> FeedItemContent | None:
+        # only needed when extraction is enabled and slow to import
+        from ftfy import fix_text
 
         try:
-            entry_data = self._get_entry_data(feed_item_content_request.url)
+            with EXTRACTOR_DURATION.labels(operation="content").time():
+                entry_data = self._get_entry_data(feed_item_content_request.url)
             try:
                 title = fix_text(entry_data["title"])
             except Exception:
@@ -47,11 +52,11 @@ class WallabagExtractor(ExtractorPort):
                 reading_time = entry_data.get("reading_time")
 
             # Remove wallabag entry
-            headers = {
+            headers = inject_context({
                 "Authorization": f"Bearer {self.access_token}",
                 "Accept": "application/json",
                 "Content-Type": "application/x-www-form-urlencoded"
-            }
+            })
             requests.delete(
                 f"{self.base_url}/api/entries/{entry_data['id']}",
                 headers=headers,
@@ -72,7 +77,8 @@ class WallabagExtractor(ExtractorPort):
         get_feed_item_image_url_request: GetFeedItemImageUrlRequest
     ) -> FeedItemImageUrl | None:
         try:
-            entry_data = self._get_entry_data(get_feed_item_image_url_request.url)
+            with EXTRACTOR_DURATION.labels(operation="image").time():
+                entry_data = self._get_entry_data(get_feed_item_image_url_request.url)
             return entry_data["preview_picture"]
 
         except Exception:
@@ -90,18 +96,18 @@ class WallabagExtractor(ExtractorPort):
             "password": self.password
         }
 
-        response = requests.post(token_url, data=payload, timeout=10)
+        response = requests.post(token_url, headers=inject_context({}), data=payload, timeout=10)
         response.raise_for_status()
         token_data = response.json()
         self.access_token = token_data.get("access_token")
 
         # Create and get wallabag entry
         entry_url = url
-        headers = {
+        headers = inject_context({
             "Authorization": f"Bearer {self.access_token}",
             "Accept": "application/json",
             "Content-Type": "application/x-www-form-urlencoded"
-        }
+        })
         payload = {
             "url": entry_url,
         }
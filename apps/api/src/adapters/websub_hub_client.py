@@ -0,0 +1,45 @@
+import logging
+
+import requests
+from src.domain.ports.websub_hub_port import WebSubHubPort
+
+logger = logging.getLogger(__name__)
+
+REQUEST_TIMEOUT = 15
+
+
+class WebSubHubClient(WebSubHubPort):
+
+    def subscribe(
+        self,
+        hub_url: str,
+        topic_url: str,
+        callback_url: str,
+        secret: str,
+        lease_seconds: int
+    ) -> bool:
+        try:
+            response = requests.post(
+                hub_url,
+                data={
+                    "hub.mode": "subscribe",
+                    "hub.topic": topic_url,
+                    "hub.callback": callback_url,
+                    "hub.secret": secret,
+                    "hub.lease_seconds": lease_seconds,
+                },
+                timeout=REQUEST_TIMEOUT,
+            )
+        except requests.RequestException:
+            logger.exception("WebSub subscription request to %s failed", hub_url)
+            return False
+        # hubs accept with 202 and verify the intent asynchronously through the callback
+        if response.status_code not in (202, 204):
+            logger.warning(
+                "WebSub hub %s refused subscription to %s: %s",
+                hub_url,
+                topic_url,
+                response.status_code
+            )
+            return False
+        return True
@@ -2,8 +2,10 @@ from fastapi import Depends
 from sqlalchemy.orm import Session
 from src.adapters.repositories.feeds_repository import FeedsRepository
 from src.adapters.repositories.filters_repository import FiltersRepository
+from src.adapters.repositories.picker_runs_repository import PickerRunsRepository
 from src.adapters.repositories.pickers_repository import PickersRepository
 from src.adapters.repositories.sources_repository import SourcesRepository
+from src.adapters.repositories.websub_repository import WebSubRepository
 from src.configs.database import get_db
 
 
@@ -18,3 +20,9 @@ def get_filters_repository(db: Session = Depends(get_db)) -> FiltersRepository:
 
 def get_pickers_repository(db: Session = Depends(get_db)) -> PickersRepository: # noqa: B008
     return PickersRepository(db)
+
+def get_websub_repository(db: Session = Depends(get_db)) -> WebSubRepository: # noqa: B008
+    return WebSubRepository(db)
+
+def get_picker_runs_repository(db: Session = Depends(get_db)) -> PickerRunsRepository: # noqa: B008
+    return PickerRunsRepository(db)
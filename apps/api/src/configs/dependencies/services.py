@@ -1,21 +1,58 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import cache
+
 from fastapi import Depends, Request
+from sqlalchemy import URL
+from sqlalchemy.orm import Session
+from src.adapters.leader_election import PostgresLeaderElection
+from src.adapters.picker_changes_listener import PostgresPickerChangesListener
+from src.adapters.picker_locks import PostgresPickerLocks
+from src.adapters.prometheus_metrics import PrometheusMetrics
+from src.adapters.repositories.export_jobs_repository import ExportJobsRepository
 from src.adapters.repositories.feeds_repository import FeedsRepository
 from src.adapters.repositories.filters_repository import FiltersRepository
+from src.adapters.repositories.picker_runs_repository import PickerRunsRepository
 from src.adapters.repositories.pickers_repository import PickersRepository
 from src.adapters.repositories.sources_repository import SourcesRepository
+from src.adapters.repositories.websub_repository import WebSubRepository
+from src.adapters.source_fetcher import HttpSourceFetcher
 from src.adapters.wallabag_extractor import WallabagExtractor
+from src.adapters.websub_hub_client import WebSubHubClient
+from src.configs.database import SessionLocal, get_db
 from src.configs.dependencies.repositories import (
     get_feeds_repository,
     get_filters_repository,
+    get_picker_runs_repository,
     get_pickers_repository,
     get_sources_repository,
+    get_websub_repository,
 )
+from src.configs.settings import settings
+from src.domain.handlers.seen_entries import SeenEntries
+from src.domain.ports.export_jobs_port import ExportJobsPort
+from src.domain.ports.profiler_port import ProfilerPort
+from src.domain.ports.scheduler_port import SchedulerPort
+from src.domain.services.export_service import ExportService
 from src.domain.services.extractor_service import ExtractorService
 from src.domain.services.feed_service import FeedService
 from src.domain.services.filter_service import FilterService
-from src.domain.services.job_service import JobService
+from src.domain.services.job_service import JobService, JobServiceFactory
+from src.domain.services.opml_service import OpmlService
+from src.domain.services.picker_run_job_service import PickerRunJobService
+from src.domain.services.picker_run_service import PickerRunService
 from src.domain.services.picker_service import PickerService
+from src.domain.services.scheduling_service import SchedulingService
 from src.domain.services.source_service import SourceService
+from src.domain.services.websub_service import WebSubService
+
+
+@cache
+def get_picker_locks(database_url: URL) -> PostgresPickerLocks:
+    # runs of a picker are serialized across processes, the locks live on connections of their
+    # own to the database the runs write to
+    return PostgresPickerLocks(database_url=database_url, lock_id=settings.PICKER_RUN_LOCK_ID)
+
 
 
 def get_source_service(
@@ -53,5 +90,144 @@ def get_picker_service(
     return PickerService(pickers_port=repository)
 
 
-def get_job_service(request: Request) -> JobService:
-    return request.app.state.job_service
+def get_opml_service(
+    source_service: SourceService = Depends(get_source_service),  # noqa: B008
+    picker_service: PickerService = Depends(get_picker_service)  # noqa: B008
+) -> OpmlService:
+    return OpmlService(
+        source_service=source_service,
+        picker_service=picker_service,
+        source_fetcher=HttpSourceFetcher()
+    )
+
+
+def get_picker_run_service(
+    repository: PickerRunsRepository = Depends(get_picker_runs_repository)  # noqa: B008
+) -> PickerRunService:
+    return PickerRunService(picker_runs_port=repository)
+
+
+def get_websub_service(
+    repository: WebSubRepository = Depends(get_websub_repository)  # noqa: B008
+) -> WebSubService:
+    return WebSubService(websub_port=repository, hub_port=WebSubHubClient())
+
+
+def get_job_service(
+    request: Request,
+    db: Session = Depends(get_db)  # noqa: B008
+) -> JobService:
+    # built on the request's session, what the scheduled runs have seen is shared
+    return build_job_service(db, request.app.state.scheduler, request.app.state.seen_entries)
+
+
+def get_job_service_factory(request: Request) -> JobServiceFactory:
+    return request.app.state.job_service_factory
+
+
+def get_run_job_service_factory(request: Request) -> JobServiceFactory:
+    return request.app.state.run_job_service_factory
+
+
+def get_export_service(request: Request) -> ExportService:
+    return request.app.state.export_service
+
+
+def get_picker_run_job_service(request: Request) -> PickerRunJobService:
+    return request.app.state.picker_run_job_service
+
+
+def get_scheduling_service(request: Request) -> SchedulingService | None:
+    return request.app.state.scheduling_service
+
+
+def get_profiler(request: Request) -> ProfilerPort:
+    return request.app.state.profiler
+
+
+@contextmanager
+def feed_service_scope() -> Iterator[FeedService]:
+    db = SessionLocal()
+    try:
+        yield FeedService(
+            feeds_port=FeedsRepository(db),
+            extractor_service=ExtractorService(extractor_port=WallabagExtractor())
+        )
+    finally:
+        db.close()
+
+
+@contextmanager
+def export_jobs_scope() -> Iterator[ExportJobsPort]:
+    db = SessionLocal()
+    try:
+        yield ExportJobsRepository(db)
+    finally:
+        db.close()
+
+
+@contextmanager
+def job_service_scope(
+    scheduler: SchedulerPort,
+    seen_entries: SeenEntries | None = None
+) -> Iterator[JobService]:
+    db = SessionLocal()
+    try:
+        yield build_job_service(db, scheduler, seen_entries)
+    finally:
+        db.close()
+
+
+def build_job_service(
+    db: Session,
+    scheduler: SchedulerPort,
+    seen_entries: SeenEntries | None = None
+) -> JobService:
+    feeds_repository = FeedsRepository(db)
+    extractor_service = ExtractorService(extractor_port=WallabagExtractor())
+    websub_service = None
+    if settings.WEBSUB_CALLBACK_URL:
+        websub_service = WebSubService(
+            websub_port=WebSubRepository(db),
+            hub_port=WebSubHubClient()
+        )
+    return JobService(
+        feed_service=FeedService(
+            feeds_port=feeds_repository,
+            extractor_service=extractor_service
+        ),
+        source_service=SourceService(source_port=SourcesRepository(db)),
+        picker_service=PickerService(pickers_port=PickersRepository(db)),
+        filter_service=FilterService(filters_port=FiltersRepository(db)),
+        scheduler=scheduler,
+        extractor_service=extractor_service,
+        feeds_port=feeds_repository,
+        source_fetcher=HttpSourceFetcher(),
+        websub_service=websub_service,
+        metrics=PrometheusMetrics() if settings.METRICS_ENABLED else None,
+        picker_run_service=PickerRunService(picker_runs_port=PickerRunsRepository(db)),
+        seen_entries=seen_entries,
+        picker_locks=get_picker_locks(db.get_bind().engine.url)
+    )
+
+
+def build_scheduling_service(
+    job_service_factory: JobServiceFactory,
+    scheduler: SchedulerPort
+) -> SchedulingService:
+    leader_election = None
+    if settings.SCHEDULER_LEADER_ELECTION_ENABLED:
+        leader_election = PostgresLeaderElection(
+            database_url=settings.DATABASE_URL,
+            lock_id=settings.SCHEDULER_LEADER_LOCK_ID,
+            interval=settings.SCHEDULER_LEADER_ELECTION_INTERVAL
+        )
+    return SchedulingService(
+        job_service_factory=job_service_factory,
+        scheduler=scheduler,
+        picker_changes=PostgresPickerChangesListener(
+            database_url=settings.DATABASE_URL,
+            interval=settings.SCHEDULER_PICKER_CHANGES_INTERVAL
+        ),
+        leader_election=leader_election
+    )
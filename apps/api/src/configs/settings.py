@@ -1,3 +1,7 @@
+import os
+import tempfile
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
@@ -12,6 +16,62 @@ class Settings(BaseSettings):
     WALLABAG_CLIENT_SECRET: str
     WALLABAG_USERNAME: str
     WALLABAG_PASSWORD: str
+    EXPORT_IMAGE_PROCESSING_ENABLED: bool = False
+    EXPORT_IMAGE_MAX_DIMENSION: int = 1200
+    EXPORT_IMAGE_FORMAT: Literal["jpeg", "webp"] = "jpeg"
+    EXPORT_IMAGE_QUALITY: int = 75
+    EXPORT_IMAGE_WORKERS: int = 2
+    EXPORT_SPOOL_MAX_SIZE: int = 16 * 1024 * 1024
+    EXPORT_CHUNK_SIZE: int = 64 * 1024
+    EXPORT_WORKERS: int = 2
+    # shared by every API worker and replica, exports are served by any of them
+    EXPORT_CACHE_DIR: str = os.path.join(tempfile.gettempdir(), "nebulapicker-exports")
+    EXPORT_CACHE_MAX_ENTRIES: int = 20
+    EXPORT_JOB_TIMEOUT: int = 60 * 60
+    EXPORT_RENDER_CACHE_MAX_AGE: int = 7 * 24 * 60 * 60
+    HTML_PROCESSOR: Literal["lxml", "beautifulsoup"] = "lxml"
+    SCHEDULER_ENABLED: bool = True
+    SCHEDULER_PICKER_CHANGES_INTERVAL: int = 1
+    SCHEDULER_LEADER_ELECTION_ENABLED: bool = True
+    SCHEDULER_LEADER_LOCK_ID: int = 726059471
+    SCHEDULER_LEADER_ELECTION_INTERVAL: int = 5
+    SCHEDULER_JOBSTORE: Literal["memory", "sqlalchemy"] = "memory"
+    SCHEDULER_JITTER_MODE: Literal["off", "jitter", "spread"] = "jitter"
+    SCHEDULER_MAX_JITTER: int = 60
+    SCHEDULER_EXECUTOR_THREADS: int = 10
+    SCHEDULER_MAX_INSTANCES: int = 1
+    SCHEDULER_COALESCE: bool = True
+    SCHEDULER_MISFIRE_GRACE_TIME: int | None = 300
+    SCHEDULER_MAX_QUEUED_RUNS: int = 100
+    SCHEDULER_LATE_RUN_THRESHOLD: int = 10
+    SCHEDULER_METRICS_LOG_INTERVAL: int = 300
+    SCHEDULER_ADAPTIVE_BACKOFF: float = 1.5
+    PICKER_SEEN_ENTRIES_WINDOW: int = 1000
+    PICKER_BACKFILL_BATCH_SIZE: int = 500
+    PICKER_RUN_JOB_WORKERS: int = 2
+    PICKER_RUN_LOCK_ID: int = 726059472
+    PICKER_RUN_JOBS_MAX_ENTRIES: int = 100
+    WEBSUB_CALLBACK_URL: str | None = None
+    WEBSUB_LEASE_SECONDS: int = 7 * 24 * 60 * 60
+    WEBSUB_RENEW_MARGIN: int = 24 * 60 * 60
+    WEBSUB_RETRY_INTERVAL: int = 60 * 60
+    SOURCE_FETCH_TIMEOUT: int = 30
+    OPML_PROBE_WORKERS: int = 8
+    METRICS_ENABLED: bool = True
+    METRICS_WORKER_PORT: int = 9100
+    TRACING_EXPORTER: Literal["none", "otlp", "file"] = "none"
+    TRACING_SAMPLE_RATIO: float = 1.0
+    TRACING_OTLP_ENDPOINT: str | None = None
+    TRACING_FILE_PATH: str = "traces.jsonl"
+    QUERY_COUNT_THRESHOLD: int = 20
+    QUERY_DURATION_THRESHOLD: float = 1.0
+    QUERY_STATS_HEADERS: bool = False
+    PICKER_RUNS_RETENTION_DAYS: int = 30
+    PICKER_RUNS_PRUNE_SCHEDULE: str = "0 3 * * *"
+    PROFILING_ENABLED: bool = False
+    PROFILING_SAMPLE_INTERVAL: float = 0.005
+    PROFILING_MAX_DURATION: int = 120
+    PROFILING_TRACEMALLOC_FRAMES: int = 25
 
     class Config:
         env_file = ".env.dev"
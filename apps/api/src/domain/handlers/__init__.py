@@ -1,5 +1,6 @@
-from src.domain.handlers.job_processors import process_filters
+from src.domain.handlers.job_processors import process_filters, prune_picker_runs
 
 HANDLERS = {
-    "process_filters": process_filters
+    "process_filters": process_filters,
+    "prune_picker_runs": prune_picker_runs
 }
@@ -0,0 +1,140 @@
+from abc import ABC, abstractmethod
+from html import escape
+
+import lxml.html
+from bs4 import BeautifulSoup
+from lxml.etree import ParserError
+from pydantic import BaseModel
+
+
+class HtmlBlock(BaseModel):
+    tag: str
+    text: str = ""
+    images: list[str] = []
+
+
+class HtmlProcessor(ABC):
+
+    @abstractmethod
+    def get_image_sources(self, html: str) -> list[str]:
+        pass
+
+    @abstractmethod
+    def rewrite_image_sources(self, html: str, sources: dict[str, str]) -> str:
+        pass
+
+    @abstractmethod
+    def get_blocks(self, html: str, block_tags: list[str]) -> list[HtmlBlock]:
+        pass
+
+
+class LxmlHtmlProcessor(HtmlProcessor):
+
+    def get_image_sources(self, html: str) -> list[str]:
+        body = self._parse(html)
+        if body is None:
+            return []
+        return [img.get("src") for img in body.iter("img") if img.get("src")]
+
+    def rewrite_image_sources(self, html: str, sources: dict[str, str]) -> str:
+        if not sources:
+            return html
+        body = self._parse(html)
+        if body is None:
+            return html
+        for img in body.iter("img"):
+            if img.get("src") in sources:
+                img.set("src", sources[img.get("src")])
+        return escape(body.text or "", quote=False) + "".join(
+            lxml.html.tostring(child, encoding="unicode") for child in body
+        )
+
+    def get_blocks(self, html: str, block_tags: list[str]) -> list[HtmlBlock]:
+        body = self._parse(html)
+        if body is None:
+            return []
+        blocks = []
+        for element in body.iter(*block_tags, "img"):
+            # nested blocks are already part of their outermost block
+            if next(element.iterancestors(*block_tags), None) is not None:
+                continue
+            if element.tag == "img":
+                blocks.append(HtmlBlock(tag="img", images=[element.get("src") or ""]))
+                continue
+            text = element.text_content()
+            blocks.append(
+                HtmlBlock(
+                    tag=element.tag,
+                    text=text if element.tag == "pre" else " ".join(text.split()),
+                    images=[img.get("src") or "" for img in element.iter("img")],
+                )
+            )
+        if not blocks:
+            text = " ".join(body.text_content().split())
+            if text:
+                blocks.append(HtmlBlock(tag="p", text=text))
+        return blocks
+
+    @staticmethod
+    def _parse(html: str) -> lxml.html.HtmlElement | None:
+        try:
+            try:
+                return lxml.html.document_fromstring(html).body
+            except ValueError:
+                # lxml refuses str input that carries an XML encoding declaration
+                return lxml.html.document_fromstring(html.encode("utf-8")).body
+        except ParserError:
+            return None
+
+
+class BeautifulSoupHtmlProcessor(HtmlProcessor):
+
+    def get_image_sources(self, html: str) -> list[str]:
+        soup = BeautifulSoup(html, "html.parser")
+        return [img.get("src") for img in soup.find_all("img") if img.get("src")]
+
+    def rewrite_image_sources(self, html: str, sources: dict[str, str]) -> str:
+        if not sources:
+            return html
+        soup = BeautifulSoup(html, "html.parser")
+        for img in soup.find_all("img"):
+            if img.get("src") in sources:
+                img["src"] = sources[img.get("src")]
+        return str(soup)
+
+    def get_blocks(self, html: str, block_tags: list[str]) -> list[HtmlBlock]:
+        soup = BeautifulSoup(html, "html.parser")
+        blocks = []
+        for element in soup.find_all([*block_tags, "img"]):
+            # nested blocks are already part of their outermost block
+            if element.find_parent(block_tags):
+                continue
+            if element.name == "img":
+                blocks.append(HtmlBlock(tag="img", images=[element.get("src") or ""]))
+                continue
+            blocks.append(
+                HtmlBlock(
+                    tag=element.name,
+                    text=(
+                        element.get_text()
+                        if element.name == "pre"
+                        else " ".join(element.get_text(" ").split())
+                    ),
+                    images=[img.get("src") or "" for img in element.find_all("img")],
+                )
+            )
+        if not blocks:
+            text = " ".join(soup.get_text(" ").split())
+            if text:
+                blocks.append(HtmlBlock(tag="p", text=text))
+        return blocks
+
+
+HTML_PROCESSORS: dict[str, type[HtmlProcessor]] = {
+    "lxml": LxmlHtmlProcessor,
+    "beautifulsoup": BeautifulSoupHtmlProcessor,
+}
+
+
+def get_html_processor(name: str) -> HtmlProcessor:
+    return HTML_PROCESSORS[name]()
@@ -0,0 +1,30 @@
+import io
+
+from PIL import Image
+
+JPEG_MODES = ("RGB", "L")
+
+
+def compress_image(
+    data: bytes,
+    max_dimension: int,
+    image_format: str,
+    quality: int
+) -> bytes | None:
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            # animated images would lose every frame but the first
+            if getattr(image, "is_animated", False):
+                return None
+            image.thumbnail((max_dimension, max_dimension))
+            if image_format == "jpeg" and image.mode not in JPEG_MODES:
+                image = image.convert("RGB")
+            output = io.BytesIO()
+            image.save(output, format=image_format.upper(), quality=quality, optimize=True)
+    except Exception:
+        return None
+
+    compressed = output.getvalue()
+    if len(compressed) >= len(data):
+        return None
+    return compressed
@@ -1,5 +1,26 @@
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+
+
 def process_filters(
     picker_id: str,
-    job_service
+    job_service_factory: Callable[[], AbstractContextManager]
 ):
-    job_service.process(int(picker_id))
+    # every run gets its own job service, and so its own database session
+    with job_service_factory() as job_service:
+        job_service.process(int(picker_id), skip_if_running=True)
+
+
+def prune_picker_runs(job_service_factory: Callable[[], AbstractContextManager]):
+    with job_service_factory() as job_service:
+        job_service.prune_picker_runs()
+
+
+def process_pushed_entries(
+    source_id: int,
+    entries: list,
+    job_service_factory: Callable[[], AbstractContextManager]
+):
+    # pushes are processed after the response, the request's session is closed by then
+    with job_service_factory() as job_service:
+        job_service.process_pushed_entries(source_id, entries)
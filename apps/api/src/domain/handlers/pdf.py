@@ -0,0 +1,101 @@
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import StyleSheet1, getSampleStyleSheet
+from reportlab.lib.utils import ImageReader
+from reportlab.platypus import (
+    Flowable,
+    Image,
+    PageBreak,
+    Paragraph,
+    Preformatted,
+    SimpleDocTemplate,
+    Spacer,
+)
+from src.domain.handlers.html import HtmlProcessor, get_html_processor
+from src.domain.models.feed import RenderedArticle
+
+BLOCK_STYLES = {
+    "h1": "Heading1",
+    "h2": "Heading2",
+    "h3": "Heading3",
+    "h4": "Heading4",
+    "h5": "Heading5",
+    "h6": "Heading6",
+    "p": "BodyText",
+    "li": "BodyText",
+    "blockquote": "BodyText",
+    "figcaption": "Italic",
+    "pre": "Code",
+}
+
+
+def render_pdf(
+    title: str,
+    article_paths: list[str],
+    images_dir: str,
+    output_path: str,
+    html_processor_name: str
+):
+    # runs in a worker process, so it only receives paths. Platypus lays out a complete list,
+    # so the paragraphs of every exported article are held until the build ends: memory grows
+    # with the text of the period, images stay on disk and are only read when a page is drawn
+    html_processor = get_html_processor(html_processor_name)
+    styles = getSampleStyleSheet()
+    document = SimpleDocTemplate(output_path, pagesize=A4, title=title)
+    flowables = []
+    for article_path in article_paths:
+        article = RenderedArticle.model_validate_json(Path(article_path).read_text("utf-8"))
+        flowables.extend(
+            _article_flowables(article, styles, Path(images_dir), document, html_processor)
+        )
+        flowables.append(PageBreak())
+    if not flowables:
+        flowables.append(Paragraph(escape(title), styles["Title"]))
+    document.build(flowables)
+
+
+def _article_flowables(
+    article: RenderedArticle,
+    styles: StyleSheet1,
+    images_dir: Path,
+    document: SimpleDocTemplate,
+    html_processor: HtmlProcessor
+) -> list[Flowable]:
+    flowables = [
+        Paragraph(escape(article.title), styles["Heading1"]),
+        Paragraph(f"<b>Reading time:</b> {article.reading_time}m", styles["BodyText"]),
+        Paragraph(f"<b>Source:</b> {escape(article.author)}", styles["BodyText"]),
+        Paragraph(
+            f"<b>Date:</b> {article.created_at.strftime('%Y-%m-%d')}",
+            styles["BodyText"]
+        ),
+        Paragraph(
+            f'<b>Link:</b> <a href="{escape(article.link)}">{escape(article.link)}</a>',
+            styles["BodyText"]
+        ),
+        Spacer(1, 24),
+    ]
+
+    for block in html_processor.get_blocks(article.content, list(BLOCK_STYLES)):
+        if block.tag == "pre":
+            flowables.append(Preformatted(block.text, styles["Code"]))
+        elif block.text:
+            flowables.append(Paragraph(escape(block.text), styles[BLOCK_STYLES[block.tag]]))
+        for src in block.images:
+            flowables.extend(_image_flowable(src, images_dir, document))
+    return flowables
+
+
+def _image_flowable(src: str, images_dir: Path, document: SimpleDocTemplate) -> list[Flowable]:
+    # only images stored by the render cache are embedded, remote ones are skipped
+    if not src:
+        return []
+    image_path = images_dir / Path(src).name
+    try:
+        width, height = ImageReader(str(image_path)).getSize()
+    except Exception:
+        return []
+    scale = min(1, document.width / width, document.height * 0.8 / height)
+    return [Image(str(image_path), width=width * scale, height=height * scale)]
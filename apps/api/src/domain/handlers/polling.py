@@ -0,0 +1,46 @@
+import statistics
+from calendar import timegm
+from datetime import UTC, datetime
+
+PUBLISHING_SAMPLE_SIZE = 20
+
+
+def get_entry_times(entries: list) -> list[datetime]:
+    # naive UTC, like the timestamps stored in the database
+    now = datetime.now(UTC).replace(tzinfo=None)
+    entry_times = []
+    for entry in entries:
+        parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+        if parsed:
+            # entries dated in the future would hide every newer entry until that date
+            entry_time = datetime.fromtimestamp(timegm(parsed), UTC).replace(tzinfo=None)
+            entry_times.append(min(entry_time, now))
+    return sorted(entry_times)
+
+
+def get_publishing_interval(entry_times: list[datetime]) -> float | None:
+    recent = entry_times[-PUBLISHING_SAMPLE_SIZE:]
+    gaps = [
+        (current - previous).total_seconds()
+        for previous, current in zip(recent, recent[1:], strict=False)
+        if current > previous
+    ]
+    if not gaps:
+        return None
+    return statistics.median(gaps)
+
+
+def get_next_poll_interval(
+    current_interval: int,
+    found_new_entries: bool,
+    publishing_interval: float | None,
+    min_interval: int,
+    max_interval: int,
+    backoff: float
+) -> int:
+    if found_new_entries:
+        # follow the pace of the source, or speed up when it has no usable timestamps
+        interval = publishing_interval or current_interval / backoff
+    else:
+        interval = current_interval * backoff
+    return round(min(max(interval, min_interval), max_interval))
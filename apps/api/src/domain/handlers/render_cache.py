@@ -0,0 +1,81 @@
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+
+from src.domain.models.feed import RenderedArticle, RenderedImage
+
+
+def cache_key(*parts) -> str:
+    return hashlib.sha256("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+
+
+class RenderCache:
+    """Processed images and rendered articles shared by every export format."""
+
+    def __init__(self, cache_dir: Path):
+        self.images_dir = cache_dir / "images"
+        self.articles_dir = cache_dir / "articles"
+        self.images_dir.mkdir(parents=True, exist_ok=True)
+        self.articles_dir.mkdir(parents=True, exist_ok=True)
+
+    def get_image(self, key: str) -> RenderedImage | None:
+        # image files are named <key>.<bytes saved>.<image type>
+        for path in self.images_dir.glob(f"{key}.*"):
+            if not self._touch(path):
+                continue
+            _, bytes_saved, img_type = path.name.split(".")
+            return RenderedImage(
+                name=path.name,
+                media_type=f"image/{img_type}",
+                bytes_saved=int(bytes_saved),
+            )
+        return None
+
+    def put_image(self, key: str, data: bytes, img_type: str, bytes_saved: int) -> RenderedImage:
+        name = f"{key}.{bytes_saved}.{img_type}"
+        self._write(self.images_dir / name, data)
+        return RenderedImage(name=name, media_type=f"image/{img_type}", bytes_saved=bytes_saved)
+
+    def get_article(self, key: str) -> Path | None:
+        path = self.articles_dir / f"{key}.json"
+        if not self._touch(path):
+            return None
+        # the images of an article in use are kept as well, an article whose images were
+        # pruned is rendered again
+        article = RenderedArticle.model_validate_json(path.read_text("utf-8"))
+        if not all(self._touch(self.images_dir / image.name) for image in article.images):
+            return None
+        return path
+
+    def put_article(self, key: str, article: RenderedArticle) -> Path:
+        path = self.articles_dir / f"{key}.json"
+        self._write(path, article.model_dump_json().encode("utf-8"))
+        return path
+
+    def prune(self, max_age: float):
+        threshold = time.time() - max_age
+        for directory in (self.images_dir, self.articles_dir):
+            for path in directory.iterdir():
+                try:
+                    if path.stat().st_mtime < threshold:
+                        path.unlink()
+                except FileNotFoundError:
+                    continue
+
+    @staticmethod
+    def _touch(path: Path) -> bool:
+        # refreshing the mtime keeps entries in use from being pruned
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return False
+        return True
+
+    @staticmethod
+    def _write(path: Path, data: bytes):
+        # concurrent exports may render the same entry, so replace it atomically
+        temporary_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}")
+        temporary_path.write_bytes(data)
+        os.replace(temporary_path, path)
@@ -0,0 +1,61 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+from src.domain.models.filter import Filter
+
+
+def get_fingerprint(entry) -> int:
+    # the guid when the feed provides one, the link otherwise
+    key = getattr(entry, "id", None) or entry.link
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest())
+
+
+def get_filters_version(filters: list[Filter]) -> str:
+    return hashlib.blake2b(
+        repr([(filter.operation.value, filter.args) for filter in filters]).encode("utf-8"),
+        digest_size=8
+    ).hexdigest()
+
+
+class SeenEntries:
+    """Fingerprints of the entries each picker already evaluated, oldest first."""
+
+    def __init__(self, window: int):
+        self.window = window
+        self._pickers: dict[int, tuple[str, OrderedDict[int, None]]] = {}
+        self._lock = threading.Lock()
+
+    def get_unseen(self, picker_id: int, filters_version: str, entries: list) -> list:
+        with self._lock:
+            version, fingerprints = self._pickers.get(picker_id, (None, None))
+            if version != filters_version:
+                # entries rejected by other filters have to be evaluated again
+                self._pickers.pop(picker_id, None)
+                return list(entries)
+            unseen = []
+            for entry in entries:
+                fingerprint = get_fingerprint(entry)
+                if fingerprint in fingerprints:
+                    # entries still in the source never slide out of the window
+                    fingerprints.move_to_end(fingerprint)
+                else:
+                    unseen.append(entry)
+            return unseen
+
+    def add(self, picker_id: int, filters_version: str, entries: list):
+        with self._lock:
+            version, fingerprints = self._pickers.get(picker_id, (None, None))
+            if version != filters_version:
+                fingerprints = OrderedDict()
+                self._pickers[picker_id] = (filters_version, fingerprints)
+            for entry in entries:
+                fingerprint = get_fingerprint(entry)
+                fingerprints[fingerprint] = None
+                fingerprints.move_to_end(fingerprint)
+            while len(fingerprints) > self.window:
+                fingerprints.popitem(last=False)
+
+    def discard(self, picker_id: int):
+        with self._lock:
+            self._pickers.pop(picker_id, None)
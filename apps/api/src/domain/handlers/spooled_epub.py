@@ -0,0 +1,31 @@
+from pathlib import Path
+
+from ebooklib import epub
+
+
+class SpooledContent:
+    """Keeps the item content in a file and only reads it back when the book is written."""
+
+    def __init__(self, *args, spool_path: Path, **kwargs):
+        self.spool_path = spool_path
+        super().__init__(*args, **kwargs)
+
+    @property
+    def content(self) -> bytes:
+        if not self.spool_path.exists():
+            return b""
+        return self.spool_path.read_bytes()
+
+    @content.setter
+    def content(self, value: bytes | str):
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        self.spool_path.write_bytes(value or b"")
+
+
+class SpooledEpubItem(SpooledContent, epub.EpubItem):
+    pass
+
+
+class SpooledEpubHtml(SpooledContent, epub.EpubHtml):
+    pass
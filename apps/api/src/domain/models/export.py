@@ -0,0 +1,36 @@
+from datetime import datetime
+from enum import Enum
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class ExportJobStatus(str, Enum):
+    pending = "pending"
+    running = "running"
+    completed = "completed"
+    failed = "failed"
+
+
+class ExportJob(BaseModel):
+    external_id: UUID
+    feed_external_id: UUID
+    file_type: str
+    start_time: datetime
+    end_time: datetime
+    status: ExportJobStatus = ExportJobStatus.pending
+    created_at: datetime
+    completed_at: datetime | None = None
+    error: str | None = None
+    file_path: str | None = None
+    file_name: str | None = None
+    media_type: str | None = None
+    images_bytes_saved: int = 0
+
+
+class ExportJobRequest(BaseModel):
+    feed_id: int
+    file_type: str
+    start_time: datetime
+    end_time: datetime
+    feed_version: str
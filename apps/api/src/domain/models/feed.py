@@ -1,4 +1,5 @@
 from datetime import datetime
+from tempfile import SpooledTemporaryFile
 from uuid import UUID
 
 from pydantic import BaseModel
@@ -72,3 +73,29 @@ class GetFeedItemContentRequest(BaseModel):
 
 class GetFeedItemImageUrlRequest(BaseModel):
     url: str
+
+
+class ExportedFile(BaseModel):
+    content: SpooledTemporaryFile
+    media_type: str
+    file_name: str
+    images_bytes_saved: int = 0
+
+    class Config:
+        arbitrary_types_allowed = True
+
+
+class RenderedImage(BaseModel):
+    name: str
+    media_type: str
+    bytes_saved: int = 0
+
+
+class RenderedArticle(BaseModel):
+    title: str
+    link: str
+    author: str
+    created_at: datetime
+    reading_time: int | None = None
+    content: str
+    images: list[RenderedImage] = []
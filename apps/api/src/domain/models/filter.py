@@ -26,3 +26,8 @@ class FilterRequest(BaseModel):
     picker_id: int
     operation: Operation
     args: str | None = None
+
+
+class FilterDefinition(BaseModel):
+    operation: Operation
+    args: str | None = None
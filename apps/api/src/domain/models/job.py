@@ -1,3 +1,6 @@
+from datetime import datetime
+from typing import Literal
+
 from pydantic import BaseModel
 
 
@@ -5,3 +8,35 @@ class Job(BaseModel):
     func_name: str
     args: list
     schedule: str
+    interval: int | None = None
+
+
+class SchedulerMetrics(BaseModel):
+    queued_runs: int = 0
+    running_runs: int = 0
+    skipped_runs: int = 0
+    missed_runs: int = 0
+    late_runs: int = 0
+    max_start_delay: float = 0.0
+
+
+class SchedulerStatus(BaseModel):
+    state: Literal["stopped", "loading", "ready", "failed"] = "stopped"
+    scheduled_jobs: int = 0
+    started_at: datetime | None = None
+    ready_at: datetime | None = None
+
+
+class PickerRunStats(BaseModel):
+    durations: dict[str, float] = {}
+    entries_fetched: int = 0
+    entries_new: int = 0
+    entries_filtered: int = 0
+    entries_extracted: int = 0
+    entries_inserted: int = 0
+    bytes_downloaded: int = 0
+    status_code: int | None = None
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    error: str | None = None
+    skipped: bool = False
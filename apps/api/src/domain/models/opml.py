@@ -0,0 +1,41 @@
+from enum import Enum
+from uuid import UUID
+
+from pydantic import BaseModel
+from src.domain.models.picker import PickerDetails
+
+
+class OpmlOutline(BaseModel):
+    url: str
+    title: str | None = None
+    category: str | None = None
+
+
+class SourceProbe(BaseModel):
+    url: str
+    status_code: int | None = None
+    feed_type: str | None = None
+    hub_url: str | None = None
+    error: str | None = None
+
+
+class OpmlOutlineStatus(str, Enum):
+    created = "created"
+    existing = "existing"
+    invalid = "invalid"
+
+
+class OpmlImportedOutline(BaseModel):
+    url: str
+    title: str | None = None
+    category: str | None = None
+    status: OpmlOutlineStatus
+    source_external_id: UUID | None = None
+    feed_type: str | None = None
+    hub_url: str | None = None
+    error: str | None = None
+
+
+class OpmlImport(BaseModel):
+    outlines: list[OpmlImportedOutline]
+    pickers: list[PickerDetails] = []
@@ -2,12 +2,15 @@ from datetime import datetime
 from uuid import UUID
 
 from pydantic import BaseModel
+from src.domain.models.filter import Filter, FilterDefinition
 
 
 class PickerRequest(BaseModel):
     source_id: int
     feed_id: int
     cronjob: str
+    min_poll_interval: int | None = None
+    max_poll_interval: int | None = None
 
 
 class Picker(BaseModel):
@@ -17,3 +20,26 @@ class Picker(BaseModel):
     feed_id: int
     cronjob: str
     created_at: datetime
+    min_poll_interval: int | None = None
+    max_poll_interval: int | None = None
+    # adaptive polling state, every picker keeps its own even when they share a source
+    poll_interval: int | None = None
+    last_entry_at: datetime | None = None
+
+
+class PickerDefinition(BaseModel):
+    cronjob: str
+    source_url: str
+    source_name: str
+    filters: list[FilterDefinition]
+    # a new feed is created when no existing feed is given
+    feed_external_id: UUID | None = None
+    feed_name: str | None = None
+    min_poll_interval: int | None = None
+    max_poll_interval: int | None = None
+
+
+class PickerDetails(Picker):
+    source_url: str
+    feed_external_id: UUID
+    filters: list[Filter]
@@ -0,0 +1,59 @@
+from datetime import datetime
+from enum import Enum
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class PickerRunRequest(BaseModel):
+    picker_id: int
+    source_id: int
+    started_at: datetime
+    finished_at: datetime
+    entries_fetched: int = 0
+    entries_new: int = 0
+    entries_filtered: int = 0
+    entries_extracted: int = 0
+    entries_inserted: int = 0
+    bytes_downloaded: int = 0
+    status_code: int | None = None
+    error: str | None = None
+
+
+class PickerRun(PickerRunRequest):
+    id: int
+
+
+class SourceRunStats(BaseModel):
+    source_external_id: UUID
+    source_url: str
+    runs: int
+    failed_runs: int
+    p50_duration: float
+    p95_duration: float
+    max_duration: float
+    entries_inserted: int
+    bytes_downloaded: int
+    last_run_at: datetime
+    last_error: str | None = None
+
+
+class PickerRunJobStatus(str, Enum):
+    pending = "pending"
+    running = "running"
+    completed = "completed"
+    failed = "failed"
+
+
+class PickerRunJob(BaseModel):
+    external_id: UUID
+    picker_ids: list[int]
+    backfill: bool = False
+    status: PickerRunJobStatus = PickerRunJobStatus.pending
+    created_at: datetime
+    completed_at: datetime | None = None
+    pickers_completed: int = 0
+    pickers_failed: int = 0
+    entries_inserted: int = 0
+    entries_extracted: int = 0
+    error: str | None = None
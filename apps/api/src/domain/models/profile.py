@@ -0,0 +1,14 @@
+from enum import Enum
+
+from pydantic import BaseModel
+
+
+class ProfileFormat(str, Enum):
+    speedscope = "speedscope"
+    pstats = "pstats"
+
+
+class Profile(BaseModel):
+    file_name: str
+    media_type: str
+    content: bytes
@@ -15,3 +15,9 @@ class Source(BaseModel):
     url: str
     name: str | None
     created_at: datetime
+
+
+class SourceResponse(BaseModel):
+    status_code: int
+    content: bytes
+    headers: dict[str, str] = {}
@@ -0,0 +1,24 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class WebSubSubscriptionRequest(BaseModel):
+    source_id: int
+    hub_url: str
+    topic_url: str
+    secret: str
+    requested_at: datetime
+
+
+class WebSubSubscription(BaseModel):
+    id: int
+    external_id: UUID
+    source_id: int
+    hub_url: str
+    topic_url: str
+    secret: str
+    lease_expires_at: datetime | None
+    requested_at: datetime
+    created_at: datetime
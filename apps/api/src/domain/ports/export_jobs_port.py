@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from uuid import UUID
+
+from src.domain.models.export import ExportJob, ExportJobRequest
+
+
+class ExportJobsPort(ABC):
+
+    @abstractmethod
+    def get_or_create_export_job(
+        self,
+        export_job_request: ExportJobRequest,
+        stale_before: datetime
+    ) -> tuple[ExportJob, bool]:
+        pass
+
+    @abstractmethod
+    def get_export_job(self, external_id: UUID) -> ExportJob | None:
+        pass
+
+    @abstractmethod
+    def update_export_job(self, export_job: ExportJob) -> bool:
+        pass
+
+    @abstractmethod
+    def delete_least_recently_used_export_jobs(self, keep: int) -> list[str]:
+        pass
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from datetime import datetime
 from uuid import UUID
 
@@ -43,6 +44,15 @@ class FeedsPort(ABC):
     def get_active_feed_items_by_feed_id(self, feed_id: int) -> list[FeedItem]:
         pass
 
+    @abstractmethod
+    def get_active_feed_items_by_feed_id_and_period(
+        self,
+        feed_id: int,
+        start_time: datetime,
+        end_time: datetime
+    ) -> Iterator[FeedItem]:
+        pass
+
     @abstractmethod
     def get_feed_item_by_feed_item_external_id(
         self,
@@ -54,10 +64,28 @@ class FeedsPort(ABC):
     def create_feed_item(self, feed_item_request: FeedItemRequest) -> FeedItem:
         pass
 
+    @abstractmethod
+    def create_feed_items(self, feed_item_requests: list[FeedItemRequest]) -> list[int]:
+        pass
+
+    @abstractmethod
+    def update_feed_item_content(
+        self,
+        feed_item_id: int,
+        content: str,
+        reading_time: int,
+        image_url: str | None
+    ) -> bool:
+        pass
+
     @abstractmethod
     def delete_feed_item(self, feed_item_id: int) -> bool:
         pass
 
+    @abstractmethod
+    def delete_feed_items_by_feed_id(self, feed_id: int) -> int:
+        pass
+
     @abstractmethod
     def get_number_of_feed_items_by_feed_id(self, feed_id: int) -> int:
         pass
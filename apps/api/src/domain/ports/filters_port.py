@@ -16,3 +16,11 @@ class FiltersPort(ABC):
     @abstractmethod
     def get_filter_by_picker_id(self, picker_id: int) -> list[Filter]:
         pass
+
+    @abstractmethod
+    def get_filters_by_picker_ids(self, picker_ids: list[int]) -> list[Filter]:
+        pass
+
+    @abstractmethod
+    def delete_filters_by_picker_ids(self, picker_ids: list[int]) -> int:
+        pass
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+
+
+class LeaderElectionPort(ABC):
+    @abstractmethod
+    def start(self, on_elected: Callable[[], None], on_revoked: Callable[[], None]) -> None:
+        pass
+
+    @abstractmethod
+    def stop(self) -> None:
+        pass
+
+    @abstractmethod
+    def is_leader(self) -> bool:
+        pass
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+
+from src.domain.models.job import PickerRunStats
+from src.domain.models.picker import Picker
+from src.domain.models.source import Source
+
+
+class MetricsPort(ABC):
+    @abstractmethod
+    def observe_picker_run(self, picker: Picker, source: Source, stats: PickerRunStats) -> None:
+        pass
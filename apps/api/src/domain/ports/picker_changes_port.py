@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+
+
+class PickerChangesPort(ABC):
+    @abstractmethod
+    def start(self, on_change: Callable[[], None]) -> None:
+        pass
+
+    @abstractmethod
+    def stop(self) -> None:
+        pass
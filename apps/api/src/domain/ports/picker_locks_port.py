@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager
+
+
+class PickerLocksPort(ABC):
+    @abstractmethod
+    def hold(self, picker_id: int, wait: bool) -> AbstractContextManager[bool]:
+        pass
@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from src.domain.models.picker_run import PickerRun, PickerRunRequest, SourceRunStats
+
+
+class PickerRunsPort(ABC):
+
+    @abstractmethod
+    def create_picker_run(self, picker_run_request: PickerRunRequest) -> None:
+        pass
+
+    @abstractmethod
+    def get_picker_runs_by_picker_id(self, picker_id: int, limit: int) -> list[PickerRun]:
+        pass
+
+    @abstractmethod
+    def get_source_run_stats(self, since: datetime) -> list[SourceRunStats]:
+        pass
+
+    @abstractmethod
+    def delete_picker_runs_before(self, before: datetime) -> int:
+        pass
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from uuid import UUID
 
-from src.domain.models.picker import Picker, PickerRequest
+from src.domain.models.picker import Picker, PickerDefinition, PickerDetails, PickerRequest
 
 
 class PickersPort(ABC):
@@ -10,6 +11,22 @@ class PickersPort(ABC):
     def create_picker(self, picker_request: PickerRequest) -> Picker:
         pass
 
+    @abstractmethod
+    def create_pickers(
+        self,
+        picker_definitions: list[PickerDefinition]
+    ) -> list[PickerDetails] | None:
+        pass
+
+    @abstractmethod
+    def update_picker_polling(
+        self,
+        picker_id: int,
+        poll_interval: int,
+        last_entry_at: datetime | None
+    ) -> None:
+        pass
+
     @abstractmethod
     def delete_picker(self, picker_id: int) -> bool:
         pass
@@ -30,6 +47,10 @@ class PickersPort(ABC):
     def get_pickers_by_feed_id(self, feed_id: int) -> list[Picker]:
         pass
 
+    @abstractmethod
+    def delete_pickers_by_feed_id(self, feed_id: int) -> int:
+        pass
+
     @abstractmethod
     def get_picker_by_source_id(self, source_id: int) -> list[Picker]:
         pass
@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+
+from src.domain.models.profile import Profile, ProfileFormat
+
+
+class ProfilerPort(ABC):
+    @abstractmethod
+    def profile_cpu(self, seconds: float, profile_format: ProfileFormat) -> Profile | None:
+        pass
+
+    @abstractmethod
+    def profile_memory(self, seconds: float) -> Profile | None:
+        pass
+
+    @abstractmethod
+    def profile_call(
+        self,
+        func: Callable[[], object],
+        name: str,
+        profile_format: ProfileFormat
+    ) -> Profile | None:
+        pass
@@ -1,17 +1,29 @@
 from abc import ABC, abstractmethod
 
-from src.domain.models.job import Job
+from src.domain.models.job import Job, SchedulerMetrics
 
 
 class SchedulerPort(ABC):
     @abstractmethod
-    def start(self) -> None:
+    def start(self, paused: bool = False) -> None:
         pass
 
     @abstractmethod
     def shutdown(self) -> None:
         pass
 
+    @abstractmethod
+    def pause(self) -> None:
+        pass
+
+    @abstractmethod
+    def resume(self) -> None:
+        pass
+
+    @abstractmethod
+    def set_handler_dependencies(self, **dependencies) -> None:
+        pass
+
     @abstractmethod
     def add_job(self, job: Job) -> None:
         pass
@@ -23,3 +35,11 @@ class SchedulerPort(ABC):
     @abstractmethod
     def delete_job(self, job: Job) -> None:
         pass
+
+    @abstractmethod
+    def get_metrics(self) -> SchedulerMetrics:
+        pass
+
+    @abstractmethod
+    def get_job_count(self) -> int:
+        pass
@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+from src.domain.models.source import SourceResponse
+
+
+class SourceFetcherPort(ABC):
+
+    @abstractmethod
+    def fetch(self, url: str) -> SourceResponse | None:
+        pass
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from uuid import UUID
 
+from src.domain.models.opml import OpmlOutline
 from src.domain.models.source import Source, SourceRequest
 
 
@@ -10,6 +11,10 @@ class SourcePort(ABC):
     def create_source(self, source_request: SourceRequest) -> Source:
         pass
 
+    @abstractmethod
+    def create_sources(self, source_requests: list[SourceRequest]) -> list[Source]:
+        pass
+
     @abstractmethod
     def update_source(
         self,
@@ -37,3 +42,15 @@ class SourcePort(ABC):
     @abstractmethod
     def get_source_by_id(self, id: int) -> Source | None:
         pass
+
+    @abstractmethod
+    def get_sources_by_ids(self, ids: list[int]) -> list[Source]:
+        pass
+
+    @abstractmethod
+    def get_sources_by_urls(self, urls: list[str]) -> list[Source]:
+        pass
+
+    @abstractmethod
+    def get_source_outlines(self) -> list[OpmlOutline]:
+        pass
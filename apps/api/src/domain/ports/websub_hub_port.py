@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+
+class WebSubHubPort(ABC):
+
+    @abstractmethod
+    def subscribe(
+        self,
+        hub_url: str,
+        topic_url: str,
+        callback_url: str,
+        secret: str,
+        lease_seconds: int
+    ) -> bool:
+        pass
@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from uuid import UUID
+
+from src.domain.models.websub import WebSubSubscription, WebSubSubscriptionRequest
+
+
+class WebSubPort(ABC):
+
+    @abstractmethod
+    def save_subscription(
+        self,
+        subscription_request: WebSubSubscriptionRequest
+    ) -> WebSubSubscription:
+        pass
+
+    @abstractmethod
+    def get_subscription_by_source_id(self, source_id: int) -> WebSubSubscription | None:
+        pass
+
+    @abstractmethod
+    def get_subscription_by_external_id(
+        self,
+        external_id: UUID
+    ) -> WebSubSubscription | None:
+        pass
+
+    @abstractmethod
+    def set_lease_expires_at(
+        self,
+        subscription_id: int,
+        lease_expires_at: datetime | None
+    ) -> None:
+        pass
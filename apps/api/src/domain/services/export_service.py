@@ -0,0 +1,122 @@
+import datetime
+import logging
+import shutil
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager
+from pathlib import Path
+from typing import BinaryIO
+from uuid import UUID
+
+from src.configs.settings import Settings
+from src.domain.models.export import ExportJob, ExportJobRequest, ExportJobStatus
+from src.domain.ports.export_jobs_port import ExportJobsPort
+from src.domain.services.feed_service import FeedService
+
+settings: Settings = Settings()
+logger = logging.getLogger(__name__)
+
+
+class ExportService:
+    def __init__(
+        self,
+        feed_service_factory: Callable[[], AbstractContextManager[FeedService]],
+        export_jobs_factory: Callable[[], AbstractContextManager[ExportJobsPort]]
+    ):
+        # every export job opens its own feed service (and database session)
+        self.feed_service_factory = feed_service_factory
+        self.export_jobs_factory = export_jobs_factory
+        self.executor = ThreadPoolExecutor(
+            max_workers=settings.EXPORT_WORKERS,
+            thread_name_prefix="export"
+        )
+        # jobs are stored in the database and their files in the cache directory, so any API
+        # worker serves the exports of the others
+        self.export_dir = Path(settings.EXPORT_CACHE_DIR) / "jobs"
+        self.export_dir.mkdir(parents=True, exist_ok=True)
+
+    def create_export_job(
+        self,
+        feed_external_id: UUID,
+        file_type: str,
+        start_time: datetime.datetime,
+        end_time: datetime.datetime
+    ) -> ExportJob | None:
+        with self.feed_service_factory() as feed_service:
+            feed = feed_service.get_feed_by_external_id(feed_external_id)
+            if feed is None:
+                return None
+            feed_version = feed_service.get_feed_version(feed)
+
+        export_job_request = ExportJobRequest(
+            feed_id=feed.id,
+            file_type=file_type,
+            start_time=start_time.astimezone(datetime.UTC),
+            end_time=end_time.astimezone(datetime.UTC),
+            feed_version=feed_version
+        )
+        stale_before = datetime.datetime.now(datetime.UTC) - datetime.timedelta(
+            seconds=settings.EXPORT_JOB_TIMEOUT
+        )
+        with self.export_jobs_factory() as export_jobs:
+            job, created = export_jobs.get_or_create_export_job(export_job_request, stale_before)
+            evicted_file_paths = export_jobs.delete_least_recently_used_export_jobs(
+                settings.EXPORT_CACHE_MAX_ENTRIES
+            )
+        for file_path in evicted_file_paths:
+            Path(file_path).unlink(missing_ok=True)
+
+        if created:
+            self.executor.submit(self._run_export_job, job.model_copy())
+        return job
+
+    def get_export_job(self, job_external_id: UUID) -> ExportJob | None:
+        with self.export_jobs_factory() as export_jobs:
+            return export_jobs.get_export_job(job_external_id)
+
+    def open_export_file(self, job: ExportJob) -> BinaryIO | None:
+        if job.status != ExportJobStatus.completed:
+            return None
+        try:
+            return open(job.file_path, "rb")
+        except FileNotFoundError:
+            return None
+
+    def shutdown(self):
+        # unfinished jobs are taken over by the next request once EXPORT_JOB_TIMEOUT passes
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run_export_job(self, job: ExportJob):
+        job.status = ExportJobStatus.running
+        self._update_export_job(job)
+        try:
+            with self.feed_service_factory() as feed_service:
+                exported_file = feed_service.export_file(
+                    job.feed_external_id,
+                    job.file_type,
+                    job.start_time,
+                    job.end_time
+                )
+            file_path = self.export_dir / f"{job.external_id}_{exported_file.file_name}"
+            with exported_file.content as source, open(file_path, "wb") as destination:
+                shutil.copyfileobj(source, destination)
+        except Exception as error:
+            logger.exception("Export job %s failed", job.external_id)
+            job.error = str(error)
+            job.status = ExportJobStatus.failed
+            self._update_export_job(job)
+            return
+
+        job.file_path = str(file_path)
+        job.file_name = exported_file.file_name
+        job.media_type = exported_file.media_type
+        job.images_bytes_saved = exported_file.images_bytes_saved
+        job.completed_at = datetime.datetime.now(datetime.UTC)
+        job.status = ExportJobStatus.completed
+        # the job may have been evicted from the cache while it was running
+        if not self._update_export_job(job):
+            file_path.unlink(missing_ok=True)
+
+    def _update_export_job(self, job: ExportJob) -> bool:
+        with self.export_jobs_factory() as export_jobs:
+            return export_jobs.update_export_job(job)
@@ -1,21 +1,27 @@
 import datetime
 import imghdr
-import io
+import multiprocessing
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
 from uuid import UUID
 
 import requests
-from bs4 import BeautifulSoup
-from ebooklib import epub
 from feedgenerator import Rss201rev2Feed
 from src.adapters.entrypoints.v1.models.feeds import ExportFileType
 from src.configs.settings import Settings
+from src.domain.handlers.render_cache import RenderCache, cache_key
 from src.domain.models.feed import (
     DetailedFeed,
+    ExportedFile,
     Feed,
     FeedItem,
     FeedItemRequest,
     FeedRequest,
     GetFeedItemContentRequest,
+    RenderedArticle,
     UpdateFeedRequest,
 )
 from src.domain.ports.feeds_port import FeedsPort
@@ -23,9 +29,21 @@ from src.domain.services.extractor_service import ExtractorService
 
 settings: Settings = Settings()
 
+# by the time it exports, the API process runs server, scheduler and exporter threads, and a
+# forked worker could inherit one of their locks while held, so workers come from a fork server
+PROCESS_POOL_CONTEXT = multiprocessing.get_context("forkserver")
+
 MAX_NUMBER_OF_ITEMS = 250
 MAX_NUMBER_OF_ITEMS_IN_RSS = 50
 HOURS_TO_COMPARE = 24
+IMAGE_MEDIA_TYPES = {
+    "jpeg": "image/jpeg",
+    "png": "image/png",
+    "gif": "image/gif",
+    "webp": "image/webp",
+    "bmp": "image/bmp",
+    "tiff": "image/tiff",
+}
 
 
 class FeedService:
@@ -79,6 +97,10 @@ class FeedService:
     def get_feed_by_id(self, id: int) -> Feed | None:
         return self.feeds_port.get_feed_by_id(id)
 
+    def get_feed_version(self, feed: Feed) -> str:
+        number_of_feed_items = self.feeds_port.get_number_of_feed_items_by_feed_id(feed.id)
+        return f"{feed.updated_at.isoformat()}_{number_of_feed_items}"
+
     def get_feed_items(
         self,
         feed_id: int,
@@ -155,11 +177,16 @@ class FeedService:
                 return feed_item
             except Exception:
                 return None
-        return self.feeds_port.create_feed_item(feed_item_request)
+        feed_item = self.feeds_port.create_feed_item(feed_item_request)
+        self.feeds_port.set_updated_at(feed_item_request.feed_id)
+        return feed_item
 
     def delete_feed_item(self, feed_item_id: int) -> bool:
         return self.feeds_port.delete_feed_item(feed_item_id)
 
+    def delete_feed_items_by_feed_id(self, feed_id: int) -> int:
+        return self.feeds_port.delete_feed_items_by_feed_id(feed_id)
+
     def deactivate_feed_item(self, feed_item_id: int) -> bool:
         return self.feeds_port.set_feed_item_as_inactive(feed_item_id)
 
@@ -191,94 +218,98 @@ class FeedService:
         file_type: ExportFileType,
         start_time: datetime,
         end_time: datetime
-    ) -> io.BytesIO:
-        # initialize buffer
-        buffer = io.BytesIO()
+    ) -> ExportedFile:
+        if file_type not in (ExportFileType.epub.value, ExportFileType.pdf.value):
+            raise Exception("wrong file type")
 
         # Get feed items
         start_time = start_time.astimezone(datetime.UTC)
         end_time = end_time.astimezone(datetime.UTC)
         feed = self.feeds_port.get_feed_by_external_id(feed_external_id)
-        feed_items = self.feeds_port.get_active_feed_items_by_feed_id(feed.id)
-        feed_items_to_export = [
-            item for item in feed_items if
-            item.created_at.replace(
-                tzinfo=datetime.UTC
-            ) > start_time and
-            item.created_at.replace(tzinfo=datetime.UTC) < end_time
-        ]
-        total_reading_time = sum(
-            [item.reading_time for item in feed_items_to_export]
+        feed_items_to_export = self.feeds_port.get_active_feed_items_by_feed_id_and_period(
+            feed.id,
+            start_time,
+            end_time
         )
 
-        if file_type == ExportFileType.epub.value:
+        # Articles are rendered once into a cache shared by every export format
+        render_cache = RenderCache(Path(settings.EXPORT_CACHE_DIR))
 
-            # Create EPUB
-            book = epub.EpubBook()
-            book.set_identifier(str(feed.external_id))
-            start_str = start_time.strftime("%Y%m%d")
-            end_str = end_time.strftime("%Y%m%d")
-            book.set_title(f"{feed.name}_{start_str}-{end_str} ({total_reading_time}m)")
-            book.set_language("en")
-
-            i = 0
-            spine = ["nav"]
-            toc = []
+        # Image processing runs in a process pool because re-encoding is CPU bound
+        image_executor = None
+        if settings.EXPORT_IMAGE_PROCESSING_ENABLED:
+            image_executor = ProcessPoolExecutor(
+                max_workers=settings.EXPORT_IMAGE_WORKERS,
+                mp_context=PROCESS_POOL_CONTEXT
+            )
+
+        # Feed items are streamed, so only the article being rendered is held in memory
+        article_paths = []
+        total_reading_time = 0
+        try:
             for feed_item in feed_items_to_export:
-                soup = BeautifulSoup(feed_item.content, "html.parser")
+                article_paths.append(
+                    self._render_article(feed_item, render_cache, image_executor)
+                )
+                total_reading_time += feed_item.reading_time
+        finally:
+            if image_executor:
+                image_executor.shutdown()
 
-                for j, img_tag in enumerate(soup.find_all("img")):
-                    img_url = img_tag.get("src")
-                    if not img_url:
-                        continue
+        start_str = start_time.strftime("%Y%m%d")
+        end_str = end_time.strftime("%Y%m%d")
+        title = f"{feed.name}_{start_str}-{end_str} ({total_reading_time}m)"
 
-                    try:
-                        headers = {
-                            "User-Agent": (
-                                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                                "(KHTML, like Gecko) Chrome/131 Safari/537.36"
-                            )
-                        }
-                        resp = requests.get(img_url, headers=headers, timeout=10)
-                        data = resp.content
-                    except Exception:
-                        continue  # skip download errors
-
-                    # Detect actual image type (jpeg, png, gif, webp, etc.)
-                    img_type = imghdr.what(None, data)
-
-                    if img_type is None:
-                        # Not an image (likely HTML)
-                        continue
+        if file_type == ExportFileType.epub.value:
+            exported_file = self._export_epub(feed, title, article_paths, render_cache)
+        else:
+            exported_file = self._export_pdf(title, article_paths, render_cache)
+        render_cache.prune(settings.EXPORT_RENDER_CACHE_MAX_AGE)
+        return exported_file
 
-                    # Map imghdr types to EPUB media types
-                    media_types = {
-                        "jpeg": "image/jpeg",
-                        "png": "image/png",
-                        "gif": "image/gif",
-                        "webp": "image/webp",
-                        "bmp": "image/bmp",
-                        "tiff": "image/tiff",
-                    }
-
-                    media_type = media_types.get(img_type)
-                    if not media_type:
-                        continue  # unsupported format
-
-                    # Use correct extension
-                    img_name = f"images/{i}_{j}.{img_type}"
-
-                    epub_img = epub.EpubItem(
-                        uid=f"img{i}_{j}",
-                        file_name=img_name,
-                        media_type=media_type,
-                        content=data
+    def _export_epub(
+        self,
+        feed: Feed,
+        title: str,
+        article_paths: list[Path],
+        render_cache: RenderCache
+    ) -> ExportedFile:
+        # export dependencies are slow to import, so they are only loaded once they are needed
+        from ebooklib import epub
+        from src.domain.handlers.spooled_epub import SpooledEpubHtml, SpooledEpubItem
+
+        # Create EPUB
+        book = epub.EpubBook()
+        book.set_identifier(str(feed.external_id))
+        book.set_title(title)
+        book.set_language("en")
+
+        # Item contents are spooled to disk so only one article is held in memory
+        spool_dir = tempfile.TemporaryDirectory()
+        images_bytes_saved = 0
+        image_names = set()
+
+        spine = ["nav"]
+        toc = []
+        try:
+            for i, article_path in enumerate(article_paths):
+                article = RenderedArticle.model_validate_json(article_path.read_text("utf-8"))
+
+                for image in article.images:
+                    # Images shared between articles are only added once
+                    if image.name in image_names:
+                        continue
+                    image_names.add(image.name)
+                    images_bytes_saved += image.bytes_saved
+                    epub_img = SpooledEpubItem(
+                        spool_path=Path(spool_dir.name) / image.name,
+                        uid=f"img_{image.name.split('.')[0]}",
+                        file_name=f"images/{image.name}",
+                        media_type=image.media_type,
+                        content=(render_cache.images_dir / image.name).read_bytes()
                     )
                     book.add_item(epub_img)
 
-                    # Update HTML <img src="...">
-                    img_tag["src"] = img_name
-
                 # Build chapter HTML
                 chapter_html = f"""
                 <!DOCTYPE html>
@@ -286,48 +317,49 @@ class FeedService:
                   <head>
                     <meta charset="utf-8"/>
                     <title>
-                      {feed_item.created_at.strftime("%Y-%m-%d")}
-                      - {feed_item.title} ({feed_item.reading_time}m)
+                      {article.created_at.strftime("%Y-%m-%d")}
+                      - {article.title} ({article.reading_time}m)
                     </title>
                   </head>
                   <body>
-                    <h1>{feed_item.title}</h1>
+                    <h1>{article.title}</h1>
                     <div class="article-info">
                       <p>
                         <strong>
                           Reading time:
                         </strong>
-                        {feed_item.reading_time}m
+                        {article.reading_time}m
                       </p>
                       <p>
                         <strong>
                           Source:
                         </strong>
-                        {feed_item.author}
+                        {article.author}
                       </p>
                       <p>
                         <strong>
                           Date:
                         </strong>
-                        {feed_item.created_at.strftime("%Y-%m-%d")}
+                        {article.created_at.strftime("%Y-%m-%d")}
                       </p>
                       <p>
                         <strong>
                           Link:
                         </strong>
-                        <a href="{feed_item.link}">{feed_item.link}</a>
+                        <a href="{article.link}">{article.link}</a>
                       </p>
                     </div>
                     <div style="height: 24px;">&nbsp;</div>
                     <div style="height: 24px;">&nbsp;</div>
-                    {str(soup)}
+                    {article.content}
                   </body>
                 </html>
                 """
 
-                chapter = epub.EpubHtml(
-                    title=f"{feed_item.created_at.strftime('%Y-%m-%d')} - "
-                          f"{feed_item.title} ({feed_item.reading_time}m)",
+                chapter = SpooledEpubHtml(
+                    spool_path=Path(spool_dir.name) / f"{i}.xhtml",
+                    title=f"{article.created_at.strftime('%Y-%m-%d')} - "
+                          f"{article.title} ({article.reading_time}m)",
                     file_name=f"{i}.xhtml",
                     lang="en",
                 )
@@ -335,16 +367,191 @@ class FeedService:
                 book.add_item(chapter)
                 spine.append(chapter)
                 toc.append(chapter)
-                i += 1
 
             # Update buffer
             book.spine = spine
             book.toc = toc
             book.add_item(epub.EpubNav())
             book.add_item(epub.EpubNcx())
+            buffer = tempfile.SpooledTemporaryFile(max_size=settings.EXPORT_SPOOL_MAX_SIZE)
             epub.write_epub(buffer, book, {})
             buffer.seek(0)
+        finally:
+            spool_dir.cleanup()
+
+        return ExportedFile(
+            content=buffer,
+            media_type="application/epub+zip",
+            file_name="export.epub",
+            images_bytes_saved=images_bytes_saved
+        )
+
+    def _export_pdf(
+        self,
+        title: str,
+        article_paths: list[Path],
+        render_cache: RenderCache
+    ) -> ExportedFile:
+        from src.domain.handlers.pdf import render_pdf
+
+        images_bytes_saved = sum(
+            {
+                image.name: image.bytes_saved
+                for article_path in article_paths
+                for image in RenderedArticle.model_validate_json(
+                    article_path.read_text("utf-8")
+                ).images
+            }.values()
+        )
+
+        spool_dir = tempfile.TemporaryDirectory()
+        try:
+            # Layout is CPU bound, so the document is built in a worker process
+            output_path = Path(spool_dir.name) / "export.pdf"
+            with ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=PROCESS_POOL_CONTEXT
+            ) as pdf_executor:
+                pdf_executor.submit(
+                    render_pdf,
+                    title,
+                    [str(article_path) for article_path in article_paths],
+                    str(render_cache.images_dir),
+                    str(output_path),
+                    settings.HTML_PROCESSOR
+                ).result()
+            buffer = tempfile.SpooledTemporaryFile(max_size=settings.EXPORT_SPOOL_MAX_SIZE)
+            with open(output_path, "rb") as pdf_file:
+                shutil.copyfileobj(pdf_file, buffer)
+            buffer.seek(0)
+        finally:
+            spool_dir.cleanup()
+
+        return ExportedFile(
+            content=buffer,
+            media_type="application/pdf",
+            file_name="export.pdf",
+            images_bytes_saved=images_bytes_saved
+        )
+
+    def _render_article(
+        self,
+        feed_item: FeedItem,
+        render_cache: RenderCache,
+        image_executor: ProcessPoolExecutor | None
+    ) -> Path:
+        from src.domain.handlers.html import get_html_processor
+
+        image_options = self._image_options()
+        article_key = cache_key(
+            feed_item.id,
+            feed_item.title,
+            feed_item.link,
+            feed_item.author,
+            feed_item.created_at.isoformat(),
+            feed_item.reading_time,
+            feed_item.content,
+            image_options
+        )
+        article_path = render_cache.get_article(article_key)
+        if article_path:
+            return article_path
+
+        content = feed_item.content or ""
+        html_processor = get_html_processor(settings.HTML_PROCESSOR)
+
+        rendered_images = []
+        image_sources = {}
+        downloaded_images = []
+        for img_url in dict.fromkeys(html_processor.get_image_sources(content)):
+            image_key = cache_key(img_url, image_options)
+            rendered_image = render_cache.get_image(image_key)
+            if rendered_image is None:
+                image = self._download_image(img_url)
+                if image is None:
+                    continue
+                downloaded_images.append((img_url, image_key, *image))
+                continue
+            image_sources[img_url] = f"images/{rendered_image.name}"
+            rendered_images.append(rendered_image)
+
+        processed_images = self._process_images(
+            image_executor,
+            [(data, img_type) for _, _, data, img_type in downloaded_images]
+        )
+        for (img_url, image_key, _, _), (data, img_type, bytes_saved) in zip(
+            downloaded_images, processed_images, strict=True
+        ):
+            rendered_image = render_cache.put_image(image_key, data, img_type, bytes_saved)
+            image_sources[img_url] = f"images/{rendered_image.name}"
+            rendered_images.append(rendered_image)
+
+        return render_cache.put_article(
+            article_key,
+            RenderedArticle(
+                title=feed_item.title,
+                link=feed_item.link,
+                author=feed_item.author,
+                created_at=feed_item.created_at,
+                reading_time=feed_item.reading_time,
+                content=html_processor.rewrite_image_sources(content, image_sources),
+                images=rendered_images,
+            )
+        )
 
-            return buffer
+    def _image_options(self) -> tuple:
+        if not settings.EXPORT_IMAGE_PROCESSING_ENABLED:
+            return ()
+        return (
+            settings.EXPORT_IMAGE_MAX_DIMENSION,
+            settings.EXPORT_IMAGE_FORMAT,
+            settings.EXPORT_IMAGE_QUALITY,
+        )
+
+    def _download_image(self, img_url: str) -> tuple[bytes, str] | None:
+        try:
+            headers = {
+                "User-Agent": (
+                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                    "(KHTML, like Gecko) Chrome/131 Safari/537.36"
+                )
+            }
+            resp = requests.get(img_url, headers=headers, timeout=10)
+            data = resp.content
+        except Exception:
+            return None  # skip download errors
+
+        # Detect actual image type (jpeg, png, gif, webp, etc.)
+        img_type = imghdr.what(None, data)
+
+        # Not an image (likely HTML) or unsupported format
+        if img_type not in IMAGE_MEDIA_TYPES:
+            return None
+
+        return data, img_type
 
-        raise Exception("wrong file type")
+    def _process_images(
+        self,
+        image_executor: ProcessPoolExecutor | None,
+        images: list[tuple[bytes, str]]
+    ) -> list[tuple[bytes, str, int]]:
+        if image_executor is None or not images:
+            return [(data, img_type, 0) for data, img_type in images]
+        from src.domain.handlers.images import compress_image
+
+        compressed_images = image_executor.map(
+            compress_image,
+            [data for data, _ in images],
+            repeat(settings.EXPORT_IMAGE_MAX_DIMENSION),
+            repeat(settings.EXPORT_IMAGE_FORMAT),
+            repeat(settings.EXPORT_IMAGE_QUALITY),
+        )
+        processed_images = []
+        for (data, img_type), compressed in zip(images, compressed_images, strict=True):
+            if compressed is None:
+                processed_images.append((data, img_type, 0))
+                continue
+            processed_images.append(
+                (compressed, settings.EXPORT_IMAGE_FORMAT, len(data) - len(compressed))
+            )
+        return processed_images
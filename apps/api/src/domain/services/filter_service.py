@@ -14,3 +14,12 @@ class FilterService:
 
     def get_filters_by_picker_id(self, picker_id: int) -> list[Filter]:
         return self.filters_port.get_filter_by_picker_id(picker_id)
+
+    def get_filters_by_picker_ids(self, picker_ids: list[int]) -> dict[int, list[Filter]]:
+        filters_by_picker_id = {picker_id: [] for picker_id in picker_ids}
+        for filter in self.filters_port.get_filters_by_picker_ids(picker_ids):
+            filters_by_picker_id[filter.picker_id].append(filter)
+        return filters_by_picker_id
+
+    def delete_filters_by_picker_ids(self, picker_ids: list[int]) -> int:
+        return self.filters_port.delete_filters_by_picker_ids(picker_ids)
@@ -1,4 +1,8 @@
 import ast
+import time
+from collections.abc import Callable
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from datetime import UTC, datetime, timedelta
 
 import feedparser
 from src.configs.settings import Settings
@@ -11,24 +15,49 @@ from src.domain.handlers.operations import (
     title_contains,
     title_does_not_contain,
 )
+from src.domain.handlers.polling import (
+    get_entry_times,
+    get_next_poll_interval,
+    get_publishing_interval,
+)
+from src.domain.handlers.seen_entries import SeenEntries, get_filters_version
 from src.domain.models.feed import (
     FeedItemRequest,
     GetFeedItemContentRequest,
     GetFeedItemImageUrlRequest,
 )
-from src.domain.models.filter import Operation
-from src.domain.models.job import Job
+from src.domain.models.filter import Filter, Operation
+from src.domain.models.job import Job, PickerRunStats
 from src.domain.models.picker import Picker
+from src.domain.models.source import Source
 from src.domain.ports.feeds_port import FeedsPort
+from src.domain.ports.metrics_port import MetricsPort
+from src.domain.ports.picker_locks_port import PickerLocksPort
 from src.domain.ports.scheduler_port import SchedulerPort
+from src.domain.ports.source_fetcher_port import SourceFetcherPort
 from src.domain.services.extractor_service import ExtractorService
-from src.domain.services.feed_service import FeedService
+from src.domain.services.feed_service import HOURS_TO_COMPARE, FeedService
 from src.domain.services.filter_service import FilterService
+from src.domain.services.picker_run_service import PickerRunService
 from src.domain.services.picker_service import PickerService
 from src.domain.services.source_service import SourceService
+from src.domain.services.websub_service import WebSubService
 
 settings: Settings = Settings()
 
+UNPARSED_CONTENT = "<p> Nebulapicker was not able to parse the content. </p>"
+
+
+@contextmanager
+def _timed(stats: PickerRunStats, stage: str):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.durations[stage] = (
+            stats.durations.get(stage, 0.0) + time.perf_counter() - started
+        )
+
 
 class JobService:
     def __init__(
@@ -39,7 +68,13 @@ class JobService:
         source_service: SourceService,
         feed_service: FeedService,
         extractor_service: ExtractorService,
-        feeds_port: FeedsPort
+        feeds_port: FeedsPort,
+        source_fetcher: SourceFetcherPort,
+        websub_service: WebSubService | None = None,
+        metrics: MetricsPort | None = None,
+        picker_run_service: PickerRunService | None = None,
+        seen_entries: SeenEntries | None = None,
+        picker_locks: PickerLocksPort | None = None
     ):
         self.scheduler = scheduler
         self.picker_service = picker_service
@@ -48,153 +83,406 @@ class JobService:
         self.feed_service = feed_service
         self.extractor_service = extractor_service
         self.feeds_port = feeds_port
+        self.source_fetcher = source_fetcher
+        self.websub_service = websub_service
+        self.metrics = metrics
+        self.picker_run_service = picker_run_service
+        # every run opens its own job service, the runs of a process share what they have seen
+        self.seen_entries = seen_entries or SeenEntries(settings.PICKER_SEEN_ENTRIES_WINDOW)
+        self.picker_locks = picker_locks
 
     def add_cronjob(self, picker: Picker):
-        job = Job(
-            func_name='process_filters',
-            args=[str(picker.id), self],
-            schedule=picker.cronjob
-        )
-        self.scheduler.add_job(job)
+        self.scheduler.add_job(self._build_job(picker))
+
+    def add_cronjobs(self, pickers: list[Picker]):
+        for picker in pickers:
+            self.scheduler.add_job(self._build_job(picker))
 
     def delete_cronjob(self, picker: Picker):
         job_to_delete = Job(
             func_name='process_filters',
-            args=[str(picker.id), self],
+            args=[str(picker.id)],
             schedule=picker.cronjob
         )
         self.scheduler.delete_job(job_to_delete)
+        self.seen_entries.discard(picker.id)
 
     def load_all(self):
-        pickers = self.picker_service.get_all_pickers()
-        jobs = []
-        for picker in pickers:
-            job = Job(
-                func_name='process_filters',
-                args=[str(picker.id), self],
-                schedule=picker.cronjob
-            )
-            jobs.append(job)
+        jobs = [self._build_job(picker) for picker in self.picker_service.get_all_pickers()]
+        if self.picker_run_service:
+            jobs.append(Job(
+                func_name="prune_picker_runs",
+                args=[],
+                schedule=settings.PICKER_RUNS_PRUNE_SCHEDULE
+            ))
         self.scheduler.load_jobs(jobs)
 
-    def process(self, picker_id: int):  # noqa: C901
+    def prune_picker_runs(self):
+        if self.picker_run_service:
+            self.picker_run_service.prune()
+
+    def process_pushed_entries(self, source_id: int, entries: list):
+        for picker in self.picker_service.get_pickers_by_source_id(source_id):
+            self.process(picker.id, entries)
+
+    def process(
+        self,
+        picker_id: int,
+        pushed_entries: list | None = None,
+        backfill: bool = False,
+        skip_if_running: bool = False
+    ) -> PickerRunStats:
+        # runs of a picker never overlap, their dedup would let both insert the same entries;
+        # a scheduled poll skips a running picker, requested runs and pushes wait for it
+        picker_lock = (
+            self.picker_locks.hold(picker_id, wait=not skip_if_running)
+            if self.picker_locks
+            else nullcontext(True)
+        )
+        with picker_lock as acquired:
+            if not acquired:
+                return PickerRunStats(skipped=True)
+            return self._run(picker_id, pushed_entries, backfill)
+
+    def _run(
+        self,
+        picker_id: int,
+        pushed_entries: list | None,
+        backfill: bool
+    ) -> PickerRunStats:
         picker = self.picker_service.get_picker_by_id(picker_id)
-        filters = self.filter_service.get_filters_by_picker_id(picker_id)
-        feed_items = self.feed_service.get_feed_items(picker.feed_id, all_items=True)
         source = self.source_service.get_source_by_id(picker.source_id)
+        stats = PickerRunStats(started_at=_now())
+        try:
+            if backfill:
+                self._backfill(picker, source, stats)
+            else:
+                self._process(picker, source, pushed_entries, stats)
+        except Exception as error:
+            stats.error = f"{type(error).__name__}: {error}"
+            raise
+        finally:
+            stats.finished_at = _now()
+            if self.metrics:
+                self.metrics.observe_picker_run(picker, source, stats)
+            if self.picker_run_service:
+                self.picker_run_service.record_run(picker, source, stats)
+        return stats
+
+    def _process(  # noqa: C901
+        self,
+        picker: Picker,
+        source: Source,
+        pushed_entries: list | None,
+        stats: PickerRunStats
+    ):
+        if pushed_entries is not None:
+            entries = pushed_entries
+        else:
+            if self.websub_service:
+                subscription = self.websub_service.get_active_subscription(source.id)
+                if subscription:
+                    # the hub pushes new entries, polling resumes when the lease expires
+                    self.websub_service.renew_if_due(subscription)
+                    return
+            entries = self._fetch_entries(source, stats)
+        stats.entries_fetched = len(entries)
+
+        with _timed(stats, "dedup"):
+            filters = self.filter_service.get_filters_by_picker_id(picker.id)
+            filters_version = get_filters_version(filters)
+            # entries the picker already evaluated with the same filters are not filtered again
+            unseen_entries = self.seen_entries.get_unseen(picker.id, filters_version, entries)
+            feed_items = []
+            if unseen_entries:
+                feed_items = self.feed_service.get_feed_items(picker.feed_id, all_items=True)
+            feed_item_links = {item.link for item in feed_items}
+            new_entries = [entry for entry in unseen_entries if entry.link not in feed_item_links]
+        stats.entries_new = len(new_entries)
+        # only entries that are settled are skipped next time: already in the feed, rejected
+        # by the filters or inserted now; the others are evaluated again
+        settled_entries = [entry for entry in unseen_entries if entry.link in feed_item_links]
         source_name = source.name if source.name else ""
-        source_set = feedparser.parse(source.url)
-        entries = source_set.entries
-        new_entries = [
-            entry for entry in entries
-            if entry.link not in {item.link for item in feed_items}
-        ]
 
         for entry in new_entries:
-            description = entry.description
-            if entry.get("tags"):
-                tags = [tag['term'] for tag in entry.get("tags")]
-                description += " ["
-                for tag in tags:
-                    description += "category: " + tag + "; "
-                description = description[:-1] + "]"
-            to_add = True
-            for filter in filters:
-                args = ast.literal_eval(filter.args)
-
-                # identity operation
-                if filter.operation is Operation.identity:
-                    to_add = identity(to_add)
-
-                # title_contains operation
-                if filter.operation is Operation.title_contains:
-                    to_add = title_contains(
-                        to_add,
-                        entry.title,
-                        args[0],
-                        int(args[1])
-                    )
+            with _timed(stats, "filter"):
+                description = self._build_description(entry)
+                to_add = self._apply_filters(filters, entry, description)
+            if not to_add:
+                stats.entries_filtered += 1
+                settled_entries.append(entry)
+                continue
 
-                # description_contains operation
-                if filter.operation is Operation.description_contains:
-                    to_add = description_contains(
-                        to_add,
-                        description,
-                        args[0],
-                        int(args[1])
-                    )
+            # this condition makes sure that feed_items are not duplicated
+            # when processing pickers
+            with _timed(stats, "dedup"):
+                duplicated = self.feed_service.get_feed_items(
+                    feed_id=picker.feed_id,
+                    title=entry.title
+                )
+            if duplicated:
+                continue
 
-                # title_does_not_contain operation
-                if filter.operation is Operation.title_does_not_contain:
-                    to_add = title_does_not_contain(
-                        to_add,
-                        entry.title,
-                        args[0],
-                        int(args[1])
+            content = None
+            image_url = None
+            if settings.WALLABAG_ENABLED:
+                with _timed(stats, "extract"):
+                    content = self.extractor_service.extract_feed_item_content(
+                        GetFeedItemContentRequest(
+                            url=entry.link
+                        )
                     )
-
-                # description_does_not_contain operation
-                if filter.operation is Operation.description_does_not_contain:
-                    to_add = description_does_not_contain(
-                        to_add,
-                        description,
-                        args[0],
-                        int(args[1])
+                    image_url = self.extractor_service.extract_feed_item_image(
+                        GetFeedItemImageUrlRequest(
+                            url=entry.link
+                        )
                     )
+            if content:
+                stats.entries_extracted += 1
+                reading_time = content.reading_time
+                content = content.content
+            else:
+                content = UNPARSED_CONTENT
+                reading_time = 0
+            feed_item_request = FeedItemRequest(
+                link=entry.link,
+                title=entry.title,
+                description=description,
+                feed_id=picker.feed_id,
+                author=source_name,
+                content=content,
+                reading_time=reading_time,
+                image_url=image_url
+            )
+            with _timed(stats, "insert"):
+                feed_item = self.feed_service.create_feed_item(feed_item_request)
+            if feed_item is None:
+                # the feed service swallows extraction and insert failures
+                continue
+            settled_entries.append(entry)
+            stats.entries_inserted += 1
 
-                # link_contains operation
-                if filter.operation is Operation.link_contains:
-                    to_add = link_contains(
-                        to_add,
-                        entry.link,
-                        args[0],
-                        int(args[1])
-                    )
+        self.seen_entries.add(picker.id, filters_version, settled_entries)
+        if picker.min_poll_interval is not None and pushed_entries is None:
+            self._adapt_poll_interval(picker, entries, stats.entries_inserted)
 
-                # link_does_not_contain operation
-                if filter.operation is Operation.link_does_not_contain:
-                    to_add = link_does_not_contain(
-                        to_add,
-                        entry.link,
-                        args[0],
-                        int(args[1])
-                    )
+    def _backfill(self, picker: Picker, source: Source, stats: PickerRunStats):
+        # the whole source window at once: the feed items are looked up once, new items
+        # are inserted in batches and their content is extracted after they are in the feed
+        entries = self._fetch_entries(source, stats)
+        stats.entries_fetched = len(entries)
 
-            if to_add:
-                # this condition makes sure that feed_items are not duplicated
-                # when processing pickers
-                if not self.feed_service.get_feed_items(
-                    feed_id=picker.feed_id,
-                    title=entry.title
+        with _timed(stats, "dedup"):
+            filters = self.filter_service.get_filters_by_picker_id(picker.id)
+            feed_items = self.feed_service.get_feed_items(picker.feed_id, all_items=True)
+            known_links = {item.link for item in feed_items}
+            compared_since = datetime.now() - timedelta(hours=HOURS_TO_COMPARE)
+            known_titles = {
+                item.title for item in feed_items if item.created_at >= compared_since
+            }
+            new_entries = [entry for entry in entries if entry.link not in known_links]
+        stats.entries_new = len(new_entries)
+        source_name = source.name if source.name else ""
+
+        feed_item_requests = []
+        created_at = datetime.now()
+        for entry in new_entries:
+            with _timed(stats, "filter"):
+                description = self._build_description(entry)
+                to_add = self._apply_filters(filters, entry, description)
+            if not to_add:
+                stats.entries_filtered += 1
+                continue
+            # the window itself can repeat a link or a title
+            if entry.link in known_links or entry.title in known_titles:
+                continue
+            known_links.add(entry.link)
+            known_titles.add(entry.title)
+            feed_item_requests.append(FeedItemRequest(
+                link=entry.link,
+                title=entry.title,
+                description=description,
+                feed_id=picker.feed_id,
+                author=source_name,
+                content=UNPARSED_CONTENT,
+                reading_time=0,
+                # one sequential run would insert the entries one after the other
+                created_at=created_at + timedelta(microseconds=len(feed_item_requests))
+            ))
+
+        feed_item_ids = []
+        with _timed(stats, "insert"):
+            batch_size = settings.PICKER_BACKFILL_BATCH_SIZE
+            for start in range(0, len(feed_item_requests), batch_size):
+                feed_item_ids += self.feeds_port.create_feed_items(
+                    feed_item_requests[start:start + batch_size]
+                )
+            if feed_item_ids:
+                self.feeds_port.set_updated_at(picker.feed_id)
+        stats.entries_inserted = len(feed_item_ids)
+        self.seen_entries.add(picker.id, get_filters_version(filters), entries)
+
+        if settings.WALLABAG_ENABLED and feed_item_ids:
+            with _timed(stats, "extract"):
+                for feed_item_id, feed_item_request in zip(
+                    feed_item_ids, feed_item_requests, strict=True
                 ):
-                    content = None
-                    image_url = None
-                    if settings.WALLABAG_ENABLED:
-                        content = self.extractor_service.extract_feed_item_content(
-                            GetFeedItemContentRequest(
-                                url=entry.link
-                            )
-                        )
-                        image_url = self.extractor_service.extract_feed_item_image(
-                            GetFeedItemImageUrlRequest(
-                                url=entry.link
-                            )
-                        )
-                    if content:
-                        reading_time = content.reading_time
-                        content = content.content
-                    else:
-                        content = "<p> Nebulapicker was not able to parse the content. </p>"
-                        reading_time = 0
-                    feed_item_request = FeedItemRequest(
-                        link=entry.link,
-                        title=entry.title,
-                        description=description,
-                        feed_id=picker.feed_id,
-                        author=source_name,
-                        content=content,
-                        reading_time=reading_time,
-                        image_url=image_url
+                    # the content carries the preview picture, no second extractor call
+                    content = self.extractor_service.extract_feed_item_content(
+                        GetFeedItemContentRequest(url=feed_item_request.link)
                     )
-                    self.feed_service.create_feed_item(feed_item_request)
+                    if content and content.content:
+                        self.feeds_port.update_feed_item_content(
+                            feed_item_id,
+                            content.content,
+                            content.reading_time or 0,
+                            content.image_url
+                        )
+                        stats.entries_extracted += 1
+                if stats.entries_extracted:
                     self.feeds_port.set_updated_at(picker.feed_id)
+
+    def _fetch_entries(self, source: Source, stats: PickerRunStats) -> list:
+        with _timed(stats, "fetch"):
+            response = self.source_fetcher.fetch(source.url)
+        if response is None:
+            stats.error = "Fetching the source failed"
+            return []
+        stats.status_code = response.status_code
+        stats.bytes_downloaded = len(response.content)
+        with _timed(stats, "parse"):
+            source_set = feedparser.parse(
+                response.content,
+                response_headers=response.headers
+            )
+        if self.websub_service:
+            self.websub_service.update_subscription(source, source_set.feed)
+        return source_set.entries
+
+    @staticmethod
+    def _build_description(entry) -> str:
+        description = entry.description
+        if entry.get("tags"):
+            tags = [tag['term'] for tag in entry.get("tags")]
+            description += " ["
+            for tag in tags:
+                description += "category: " + tag + "; "
+            description = description[:-1] + "]"
+        return description
+
+    @staticmethod
+    def _apply_filters(filters: list[Filter], entry, description: str) -> bool:
+        to_add = True
+        for filter in filters:
+            args = ast.literal_eval(filter.args)
+
+            # identity operation
+            if filter.operation is Operation.identity:
+                to_add = identity(to_add)
+
+            # title_contains operation
+            if filter.operation is Operation.title_contains:
+                to_add = title_contains(
+                    to_add,
+                    entry.title,
+                    args[0],
+                    int(args[1])
+                )
+
+            # description_contains operation
+            if filter.operation is Operation.description_contains:
+                to_add = description_contains(
+                    to_add,
+                    description,
+                    args[0],
+                    int(args[1])
+                )
+
+            # title_does_not_contain operation
+            if filter.operation is Operation.title_does_not_contain:
+                to_add = title_does_not_contain(
+                    to_add,
+                    entry.title,
+                    args[0],
+                    int(args[1])
+                )
+
+            # description_does_not_contain operation
+            if filter.operation is Operation.description_does_not_contain:
+                to_add = description_does_not_contain(
+                    to_add,
+                    description,
+                    args[0],
+                    int(args[1])
+                )
+
+            # link_contains operation
+            if filter.operation is Operation.link_contains:
+                to_add = link_contains(
+                    to_add,
+                    entry.link,
+                    args[0],
+                    int(args[1])
+                )
+
+            # link_does_not_contain operation
+            if filter.operation is Operation.link_does_not_contain:
+                to_add = link_does_not_contain(
+                    to_add,
+                    entry.link,
+                    args[0],
+                    int(args[1])
+                )
+        return to_add
+
+    def _build_job(self, picker: Picker) -> Job:
+        # pickers with poll interval bounds are polled adaptively instead of by their cronjob
+        interval = None
+        if picker.min_poll_interval is not None:
+            interval = self._get_poll_interval(picker)
+        return Job(
+            func_name='process_filters',
+            args=[str(picker.id)],
+            schedule=picker.cronjob,
+            interval=interval
+        )
+
+    @staticmethod
+    def _get_poll_interval(picker: Picker) -> int:
+        if picker.poll_interval is None:
+            return picker.min_poll_interval
+        return min(max(picker.poll_interval, picker.min_poll_interval), picker.max_poll_interval)
+
+    def _adapt_poll_interval(self, picker: Picker, entries: list, added: int):
+        # the state is the picker's own, pickers sharing a source each see the new entries
+        entry_times = get_entry_times(entries)
+        if entry_times:
+            found_new_entries = (
+                picker.last_entry_at is None or entry_times[-1] > picker.last_entry_at
+            )
+            last_entry_at = max(entry_times[-1], picker.last_entry_at or entry_times[-1])
+        else:
+            found_new_entries = added > 0
+            last_entry_at = picker.last_entry_at
+        current_interval = self._get_poll_interval(picker)
+        poll_interval = get_next_poll_interval(
+            current_interval=current_interval,
+            found_new_entries=found_new_entries,
+            publishing_interval=get_publishing_interval(entry_times),
+            min_interval=picker.min_poll_interval,
+            max_interval=picker.max_poll_interval,
+            backoff=settings.SCHEDULER_ADAPTIVE_BACKOFF
+        )
+        self.picker_service.update_picker_polling(picker.id, poll_interval, last_entry_at)
+        if poll_interval != current_interval:
+            self.scheduler.add_job(
+                self._build_job(picker.model_copy(update={"poll_interval": poll_interval}))
+            )
+
+
+# opens a job service on its own database session and closes the session afterwards
+JobServiceFactory = Callable[[], AbstractContextManager[JobService]]
+
+
+def _now() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
@@ -0,0 +1,224 @@
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from email.utils import format_datetime
+from urllib.parse import urlparse
+from xml.sax.saxutils import escape, quoteattr
+
+import feedparser
+from lxml import etree
+from src.configs.settings import Settings
+from src.domain.models.filter import FilterDefinition, Operation
+from src.domain.models.opml import (
+    OpmlImport,
+    OpmlImportedOutline,
+    OpmlOutline,
+    OpmlOutlineStatus,
+    SourceProbe,
+)
+from src.domain.models.picker import PickerDefinition
+from src.domain.models.source import Source, SourceRequest
+from src.domain.ports.source_fetcher_port import SourceFetcherPort
+from src.domain.services.picker_service import PickerService
+from src.domain.services.source_service import SourceService
+from src.domain.services.websub_service import get_hub_links
+
+settings: Settings = Settings()
+
+# pickers created on import keep every entry, filters are added afterwards
+IMPORT_FILTERS = [FilterDefinition(operation=Operation.identity, args="[]")]
+
+
+class OpmlService:
+    def __init__(
+        self,
+        source_service: SourceService,
+        picker_service: PickerService,
+        source_fetcher: SourceFetcherPort
+    ):
+        self.source_service = source_service
+        self.picker_service = picker_service
+        self.source_fetcher = source_fetcher
+
+    def import_outlines(
+        self,
+        outlines: list[OpmlOutline],
+        probe: bool,
+        cronjob: str | None
+    ) -> OpmlImport:
+        # the first outline of a url wins, sources already stored are left as they are
+        outlines_by_url: dict[str, OpmlOutline] = {}
+        for outline in outlines:
+            outlines_by_url.setdefault(outline.url, outline)
+        existing_sources = self.source_service.get_sources_by_urls(list(outlines_by_url))
+        new_outlines = [
+            outline for url, outline in outlines_by_url.items() if url not in existing_sources
+        ]
+        probes = self.probe_sources([outline.url for outline in new_outlines], probe)
+        valid_outlines = [outline for outline in new_outlines if probes[outline.url].error is None]
+
+        pickers = []
+        created_sources: dict[str, Source] = {}
+        if valid_outlines and cronjob is not None:
+            # sources, feeds, pickers and filters are stored in a single transaction
+            pickers = self.picker_service.create_pickers([
+                PickerDefinition(
+                    cronjob=cronjob,
+                    source_url=outline.url,
+                    source_name=_get_source_name(outline),
+                    filters=IMPORT_FILTERS,
+                    feed_name=outline.category or outline.title
+                )
+                for outline in valid_outlines
+            ])
+            created_sources = self.source_service.get_sources_by_urls(
+                [outline.url for outline in valid_outlines]
+            )
+        elif valid_outlines:
+            created_sources = {
+                source.url: source
+                for source in self.source_service.create_sources([
+                    SourceRequest(url=outline.url, name=_get_source_name(outline))
+                    for outline in valid_outlines
+                ])
+            }
+
+        imported_outlines = []
+        for url, outline in outlines_by_url.items():
+            source_probe = probes.get(url, SourceProbe(url=url))
+            if url in existing_sources:
+                status = OpmlOutlineStatus.existing
+                source = existing_sources[url]
+            elif source_probe.error is None:
+                status = OpmlOutlineStatus.created
+                source = created_sources.get(url)
+            else:
+                status = OpmlOutlineStatus.invalid
+                source = None
+            imported_outlines.append(
+                OpmlImportedOutline(
+                    url=url,
+                    title=outline.title,
+                    category=outline.category,
+                    status=status,
+                    source_external_id=source.external_id if source else None,
+                    feed_type=source_probe.feed_type,
+                    hub_url=source_probe.hub_url,
+                    error=source_probe.error
+                )
+            )
+        return OpmlImport(outlines=imported_outlines, pickers=pickers or [])
+
+    def probe_sources(self, urls: list[str], probe: bool = True) -> dict[str, SourceProbe]:
+        if not probe or not urls:
+            return {url: SourceProbe(url=url, error=_validate_url(url)) for url in urls}
+        # fetching is network bound, a bounded pool keeps a large import from flooding upstreams
+        with ThreadPoolExecutor(
+            max_workers=min(settings.OPML_PROBE_WORKERS, len(urls)),
+            thread_name_prefix="opml-probe"
+        ) as executor:
+            return dict(zip(urls, executor.map(self.probe_source, urls), strict=True))
+
+    def probe_source(self, url: str) -> SourceProbe:
+        error = _validate_url(url)
+        if error is not None:
+            return SourceProbe(url=url, error=error)
+        response = self.source_fetcher.fetch(url)
+        if response is None:
+            return SourceProbe(url=url, error="Source is unreachable")
+        if response.status_code >= 400:
+            return SourceProbe(
+                url=url,
+                status_code=response.status_code,
+                error=f"Source responded with status {response.status_code}"
+            )
+        feed = feedparser.parse(response.content, response_headers=response.headers)
+        if not feed.version:
+            return SourceProbe(url=url, status_code=response.status_code, error="Not a feed")
+        hub_url, _ = get_hub_links(feed.feed, url)
+        return SourceProbe(
+            url=url,
+            status_code=response.status_code,
+            feed_type=feed.version,
+            hub_url=hub_url
+        )
+
+    def export_opml(self) -> Iterator[bytes]:
+        # the outlines are read before streaming starts, the database session does not outlive
+        # the request handler
+        return render_opml(self.source_service.get_source_outlines(), settings.APP_NAME)
+
+
+def parse_opml(content: bytes) -> list[OpmlOutline] | None:
+    # entities are not expanded and nothing is fetched, the document comes from the client
+    parser = etree.XMLParser(resolve_entities=False, no_network=True)
+    try:
+        root = etree.fromstring(content, parser)
+    except etree.XMLSyntaxError:
+        return None
+    body = root.find("body")
+    if root.tag != "opml" or body is None:
+        return None
+    return [
+        OpmlOutline(
+            url=element.get("xmlUrl").strip(),
+            title=element.get("title") or element.get("text") or None,
+            category=_get_category(element)
+        )
+        for element in body.iter("outline")
+        if element.get("xmlUrl", "").strip()
+    ]
+
+
+def render_opml(outlines: list[OpmlOutline], title: str) -> Iterator[bytes]:
+    # outlines come grouped by category and are written in chunks, the document as a whole is
+    # never held in memory
+    parts = [
+        '<?xml version="1.0" encoding="utf-8"?>\n<opml version="2.0">\n<head>\n'
+        f"<title>{escape(title)}</title>\n"
+        f"<dateCreated>{format_datetime(datetime.now(UTC), usegmt=True)}</dateCreated>\n"
+        "</head>\n<body>\n"
+    ]
+    size = len(parts[0])
+    category = None
+    for outline in outlines:
+        if outline.category != category:
+            if category is not None:
+                parts.append("</outline>\n")
+            category = outline.category
+            if category is not None:
+                parts.append(f"<outline text={quoteattr(category)}>\n")
+        text = outline.title or outline.url
+        parts.append(
+            f'<outline type="rss" text={quoteattr(text)} title={quoteattr(text)} '
+            f"xmlUrl={quoteattr(outline.url)}/>\n"
+        )
+        size += len(parts[-1])
+        if size >= settings.EXPORT_CHUNK_SIZE:
+            yield "".join(parts).encode("utf-8")
+            parts = []
+            size = 0
+    if category is not None:
+        parts.append("</outline>\n")
+    parts.append("</body>\n</opml>\n")
+    yield "".join(parts).encode("utf-8")
+
+
+def _get_category(element) -> str | None:
+    # readers export folders as enclosing outlines, OPML 2.0 also has a category attribute
+    parent = element.getparent()
+    if parent is not None and parent.tag == "outline":
+        return parent.get("title") or parent.get("text") or None
+    categories = element.get("category", "").split(",")
+    return categories[0].strip().strip("/") or None
+
+
+def _get_source_name(outline: OpmlOutline) -> str:
+    return outline.title or urlparse(outline.url).netloc
+
+
+def _validate_url(url: str) -> str | None:
+    parsed_url = urlparse(url)
+    if parsed_url.scheme not in ("http", "https") or not parsed_url.netloc:
+        return "Invalid url"
+    return None
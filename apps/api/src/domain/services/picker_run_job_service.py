@@ -0,0 +1,89 @@
+import datetime
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from uuid import UUID, uuid4
+
+from src.configs.settings import Settings
+from src.domain.models.picker_run import PickerRunJob, PickerRunJobStatus
+from src.domain.services.job_service import JobServiceFactory
+
+settings: Settings = Settings()
+logger = logging.getLogger(__name__)
+
+UNFINISHED_STATUSES = (PickerRunJobStatus.pending, PickerRunJobStatus.running)
+
+
+class PickerRunJobService:
+    def __init__(self, job_service_factory: JobServiceFactory):
+        # every picker run opens its own job service (and database session)
+        self.job_service_factory = job_service_factory
+        self.executor = ThreadPoolExecutor(
+            max_workers=settings.PICKER_RUN_JOB_WORKERS,
+            thread_name_prefix="picker-run"
+        )
+        self.lock = threading.Lock()
+        self.jobs: OrderedDict[UUID, PickerRunJob] = OrderedDict()
+
+    def create_picker_run_job(self, picker_ids: list[int], backfill: bool) -> PickerRunJob:
+        with self.lock:
+            # running the same pickers twice at once would only race on the same entries
+            for job in self.jobs.values():
+                if (
+                    job.picker_ids == picker_ids
+                    and job.backfill == backfill
+                    and job.status in UNFINISHED_STATUSES
+                ):
+                    return job
+
+            job = PickerRunJob(
+                external_id=uuid4(),
+                picker_ids=picker_ids,
+                backfill=backfill,
+                created_at=datetime.datetime.now(datetime.UTC),
+            )
+            self.jobs[job.external_id] = job
+            self._evict_jobs()
+
+        self.executor.submit(self._run_picker_run_job, job)
+        return job
+
+    def get_picker_run_job(self, job_external_id: UUID) -> PickerRunJob | None:
+        return self.jobs.get(job_external_id)
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run_picker_run_job(self, job: PickerRunJob):
+        job.status = PickerRunJobStatus.running
+        for picker_id in job.picker_ids:
+            # a failed run can leave its session unusable, the next picker gets a new one
+            try:
+                with self.job_service_factory() as job_service:
+                    stats = job_service.process(picker_id, backfill=job.backfill)
+            except Exception as error:
+                logger.exception("Picker %s failed in run job %s", picker_id, job.external_id)
+                job.pickers_failed += 1
+                job.error = job.error or f"{type(error).__name__}: {error}"
+                continue
+            job.entries_inserted += stats.entries_inserted
+            job.entries_extracted += stats.entries_extracted
+            if stats.error:
+                job.pickers_failed += 1
+                job.error = job.error or stats.error
+            else:
+                job.pickers_completed += 1
+        job.completed_at = datetime.datetime.now(datetime.UTC)
+        job.status = (
+            PickerRunJobStatus.failed if job.pickers_failed else PickerRunJobStatus.completed
+        )
+
+    def _evict_jobs(self):
+        finished = [
+            job_external_id
+            for job_external_id, job in self.jobs.items()
+            if job.status not in UNFINISHED_STATUSES
+        ]
+        for job_external_id in finished[:len(self.jobs) - settings.PICKER_RUN_JOBS_MAX_ENTRIES]:
+            self.jobs.pop(job_external_id)
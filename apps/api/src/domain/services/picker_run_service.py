@@ -0,0 +1,58 @@
+import logging
+from datetime import UTC, datetime, timedelta
+
+from src.configs.settings import Settings
+from src.domain.models.job import PickerRunStats
+from src.domain.models.picker import Picker
+from src.domain.models.picker_run import PickerRun, PickerRunRequest, SourceRunStats
+from src.domain.models.source import Source
+from src.domain.ports.picker_runs_port import PickerRunsPort
+
+settings: Settings = Settings()
+
+logger = logging.getLogger(__name__)
+
+MAX_ERROR_LENGTH = 2000
+
+
+class PickerRunService:
+    def __init__(self, picker_runs_port: PickerRunsPort):
+        self.picker_runs_port = picker_runs_port
+
+    def record_run(self, picker: Picker, source: Source, stats: PickerRunStats) -> None:
+        finished_at = stats.finished_at or _now()
+        try:
+            self.picker_runs_port.create_picker_run(PickerRunRequest(
+                picker_id=picker.id,
+                source_id=source.id,
+                started_at=stats.started_at or finished_at,
+                finished_at=finished_at,
+                entries_fetched=stats.entries_fetched,
+                entries_new=stats.entries_new,
+                entries_filtered=stats.entries_filtered,
+                entries_extracted=stats.entries_extracted,
+                entries_inserted=stats.entries_inserted,
+                bytes_downloaded=stats.bytes_downloaded,
+                status_code=stats.status_code,
+                error=stats.error[:MAX_ERROR_LENGTH] if stats.error else None
+            ))
+        except Exception:
+            # the history is diagnostic, losing a run must not fail the run itself
+            logger.exception("Recording the run of picker %s failed", picker.id)
+
+    def get_picker_runs(self, picker_id: int, limit: int) -> list[PickerRun]:
+        return self.picker_runs_port.get_picker_runs_by_picker_id(picker_id, limit)
+
+    def get_source_run_stats(self, hours: int) -> list[SourceRunStats]:
+        return self.picker_runs_port.get_source_run_stats(_now() - timedelta(hours=hours))
+
+    def prune(self) -> int:
+        deleted = self.picker_runs_port.delete_picker_runs_before(
+            _now() - timedelta(days=settings.PICKER_RUNS_RETENTION_DAYS)
+        )
+        logger.info("Pruned %s picker runs", deleted)
+        return deleted
+
+
+def _now() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
@@ -1,6 +1,7 @@
+from datetime import datetime
 from uuid import UUID
 
-from src.domain.models.picker import Picker, PickerRequest
+from src.domain.models.picker import Picker, PickerDefinition, PickerDetails, PickerRequest
 from src.domain.ports.pickers_port import PickersPort
 
 
@@ -11,9 +12,26 @@ class PickerService:
     def create_picker(self, picker_request: PickerRequest) -> Picker:
         return self.pickers_port.create_picker(picker_request)
 
+    def create_pickers(
+        self,
+        picker_definitions: list[PickerDefinition]
+    ) -> list[PickerDetails] | None:
+        return self.pickers_port.create_pickers(picker_definitions)
+
+    def update_picker_polling(
+        self,
+        picker_id: int,
+        poll_interval: int,
+        last_entry_at: datetime | None
+    ):
+        self.pickers_port.update_picker_polling(picker_id, poll_interval, last_entry_at)
+
     def delete_picker(self, picker_id: int) -> bool:
         return self.pickers_port.delete_picker(picker_id)
 
+    def delete_pickers_by_feed_id(self, feed_id: int) -> int:
+        return self.pickers_port.delete_pickers_by_feed_id(feed_id)
+
     def get_picker_by_external_id(self, external_id: UUID) -> Picker:
         return self.pickers_port.get_picker_by_external_id(external_id)
 
@@ -0,0 +1,76 @@
+import logging
+from datetime import UTC, datetime
+
+from src.domain.models.job import SchedulerMetrics, SchedulerStatus
+from src.domain.ports.leader_election_port import LeaderElectionPort
+from src.domain.ports.picker_changes_port import PickerChangesPort
+from src.domain.ports.scheduler_port import SchedulerPort
+from src.domain.services.job_service import JobServiceFactory
+
+logger = logging.getLogger(__name__)
+
+
+class SchedulingService:
+    def __init__(
+        self,
+        job_service_factory: JobServiceFactory,
+        scheduler: SchedulerPort,
+        picker_changes: PickerChangesPort,
+        leader_election: LeaderElectionPort | None = None
+    ):
+        # scheduled runs, the listener and the leader election each run on their own thread,
+        # so every load and every run opens its own job service (and database session)
+        self.job_service_factory = job_service_factory
+        self.scheduler = scheduler
+        self.picker_changes = picker_changes
+        self.leader_election = leader_election
+        self.status = SchedulerStatus()
+
+    def start(self):
+        self.status = SchedulerStatus(state="loading", started_at=_now())
+        try:
+            # with leader election every process keeps its jobs loaded but only the leader
+            # runs them, without it persisted jobs only run once the current pickers are loaded
+            self.scheduler.set_handler_dependencies(job_service_factory=self.job_service_factory)
+            self.scheduler.start(paused=True)
+            self._load_all()
+            self.picker_changes.start(on_change=self._load_all)
+            if self.leader_election:
+                self.leader_election.start(
+                    on_elected=self._on_elected,
+                    on_revoked=self.scheduler.pause
+                )
+            else:
+                self.scheduler.resume()
+        except Exception:
+            logger.exception("Scheduler failed to start")
+            self.status = self.status.model_copy(update={"state": "failed"})
+            raise
+        self.status = self.status.model_copy(update={"state": "ready", "ready_at": _now()})
+        logger.info("Scheduler ready with %s jobs", self.scheduler.get_job_count())
+
+    def stop(self):
+        if self.leader_election:
+            self.leader_election.stop()
+        self.picker_changes.stop()
+        self.scheduler.shutdown()
+        self.status = SchedulerStatus()
+
+    def get_metrics(self) -> SchedulerMetrics:
+        return self.scheduler.get_metrics()
+
+    def get_status(self) -> SchedulerStatus:
+        # the job count grows while jobs load, so it shows the warm-up progress
+        return self.status.model_copy(update={"scheduled_jobs": self.scheduler.get_job_count()})
+
+    def _on_elected(self):
+        self._load_all()
+        self.scheduler.resume()
+
+    def _load_all(self):
+        with self.job_service_factory() as job_service:
+            job_service.load_all()
+
+
+def _now() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
@@ -1,5 +1,6 @@
 from uuid import UUID
 
+from src.domain.models.opml import OpmlOutline
 from src.domain.models.source import Source, SourceRequest
 from src.domain.ports.sources_port import SourcePort
 
@@ -11,6 +12,9 @@ class SourceService:
     def create_source(self, source_request: SourceRequest) -> Source:
         return self.source_port.create_source(source_request)
 
+    def create_sources(self, source_requests: list[SourceRequest]) -> list[Source]:
+        return self.source_port.create_sources(source_requests)
+
     def update_source(
         self,
         source_external_id,
@@ -33,5 +37,18 @@ class SourceService:
     def get_source_by_id(self, id: int):
         return self.source_port.get_source_by_id(id)
 
+    def get_sources_by_ids(self, ids: list[int]) -> dict[int, Source]:
+        return {source.id: source for source in self.source_port.get_sources_by_ids(ids)}
+
     def get_source_by_url(self, url: str):
         return self.source_port.get_source_by_url(url)
+
+    def get_sources_by_urls(self, urls: list[str]) -> dict[str, Source]:
+        # urls are not unique, the oldest source of a url is the one the pickers reuse
+        sources: dict[str, Source] = {}
+        for source in self.source_port.get_sources_by_urls(urls):
+            sources.setdefault(source.url, source)
+        return sources
+
+    def get_source_outlines(self) -> list[OpmlOutline]:
+        return self.source_port.get_source_outlines()
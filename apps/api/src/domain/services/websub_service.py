@@ -0,0 +1,147 @@
+import hmac
+import logging
+import secrets
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+import feedparser
+from src.configs.settings import Settings
+from src.domain.models.source import Source
+from src.domain.models.websub import WebSubSubscription, WebSubSubscriptionRequest
+from src.domain.ports.websub_hub_port import WebSubHubPort
+from src.domain.ports.websub_port import WebSubPort
+
+settings: Settings = Settings()
+
+logger = logging.getLogger(__name__)
+
+SIGNATURE_METHODS = {"sha1", "sha256", "sha384", "sha512"}
+
+
+class WebSubService:
+    def __init__(self, websub_port: WebSubPort, hub_port: WebSubHubPort):
+        self.websub_port = websub_port
+        self.hub_port = hub_port
+
+    def get_active_subscription(self, source_id: int) -> WebSubSubscription | None:
+        subscription = self.websub_port.get_subscription_by_source_id(source_id)
+        if subscription is None or subscription.lease_expires_at is None:
+            return None
+        if subscription.lease_expires_at <= _now():
+            return None
+        return subscription
+
+    def update_subscription(self, source: Source, feed: dict) -> None:
+        # subscribe to the hub a polled feed advertises, renewing the lease before it expires
+        hub_url, topic_url = get_hub_links(feed, source.url)
+        if hub_url is None:
+            return
+        subscription = self.websub_port.get_subscription_by_source_id(source.id)
+        if (
+            subscription
+            and subscription.hub_url == hub_url
+            and subscription.topic_url == topic_url
+        ):
+            self.renew_if_due(subscription)
+            return
+        self._subscribe(source.id, hub_url, topic_url, secrets.token_hex(32))
+
+    def renew_if_due(self, subscription: WebSubSubscription) -> None:
+        now = _now()
+        lease_expires_at = subscription.lease_expires_at
+        if (
+            lease_expires_at is not None
+            and lease_expires_at - now > timedelta(seconds=settings.WEBSUB_RENEW_MARGIN)
+        ):
+            return
+        if now - subscription.requested_at < timedelta(seconds=settings.WEBSUB_RETRY_INTERVAL):
+            return
+        self._subscribe(
+            subscription.source_id,
+            subscription.hub_url,
+            subscription.topic_url,
+            subscription.secret
+        )
+
+    def verify_intent(
+        self,
+        external_id: UUID,
+        mode: str,
+        topic_url: str,
+        challenge: str | None,
+        lease_seconds: int | None
+    ) -> str | None:
+        subscription = self.websub_port.get_subscription_by_external_id(external_id)
+        if subscription is None or subscription.topic_url != topic_url:
+            return None
+        if mode == "subscribe" and challenge is not None:
+            lease_expires_at = _now() + timedelta(
+                seconds=lease_seconds or settings.WEBSUB_LEASE_SECONDS
+            )
+            self.websub_port.set_lease_expires_at(subscription.id, lease_expires_at)
+            return challenge
+        if mode in ("unsubscribe", "denied"):
+            # polling takes over again
+            self.websub_port.set_lease_expires_at(subscription.id, None)
+            return challenge or ""
+        return None
+
+    def get_pushed_entries(
+        self,
+        external_id: UUID,
+        body: bytes,
+        signature: str | None
+    ) -> tuple[int, list] | None:
+        subscription = self.websub_port.get_subscription_by_external_id(external_id)
+        if subscription is None:
+            return None
+        if not _is_valid_signature(subscription.secret, body, signature):
+            logger.warning("Ignoring WebSub content with an invalid signature for %s", external_id)
+            return None
+        return subscription.source_id, feedparser.parse(body).entries
+
+    def _subscribe(self, source_id: int, hub_url: str, topic_url: str, secret: str):
+        subscription = self.websub_port.save_subscription(
+            WebSubSubscriptionRequest(
+                source_id=source_id,
+                hub_url=hub_url,
+                topic_url=topic_url,
+                secret=secret,
+                requested_at=_now()
+            )
+        )
+        self.hub_port.subscribe(
+            hub_url=hub_url,
+            topic_url=topic_url,
+            callback_url=(
+                f"{settings.WEBSUB_CALLBACK_URL.rstrip('/')}/v1/websub/{subscription.external_id}"
+            ),
+            secret=secret,
+            lease_seconds=settings.WEBSUB_LEASE_SECONDS
+        )
+
+
+def _now() -> datetime:
+    # naive UTC, like the timestamps stored in the database
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def get_hub_links(feed: dict, default_topic_url: str) -> tuple[str | None, str]:
+    hub_url = None
+    topic_url = default_topic_url
+    for link in feed.get("links", []):
+        if link.get("rel") == "hub" and hub_url is None:
+            hub_url = link.get("href")
+        elif link.get("rel") == "self" and link.get("href"):
+            topic_url = link["href"]
+    return hub_url, topic_url
+
+
+def _is_valid_signature(secret: str, body: bytes, signature: str | None) -> bool:
+    if not signature or "=" not in signature:
+        return False
+    method, digest = signature.split("=", 1)
+    if method not in SIGNATURE_METHODS:
+        return False
+    expected = hmac.new(secret.encode("utf-8"), body, method).hexdigest()
+    return hmac.compare_digest(expected, digest)
@@ -1,22 +1,36 @@
+import contextlib
 import logging
+import threading
+import time
+from functools import partial
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
+from opentelemetry import propagate
+from opentelemetry.trace import SpanKind
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from src.adapters.entrypoints.v1.models.welcome import WelcomeResponse
 from src.adapters.entrypoints.v1.routes import router as v1_router
-from src.adapters.repositories.feeds_repository import FeedsRepository
-from src.adapters.repositories.filters_repository import FiltersRepository
-from src.adapters.repositories.pickers_repository import PickersRepository
-from src.adapters.repositories.sources_repository import SourcesRepository
+from src.adapters.profiler import SamplingProfiler
+from src.adapters.prometheus_metrics import (
+    HTTP_REQUEST_DURATION,
+    track_database_pool,
+    track_scheduler,
+)
+from src.adapters.query_counter import count_queries, report_queries, track_queries
 from src.adapters.scheduler import Scheduler
-from src.adapters.wallabag_extractor import WallabagExtractor
-from src.configs.database import get_db
+from src.adapters.tracing import configure_tracing, tracer
+from src.configs.database import engine
+from src.configs.dependencies.services import (
+    build_scheduling_service,
+    export_jobs_scope,
+    feed_service_scope,
+    job_service_scope,
+)
 from src.configs.settings import Settings
-from src.domain.services.extractor_service import ExtractorService
-from src.domain.services.feed_service import FeedService
-from src.domain.services.filter_service import FilterService
-from src.domain.services.job_service import JobService
-from src.domain.services.picker_service import PickerService
-from src.domain.services.source_service import SourceService
+from src.domain.handlers.seen_entries import SeenEntries
+from src.domain.services.export_service import ExportService
+from src.domain.services.picker_run_job_service import PickerRunJobService
+from src.domain.services.scheduling_service import SchedulingService
 
 # CONSTANTS
 settings: Settings = Settings()
@@ -42,40 +56,125 @@ logging.basicConfig(
 )
 app.logger = logging.getLogger(__name__)
 
+# TRACING
+tracer_provider = configure_tracing(f"{settings.APP_NAME}-api")
+count_queries()
+
 # SCHEDULER
 scheduler_adapter = Scheduler()
 
 
 @app.on_event("startup")
 def startup():
-    db_session = next(get_db())
-    feed_repository = FeedsRepository(db_session)
-    source_repository = SourcesRepository(db_session)
-    picker_repository = PickersRepository(db_session)
-    filter_repository = FiltersRepository(db_session)
-    wallabag_service = WallabagExtractor()
-    source_service = SourceService(source_port=source_repository)
-    picker_service = PickerService(pickers_port=picker_repository)
-    filter_service = FilterService(filters_port=filter_repository)
-    extractor_service = ExtractorService(extractor_port=wallabag_service)
-    feed_service = FeedService(feeds_port=feed_repository, extractor_service=extractor_service)
-    job_service = JobService(
-        feed_service=feed_service,
-        source_service=source_service,
-        picker_service=picker_service,
-        filter_service=filter_service,
-        scheduler=scheduler_adapter,
-        extractor_service=extractor_service,
-        feeds_port=feed_repository
+    # requests build their job service on their own session, scheduled runs open one per run
+    app.state.scheduler = scheduler_adapter
+    app.state.seen_entries = SeenEntries(settings.PICKER_SEEN_ENTRIES_WINDOW)
+    app.state.job_service_factory = partial(
+        job_service_scope, scheduler_adapter, app.state.seen_entries
+    )
+    app.state.export_service = ExportService(
+        feed_service_factory=feed_service_scope,
+        export_jobs_factory=export_jobs_scope
     )
-    app.state.job_service = job_service
-    scheduler_adapter.start()
-    job_service.load_all()
+    # runs requested through the API start without the entries scheduled runs have seen
+    app.state.run_job_service_factory = partial(job_service_scope, scheduler_adapter)
+    app.state.picker_run_job_service = PickerRunJobService(
+        job_service_factory=app.state.run_job_service_factory
+    )
+    app.state.profiler = SamplingProfiler()
+    app.state.scheduling_service = None
+    app.state.scheduling_startup = None
+    if settings.METRICS_ENABLED:
+        track_scheduler(scheduler_adapter)
+        track_database_pool(engine)
+    # ingestion can run in a separate worker process (python -m src.worker) instead
+    if settings.SCHEDULER_ENABLED:
+        app.state.scheduling_service = build_scheduling_service(
+            app.state.job_service_factory,
+            scheduler_adapter
+        )
+        # jobs load in the background so requests are served while the scheduler warms up,
+        # /v1/health/ready reports when it is done
+        app.state.scheduling_startup = threading.Thread(
+            target=start_scheduling,
+            args=(app.state.scheduling_service,),
+            name="scheduling-startup",
+            daemon=True
+        )
+        app.state.scheduling_startup.start()
+
+
+def start_scheduling(scheduling_service: SchedulingService):
+    # failures are logged by the scheduling service and reported by the readiness probe
+    with contextlib.suppress(Exception):
+        scheduling_service.start()
 
 
 @app.on_event("shutdown")
 def shutdown():
-    scheduler_adapter.shutdown()
+    if app.state.scheduling_startup:
+        app.state.scheduling_startup.join()
+    if app.state.scheduling_service:
+        app.state.scheduling_service.stop()
+    app.state.export_service.shutdown()
+    app.state.picker_run_job_service.shutdown()
+    if tracer_provider:
+        tracer_provider.shutdown()
+
+
+@app.middleware("http")
+async def observe_request_duration(request: Request, call_next):
+    if not settings.METRICS_ENABLED:
+        return await call_next(request)
+    started = time.perf_counter()
+    response = await call_next(request)
+    # the route template keeps one series per endpoint instead of one per url
+    route = request.scope.get("route")
+    HTTP_REQUEST_DURATION.labels(
+        method=request.method,
+        route=route.path if route else "unmatched",
+        status=str(response.status_code)
+    ).observe(time.perf_counter() - started)
+    return response
+
+
+@app.middleware("http")
+async def count_request_queries(request: Request, call_next):
+    with track_queries() as query_stats:
+        response = await call_next(request)
+    route = request.scope.get("route")
+    report_queries(
+        f"{request.method} {route.path if route else request.url.path}",
+        query_stats
+    )
+    if settings.QUERY_STATS_HEADERS:
+        response.headers["X-Query-Count"] = str(query_stats.count)
+        response.headers["X-Query-Duration"] = f"{query_stats.duration:.6f}"
+    return response
+
+
+@app.middleware("http")
+async def trace_request(request: Request, call_next):
+    with tracer.start_as_current_span(
+        request.method,
+        context=propagate.extract(request.headers),
+        kind=SpanKind.SERVER,
+        attributes={"http.request.method": request.method}
+    ) as span:
+        response = await call_next(request)
+        route = request.scope.get("route")
+        if route:
+            span.update_name(f"{request.method} {route.path}")
+            span.set_attribute("http.route", route.path)
+        span.set_attribute("http.response.status_code", response.status_code)
+        return response
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    if not settings.METRICS_ENABLED:
+        return Response(status_code=404)
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
 
 
 @app.get(
@@ -0,0 +1,57 @@
+import logging
+import signal
+import threading
+from functools import partial
+
+from prometheus_client import start_http_server
+from src.adapters.prometheus_metrics import track_database_pool, track_scheduler
+from src.adapters.query_counter import count_queries
+from src.adapters.scheduler import Scheduler
+from src.adapters.tracing import configure_tracing
+from src.configs.database import engine
+from src.configs.dependencies.services import build_scheduling_service, job_service_scope
+from src.configs.settings import settings
+from src.domain.handlers.seen_entries import SeenEntries
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    stop_event = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+    signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+
+    tracer_provider = configure_tracing(f"{settings.APP_NAME}-worker")
+    count_queries()
+    scheduler = Scheduler()
+    # every scheduled run and every job reload opens its own database session
+    scheduling_service = build_scheduling_service(
+        partial(
+            job_service_scope,
+            scheduler,
+            SeenEntries(settings.PICKER_SEEN_ENTRIES_WINDOW)
+        ),
+        scheduler
+    )
+    if settings.METRICS_ENABLED:
+        # the worker serves no API, so its metrics get their own endpoint
+        track_scheduler(scheduler)
+        track_database_pool(engine)
+        start_http_server(settings.METRICS_WORKER_PORT)
+    scheduling_service.start()
+    logger.info("Worker started")
+    try:
+        while not stop_event.wait(settings.SCHEDULER_METRICS_LOG_INTERVAL):
+            logger.info("Scheduler metrics: %s", scheduling_service.get_metrics())
+    finally:
+        logger.info("Worker stopping")
+        scheduling_service.stop()
+        if tracer_provider:
+            tracer_provider.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+import os
+
+import pytest
+from scripts.fake_upstreams import (
+    RssProfile,
+    WallabagProfile,
+    build_rss_handler,
+    build_wallabag_handler,
+    serve,
+)
+from tests.benchmarks.data import SOURCE_ENTRIES, build_rss
+
+# sizes of the feed item benchmarks, smoke runs (benchmarks disabled) only use the smallest
+FEED_ITEMS_COUNTS = [
+    int(count)
+    for count in os.environ.get("BENCHMARK_FEED_ITEMS", "10000,100000,1000000").split(",")
+]
+
+
+def pytest_generate_tests(metafunc):
+    if "feed_items_count" in metafunc.fixturenames:
+        counts = FEED_ITEMS_COUNTS
+        config = metafunc.config
+        if config.getoption("benchmark_disable") and not config.getoption("benchmark_enable"):
+            counts = [min(FEED_ITEMS_COUNTS)]
+        metafunc.parametrize("feed_items_count", counts)
+
+
+@pytest.fixture(scope="session")
+def rss_server():
+    # the same document on every tick, so every round processes the same entries
+    feed = build_rss(SOURCE_ENTRIES)
+    with serve(build_rss_handler(RssProfile(), render=lambda source_id, tick: feed)) as url:
+        yield url
+
+
+@pytest.fixture(scope="session")
+def wallabag_server():
+    with serve(build_wallabag_handler(WallabagProfile())) as url:
+        yield url
@@ -0,0 +1,97 @@
+import random
+from datetime import datetime, timedelta
+from email.utils import format_datetime
+from functools import cache
+from uuid import UUID
+from xml.sax.saxutils import escape
+
+import feedparser
+from scripts.fake_upstreams import WORDS, build_sentence
+from src.domain.models.feed import Feed, FeedItem
+from src.domain.models.filter import Filter, Operation
+
+START = datetime(2025, 1, 1, 12, 0, 0)
+SOURCE_ENTRIES = 50
+
+
+def build_entries(count: int, seed: int = 0) -> list[feedparser.FeedParserDict]:
+    rng = random.Random(seed)
+    return [
+        feedparser.FeedParserDict(
+            id=f"urn:entry:{seed}:{index}",
+            link=f"https://example.com/{seed}/articles/{index}",
+            title=build_sentence(rng, 8).capitalize(),
+            description=build_sentence(rng, 40),
+            tags=[{"term": rng.choice(WORDS)} for _ in range(3)],
+        )
+        for index in range(count)
+    ]
+
+
+def build_rss(count: int, seed: int = 0) -> bytes:
+    items = "".join(
+        "<item>"
+        f"<guid>{entry.id}</guid>"
+        f"<link>{entry.link}</link>"
+        f"<title>{escape(entry.title)}</title>"
+        f"<description>{escape(entry.description)}</description>"
+        f"<pubDate>{format_datetime(START - timedelta(minutes=index))}</pubDate>"
+        + "".join(f"<category>{tag['term']}</category>" for tag in entry.tags)
+        + "</item>"
+        for index, entry in enumerate(build_entries(count, seed))
+    )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?><rss version="2.0"><channel>'
+        "<title>Synthetic source</title><link>https://example.com/</link>"
+        f"<description>Synthetic source</description>{items}</channel></rss>"
+    ).encode()
+
+
+def build_feed(feed_id: int = 1) -> Feed:
+    return Feed(
+        id=feed_id,
+        external_id=UUID(int=feed_id),
+        name="Synthetic feed",
+        created_at=START,
+        updated_at=START,
+    )
+
+
+@cache
+def build_feed_items(count: int, feed_id: int = 1, content: str | None = None) -> list[FeedItem]:
+    # model_construct and shared strings keep a million items within a few hundred MiB
+    rng = random.Random(count)
+    titles = [build_sentence(rng, 8).capitalize() for _ in range(1000)]
+    description = build_sentence(rng, 40)
+    return [
+        FeedItem.model_construct(
+            id=index,
+            external_id=UUID(int=index),
+            link=f"https://example.com/articles/{index}",
+            title=titles[index % len(titles)],
+            description=description,
+            created_at=START - timedelta(minutes=index),
+            feed_id=feed_id,
+            author="Synthetic source",
+            content=content,
+            reading_time=3,
+            image_url=None,
+        )
+        for index in range(count)
+    ]
+
+
+def build_filters(picker_id: int = 1) -> list[Filter]:
+    # a typical picker: topics to keep and noise to drop
+    chain = [
+        (Operation.title_contains, "['python', 1]"),
+        (Operation.description_contains, "['release', 1]"),
+        (Operation.title_does_not_contain, "['sponsored', 1]"),
+        (Operation.description_does_not_contain, "['webinar', 1]"),
+        (Operation.link_contains, "['example.com', 1]"),
+        (Operation.link_does_not_contain, "['/ads/', 1]"),
+    ]
+    return [
+        Filter(id=index, picker_id=picker_id, operation=operation, args=args, created_at=START)
+        for index, (operation, args) in enumerate(chain, start=1)
+    ]
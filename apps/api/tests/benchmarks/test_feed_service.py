@@ -0,0 +1,92 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from scripts.fake_upstreams import build_article
+from src.adapters.entrypoints.v1.models.feeds import ExportFileType
+from src.domain.services.feed_service import FeedService, settings
+from tests.benchmarks.data import build_feed, build_feed_items
+
+EXPORTED_ARTICLES = 50
+
+
+@pytest.fixture
+def feeds_port():
+    feeds_port = MagicMock()
+    feeds_port.get_feed_by_external_id.return_value = build_feed()
+    return feeds_port
+
+
+@pytest.fixture
+def feed_service(feeds_port):
+    return FeedService(feeds_port=feeds_port, extractor_service=MagicMock())
+
+
+def test_get_feed_items(benchmark, feed_service, feeds_port, feed_items_count: int):
+    # GIVEN
+    feeds_port.get_active_feed_items_by_feed_id.return_value = build_feed_items(feed_items_count)
+
+    # WHEN
+    result = benchmark(feed_service.get_feed_items, 1)
+
+    # THEN
+    assert len(result) == feed_items_count
+
+
+def test_get_feed_items_by_query_title(
+    benchmark,
+    feed_service,
+    feeds_port,
+    feed_items_count: int
+):
+    # GIVEN
+    feeds_port.get_active_feed_items_by_feed_id.return_value = build_feed_items(feed_items_count)
+
+    # WHEN
+    result = benchmark(feed_service.get_feed_items, 1, query_title="Python")
+
+    # THEN
+    assert 0 < len(result) < feed_items_count
+
+
+def test_get_rss(benchmark, feed_service, feeds_port, feed_items_count: int):
+    # GIVEN
+    feeds_port.get_active_feed_items_by_feed_id.return_value = build_feed_items(feed_items_count)
+
+    # WHEN
+    result = benchmark(feed_service.get_rss, build_feed().external_id)
+
+    # THEN
+    assert result.count("<item>") == 50
+
+
+@pytest.mark.parametrize("file_type", [ExportFileType.epub.value, ExportFileType.pdf.value])
+def test_export_file(
+    benchmark,
+    feed_service,
+    feeds_port,
+    file_type: str,
+    tmp_path_factory: pytest.TempPathFactory,
+    monkeypatch: pytest.MonkeyPatch
+):
+    # GIVEN
+    feeds_port.get_active_feed_items_by_feed_id_and_period.side_effect = (
+        lambda *args: iter(build_feed_items(EXPORTED_ARTICLES, content=build_article(10)))
+    )
+
+    def cold_render_cache():
+        # every round renders the articles again instead of reading them from the cache
+        monkeypatch.setattr(settings, "EXPORT_CACHE_DIR", tmp_path_factory.mktemp("exports"))
+        return (
+            build_feed().external_id,
+            file_type,
+            datetime(2024, 1, 1),
+            datetime(2026, 1, 1)
+        ), {}
+
+    # WHEN
+    result = benchmark.pedantic(feed_service.export_file, setup=cold_render_cache, rounds=5)
+
+    # THEN
+    assert result.content.tell() == 0
+    result.content.close()
@@ -0,0 +1,51 @@
+import pytest
+from src.domain.handlers.operations import (
+    description_contains,
+    description_does_not_contain,
+    link_contains,
+    link_does_not_contain,
+    title_contains,
+    title_does_not_contain,
+)
+from src.domain.services.job_service import JobService
+from tests.benchmarks.data import build_entries, build_filters
+
+ENTRIES = 10_000
+
+
+@pytest.mark.parametrize(
+    ("operation", "field"),
+    [
+        (title_contains, "title"),
+        (title_does_not_contain, "title"),
+        (description_contains, "description"),
+        (description_does_not_contain, "description"),
+        (link_contains, "link"),
+        (link_does_not_contain, "link"),
+    ]
+)
+def test_operation(benchmark, operation, field: str):
+    # GIVEN
+    values = [entry[field] for entry in build_entries(ENTRIES)]
+
+    # WHEN
+    result = benchmark(lambda: [operation(True, value, "python", 1) for value in values])
+
+    # THEN
+    assert len(result) == ENTRIES
+
+
+def test_apply_filters(benchmark):
+    # GIVEN
+    entries = build_entries(ENTRIES)
+    filters = build_filters()
+
+    # WHEN
+    result = benchmark(
+        lambda: [
+            JobService._apply_filters(filters, entry, entry.description) for entry in entries
+        ]
+    )
+
+    # THEN
+    assert 0 < sum(result) < ENTRIES
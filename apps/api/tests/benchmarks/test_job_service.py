@@ -0,0 +1,93 @@
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from src.adapters import wallabag_extractor
+from src.adapters.source_fetcher import HttpSourceFetcher
+from src.adapters.wallabag_extractor import WallabagExtractor
+from src.domain.models.picker import Picker
+from src.domain.models.source import Source
+from src.domain.services import feed_service, job_service
+from src.domain.services.extractor_service import ExtractorService
+from src.domain.services.feed_service import FeedService
+from src.domain.services.filter_service import FilterService
+from src.domain.services.job_service import JobService
+from tests.benchmarks.data import SOURCE_ENTRIES, START, build_filters
+
+
+@pytest.fixture
+def picker():
+    return Picker(
+        id=1, cronjob="*/5 * * * *", source_id=1, feed_id=1,
+        external_id=uuid4(), created_at=START
+    )
+
+
+@pytest.fixture
+def build_job_service(picker, rss_server, wallabag_server, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(wallabag_extractor.settings, "WALLABAG_URL", wallabag_server)
+    source = Source(
+        id=1, external_id=uuid4(), url=f"{rss_server}/feed.xml", name="Synthetic source",
+        created_at=START
+    )
+
+    def build(wallabag_enabled: bool) -> tuple[JobService, MagicMock]:
+        monkeypatch.setattr(job_service.settings, "WALLABAG_ENABLED", wallabag_enabled)
+        monkeypatch.setattr(feed_service.settings, "WALLABAG_ENABLED", wallabag_enabled)
+        picker_service = MagicMock()
+        picker_service.get_picker_by_id.return_value = picker
+        source_service = MagicMock()
+        source_service.get_source_by_id.return_value = source
+        filters_port = MagicMock()
+        filters_port.get_filter_by_picker_id.return_value = build_filters()[-2:]
+        feeds_port = MagicMock()
+        feeds_port.get_all_feed_items_by_feed_id.return_value = []
+        feeds_port.get_active_feed_items_by_feed_id.return_value = []
+        extractor_service = ExtractorService(extractor_port=WallabagExtractor())
+        service = JobService(
+            scheduler=MagicMock(),
+            picker_service=picker_service,
+            filter_service=FilterService(filters_port=filters_port),
+            source_service=source_service,
+            feed_service=FeedService(feeds_port=feeds_port, extractor_service=extractor_service),
+            extractor_service=extractor_service,
+            feeds_port=feeds_port,
+            source_fetcher=HttpSourceFetcher(),
+        )
+        return service, feeds_port
+
+    return build
+
+
+@pytest.mark.parametrize("wallabag_enabled", [False, True])
+def test_process_new_entries(benchmark, build_job_service, picker, wallabag_enabled: bool):
+    # GIVEN
+    created = []
+
+    def fresh_job_service():
+        # every round starts without seen entries, so every entry goes through the pipeline
+        service, feeds_port = build_job_service(wallabag_enabled)
+        created.append(feeds_port)
+        return (service, picker.id), {}
+
+    # WHEN
+    benchmark.pedantic(
+        lambda service, picker_id: service.process(picker_id),
+        setup=fresh_job_service,
+        rounds=5 if wallabag_enabled else 20
+    )
+
+    # THEN
+    assert created[-1].create_feed_item.call_count == SOURCE_ENTRIES
+
+
+def test_process_seen_entries(benchmark, build_job_service, picker):
+    # GIVEN
+    service, feeds_port = build_job_service(False)
+    service.process(picker.id)
+
+    # WHEN
+    benchmark(service.process, picker.id)
+
+    # THEN
+    assert feeds_port.create_feed_item.call_count == SOURCE_ENTRIES
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import UTC, datetime
 from uuid import UUID, uuid4
 
 import psycopg
@@ -427,6 +427,49 @@ def test_get_active_feed_items(repo, db_session):
     assert 2 not in [item.id for item in items]
 
 
+def test_get_active_feed_items_by_feed_id_and_period(repo, db_session):
+    # GIVEN
+    db_session.execute(
+        text("""
+            INSERT INTO feeds (id, external_id, name, created_at)
+            VALUES (1, :external_id, 'Example', '2025-01-01T12:00:00')
+        """),
+        {"external_id": uuid4()}
+    )
+    db_session.execute(
+        text("""
+            INSERT INTO feed_items (
+                id, feed_id, link, title, description, author, created_at, is_active
+            )
+            VALUES
+                (1, 1, 'https://e.com/1', 'Before', 'Desc', 'A', '2025-09-15T23:00:00', TRUE),
+                (2, 1, 'https://e.com/2', 'Morning', 'Desc', 'A', '2025-09-16T08:00:00', TRUE),
+                (3, 1, 'https://e.com/3', 'Evening', 'Desc', 'A', '2025-09-16T20:00:00', TRUE),
+                (4, 1, 'https://e.com/4', 'Inactive', 'Desc', 'A', '2025-09-16T10:00:00', FALSE),
+                (5, 1, 'https://e.com/5', 'After', 'Desc', 'A', '2025-09-17T01:00:00', TRUE)
+        """)
+    )
+    db_session.commit()
+
+    # WHEN
+    items = repo.get_active_feed_items_by_feed_id_and_period(
+        feed_id=1,
+        start_time=datetime(2025, 9, 16, tzinfo=UTC),
+        end_time=datetime(2025, 9, 17, tzinfo=UTC)
+    )
+    first_item = next(items)
+    open_cursors = db_session.execute(text("SELECT COUNT(*) FROM pg_cursors")).scalar()
+    remaining_items = list(items)
+
+    # THEN
+    assert isinstance(first_item, FeedItem)
+    assert [first_item.title] + [item.title for item in remaining_items] == [
+        "Evening",
+        "Morning",
+    ]
+    assert open_cursors == 1
+
+
 def test_create_feed_item_successfully(repo, db_session):
     # GIVEN
     db_session.execute(
@@ -472,6 +515,57 @@ def test_create_feed_item_successfully(repo, db_session):
     assert row.description == "New Item Description"
 
 
+def test_create_feed_items_in_one_batch(repo, db_session):
+    # GIVEN
+    db_session.execute(text("INSERT INTO feeds (id, name) VALUES (1, 'Parent Feed')"))
+    db_session.commit()
+    feed_item_requests = [
+        FeedItemRequest(
+            feed_id=1,
+            link=f"https://example.com/item-{index}",
+            title=f"Item {index}",
+            description="Description",
+            content="<p>Content</p>",
+            created_at=datetime(2025, 1, 1, 12, 0, index)
+        )
+        for index in range(3)
+    ]
+
+    # WHEN
+    ids = repo.create_feed_items(feed_item_requests)
+
+    # THEN
+    rows = db_session.execute(
+        text("SELECT id, link, created_at FROM feed_items ORDER BY id")
+    ).all()
+    assert ids == [row.id for row in rows]
+    assert [row.link for row in rows] == [request.link for request in feed_item_requests]
+    assert rows[2].created_at == datetime(2025, 1, 1, 12, 0, 2)
+
+
+def test_update_feed_item_content(repo, db_session):
+    # GIVEN
+    db_session.execute(text("INSERT INTO feeds (id, name) VALUES (1, 'Parent Feed')"))
+    db_session.execute(text(
+        "INSERT INTO feed_items (id, feed_id, link, title, content, reading_time) "
+        "VALUES (1, 1, 'https://example.com/item', 'Item', 'placeholder', 0)"
+    ))
+    db_session.commit()
+
+    # WHEN
+    updated = repo.update_feed_item_content(1, "<p>Article</p>", 4, "https://example.com/a.png")
+
+    # THEN
+    assert updated is True
+    row = db_session.execute(
+        text("SELECT content, reading_time, image_url FROM feed_items WHERE id = 1")
+    ).first()
+    assert row.content == "<p>Article</p>"
+    assert row.reading_time == 4
+    assert row.image_url == "https://example.com/a.png"
+    assert repo.update_feed_item_content(2, "<p>Article</p>", 4, None) is False
+
+
 def test_get_feed_item_by_external_id(repo, db_session):
     # GIVEN
     feed_external_id = uuid4()
@@ -580,3 +674,52 @@ def test_get_number_of_feed_items_by_feed_id(repo, db_session):
     assert count_feed_1 == 3
     assert count_feed_2 == 1
     assert count_feed_missing == 0
+
+
+@pytest.mark.parametrize("change", [
+    lambda repo: repo.set_feed_item_as_inactive(1),
+    lambda repo: repo.delete_feed_item(1),
+    lambda repo: repo.delete_feed_items_by_feed_id(1),
+])
+def test_removing_feed_items_bumps_the_feed_updated_at(repo, db_session, change):
+    # GIVEN
+    updated_at = datetime(2025, 1, 1, 12, 0, 0)
+    db_session.execute(
+        text("INSERT INTO feeds (id, name, updated_at) VALUES (1, 'Feed', :updated_at)"),
+        {"updated_at": updated_at}
+    )
+    db_session.execute(text(
+        "INSERT INTO feed_items (id, feed_id, title) VALUES (1, 1, 'Item 1'), (2, 1, 'Item 2')"
+    ))
+    db_session.commit()
+
+    # WHEN
+    assert change(repo)
+
+    # THEN
+    feed_updated_at = db_session.execute(
+        text("SELECT updated_at FROM feeds WHERE id = 1")
+    ).scalar_one()
+    assert feed_updated_at > updated_at
+
+
+def test_removing_missing_feed_items_keeps_the_feed_updated_at(repo, db_session):
+    # GIVEN
+    updated_at = datetime(2025, 1, 1, 12, 0, 0)
+    db_session.execute(
+        text("INSERT INTO feeds (id, name, updated_at) VALUES (1, 'Feed', :updated_at)"),
+        {"updated_at": updated_at}
+    )
+    db_session.commit()
+
+    # WHEN
+    deactivated = repo.set_feed_item_as_inactive(1)
+    deleted = repo.delete_feed_item(1)
+    deleted_count = repo.delete_feed_items_by_feed_id(1)
+
+    # THEN
+    assert (deactivated, deleted, deleted_count) == (False, False, 0)
+    feed_updated_at = db_session.execute(
+        text("SELECT updated_at FROM feeds WHERE id = 1")
+    ).scalar_one()
+    assert feed_updated_at == updated_at
@@ -46,7 +46,11 @@ def setup_test_db():
                 source_id INT NOT NULL REFERENCES sources(id),
                 feed_id INT NOT NULL REFERENCES feeds(id),
                 cronjob TEXT,
-                created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT CURRENT_TIMESTAMP
+                created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+                min_poll_interval INTEGER,
+                max_poll_interval INTEGER,
+                poll_interval INTEGER,
+                last_entry_at TIMESTAMP WITHOUT TIME ZONE
             );
         """))
 
@@ -121,6 +125,62 @@ def test_create_picker_successfully(db_session, pickers_repo):
     assert row is not None
 
 
+def test_create_picker_with_poll_interval_bounds(db_session, pickers_repo):
+    # GIVEN
+    db_session.execute(text("INSERT INTO feeds (id, name) VALUES (1, 'feed_fake_name')"))
+    db_session.execute(text("INSERT INTO sources (id, url) VALUES (1, 'www.fake.com/feed')"))
+    db_session.commit()
+
+    # WHEN
+    created = pickers_repo.create_picker(
+        PickerRequest(
+            feed_id=1,
+            source_id=1,
+            cronjob="*/15 * * * *",
+            min_poll_interval=300,
+            max_poll_interval=86400
+        )
+    )
+
+    # THEN
+    assert created.min_poll_interval == 300
+    assert created.max_poll_interval == 86400
+    picker = pickers_repo.get_picker_by_id(created.id)
+    assert picker.min_poll_interval == 300
+    assert picker.max_poll_interval == 86400
+
+
+def test_update_picker_polling_keeps_the_state_per_picker(db_session, pickers_repo):
+    # GIVEN
+    db_session.execute(text("INSERT INTO feeds (id, name) VALUES (1, 'feed_fake_name')"))
+    db_session.execute(text("INSERT INTO sources (id, url) VALUES (1, 'www.fake.com/feed')"))
+    db_session.commit()
+    pickers = [
+        pickers_repo.create_picker(
+            PickerRequest(
+                feed_id=1,
+                source_id=1,
+                cronjob="*/15 * * * *",
+                min_poll_interval=300,
+                max_poll_interval=86400
+            )
+        )
+        for _ in range(2)
+    ]
+    last_entry_at = datetime(2025, 1, 1, 12, 0, 0)
+
+    # WHEN
+    pickers_repo.update_picker_polling(pickers[0].id, 1800, last_entry_at)
+
+    # THEN
+    picker = pickers_repo.get_picker_by_id(pickers[0].id)
+    assert picker.poll_interval == 1800
+    assert picker.last_entry_at == last_entry_at
+    other_picker = pickers_repo.get_picker_by_id(pickers[1].id)
+    assert other_picker.poll_interval is None
+    assert other_picker.last_entry_at is None
+
+
 def test_get_picker_by_external_id_success(db_session, pickers_repo):
     # GIVEN
     external_id = uuid4()
@@ -0,0 +1,124 @@
+import json
+import marshal
+import pstats
+import threading
+
+import pytest
+from src.adapters.profiler import SamplingProfiler, to_pstats, to_speedscope
+from src.domain.models.profile import ProfileFormat
+
+ROOT = ("app.py", 1, "main")
+PROCESS = ("job_service.py", 10, "process")
+FETCH = ("source_fetcher.py", 20, "fetch")
+
+
+def busy(stopped: threading.Event):
+    while not stopped.is_set():
+        sum(range(1000))
+
+
+@pytest.fixture
+def busy_thread():
+    stopped = threading.Event()
+    thread = threading.Thread(target=busy, args=(stopped,), name="busy-thread")
+    thread.start()
+    yield thread
+    stopped.set()
+    thread.join()
+
+
+def test_to_speedscope_shares_frames_across_threads():
+    # GIVEN
+    samples = {
+        (1, (ROOT, PROCESS)): 0.2,
+        (1, (ROOT, PROCESS, FETCH)): 0.5,
+        (2, (ROOT,)): 0.1,
+    }
+
+    # WHEN
+    profile = json.loads(to_speedscope(samples, {1: "worker", 2: "main"}, "cpu"))
+
+    # THEN
+    assert [frame["name"] for frame in profile["shared"]["frames"]] == [
+        "main", "process", "fetch"
+    ]
+    first, second = profile["profiles"]
+    assert first["name"] == "worker"
+    assert first["samples"] == [[0, 1], [0, 1, 2]]
+    assert first["weights"] == [0.2, 0.5]
+    assert first["endValue"] == pytest.approx(0.7)
+    assert second["name"] == "main"
+
+
+def test_to_pstats_counts_recursive_frames_once():
+    # GIVEN
+    samples = {
+        (1, (ROOT, PROCESS, PROCESS, FETCH)): 0.5,
+        (1, (ROOT, PROCESS)): 0.2,
+    }
+
+    # WHEN
+    stats = marshal.loads(to_pstats(samples))
+
+    # THEN
+    calls, _, total, cumulative, callers = stats[PROCESS]
+    assert calls == 2
+    assert total == pytest.approx(0.2)
+    assert cumulative == pytest.approx(0.7)
+    assert set(callers) == {ROOT, PROCESS}
+    assert stats[FETCH][2] == pytest.approx(0.5)
+
+
+def test_profile_cpu_samples_every_thread(busy_thread, tmp_path):
+    # WHEN
+    profile = SamplingProfiler(interval=0.001).profile_cpu(0.2, ProfileFormat.pstats)
+
+    # THEN
+    assert profile.file_name.endswith(".pstats")
+    path = tmp_path / profile.file_name
+    path.write_bytes(profile.content)
+    functions = {function for _, _, function in pstats.Stats(str(path)).stats}
+    assert "busy" in functions
+
+
+def test_profile_call_only_samples_the_calling_thread(busy_thread):
+    # GIVEN
+    stopped = threading.Event()
+    threading.Timer(0.2, stopped.set).start()
+
+    # WHEN
+    profile = SamplingProfiler(interval=0.001).profile_call(
+        lambda: busy(stopped), "picker-1", ProfileFormat.speedscope
+    )
+
+    # THEN
+    assert profile.file_name.startswith("picker-1-")
+    assert profile.media_type == "application/json"
+    content = json.loads(profile.content)
+    assert len(content["profiles"]) == 1
+    assert "busy" in {frame["name"] for frame in content["shared"]["frames"]}
+
+
+def test_profile_memory_reports_allocations_held():
+    # GIVEN
+    held = []
+    threading.Timer(0.05, lambda: held.extend(bytearray(1024) for _ in range(100))).start()
+
+    # WHEN
+    profile = SamplingProfiler().profile_memory(0.2)
+
+    # THEN
+    content = json.loads(profile.content)
+    assert content["profiles"][0]["unit"] == "bytes"
+    assert any(frame["file"] == __file__ for frame in content["shared"]["frames"])
+
+
+def test_profiler_captures_one_profile_at_a_time():
+    # GIVEN
+    profiler = SamplingProfiler()
+    profiler.lock.acquire()
+
+    # WHEN / THEN
+    assert profiler.profile_cpu(0.01, ProfileFormat.speedscope) is None
+    assert profiler.profile_memory(0.01) is None
+    assert profiler.profile_call(lambda: None, "picker-1", ProfileFormat.speedscope) is None
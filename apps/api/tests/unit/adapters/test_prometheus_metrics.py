@@ -0,0 +1,104 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from prometheus_client import REGISTRY, CollectorRegistry
+from src.adapters.prometheus_metrics import (
+    DatabasePoolCollector,
+    PrometheusMetrics,
+    SchedulerCollector,
+)
+from src.domain.models.job import PickerRunStats, SchedulerMetrics
+from src.domain.models.picker import Picker
+from src.domain.models.source import Source
+
+
+def test_observe_picker_run():
+    # GIVEN
+    picker = Picker(
+        id=1, cronjob="*/5 * * * *", source_id=10, feed_id=20,
+        external_id=uuid4(), created_at=datetime(2025, 1, 1, 13, 0, 0)
+    )
+    source = Source(
+        id=10, external_id=uuid4(), url="http://example.com/feed", name=None,
+        created_at=datetime(2025, 1, 1, 13, 0, 0)
+    )
+    stats = PickerRunStats(
+        durations={"fetch": 0.25, "filter": 0.01},
+        entries_fetched=3,
+        entries_new=2,
+        entries_filtered=1,
+        entries_inserted=1,
+        bytes_downloaded=2048,
+        status_code=200
+    )
+    labels = {"source": str(source.external_id), "picker": str(picker.external_id)}
+
+    # WHEN
+    PrometheusMetrics().observe_picker_run(picker, source, stats)
+
+    # THEN
+    assert REGISTRY.get_sample_value(
+        "nebulapicker_picker_stage_duration_seconds_sum", {"stage": "fetch", **labels}
+    ) == 0.25
+    assert REGISTRY.get_sample_value(
+        "nebulapicker_picker_stage_duration_seconds_count", {"stage": "parse", **labels}
+    ) is None
+    assert REGISTRY.get_sample_value(
+        "nebulapicker_picker_entries_total", {"outcome": "fetched", **labels}
+    ) == 3
+    assert REGISTRY.get_sample_value(
+        "nebulapicker_picker_entries_total", {"outcome": "inserted", **labels}
+    ) == 1
+    assert REGISTRY.get_sample_value(
+        "nebulapicker_picker_downloaded_bytes_total", labels
+    ) == 2048
+    assert REGISTRY.get_sample_value(
+        "nebulapicker_picker_runs_total", {"status": "200", **labels}
+    ) == 1
+
+
+def test_scheduler_collector():
+    # GIVEN
+    registry = CollectorRegistry()
+    collector = SchedulerCollector()
+    registry.register(collector)
+    collector.scheduler = MagicMock()
+    collector.scheduler.get_job_count.return_value = 4
+    collector.scheduler.get_metrics.return_value = SchedulerMetrics(
+        queued_runs=2, running_runs=1, skipped_runs=5, missed_runs=3, late_runs=7
+    )
+
+    # WHEN / THEN
+    assert registry.get_sample_value("nebulapicker_scheduler_jobs") == 4
+    assert registry.get_sample_value("nebulapicker_scheduler_queued_runs") == 2
+    assert registry.get_sample_value("nebulapicker_scheduler_running_runs") == 1
+    assert registry.get_sample_value("nebulapicker_scheduler_skipped_runs_total") == 5
+    assert registry.get_sample_value("nebulapicker_scheduler_missed_runs_total") == 3
+    assert registry.get_sample_value("nebulapicker_scheduler_late_runs_total") == 7
+
+
+def test_collectors_without_target():
+    # GIVEN
+    registry = CollectorRegistry()
+    registry.register(SchedulerCollector())
+    registry.register(DatabasePoolCollector())
+
+    # WHEN / THEN
+    assert list(registry.collect()) == []
+
+
+def test_database_pool_collector():
+    # GIVEN
+    registry = CollectorRegistry()
+    collector = DatabasePoolCollector()
+    registry.register(collector)
+    collector.engine = MagicMock()
+    collector.engine.pool.size.return_value = 5
+    collector.engine.pool.checkedout.return_value = 3
+    collector.engine.pool.overflow.return_value = -2
+
+    # WHEN / THEN
+    assert registry.get_sample_value("nebulapicker_db_pool_size") == 5
+    assert registry.get_sample_value("nebulapicker_db_pool_checked_out") == 3
+    assert registry.get_sample_value("nebulapicker_db_pool_overflow") == 0
@@ -0,0 +1,91 @@
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from src.adapters import query_counter
+from src.adapters.query_counter import (
+    QueryStats,
+    count_queries,
+    report_queries,
+    track_queries,
+)
+
+
+@pytest.fixture
+def engine():
+    count_queries()
+    engine = create_engine("sqlite://")
+    yield engine
+    engine.dispose()
+
+
+def test_track_queries(engine):
+    # WHEN
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        with track_queries() as stats:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+
+    # THEN
+    assert stats.count == 2
+    assert stats.duration > 0
+
+
+def test_track_queries_nested(engine):
+    # WHEN
+    with engine.connect() as connection, track_queries() as outer_stats:
+        connection.execute(text("SELECT 1"))
+        with track_queries() as inner_stats:
+            connection.execute(text("SELECT 2"))
+
+    # THEN
+    assert outer_stats.count == 1
+    assert inner_stats.count == 1
+
+
+def test_track_queries_after_a_failed_statement(engine):
+    # GIVEN
+    with engine.connect() as connection, track_queries() as stats:
+        with pytest.raises(OperationalError):
+            connection.execute(text("SELECT * FROM missing_table"))
+
+        # WHEN
+        connection.execute(text("SELECT 1"))
+
+        # THEN
+        assert stats.count == 1
+        assert connection.info["query_started_at"] == []
+
+
+def test_count_queries_listens_once(engine):
+    # WHEN
+    count_queries()
+
+    # THEN
+    with engine.connect() as connection, track_queries() as stats:
+        connection.execute(text("SELECT 1"))
+    assert stats.count == 1
+
+
+@pytest.mark.parametrize(
+    ("stats", "logged"),
+    [
+        (QueryStats(count=3, duration=0.1), False),
+        (QueryStats(count=21, duration=0.1), True),
+        (QueryStats(count=3, duration=1.5), True),
+    ]
+)
+def test_report_queries(stats: QueryStats, logged: bool, monkeypatch: pytest.MonkeyPatch):
+    # GIVEN
+    logger = MagicMock()
+    monkeypatch.setattr(query_counter, "logger", logger)
+    monkeypatch.setattr(query_counter.settings, "QUERY_COUNT_THRESHOLD", 20)
+    monkeypatch.setattr(query_counter.settings, "QUERY_DURATION_THRESHOLD", 1.0)
+
+    # WHEN
+    report_queries("GET /v1/feeds/{external_id}", stats)
+
+    # THEN
+    assert logger.warning.called is logged
@@ -1,14 +1,25 @@
-from datetime import datetime
-from unittest.mock import MagicMock, patch
+import threading
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
-from src.adapters.scheduler import Scheduler
+from apscheduler.events import EVENT_JOB_MAX_INSTANCES, EVENT_JOB_MISSED
+from apscheduler.executors.base import MaxInstancesReachedError
+from apscheduler.triggers.cron import CronTrigger
+from src.adapters.scheduler import (
+    BoundedThreadPoolExecutor,
+    OffsetTrigger,
+    Scheduler,
+    run_handler,
+    settings,
+)
 from src.domain.models.job import Job
 
 
 @pytest.fixture
 def mock_scheduler():
-    with patch("src.adapters.scheduler.BackgroundScheduler") as mock_scheduler:
+    with patch("src.adapters.scheduler.StoppableBackgroundScheduler") as mock_scheduler:
         mock_instance = MagicMock()
         mock_scheduler.return_value = mock_instance
         yield mock_instance
@@ -16,7 +27,7 @@ def mock_scheduler():
 
 @pytest.fixture
 def scheduler(mock_scheduler):
-    return Scheduler()
+    return Scheduler(jitter_mode="off")
 
 
 def test_start_calls_scheduler_start(scheduler, mock_scheduler):
@@ -39,7 +50,7 @@ def test_add_job_calls_scheduler_add_job(scheduler, mock_scheduler):
         created_at=datetime(2025, 1, 1, 13, 0, 0)
     )
 
-    with patch("src.adapters.scheduler.HANDLERS", {"test_func": MagicMock()}) as mock_funcs:
+    with patch("src.adapters.scheduler.HANDLERS", {"test_func": MagicMock()}):
         # WHEN
         scheduler.add_job(job)
 
@@ -47,8 +58,8 @@ def test_add_job_calls_scheduler_add_job(scheduler, mock_scheduler):
         mock_scheduler.add_job.assert_called_once()
         called_kwargs = mock_scheduler.add_job.call_args.kwargs
 
-        assert called_kwargs["func"] == mock_funcs["test_func"]
-        assert called_kwargs["args"] == job.args
+        assert called_kwargs["func"] == "src.adapters.scheduler:run_handler"
+        assert called_kwargs["args"] == ["test_func", *job.args]
         assert called_kwargs["trigger"].__class__.__name__ == "CronTrigger"
 
 
@@ -90,7 +101,7 @@ def test_load_jobs_calls_add_job_for_each(scheduler):
         ),
     ]
 
-    with patch.object(scheduler, "add_job") as mock_add_job:
+    with patch.object(scheduler, "_add_job") as mock_add_job:
         # WHEN
         scheduler.load_jobs(jobs)
 
@@ -98,3 +109,244 @@ def test_load_jobs_calls_add_job_for_each(scheduler):
         assert mock_add_job.call_count == 2
         mock_add_job.assert_any_call(jobs[0])
         mock_add_job.assert_any_call(jobs[1])
+
+
+def test_start_paused(scheduler, mock_scheduler):
+    scheduler.start(paused=True)
+    mock_scheduler.start.assert_called_once_with(paused=True)
+
+
+def test_pause_and_resume(scheduler, mock_scheduler):
+    scheduler.pause()
+    scheduler.resume()
+    mock_scheduler.pause.assert_called_once()
+    mock_scheduler.resume.assert_called_once()
+
+
+def test_load_jobs_only_applies_changes(scheduler, mock_scheduler):
+    # GIVEN
+    unchanged_job = Job(func_name="f1", args=["1"], schedule="* * * * *")
+    changed_job = Job(func_name="f1", args=["2"], schedule="0 * * * *")
+    removed_job = Job(func_name="f1", args=["3"], schedule="0 0 * * *")
+    new_job = Job(func_name="f1", args=["4"], schedule="0 0 * * *")
+    with patch("src.adapters.scheduler.HANDLERS", {"f1": MagicMock()}):
+        previous_changed_job = changed_job.model_copy(update={"schedule": "* * * * *"})
+        scheduler.load_jobs([unchanged_job, previous_changed_job, removed_job])
+        mock_scheduler.add_job.reset_mock()
+
+        # WHEN
+        scheduler.load_jobs([unchanged_job, changed_job, new_job])
+
+    # THEN
+    added_ids = [call.kwargs["id"] for call in mock_scheduler.add_job.call_args_list]
+    assert added_ids == ["f1_2", "f1_4"]
+    mock_scheduler.remove_job.assert_called_once_with("f1_3")
+    assert scheduler.schedules == {
+        "f1_1": "* * * * *",
+        "f1_2": "0 * * * *",
+        "f1_4": "0 0 * * *",
+    }
+
+
+def test_offset_trigger_shifts_fire_times():
+    # GIVEN
+    trigger = OffsetTrigger(CronTrigger.from_crontab("*/15 * * * *", timezone="UTC"), 90)
+    now = datetime(2025, 1, 1, 10, 0, 0, tzinfo=UTC)
+
+    # WHEN
+    first_fire_time = trigger.get_next_fire_time(None, now)
+    second_fire_time = trigger.get_next_fire_time(first_fire_time, first_fire_time)
+
+    # THEN
+    assert first_fire_time == datetime(2025, 1, 1, 10, 1, 30, tzinfo=UTC)
+    assert second_fire_time == datetime(2025, 1, 1, 10, 16, 30, tzinfo=UTC)
+
+
+def test_jitter_is_deterministic_per_picker(mock_scheduler):
+    # GIVEN
+    schedulers = [Scheduler(jitter_mode="jitter", max_jitter=60) for _ in range(2)]
+    jobs = [
+        Job(func_name="f1", args=["picker-1", MagicMock()], schedule="*/15 * * * *"),
+        Job(func_name="f1", args=["picker-2", MagicMock()], schedule="*/15 * * * *"),
+    ]
+
+    # WHEN
+    with patch("src.adapters.scheduler.HANDLERS", {"f1": MagicMock()}):
+        for scheduler in schedulers:
+            scheduler.load_jobs(jobs)
+
+    # THEN
+    offsets = [sorted(scheduler.offsets.values()) for scheduler in schedulers]
+    assert offsets[0] == offsets[1]
+    assert len(set(offsets[0])) == 2
+    assert all(0 <= offset < 60 for offset in offsets[0])
+    trigger = mock_scheduler.add_job.call_args.kwargs["trigger"]
+    assert isinstance(trigger, OffsetTrigger)
+
+
+def test_jitter_stays_within_the_schedule_interval(mock_scheduler):
+    # GIVEN
+    scheduler = Scheduler(jitter_mode="jitter", max_jitter=3600)
+    job = Job(func_name="f1", args=["picker-1"], schedule="* * * * *")
+
+    # WHEN
+    with patch("src.adapters.scheduler.HANDLERS", {"f1": MagicMock()}):
+        scheduler.add_job(job)
+
+    # THEN
+    assert 0 < scheduler.offsets["f1_picker-1"] < 60
+
+
+def test_spread_places_jobs_evenly_across_the_interval(mock_scheduler):
+    # GIVEN
+    scheduler = Scheduler(jitter_mode="spread")
+    jobs = [
+        Job(func_name="f1", args=[str(picker_id)], schedule="*/15 * * * *")
+        for picker_id in range(4)
+    ] + [Job(func_name="f1", args=["hourly"], schedule="0 * * * *")]
+
+    with patch("src.adapters.scheduler.HANDLERS", {"f1": MagicMock()}):
+        # WHEN
+        scheduler.load_jobs(jobs)
+
+        # THEN
+        assert scheduler.offsets == {
+            "f1_0": 0,
+            "f1_1": 225,
+            "f1_2": 450,
+            "f1_3": 675,
+            "f1_hourly": 0,
+        }
+        assert mock_scheduler.reschedule_job.call_count == 3
+
+        # WHEN
+        scheduler.delete_job(jobs[1])
+
+    # THEN
+    assert scheduler.offsets == {"f1_0": 0, "f1_2": 300, "f1_3": 600, "f1_hourly": 0}
+
+
+@pytest.fixture
+def executor():
+    executor = BoundedThreadPoolExecutor(max_workers=1, max_queued_runs=1, late_run_threshold=10)
+    executor.start(MagicMock(_create_lock=threading.RLock), "default")
+    yield executor
+    executor.shutdown()
+
+
+def build_run(job_id: str, func, delay: int = 0):
+    job = SimpleNamespace(
+        id=job_id,
+        func=func,
+        args=[],
+        kwargs={},
+        max_instances=1,
+        misfire_grace_time=300,
+        _jobstore_alias="default",
+    )
+    return job, [datetime.now(UTC) - timedelta(seconds=delay)]
+
+
+def test_scheduler_uses_run_policy_from_settings():
+    with patch("src.adapters.scheduler.StoppableBackgroundScheduler") as mock_background_scheduler:
+        # WHEN
+        scheduler = Scheduler()
+
+    # THEN
+    mock_background_scheduler.assert_called_once_with(
+        jobstores={"default": ANY},
+        executors={"default": scheduler.executor},
+        job_defaults={
+            "max_instances": settings.SCHEDULER_MAX_INSTANCES,
+            "coalesce": settings.SCHEDULER_COALESCE,
+            "misfire_grace_time": settings.SCHEDULER_MISFIRE_GRACE_TIME,
+        }
+    )
+    assert scheduler.executor._pool._max_workers == settings.SCHEDULER_EXECUTOR_THREADS
+
+
+def test_executor_skips_runs_when_queue_is_full(executor):
+    # GIVEN
+    release = threading.Event()
+    executor.submit_job(*build_run("running", lambda: release.wait(5)))
+    executor.submit_job(*build_run("queued", lambda: None))
+
+    # WHEN / THEN
+    with pytest.raises(MaxInstancesReachedError):
+        executor.submit_job(*build_run("skipped", lambda: None))
+    metrics = executor.get_metrics()
+    assert metrics.running_runs == 1
+    assert metrics.queued_runs == 1
+    release.set()
+
+
+def test_executor_counts_late_runs(executor):
+    # GIVEN
+    done = threading.Event()
+
+    # WHEN
+    executor.submit_job(*build_run("late", done.set, delay=60))
+    executor.submit_job(*build_run("missed", done.set, delay=600))
+
+    # THEN
+    assert done.wait(5)
+    executor.shutdown()
+    metrics = executor.get_metrics()
+    assert metrics.late_runs == 1
+    assert metrics.max_start_delay >= 600
+    assert metrics.queued_runs == 0
+    assert metrics.running_runs == 0
+
+
+def test_dropped_runs_are_counted(scheduler):
+    # WHEN
+    scheduler._on_run_dropped(SimpleNamespace(code=EVENT_JOB_MAX_INSTANCES))
+    scheduler._on_run_dropped(SimpleNamespace(code=EVENT_JOB_MISSED))
+    scheduler._on_run_dropped(SimpleNamespace(code=EVENT_JOB_MISSED))
+
+    # THEN
+    metrics = scheduler.get_metrics()
+    assert metrics.skipped_runs == 1
+    assert metrics.missed_runs == 2
+
+
+def test_run_handler_passes_handler_dependencies(scheduler):
+    # GIVEN
+    handler = MagicMock()
+    scheduler.set_handler_dependencies(job_service_factory="job service factory")
+
+    # WHEN
+    with patch("src.adapters.scheduler.HANDLERS", {"f1": handler}):
+        run_handler("f1", "1")
+
+    # THEN
+    handler.assert_called_once_with("1", job_service_factory="job service factory")
+
+
+def test_persisted_jobs_survive_a_restart(tmp_path, monkeypatch):
+    # GIVEN
+    monkeypatch.setattr(settings, "DATABASE_URL", f"sqlite:///{tmp_path / 'jobs.sqlite'}")
+    unchanged_job = Job(func_name="f1", args=["1"], schedule="*/15 * * * *")
+    changed_job = Job(func_name="f1", args=["2"], schedule="*/15 * * * *")
+    removed_job = Job(func_name="f1", args=["3"], schedule="*/15 * * * *")
+    missed_run_time = datetime.now(UTC) - timedelta(minutes=5)
+    with patch("src.adapters.scheduler.HANDLERS", {"f1": MagicMock()}):
+        scheduler = Scheduler(jitter_mode="jitter", jobstore="sqlalchemy")
+        scheduler.start(paused=True)
+        scheduler.load_jobs([unchanged_job, changed_job, removed_job])
+        scheduler.scheduler.modify_job("f1_1", next_run_time=missed_run_time)
+        offset = scheduler.offsets["f1_1"]
+        scheduler.shutdown()
+
+        # WHEN
+        restarted = Scheduler(jitter_mode="jitter", jobstore="sqlalchemy")
+        restarted.start(paused=True)
+        restarted.load_jobs([unchanged_job, changed_job.model_copy(update={"interval": 600})])
+
+    # THEN
+    jobs = {job.id: job for job in restarted.scheduler.get_jobs()}
+    assert set(jobs) == {"f1_1", "f1_2"}
+    assert jobs["f1_1"].next_run_time == missed_run_time
+    assert jobs["f1_2"].trigger.__class__.__name__ == "IntervalTrigger"
+    assert restarted.offsets == {"f1_1": offset, "f1_2": 0.0}
+    restarted.shutdown()
@@ -0,0 +1,60 @@
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+from src.adapters.source_fetcher import HttpSourceFetcher
+
+FEED = b"<rss version='2.0'><channel><title>Example</title></channel></rss>"
+
+
+@pytest.fixture
+def source():
+    requests = []
+
+    class SourceHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests.append(dict(self.headers))
+            self.send_response(200)
+            self.send_header("Content-Type", "application/rss+xml")
+            self.send_header("ETag", '"v1"')
+            self.end_headers()
+            self.wfile.write(FEED)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), SourceHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/feed", requests
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_fetch(source):
+    # GIVEN
+    url, requests = source
+
+    # WHEN
+    response = HttpSourceFetcher().fetch(url)
+
+    # THEN
+    assert response.status_code == 200
+    assert response.content == FEED
+    assert response.headers["content-type"] == "application/rss+xml"
+    assert response.headers["etag"] == '"v1"'
+    assert response.headers["content-location"] == url
+    assert requests[0]["User-Agent"].startswith("feedparser/")
+    assert "application/rss+xml" in requests[0]["Accept"]
+
+
+def test_fetch_unreachable_source():
+    # GIVEN
+    server = HTTPServer(("127.0.0.1", 0), BaseHTTPRequestHandler)
+    port = server.server_port
+    server.server_close()
+
+    # WHEN / THEN
+    assert HttpSourceFetcher().fetch(f"http://127.0.0.1:{port}/feed") is None
@@ -0,0 +1,149 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from src.adapters import tracing
+from src.adapters.scheduler import run_handler
+from src.adapters.source_fetcher import HttpSourceFetcher
+from src.adapters.tracing import _build_exporter, configure_tracing, inject_context, traced
+from src.domain.handlers import HANDLERS
+
+
+@pytest.fixture(scope="module")
+def provider_exporter():
+    # the global provider can only be installed once per process
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+    return exporter
+
+
+@pytest.fixture
+def span_exporter(provider_exporter):
+    provider_exporter.clear()
+    return provider_exporter
+
+
+@traced
+class Repository:
+    def get_item(self, item_id: int) -> int:
+        return self._load(item_id)
+
+    def _load(self, item_id: int) -> int:
+        return item_id
+
+
+def test_traced_runs_public_methods_in_spans(span_exporter):
+    # WHEN
+    with tracing.tracer.start_as_current_span("process_filters"):
+        result = Repository().get_item(3)
+
+    # THEN
+    assert result == 3
+    spans = {span.name: span for span in span_exporter.get_finished_spans()}
+    assert set(spans) == {"process_filters", "Repository.get_item"}
+    assert spans["Repository.get_item"].parent.span_id == spans["process_filters"].context.span_id
+
+
+def test_inject_context(span_exporter):
+    # WHEN
+    with tracing.tracer.start_as_current_span("process_filters") as span:
+        headers = inject_context({"Accept": "application/json"})
+
+    # THEN
+    assert headers["Accept"] == "application/json"
+    assert format(span.get_span_context().trace_id, "032x") in headers["traceparent"]
+
+
+def test_run_handler_starts_a_span(span_exporter, monkeypatch: pytest.MonkeyPatch):
+    # GIVEN
+    calls = []
+    monkeypatch.setitem(HANDLERS, "process_filters", calls.append)
+    monkeypatch.setattr("src.adapters.scheduler._handler_dependencies", {})
+
+    # WHEN
+    run_handler("process_filters", "7")
+
+    # THEN
+    assert calls == ["7"]
+    span = span_exporter.get_finished_spans()[0]
+    assert span.name == "process_filters"
+    assert span.attributes["job.args"] == ("7",)
+
+
+def test_source_fetch_span_records_failures(span_exporter):
+    # GIVEN
+    server = HTTPServer(("127.0.0.1", 0), BaseHTTPRequestHandler)
+    url = f"http://127.0.0.1:{server.server_port}/feed"
+    server.server_close()
+
+    # WHEN
+    HttpSourceFetcher().fetch(url)
+
+    # THEN
+    span = span_exporter.get_finished_spans()[0]
+    assert span.name == "source.fetch"
+    assert span.attributes["url.full"] == url
+    assert span.events[0].name == "exception"
+
+
+def test_source_fetch_does_not_propagate_the_trace(span_exporter):
+    # GIVEN
+    requests = []
+
+    class SourceHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests.append(dict(self.headers))
+            self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), SourceHandler)
+    thread = threading.Thread(target=server.handle_request, daemon=True)
+    thread.start()
+
+    # WHEN
+    with tracing.tracer.start_as_current_span("process_filters"):
+        HttpSourceFetcher().fetch(f"http://127.0.0.1:{server.server_port}/feed")
+    thread.join()
+    server.server_close()
+
+    # THEN
+    assert "traceparent" not in {name.lower() for name in requests[0]}
+    assert span_exporter.get_finished_spans()[0].name == "source.fetch"
+
+
+def test_configure_tracing_disabled(monkeypatch: pytest.MonkeyPatch):
+    # GIVEN
+    monkeypatch.setattr(tracing.settings, "TRACING_EXPORTER", "none")
+
+    # WHEN / THEN
+    assert configure_tracing("nebulapicker-test") is None
+
+
+def test_file_exporter_writes_one_span_per_line(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    # GIVEN
+    path = tmp_path / "traces.jsonl"
+    monkeypatch.setattr(tracing.settings, "TRACING_EXPORTER", "file")
+    monkeypatch.setattr(tracing.settings, "TRACING_FILE_PATH", str(path))
+    exporter = _build_exporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+
+    # WHEN
+    with provider.get_tracer(__name__).start_as_current_span("process_filters"):
+        pass
+    exporter.out.flush()
+
+    # THEN
+    lines = path.read_text().splitlines()
+    assert [json.loads(line)["name"] for line in lines] == ["process_filters"]
+
@@ -0,0 +1,74 @@
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs
+
+import pytest
+from src.adapters.websub_hub_client import WebSubHubClient
+
+
+@pytest.fixture
+def hub():
+    requests = []
+
+    class HubHandler(BaseHTTPRequestHandler):
+        status = 202
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"])).decode()
+            requests.append(parse_qs(body))
+            self.send_response(HubHandler.status)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), HubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/", HubHandler, requests
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def subscribe(hub_url: str) -> bool:
+    return WebSubHubClient().subscribe(
+        hub_url=hub_url,
+        topic_url="http://example.com/feed",
+        callback_url="https://nebula.example.com/v1/websub/1",
+        secret="secret",
+        lease_seconds=3600
+    )
+
+
+def test_subscribe(hub):
+    # GIVEN
+    hub_url, _, requests = hub
+
+    # WHEN
+    result = subscribe(hub_url)
+
+    # THEN
+    assert result is True
+    assert requests == [{
+        "hub.mode": ["subscribe"],
+        "hub.topic": ["http://example.com/feed"],
+        "hub.callback": ["https://nebula.example.com/v1/websub/1"],
+        "hub.secret": ["secret"],
+        "hub.lease_seconds": ["3600"],
+    }]
+
+
+def test_subscribe_refused_by_hub(hub):
+    # GIVEN
+    hub_url, handler, _ = hub
+    handler.status = 400
+
+    # WHEN / THEN
+    assert subscribe(hub_url) is False
+
+
+def test_subscribe_to_unreachable_hub():
+    # WHEN / THEN
+    assert subscribe("http://127.0.0.1:1/") is False
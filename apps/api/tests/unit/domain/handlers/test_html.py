@@ -0,0 +1,83 @@
+import pytest
+from src.domain.handlers.html import HTML_PROCESSORS, HtmlBlock, get_html_processor
+
+BLOCK_TAGS = ["h2", "p", "blockquote", "pre"]
+
+
+@pytest.fixture(params=list(HTML_PROCESSORS))
+def html_processor(request):
+    return get_html_processor(request.param)
+
+
+def test_get_image_sources(html_processor):
+    # GIVEN
+    html = '<p>Intro <img src="http://img.com/a.png"></p><img><figure><img src="b.jpg"></figure>'
+
+    # WHEN
+    result = html_processor.get_image_sources(html)
+
+    # THEN
+    assert result == ["http://img.com/a.png", "b.jpg"]
+
+
+@pytest.mark.parametrize("html", ["", '<?xml version="1.0" encoding="utf-8"?>\n'])
+def test_get_image_sources_of_empty_content(html_processor, html):
+    # WHEN / THEN
+    assert html_processor.get_image_sources(html) == []
+    assert html_processor.get_blocks(html, BLOCK_TAGS) == []
+    assert html_processor.rewrite_image_sources(html, {"a.png": "b.png"}) == html
+
+
+def test_rewrite_image_sources(html_processor):
+    # GIVEN
+    html = 'Lead &amp; text<p>Intro <img src="http://img.com/a.png"></p><img src="b.jpg">'
+
+    # WHEN
+    result = html_processor.rewrite_image_sources(
+        html,
+        {"http://img.com/a.png": "images/a.png"}
+    )
+
+    # THEN
+    assert result.startswith("Lead &amp; text<p>Intro ")
+    assert 'src="images/a.png"' in result
+    assert 'src="b.jpg"' in result
+    assert "http://img.com/a.png" not in result
+
+
+def test_rewrite_image_sources_without_sources_keeps_content(html_processor):
+    # GIVEN
+    html = "<div><p>Unchanged</p></div>"
+
+    # WHEN / THEN
+    assert html_processor.rewrite_image_sources(html, {}) is html
+
+
+def test_get_blocks(html_processor):
+    # GIVEN
+    html = (
+        "<h2>Intro</h2>"
+        "<blockquote><p>Quote\n  &amp; more</p></blockquote>"
+        '<div><p>Text <img src="a.png"></p><img src="b.png"></div>'
+        "<pre>code  block</pre>"
+    )
+
+    # WHEN
+    result = html_processor.get_blocks(html, BLOCK_TAGS)
+
+    # THEN
+    assert result == [
+        HtmlBlock(tag="h2", text="Intro"),
+        HtmlBlock(tag="blockquote", text="Quote & more"),
+        HtmlBlock(tag="p", text="Text", images=["a.png"]),
+        HtmlBlock(tag="img", images=["b.png"]),
+        HtmlBlock(tag="pre", text="code  block"),
+    ]
+
+
+def test_get_blocks_falls_back_to_plain_text(html_processor):
+    # WHEN
+    result = html_processor.get_blocks("<div>Only <b>plain</b> text</div>", BLOCK_TAGS)
+
+    # THEN
+    assert result == [HtmlBlock(tag="p", text="Only plain text")]
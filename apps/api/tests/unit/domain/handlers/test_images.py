@@ -0,0 +1,65 @@
+import io
+
+import pytest
+from PIL import Image
+from src.domain.handlers.images import compress_image
+
+
+def _build_image(
+    size: tuple[int, int],
+    image_format: str,
+    mode: str = "RGB",
+    **save_options
+) -> bytes:
+    image = Image.effect_noise(size, 64).convert(mode)
+    output = io.BytesIO()
+    image.save(output, format=image_format, **save_options)
+    return output.getvalue()
+
+
+@pytest.mark.parametrize("image_format", ["jpeg", "webp"])
+def test_compress_image_downscales_and_reencodes(image_format):
+    # GIVEN
+    data = _build_image((2000, 1000), "PNG")
+
+    # WHEN
+    result = compress_image(data, 500, image_format, 70)
+
+    # THEN
+    assert result is not None
+    assert len(result) < len(data)
+    with Image.open(io.BytesIO(result)) as image:
+        assert image.format == image_format.upper()
+        assert image.size == (500, 250)
+
+
+def test_compress_image_converts_transparent_images_to_jpeg():
+    # GIVEN
+    data = _build_image((800, 800), "PNG", mode="RGBA")
+
+    # WHEN
+    result = compress_image(data, 400, "jpeg", 70)
+
+    # THEN
+    assert result is not None
+    with Image.open(io.BytesIO(result)) as image:
+        assert image.mode == "RGB"
+
+
+def test_compress_image_returns_none_when_not_smaller():
+    # GIVEN
+    data = _build_image((64, 64), "JPEG", quality=20, optimize=True)
+
+    # WHEN
+    result = compress_image(data, 1200, "jpeg", 100)
+
+    # THEN
+    assert result is None
+
+
+def test_compress_image_returns_none_for_invalid_data():
+    # WHEN
+    result = compress_image(b"<html>not an image</html>", 1200, "jpeg", 75)
+
+    # THEN
+    assert result is None
@@ -1,16 +1,52 @@
 from unittest.mock import MagicMock
 
-from src.domain.handlers.job_processors import process_filters
+from src.domain.handlers.job_processors import (
+    process_filters,
+    process_pushed_entries,
+    prune_picker_runs,
+)
 from src.domain.services.job_service import JobService
 
 
 def test_process_filters_calls_job_service_with_int():
     # GIVEN
+    job_service_factory = MagicMock()
     mock_job_service = MagicMock(spec=JobService)
+    job_service_factory.return_value.__enter__.return_value = mock_job_service
     picker_id = "123"
 
     # WHEN
-    process_filters(picker_id, mock_job_service)
+    process_filters(picker_id, job_service_factory)
 
     # THEN
-    mock_job_service.process.assert_called_once_with(123)
+    mock_job_service.process.assert_called_once_with(123, skip_if_running=True)
+    job_service_factory.return_value.__exit__.assert_called_once()
+
+
+def test_prune_picker_runs_opens_its_own_job_service():
+    # GIVEN
+    job_service_factory = MagicMock()
+    mock_job_service = MagicMock(spec=JobService)
+    job_service_factory.return_value.__enter__.return_value = mock_job_service
+
+    # WHEN
+    prune_picker_runs(job_service_factory)
+
+    # THEN
+    mock_job_service.prune_picker_runs.assert_called_once_with()
+    job_service_factory.return_value.__exit__.assert_called_once()
+
+
+def test_process_pushed_entries_opens_its_own_job_service():
+    # GIVEN
+    job_service_factory = MagicMock()
+    mock_job_service = MagicMock(spec=JobService)
+    job_service_factory.return_value.__enter__.return_value = mock_job_service
+    entries = [MagicMock()]
+
+    # WHEN
+    process_pushed_entries(1, entries, job_service_factory)
+
+    # THEN
+    mock_job_service.process_pushed_entries.assert_called_once_with(1, entries)
+    job_service_factory.return_value.__exit__.assert_called_once()
@@ -0,0 +1,61 @@
+import io
+from datetime import datetime
+
+from PIL import Image
+from src.domain.handlers.pdf import render_pdf
+from src.domain.models.feed import RenderedArticle, RenderedImage
+
+
+def _write_article(path, content, images=None):
+    path.write_text(
+        RenderedArticle(
+            title="First item",
+            link="https://example.com/1",
+            author="Author A",
+            created_at=datetime(2025, 1, 1, 10, 0, 0),
+            reading_time=5,
+            content=content,
+            images=images or [],
+        ).model_dump_json()
+    )
+    return str(path)
+
+
+def test_render_pdf_writes_articles_and_images(tmp_path):
+    # GIVEN
+    images_dir = tmp_path / "images"
+    images_dir.mkdir()
+    image_buffer = io.BytesIO()
+    Image.new("RGB", (4000, 100), "red").save(image_buffer, format="PNG")
+    (images_dir / "key.0.png").write_bytes(image_buffer.getvalue())
+    article_paths = [
+        _write_article(
+            tmp_path / "first.json",
+            '<h2>Intro</h2><blockquote><p>Quote &amp; more</p></blockquote>'
+            '<img src="images/key.0.png"><img src="http://img.com/missing.png">'
+            '<pre>code  block</pre>',
+            [RenderedImage(name="key.0.png", media_type="image/png")]
+        ),
+        _write_article(tmp_path / "second.json", "Plain text — ünïcödé 日本語"),
+    ]
+    output_path = tmp_path / "export.pdf"
+
+    # WHEN
+    render_pdf("Test Feed", article_paths, str(images_dir), str(output_path), "lxml")
+
+    # THEN
+    data = output_path.read_bytes()
+    assert data.startswith(b"%PDF")
+    assert data.count(b"/Subtype /Image") == 1
+    assert b"/Count 2" in data
+
+
+def test_render_pdf_without_articles(tmp_path):
+    # GIVEN
+    output_path = tmp_path / "export.pdf"
+
+    # WHEN
+    render_pdf("Test Feed", [], str(tmp_path), str(output_path), "lxml")
+
+    # THEN
+    assert output_path.read_bytes().startswith(b"%PDF")
@@ -0,0 +1,86 @@
+import time
+from datetime import datetime
+
+import pytest
+from src.domain.handlers.polling import (
+    get_entry_times,
+    get_next_poll_interval,
+    get_publishing_interval,
+)
+
+
+def test_get_entry_times():
+    # GIVEN
+    entries = [
+        {"published_parsed": time.strptime("2025-01-01 12:00", "%Y-%m-%d %H:%M")},
+        {"updated_parsed": time.strptime("2025-01-01 10:00", "%Y-%m-%d %H:%M")},
+        {"title": "no timestamp"},
+    ]
+
+    # WHEN
+    result = get_entry_times(entries)
+
+    # THEN
+    assert result == [datetime(2025, 1, 1, 10, 0), datetime(2025, 1, 1, 12, 0)]
+
+
+def test_get_publishing_interval():
+    # GIVEN
+    entry_times = [
+        datetime(2025, 1, 1, 10, 0),
+        datetime(2025, 1, 1, 11, 0),
+        datetime(2025, 1, 1, 11, 0),
+        datetime(2025, 1, 1, 13, 0),
+        datetime(2025, 1, 1, 13, 30),
+    ]
+
+    # WHEN
+    result = get_publishing_interval(entry_times)
+
+    # THEN
+    assert result == 3600
+
+
+def test_get_publishing_interval_without_enough_entries():
+    # WHEN / THEN
+    assert get_publishing_interval([datetime(2025, 1, 1, 10, 0)]) is None
+
+
+@pytest.mark.parametrize(
+    ("found_new_entries", "publishing_interval", "expected"),
+    [
+        (True, 1200, 1200),
+        (True, None, 2400),
+        (True, 60, 300),
+        (False, 1200, 5400),
+        (False, None, 5400),
+    ]
+)
+def test_get_next_poll_interval(found_new_entries, publishing_interval, expected):
+    # WHEN
+    result = get_next_poll_interval(
+        current_interval=3600,
+        found_new_entries=found_new_entries,
+        publishing_interval=publishing_interval,
+        min_interval=300,
+        max_interval=86400,
+        backoff=1.5
+    )
+
+    # THEN
+    assert result == expected
+
+
+def test_get_next_poll_interval_backs_off_up_to_max_interval():
+    # WHEN
+    result = get_next_poll_interval(
+        current_interval=80000,
+        found_new_entries=False,
+        publishing_interval=None,
+        min_interval=300,
+        max_interval=86400,
+        backoff=1.5
+    )
+
+    # THEN
+    assert result == 86400
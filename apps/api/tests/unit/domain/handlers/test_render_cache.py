@@ -0,0 +1,109 @@
+import os
+import time
+from datetime import datetime
+
+from src.domain.handlers.render_cache import RenderCache, cache_key
+from src.domain.models.feed import RenderedArticle
+
+
+def test_cache_key_depends_on_every_part():
+    # WHEN / THEN
+    assert cache_key("a", 1) == cache_key("a", 1)
+    assert cache_key("a", 1) != cache_key("a", 2)
+
+
+def test_put_image_can_be_read_back(tmp_path):
+    # GIVEN
+    render_cache = RenderCache(tmp_path)
+    key = cache_key("http://img.com/a.png")
+
+    # WHEN
+    stored_image = render_cache.put_image(key, b"image_data", "webp", 10)
+    cached_image = render_cache.get_image(key)
+
+    # THEN
+    assert cached_image == stored_image
+    assert cached_image.media_type == "image/webp"
+    assert cached_image.bytes_saved == 10
+    assert (render_cache.images_dir / cached_image.name).read_bytes() == b"image_data"
+    assert render_cache.get_image(cache_key("http://img.com/b.png")) is None
+
+
+def test_put_article_can_be_read_back(tmp_path):
+    # GIVEN
+    render_cache = RenderCache(tmp_path)
+    article = RenderedArticle(
+        title="First item",
+        link="https://example.com/1",
+        author="Author A",
+        created_at=datetime(2025, 1, 1, 10, 0, 0),
+        reading_time=5,
+        content="<p>Content A</p>",
+    )
+
+    # WHEN
+    render_cache.put_article("key", article)
+    article_path = render_cache.get_article("key")
+
+    # THEN
+    assert RenderedArticle.model_validate_json(article_path.read_text()) == article
+    assert render_cache.get_article("other_key") is None
+
+
+def test_prune_removes_entries_not_used_recently(tmp_path):
+    # GIVEN
+    render_cache = RenderCache(tmp_path)
+    old_image = render_cache.put_image("old", b"old_data", "png", 0)
+    render_cache.put_image("new", b"new_data", "png", 0)
+    old_time = time.time() - 3600
+    os.utime(render_cache.images_dir / old_image.name, (old_time, old_time))
+
+    # WHEN
+    render_cache.prune(60)
+
+    # THEN
+    assert render_cache.get_image("old") is None
+    assert render_cache.get_image("new") is not None
+
+
+def test_get_article_keeps_its_images_from_being_pruned(tmp_path):
+    # GIVEN
+    render_cache = RenderCache(tmp_path)
+    image = render_cache.put_image("image", b"image_data", "png", 0)
+    render_cache.put_article("key", RenderedArticle(
+        title="First item",
+        link="https://example.com/1",
+        author="Author A",
+        created_at=datetime(2025, 1, 1, 10, 0, 0),
+        content='<img src="images/image.0.png">',
+        images=[image],
+    ))
+    old_time = time.time() - 3600
+    for path in (render_cache.images_dir / image.name, render_cache.articles_dir / "key.json"):
+        os.utime(path, (old_time, old_time))
+
+    # WHEN
+    article_path = render_cache.get_article("key")
+    render_cache.prune(60)
+
+    # THEN
+    assert article_path is not None
+    assert (render_cache.images_dir / image.name).exists()
+
+
+def test_get_article_misses_when_an_image_is_gone(tmp_path):
+    # GIVEN
+    render_cache = RenderCache(tmp_path)
+    image = render_cache.put_image("image", b"image_data", "png", 0)
+    render_cache.put_article("key", RenderedArticle(
+        title="First item",
+        link="https://example.com/1",
+        author="Author A",
+        created_at=datetime(2025, 1, 1, 10, 0, 0),
+        content='<img src="images/image.0.png">',
+        images=[image],
+    ))
+    (render_cache.images_dir / image.name).unlink()
+
+    # WHEN / THEN
+    assert render_cache.get_article("key") is None
@@ -0,0 +1,92 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+from src.domain.handlers.seen_entries import SeenEntries, get_filters_version, get_fingerprint
+from src.domain.models.filter import Filter, Operation
+
+
+def build_entry(link: str, guid: str | None = None) -> SimpleNamespace:
+    if guid:
+        return SimpleNamespace(id=guid, link=link)
+    return SimpleNamespace(link=link)
+
+
+def build_filter(operation: Operation, args: str) -> Filter:
+    return Filter(
+        id=1, picker_id=1, operation=operation, args=args, created_at=datetime(2025, 1, 1)
+    )
+
+
+def test_get_fingerprint_prefers_guid():
+    # WHEN / THEN
+    assert get_fingerprint(build_entry("http://a.com", "guid")) == get_fingerprint(
+        build_entry("http://b.com", "guid")
+    )
+    assert get_fingerprint(build_entry("http://a.com")) != get_fingerprint(
+        build_entry("http://b.com")
+    )
+
+
+def test_get_filters_version():
+    # GIVEN
+    filters = [build_filter(Operation.title_contains, "['python', 1]")]
+
+    # WHEN / THEN
+    assert get_filters_version(filters) == get_filters_version(list(filters))
+    assert get_filters_version(filters) != get_filters_version(
+        [build_filter(Operation.title_contains, "['rust', 1]")]
+    )
+    assert get_filters_version(filters) != get_filters_version([])
+
+
+def test_get_unseen():
+    # GIVEN
+    seen_entries = SeenEntries(window=10)
+    first, second = build_entry("http://a.com"), build_entry("http://b.com")
+    seen_entries.add(1, "version", [first])
+
+    # WHEN / THEN
+    assert seen_entries.get_unseen(1, "version", [first, second]) == [second]
+    assert seen_entries.get_unseen(2, "version", [first, second]) == [first, second]
+
+
+def test_get_unseen_with_other_filters_version():
+    # GIVEN
+    seen_entries = SeenEntries(window=10)
+    entry = build_entry("http://a.com")
+    seen_entries.add(1, "version", [entry])
+
+    # WHEN
+    result = seen_entries.get_unseen(1, "other version", [entry])
+
+    # THEN
+    assert result == [entry]
+    assert seen_entries.get_unseen(1, "version", [entry]) == [entry]
+
+
+def test_add_slides_window():
+    # GIVEN
+    seen_entries = SeenEntries(window=2)
+    first, second, third = (build_entry(f"http://{name}.com") for name in "abc")
+    seen_entries.add(1, "version", [first, second])
+    # first is still in the source, so it is kept over second
+    seen_entries.get_unseen(1, "version", [first])
+
+    # WHEN
+    seen_entries.add(1, "version", [third])
+
+    # THEN
+    assert seen_entries.get_unseen(1, "version", [first, second, third]) == [second]
+
+
+def test_discard():
+    # GIVEN
+    seen_entries = SeenEntries(window=10)
+    entry = build_entry("http://a.com")
+    seen_entries.add(1, "version", [entry])
+
+    # WHEN
+    seen_entries.discard(1)
+
+    # THEN
+    assert seen_entries.get_unseen(1, "version", [entry]) == [entry]
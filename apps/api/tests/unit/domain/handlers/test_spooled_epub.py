@@ -0,0 +1,46 @@
+from src.domain.handlers.spooled_epub import SpooledEpubHtml, SpooledEpubItem
+
+
+def test_spooled_epub_item_keeps_content_on_disk(tmp_path):
+    # GIVEN
+    spool_path = tmp_path / "img0_0"
+
+    # WHEN
+    item = SpooledEpubItem(
+        spool_path=spool_path,
+        uid="img0_0",
+        file_name="images/0_0.png",
+        media_type="image/png",
+        content=b"image_bytes"
+    )
+
+    # THEN
+    assert "content" not in vars(item)
+    assert spool_path.read_bytes() == b"image_bytes"
+    assert item.get_content() == b"image_bytes"
+
+
+def test_spooled_epub_html_encodes_text_content(tmp_path):
+    # GIVEN
+    chapter = SpooledEpubHtml(
+        spool_path=tmp_path / "0.xhtml",
+        title="Chapter",
+        file_name="0.xhtml",
+        lang="en"
+    )
+
+    # WHEN
+    chapter.content = "<html><body><p>Olá</p></body></html>"
+
+    # THEN
+    assert chapter.content == "<html><body><p>Olá</p></body></html>".encode()
+    assert "Olá".encode() in chapter.get_body_content()
+
+
+def test_spooled_epub_item_without_content_is_empty(tmp_path):
+    # WHEN
+    item = SpooledEpubItem(spool_path=tmp_path / "missing", uid="missing")
+    (tmp_path / "missing").unlink()
+
+    # THEN
+    assert item.content == b""
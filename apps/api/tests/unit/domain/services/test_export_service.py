@@ -0,0 +1,232 @@
+import tempfile
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from src.domain.models.export import ExportJob, ExportJobStatus
+from src.domain.models.feed import ExportedFile, Feed
+from src.domain.services.export_service import ExportService, settings
+
+START_TIME = datetime(2025, 1, 1, tzinfo=UTC)
+END_TIME = datetime(2025, 1, 2, tzinfo=UTC)
+
+
+@pytest.fixture
+def feed():
+    return Feed(
+        id=1,
+        external_id=uuid4(),
+        name="Test Feed",
+        created_at=datetime(2025, 1, 1, 12, 0, 0),
+        updated_at=datetime(2025, 1, 1, 12, 0, 0),
+    )
+
+
+@pytest.fixture
+def feed_service_mock(feed):
+    feed_service = MagicMock()
+    feed_service.get_feed_by_external_id.return_value = feed
+    feed_service.get_feed_version.return_value = "version_1"
+
+    def export_file(*args):
+        content = tempfile.SpooledTemporaryFile()
+        content.write(b"fake_epub_data")
+        content.seek(0)
+        return ExportedFile(
+            content=content,
+            media_type="application/epub+zip",
+            file_name="export.epub",
+            images_bytes_saved=10
+        )
+
+    feed_service.export_file.side_effect = export_file
+    return feed_service
+
+
+@pytest.fixture
+def export_jobs_mock(feed):
+    export_jobs = MagicMock()
+
+    def get_or_create_export_job(export_job_request, stale_before):
+        return ExportJob(
+            external_id=uuid4(),
+            feed_external_id=feed.external_id,
+            file_type=export_job_request.file_type,
+            start_time=export_job_request.start_time,
+            end_time=export_job_request.end_time,
+            created_at=datetime.now(UTC)
+        ), True
+
+    export_jobs.get_or_create_export_job.side_effect = get_or_create_export_job
+    export_jobs.update_export_job.return_value = True
+    export_jobs.delete_least_recently_used_export_jobs.return_value = []
+    return export_jobs
+
+
+@pytest.fixture
+def export_service(feed_service_mock, export_jobs_mock, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "EXPORT_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "EXPORT_WORKERS", 1)
+
+    @contextmanager
+    def feed_service_factory():
+        yield feed_service_mock
+
+    @contextmanager
+    def export_jobs_factory():
+        yield export_jobs_mock
+
+    export_service = ExportService(
+        feed_service_factory=feed_service_factory,
+        export_jobs_factory=export_jobs_factory
+    )
+    yield export_service
+    export_service.shutdown()
+
+
+def _wait_for_jobs(export_service):
+    export_service.executor.shutdown(wait=True)
+
+
+def _get_stored_job(export_jobs_mock) -> ExportJob:
+    return export_jobs_mock.update_export_job.call_args[0][0]
+
+
+def test_create_export_job_builds_file_in_background(export_service, export_jobs_mock, feed):
+    # GIVEN
+    statuses = []
+
+    def update_export_job(job):
+        statuses.append(job.status)
+        return True
+
+    export_jobs_mock.update_export_job.side_effect = update_export_job
+
+    # WHEN
+    job = export_service.create_export_job(feed.external_id, "epub", START_TIME, END_TIME)
+    _wait_for_jobs(export_service)
+
+    # THEN
+    stored_job = _get_stored_job(export_jobs_mock)
+    assert stored_job.external_id == job.external_id
+    assert stored_job.status == ExportJobStatus.completed
+    assert stored_job.media_type == "application/epub+zip"
+    assert stored_job.file_name == "export.epub"
+    assert stored_job.images_bytes_saved == 10
+    assert Path(stored_job.file_path).parent == Path(settings.EXPORT_CACHE_DIR) / "jobs"
+    assert statuses == [ExportJobStatus.running, ExportJobStatus.completed]
+    with export_service.open_export_file(stored_job) as export_file:
+        assert export_file.read() == b"fake_epub_data"
+
+
+def test_create_export_job_returns_none_when_feed_does_not_exist(
+    export_service, feed_service_mock, export_jobs_mock
+):
+    # GIVEN
+    feed_service_mock.get_feed_by_external_id.return_value = None
+
+    # WHEN
+    job = export_service.create_export_job(uuid4(), "epub", START_TIME, END_TIME)
+
+    # THEN
+    assert job is None
+    feed_service_mock.export_file.assert_not_called()
+    export_jobs_mock.get_or_create_export_job.assert_not_called()
+
+
+def test_create_export_job_keys_the_job_by_feed_version_and_utc_range(
+    export_service, export_jobs_mock, feed
+):
+    # WHEN
+    export_service.create_export_job(
+        feed.external_id,
+        "epub",
+        START_TIME.astimezone(),
+        END_TIME.astimezone()
+    )
+    _wait_for_jobs(export_service)
+
+    # THEN
+    export_job_request = export_jobs_mock.get_or_create_export_job.call_args[0][0]
+    assert export_job_request.feed_id == feed.id
+    assert export_job_request.feed_version == "version_1"
+    assert export_job_request.start_time.utcoffset().total_seconds() == 0
+    assert (export_job_request.start_time, export_job_request.end_time) == (START_TIME, END_TIME)
+
+
+def test_create_export_job_reuses_stored_job(
+    export_service, export_jobs_mock, feed, feed_service_mock
+):
+    # GIVEN
+    stored_job = ExportJob(
+        external_id=uuid4(),
+        feed_external_id=feed.external_id,
+        file_type="epub",
+        start_time=START_TIME,
+        end_time=END_TIME,
+        status=ExportJobStatus.running,
+        created_at=datetime.now(UTC)
+    )
+    export_jobs_mock.get_or_create_export_job.side_effect = None
+    export_jobs_mock.get_or_create_export_job.return_value = (stored_job, False)
+
+    # WHEN
+    job = export_service.create_export_job(feed.external_id, "epub", START_TIME, END_TIME)
+    _wait_for_jobs(export_service)
+
+    # THEN
+    assert job == stored_job
+    feed_service_mock.export_file.assert_not_called()
+    export_jobs_mock.update_export_job.assert_not_called()
+
+
+def test_create_export_job_stores_failed_export(
+    export_service, export_jobs_mock, feed, feed_service_mock
+):
+    # GIVEN
+    feed_service_mock.export_file.side_effect = Exception("wrong file type")
+
+    # WHEN
+    export_service.create_export_job(feed.external_id, "epub", START_TIME, END_TIME)
+    _wait_for_jobs(export_service)
+
+    # THEN
+    failed_job = _get_stored_job(export_jobs_mock)
+    assert failed_job.status == ExportJobStatus.failed
+    assert failed_job.error == "wrong file type"
+    assert export_service.open_export_file(failed_job) is None
+
+
+def test_create_export_job_removes_files_of_evicted_jobs(
+    export_service, export_jobs_mock, feed, monkeypatch
+):
+    # GIVEN
+    monkeypatch.setattr(settings, "EXPORT_CACHE_MAX_ENTRIES", 1)
+    evicted_file = export_service.export_dir / "evicted.epub"
+    evicted_file.write_bytes(b"old")
+    export_jobs_mock.delete_least_recently_used_export_jobs.return_value = [str(evicted_file)]
+
+    # WHEN
+    export_service.create_export_job(feed.external_id, "epub", START_TIME, END_TIME)
+    _wait_for_jobs(export_service)
+
+    # THEN
+    export_jobs_mock.delete_least_recently_used_export_jobs.assert_called_once_with(1)
+    assert not evicted_file.exists()
+
+
+def test_export_job_evicted_while_running_removes_its_file(
+    export_service, export_jobs_mock, feed
+):
+    # GIVEN
+    export_jobs_mock.update_export_job.return_value = False
+
+    # WHEN
+    export_service.create_export_job(feed.external_id, "epub", START_TIME, END_TIME)
+    _wait_for_jobs(export_service)
+
+    # THEN
+    assert not Path(_get_stored_job(export_jobs_mock).file_path).exists()
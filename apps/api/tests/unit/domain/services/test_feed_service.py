@@ -1,13 +1,20 @@
+import io
+import os
+import time
 import unittest
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
 import pytest
-from bs4 import BeautifulSoup
+from PIL import Image
 from src.adapters.entrypoints.v1.models.feeds import ExportFileType
+from src.domain.handlers.html import get_html_processor
 from src.domain.models.feed import Feed, FeedItem, FeedRequest, UpdateFeedRequest
-from src.domain.services.feed_service import FeedService
+from src.domain.services.feed_service import FeedService, settings
 
 
 @pytest.fixture
@@ -25,6 +32,12 @@ def extractor_service_mock():
     return MagicMock()
 
 
+@pytest.fixture(autouse=True)
+def export_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "EXPORT_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
 @pytest.fixture
 def feed_service(feeds_port_mock):
     return FeedService(feeds_port=feeds_port_mock, extractor_service=extractor_service_mock)
@@ -203,6 +216,27 @@ def test_get_feed_by_external_id_delegates_to_port(feed_service, feeds_port_mock
     assert result == feed
 
 
+def test_get_feed_version_changes_with_number_of_feed_items(feed_service, feeds_port_mock):
+    # GIVEN
+    feed = Feed(
+        id=1,
+        name="Example Feed",
+        external_id=uuid4(),
+        created_at=datetime(2025, 1, 1, 12, 0, 0),
+        updated_at=datetime(2025, 1, 2, 12, 0, 0),
+    )
+    feeds_port_mock.get_number_of_feed_items_by_feed_id.side_effect = [3, 2]
+
+    # WHEN
+    first_version = feed_service.get_feed_version(feed)
+    second_version = feed_service.get_feed_version(feed)
+
+    # THEN
+    assert first_version == "2025-01-02T12:00:00_3"
+    assert first_version != second_version
+    feeds_port_mock.get_number_of_feed_items_by_feed_id.assert_called_with(feed.id)
+
+
 @unittest.skip("Temporarily disabled")
 def test_create_feed_item_delegates_to_port(feed_service, feeds_port_mock):
     # GIVEN
@@ -218,11 +252,32 @@ def test_create_feed_item_delegates_to_port(feed_service, feeds_port_mock):
     assert result == expected_feed_item
 
 
+def test_create_feed_item_without_extraction_bumps_the_feed(
+    feed_service, feeds_port_mock, monkeypatch
+):
+    # GIVEN
+    monkeypatch.setattr(settings, "WALLABAG_ENABLED", False)
+    feed_item_request = MagicMock(feed_id=1)
+
+    # WHEN
+    result = feed_service.create_feed_item(feed_item_request)
+
+    # THEN
+    assert result == feeds_port_mock.create_feed_item.return_value
+    feeds_port_mock.set_updated_at.assert_called_once_with(1)
+
+
 @patch("src.domain.services.feed_service.requests")
-@patch("src.domain.services.feed_service.epub")
-@patch("src.domain.services.feed_service.BeautifulSoup")
+@patch("src.domain.handlers.spooled_epub.SpooledEpubItem")
+@patch("src.domain.handlers.spooled_epub.SpooledEpubHtml")
+@patch("ebooklib.epub")
 def test_export_file_epub_success(
-        mock_beautifulsoup, mock_epub, mock_requests, feed_service, feeds_port_mock
+        mock_epub,
+        mock_spooled_epub_html,
+        mock_spooled_epub_item,
+        mock_requests,
+        feed_service,
+        feeds_port_mock
 ):
     # GIVEN
     feed_external_id = uuid4()
@@ -230,7 +285,6 @@ def test_export_file_epub_success(
     start_time = datetime(2025, 1, 1, 10, 0, 0, tzinfo=UTC) - timedelta(hours=1)
     end_time = datetime(2025, 1, 1, 10, 0, 0, tzinfo=UTC) + timedelta(hours=1)
     item_created_at_in_range = datetime(2025, 1, 1, 10, 0, 0)
-    item_created_at_out_of_range = datetime(2025, 1, 5, 10, 0, 0)
     feed = Feed(
         id=feed_id,
         external_id=feed_external_id,
@@ -250,40 +304,21 @@ def test_export_file_epub_success(
         reading_time=5,
         created_at=item_created_at_in_range,
     )
-    feed_item_out_of_range = FeedItem(
-        id=11,
-        feed_id=feed_id,
-        external_id=uuid4(),
-        link="https://example.com/2",
-        title="Second item",
-        description="Desc 2",
-        author="Author B",
-        content="Content B",
-        reading_time=10,
-        created_at=item_created_at_out_of_range,
-    )
-    all_feed_items = [feed_item_in_range, feed_item_out_of_range]
     feeds_port_mock.get_feed_by_external_id.return_value = feed
-    feeds_port_mock.get_active_feed_items_by_feed_id.return_value = all_feed_items
-    mock_soup_instance = MagicMock(spec=BeautifulSoup)
-    mock_img_tag = MagicMock()
-    mock_img_tag.get.return_value = "http://img.com/a.jpg"
-    mock_soup_instance.find_all.return_value = [mock_img_tag]
-    mock_soup_instance.__str__.return_value = 'Mocked HTML Content'
-    mock_beautifulsoup.return_value = mock_soup_instance
+    feeds_port_mock.get_active_feed_items_by_feed_id_and_period.return_value = iter(
+        [feed_item_in_range]
+    )
     mock_response = MagicMock()
     mock_response.content = b"fake_image_content"
     mock_requests.get.return_value = mock_response
     mock_epub_book = MagicMock()
     mock_epub.EpubBook.return_value = mock_epub_book
-    mock_epub.EpubHtml.return_value = MagicMock()
-    mock_epub.EpubItem.return_value = MagicMock()
     mock_epub.write_epub = MagicMock(
         side_effect=lambda buffer, book, opts: buffer.write(b"fake_epub_data")
     )
 
     # WHEN
-    result_buffer = feed_service.export_file(
+    result = feed_service.export_file(
         feed_external_id=feed_external_id,
         file_type=ExportFileType.epub.value,
         start_time=start_time.replace(tzinfo=None),
@@ -294,18 +329,130 @@ def test_export_file_epub_success(
     feeds_port_mock.get_feed_by_external_id.assert_called_once_with(
         feed_external_id
     )
-    feeds_port_mock.get_active_feed_items_by_feed_id.assert_called_once_with(feed.id)
-    assert len(mock_beautifulsoup.call_args_list) == 1
-    assert feed_item_in_range.content in mock_beautifulsoup.call_args[0]
+    feeds_port_mock.get_active_feed_items_by_feed_id_and_period.assert_called_once_with(
+        feed.id,
+        start_time.replace(tzinfo=None).astimezone(UTC),
+        end_time.replace(tzinfo=None).astimezone(UTC)
+    )
+    mock_requests.get.assert_called_once()
+    assert mock_requests.get.call_args[0][0] == "http://img.com/a.jpg"
     assert mock_epub_book.set_title.call_args[0][0].endswith("(5m)")
     assert mock_epub_book.add_item.call_count > 0
     assert mock_epub.write_epub.called
-    assert result_buffer.getvalue() == b"fake_epub_data"
-    assert result_buffer.tell() == 0
+    assert result.content.tell() == 0
+    assert result.content.read() == b"fake_epub_data"
+    assert result.media_type == "application/epub+zip"
+    assert result.images_bytes_saved == 0
     expected_chapter_title = (
         f"{feed_item_in_range.created_at.strftime('%Y-%m-%d')} - First item (5m)"
     )
-    assert mock_epub.EpubHtml.call_args[1]['title'] == expected_chapter_title
+    assert mock_spooled_epub_html.call_args[1]['title'] == expected_chapter_title
+
+
+@patch("src.domain.services.feed_service.requests")
+def test_export_file_epub_writes_archive_to_spooled_file(
+        mock_requests, feed_service, feeds_port_mock, monkeypatch
+):
+    # GIVEN
+    monkeypatch.setattr(settings, "EXPORT_SPOOL_MAX_SIZE", 1024)
+    feed = Feed(
+        id=1,
+        external_id=uuid4(),
+        name="Test Feed",
+        created_at=datetime(2024, 1, 1, 12, 0, 0),
+        updated_at=datetime(2024, 1, 1, 12, 0, 0),
+    )
+    feeds_port_mock.get_feed_by_external_id.return_value = feed
+    feeds_port_mock.get_active_feed_items_by_feed_id_and_period.return_value = [
+        FeedItem(
+            id=10 + index,
+            feed_id=feed.id,
+            external_id=uuid4(),
+            link=f"https://example.com/{index}",
+            title=f"Item {index}",
+            description="Desc",
+            content=f"<p>Content {index}</p>" * 200,
+            reading_time=1,
+            created_at=datetime(2025, 1, 1, 10, index, 0),
+        )
+        for index in range(3)
+    ]
+
+    # WHEN
+    result = feed_service.export_file(
+        feed_external_id=feed.external_id,
+        file_type=ExportFileType.epub.value,
+        start_time=datetime(2025, 1, 1, tzinfo=UTC),
+        end_time=datetime(2025, 1, 2, tzinfo=UTC),
+    )
+
+    # THEN
+    assert result.content._rolled
+    with zipfile.ZipFile(result.content) as archive:
+        assert archive.read("mimetype") == b"application/epub+zip"
+        chapters = [archive.read(f"EPUB/{index}.xhtml").decode() for index in range(3)]
+    assert all(f"Content {index}" in chapter for index, chapter in enumerate(chapters))
+    mock_requests.get.assert_not_called()
+
+
+def build_thread_pool(max_workers: int, mp_context):
+    # the API process is multi-threaded, so its worker processes must not be forked from it
+    assert mp_context.get_start_method() == "forkserver"
+    return ThreadPoolExecutor(max_workers)
+
+
+@patch("src.domain.services.feed_service.ProcessPoolExecutor", build_thread_pool)
+@patch("src.domain.services.feed_service.requests")
+def test_export_file_epub_compresses_images(
+        mock_requests, feed_service, feeds_port_mock, monkeypatch
+):
+    # GIVEN
+    monkeypatch.setattr(settings, "EXPORT_IMAGE_PROCESSING_ENABLED", True)
+    monkeypatch.setattr(settings, "EXPORT_IMAGE_MAX_DIMENSION", 300)
+    monkeypatch.setattr(settings, "EXPORT_IMAGE_FORMAT", "webp")
+    feed = Feed(
+        id=1,
+        external_id=uuid4(),
+        name="Test Feed",
+        created_at=datetime(2024, 1, 1, 12, 0, 0),
+        updated_at=datetime(2024, 1, 1, 12, 0, 0),
+    )
+    feeds_port_mock.get_feed_by_external_id.return_value = feed
+    feeds_port_mock.get_active_feed_items_by_feed_id_and_period.return_value = [
+        FeedItem(
+            id=10,
+            feed_id=feed.id,
+            external_id=uuid4(),
+            link="https://example.com/1",
+            title="First item",
+            description="Desc 1",
+            content='<p>Content A</p><img src="http://img.com/a.png">',
+            reading_time=5,
+            created_at=datetime(2025, 1, 1, 10, 0, 0),
+        )
+    ]
+    image_buffer = io.BytesIO()
+    Image.effect_noise((1200, 900), 64).convert("RGB").save(image_buffer, format="PNG")
+    original_image = image_buffer.getvalue()
+    mock_requests.get.return_value = MagicMock(content=original_image)
+
+    # WHEN
+    result = feed_service.export_file(
+        feed_external_id=feed.external_id,
+        file_type=ExportFileType.epub.value,
+        start_time=datetime(2025, 1, 1, tzinfo=UTC),
+        end_time=datetime(2025, 1, 2, tzinfo=UTC),
+    )
+
+    # THEN
+    with zipfile.ZipFile(result.content) as archive:
+        [image_name] = [name for name in archive.namelist() if name.startswith("EPUB/images/")]
+        compressed_image = archive.read(image_name)
+        chapter = archive.read("EPUB/0.xhtml").decode()
+    assert image_name.endswith(".webp")
+    assert result.images_bytes_saved == len(original_image) - len(compressed_image)
+    assert result.images_bytes_saved > 0
+    assert f'src="{image_name.removeprefix("EPUB/")}"' in chapter
 
 
 def test_export_file_wrong_file_type(feed_service, feeds_port_mock):
@@ -318,12 +465,163 @@ def test_export_file_wrong_file_type(feed_service, feeds_port_mock):
     with pytest.raises(Exception, match="wrong file type"):
         feed_service.export_file(
             feed_external_id=feed_external_id,
-            file_type="pdf",
+            file_type="docx",
             start_time=start_time,
             end_time=end_time
         )
 
 
+def _build_png(size: tuple[int, int]) -> bytes:
+    image_buffer = io.BytesIO()
+    Image.effect_noise(size, 64).convert("RGB").save(image_buffer, format="PNG")
+    return image_buffer.getvalue()
+
+
+@patch("src.domain.services.feed_service.requests")
+def test_export_file_pdf_success(mock_requests, feed_service, feeds_port_mock):
+    # GIVEN
+    feed = Feed(
+        id=1,
+        external_id=uuid4(),
+        name="Test Feed",
+        created_at=datetime(2024, 1, 1, 12, 0, 0),
+        updated_at=datetime(2024, 1, 1, 12, 0, 0),
+    )
+    feeds_port_mock.get_feed_by_external_id.return_value = feed
+    feeds_port_mock.get_active_feed_items_by_feed_id_and_period.return_value = [
+        FeedItem(
+            id=10,
+            feed_id=feed.id,
+            external_id=uuid4(),
+            link="https://example.com/1",
+            title="First item",
+            description="Desc 1",
+            author="Author A",
+            content='<h2>Intro</h2><p>Content A</p><img src="http://img.com/a.png">',
+            reading_time=5,
+            created_at=datetime(2025, 1, 1, 10, 0, 0),
+        )
+    ]
+    mock_requests.get.return_value = MagicMock(content=_build_png((200, 100)))
+
+    # WHEN
+    result = feed_service.export_file(
+        feed_external_id=feed.external_id,
+        file_type=ExportFileType.pdf.value,
+        start_time=datetime(2025, 1, 1, tzinfo=UTC),
+        end_time=datetime(2025, 1, 2, tzinfo=UTC),
+    )
+
+    # THEN
+    data = result.content.read()
+    assert data.startswith(b"%PDF")
+    assert b"/Subtype /Image" in data
+    assert result.media_type == "application/pdf"
+    assert result.file_name == "export.pdf"
+    mock_requests.get.assert_called_once()
+
+
+@patch("src.domain.handlers.html.get_html_processor", wraps=get_html_processor)
+@patch("src.domain.services.feed_service.requests")
+def test_export_file_reuses_rendered_articles_across_formats(
+        mock_requests, mock_get_html_processor, feed_service, feeds_port_mock
+):
+    # GIVEN
+    feed = Feed(
+        id=1,
+        external_id=uuid4(),
+        name="Test Feed",
+        created_at=datetime(2024, 1, 1, 12, 0, 0),
+        updated_at=datetime(2024, 1, 1, 12, 0, 0),
+    )
+    feeds_port_mock.get_feed_by_external_id.return_value = feed
+    feeds_port_mock.get_active_feed_items_by_feed_id_and_period.return_value = [
+        FeedItem(
+            id=10,
+            feed_id=feed.id,
+            external_id=uuid4(),
+            link="https://example.com/1",
+            title="First item",
+            description="Desc 1",
+            content='<p>Content A</p><img src="http://img.com/a.png">',
+            reading_time=5,
+            created_at=datetime(2025, 1, 1, 10, 0, 0),
+        )
+    ]
+    mock_requests.get.return_value = MagicMock(content=_build_png((200, 100)))
+    feed_service.export_file(
+        feed_external_id=feed.external_id,
+        file_type=ExportFileType.epub.value,
+        start_time=datetime(2025, 1, 1, tzinfo=UTC),
+        end_time=datetime(2025, 1, 2, tzinfo=UTC),
+    )
+
+    # WHEN
+    result = feed_service.export_file(
+        feed_external_id=feed.external_id,
+        file_type=ExportFileType.pdf.value,
+        start_time=datetime(2025, 1, 1, tzinfo=UTC),
+        end_time=datetime(2025, 1, 2, tzinfo=UTC),
+    )
+
+    # THEN
+    assert result.content.read().startswith(b"%PDF")
+    assert mock_requests.get.call_count == 1
+    assert mock_get_html_processor.call_count == 1
+
+
+@patch("src.domain.services.feed_service.requests")
+def test_export_file_keeps_images_of_cached_articles_after_pruning(
+        mock_requests, feed_service, feeds_port_mock
+):
+    # GIVEN
+    feed = Feed(
+        id=1,
+        external_id=uuid4(),
+        name="Test Feed",
+        created_at=datetime(2024, 1, 1, 12, 0, 0),
+        updated_at=datetime(2024, 1, 1, 12, 0, 0),
+    )
+    feeds_port_mock.get_feed_by_external_id.return_value = feed
+    feeds_port_mock.get_active_feed_items_by_feed_id_and_period.side_effect = lambda *_: [
+        FeedItem(
+            id=10,
+            feed_id=feed.id,
+            external_id=uuid4(),
+            link="https://example.com/1",
+            title="First item",
+            description="Desc 1",
+            content='<p>Content A</p><img src="http://img.com/a.png">',
+            reading_time=5,
+            created_at=datetime(2025, 1, 1, 10, 0, 0),
+        )
+    ]
+    mock_requests.get.return_value = MagicMock(content=_build_png((200, 100)))
+
+    def export():
+        return feed_service.export_file(
+            feed_external_id=feed.external_id,
+            file_type=ExportFileType.epub.value,
+            start_time=datetime(2025, 1, 1, tzinfo=UTC),
+            end_time=datetime(2025, 1, 2, tzinfo=UTC),
+        )
+
+    export()
+    expired_time = time.time() - settings.EXPORT_RENDER_CACHE_MAX_AGE - 60
+    for path in Path(settings.EXPORT_CACHE_DIR).rglob("*"):
+        if path.is_file():
+            os.utime(path, (expired_time, expired_time))
+
+    # WHEN
+    export()
+    result = export()
+
+    # THEN
+    with zipfile.ZipFile(result.content) as archive:
+        assert any(name.startswith("EPUB/images/") for name in archive.namelist())
+    assert mock_requests.get.call_count == 1
+
+
 def test_get_detailed_feeds(feed_service, feeds_port_mock):
     # GIVEN
     feed_a = Feed(
@@ -106,3 +106,37 @@ def test_delete_filter_not_found(filter_service, filters_port_mock):
     # THEN
     filters_port_mock.delete_filter.assert_called_once_with(999)
     assert result is False
+
+
+def test_get_filters_by_picker_ids_groups_by_picker(filter_service, filters_port_mock):
+    # GIVEN
+    filters = [
+        Filter(
+            id=index,
+            picker_id=picker_id,
+            operation=Operation('identity'),
+            args="[a]",
+            created_at=datetime(2025, 1, 1, 12, 0, 0)
+        )
+        for index, picker_id in enumerate([1, 2, 1], start=1)
+    ]
+    filters_port_mock.get_filters_by_picker_ids.return_value = filters
+
+    # WHEN
+    result = filter_service.get_filters_by_picker_ids([1, 2, 3])
+
+    # THEN
+    filters_port_mock.get_filters_by_picker_ids.assert_called_once_with([1, 2, 3])
+    assert result == {1: [filters[0], filters[2]], 2: [filters[1]], 3: []}
+
+
+def test_delete_filters_by_picker_ids(filter_service, filters_port_mock):
+    # GIVEN
+    filters_port_mock.delete_filters_by_picker_ids.return_value = 4
+
+    # WHEN
+    result = filter_service.delete_filters_by_picker_ids([1, 2])
+
+    # THEN
+    filters_port_mock.delete_filters_by_picker_ids.assert_called_once_with([1, 2])
+    assert result == 4
@@ -1,14 +1,18 @@
+from contextlib import nullcontext
 from datetime import datetime
 from types import SimpleNamespace
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 from uuid import uuid4
 
 import pytest
-from src.domain.models.feed import FeedItemRequest
+from src.domain.handlers.seen_entries import SeenEntries
+from src.domain.models.feed import FeedItem, FeedItemContent, FeedItemRequest
 from src.domain.models.filter import Operation
 from src.domain.models.job import Job
 from src.domain.models.picker import Picker
+from src.domain.models.source import Source
 from src.domain.services.job_service import JobService, settings
+from src.domain.services.picker_run_service import PickerRunService
 
 settings.WALLABAG_ENABLED = False
 
@@ -27,7 +31,8 @@ def mock_services():
         "source_service": MagicMock(),
         "feed_service": MagicMock(),
         "extractor_service": MagicMock(),
-        "feeds_port": MagicMock()
+        "feeds_port": MagicMock(),
+        "source_fetcher": MagicMock()
     }
 
 
@@ -40,7 +45,8 @@ def job_service(mock_services):
         source_service=mock_services["source_service"],
         feed_service=mock_services["feed_service"],
         extractor_service=mock_services["extractor_service"],
-        feeds_port=mock_services["feeds_port"]
+        feeds_port=mock_services["feeds_port"],
+        source_fetcher=mock_services["source_fetcher"]
     )
 
 
@@ -66,6 +72,45 @@ def test_add_cronjob(job_service, mock_services):
     assert str(picker.id) in job_arg.args
 
 
+def test_add_cronjobs(job_service, mock_services):
+    # GIVEN
+    pickers = [
+        Picker(
+            id=1, cronjob="*/5 * * * *", source_id=10, feed_id=20, external_id=uuid4(),
+            created_at=datetime(2025, 1, 1, 13, 0, 0)
+        ),
+        Picker(
+            id=2, cronjob="*/5 * * * *", source_id=11, feed_id=20, external_id=uuid4(),
+            created_at=datetime(2025, 1, 1, 13, 0, 0), min_poll_interval=300,
+            max_poll_interval=3600, poll_interval=900
+        ),
+    ]
+
+    # WHEN
+    job_service.add_cronjobs(pickers)
+
+    # THEN
+    jobs = [call.args[0] for call in mock_services["scheduler"].add_job.call_args_list]
+    assert [job.args for job in jobs] == [["1"], ["2"]]
+    assert [job.interval for job in jobs] == [None, 900]
+    mock_services["source_service"].get_all_sources.assert_not_called()
+    mock_services["source_service"].get_source_by_id.assert_not_called()
+
+
+def test_job_services_share_the_seen_entries_they_are_given(mock_services):
+    # GIVEN
+    seen_entries = SeenEntries(10)
+
+    # WHEN
+    first = JobService(**mock_services, seen_entries=seen_entries)
+    second = JobService(**mock_services, seen_entries=seen_entries)
+
+    # THEN
+    assert first.seen_entries is second.seen_entries is seen_entries
+    assert JobService(**mock_services).seen_entries is not seen_entries
+    mock_services["scheduler"].set_handler_dependencies.assert_not_called()
+
+
 def test_load_all(job_service, mock_services):
     # GIVEN
     picker1 = Picker(
@@ -87,6 +132,157 @@ def test_load_all(job_service, mock_services):
     assert all(isinstance(job, Job) for job in jobs_arg)
 
 
+def build_adaptive_picker(**polling) -> Picker:
+    return Picker(
+        id=1, cronjob="*/5 * * * *", source_id=10, feed_id=20, external_id=uuid4(),
+        created_at=datetime(2025, 1, 1, 13, 0, 0), min_poll_interval=300, max_poll_interval=86400,
+        **polling
+    )
+
+
+def build_source() -> Source:
+    return Source(
+        id=10, external_id=uuid4(), url="http://example.com/feed", name="Example Source",
+        created_at=datetime(2025, 1, 1, 13, 0, 0)
+    )
+
+
+def test_add_cronjob_with_poll_interval_bounds(job_service, mock_services):
+    # WHEN
+    job_service.add_cronjob(build_adaptive_picker(poll_interval=100000))
+
+    # THEN
+    job_arg = mock_services["scheduler"].add_job.call_args[0][0]
+    assert job_arg.interval == 86400
+
+
+def test_load_all_with_poll_interval_bounds(job_service, mock_services):
+    # GIVEN
+    cron_picker = build_adaptive_picker().model_copy(
+        update={"id": 2, "min_poll_interval": None, "max_poll_interval": None}
+    )
+    mock_services["picker_service"].get_all_pickers.return_value = [
+        build_adaptive_picker(poll_interval=1800),
+        cron_picker
+    ]
+
+    # WHEN
+    job_service.load_all()
+
+    # THEN
+    jobs_arg = mock_services["scheduler"].load_jobs.call_args[0][0]
+    assert [job.interval for job in jobs_arg] == [1800, None]
+
+
+@patch("src.domain.services.job_service.feedparser.parse")
+def test_process_polls_sooner_when_source_has_new_entries(mock_parse, job_service, mock_services):
+    # GIVEN
+    mock_services["picker_service"].get_picker_by_id.return_value = build_adaptive_picker(
+        poll_interval=7200,
+        last_entry_at=datetime(2025, 1, 1, 11, 0, 0)
+    )
+    mock_services["filter_service"].get_filters_by_picker_id.return_value = []
+    mock_services["feed_service"].get_feed_items.return_value = [
+        SimpleNamespace(link=f"http://example.com/article{hour}") for hour in (10, 11, 12)
+    ]
+    mock_services["source_service"].get_source_by_id.return_value = build_source()
+    mock_parse.return_value.entries = [
+        AttrDict(
+            link=f"http://example.com/article{hour}",
+            published_parsed=datetime(2025, 1, 1, hour, 0, 0).timetuple()
+        )
+        for hour in (10, 11, 12)
+    ]
+
+    # WHEN
+    job_service.process(picker_id=1)
+
+    # THEN
+    mock_services["picker_service"].update_picker_polling.assert_called_once_with(
+        1, 3600, datetime(2025, 1, 1, 12, 0, 0)
+    )
+    job_arg = mock_services["scheduler"].add_job.call_args[0][0]
+    assert job_arg.interval == 3600
+
+
+@patch("src.domain.services.job_service.feedparser.parse")
+def test_process_backs_off_when_source_has_no_new_entries(
+    mock_parse,
+    job_service,
+    mock_services
+):
+    # GIVEN
+    mock_services["picker_service"].get_picker_by_id.return_value = build_adaptive_picker(
+        poll_interval=1200,
+        last_entry_at=datetime(2025, 1, 1, 12, 0, 0)
+    )
+    mock_services["filter_service"].get_filters_by_picker_id.return_value = []
+    mock_services["feed_service"].get_feed_items.return_value = []
+    mock_services["source_service"].get_source_by_id.return_value = build_source()
+    mock_parse.return_value.entries = []
+
+    # WHEN
+    job_service.process(picker_id=1)
+
+    # THEN
+    mock_services["picker_service"].update_picker_polling.assert_called_once_with(
+        1, 1800, datetime(2025, 1, 1, 12, 0, 0)
+    )
+    job_arg = mock_services["scheduler"].add_job.call_args[0][0]
+    assert job_arg.interval == 1800
+
+
+@patch("src.domain.services.job_service.feedparser.parse")
+def test_process_adapts_pickers_of_one_source_independently(
+    mock_parse,
+    job_service,
+    mock_services
+):
+    # GIVEN
+    pickers = {
+        picker.id: picker
+        for picker in [
+            build_adaptive_picker(poll_interval=7200, last_entry_at=datetime(2025, 1, 1, 11)),
+            build_adaptive_picker(
+                poll_interval=7200, last_entry_at=datetime(2025, 1, 1, 11)
+            ).model_copy(update={"id": 2, "feed_id": 21}),
+        ]
+    }
+    mock_services["picker_service"].get_picker_by_id.side_effect = pickers.get
+
+    def update_picker_polling(picker_id, poll_interval, last_entry_at):
+        pickers[picker_id] = pickers[picker_id].model_copy(
+            update={"poll_interval": poll_interval, "last_entry_at": last_entry_at}
+        )
+
+    mock_services["picker_service"].update_picker_polling.side_effect = update_picker_polling
+    mock_services["filter_service"].get_filters_by_picker_id.return_value = []
+    mock_services["feed_service"].get_feed_items.return_value = [
+        SimpleNamespace(link=f"http://example.com/article{hour}") for hour in (10, 11, 12)
+    ]
+    mock_services["source_service"].get_source_by_id.return_value = build_source()
+    mock_parse.return_value.entries = [
+        AttrDict(
+            link=f"http://example.com/article{hour}",
+            published_parsed=datetime(2025, 1, 1, hour, 0, 0).timetuple()
+        )
+        for hour in (10, 11, 12)
+    ]
+
+    # WHEN
+    job_service.process(picker_id=1)
+    job_service.process(picker_id=2)
+
+    # THEN
+    # the second picker finds the new entry too, the first run did not consume it
+    assert mock_services["picker_service"].update_picker_polling.call_args_list == [
+        call(1, 3600, datetime(2025, 1, 1, 12)),
+        call(2, 3600, datetime(2025, 1, 1, 12)),
+    ]
+    jobs = [call.args[0] for call in mock_services["scheduler"].add_job.call_args_list]
+    assert [(job.args, job.interval) for job in jobs] == [(["1"], 3600), (["2"], 3600)]
+
+
 @patch("src.domain.services.job_service.feedparser.parse")
 def test_process_adds_new_entry(mock_parse, job_service, mock_services):
     # GIVEN
@@ -359,3 +555,517 @@ def test_process_with_description_does_not_contain_filter(mock_parse, job_servic
     assert mock_services["feed_service"].create_feed_item.call_count == 1
     feed_item = mock_services["feed_service"].create_feed_item.call_args[0][0]
     assert feed_item.link == "http://ok"
+
+
+@patch("src.domain.services.job_service.feedparser.parse")
+def test_process_skips_polling_while_subscribed(mock_parse, mock_services):
+    # GIVEN
+    websub_service = MagicMock()
+    job_service = JobService(**mock_services, websub_service=websub_service)
+    picker = Picker(
+        id=1, cronjob="*/5 * * * *", source_id=10, feed_id=20,
+        external_id=uuid4(), created_at=datetime(2025, 1, 1, 13, 0, 0)
+    )
+    mock_services["picker_service"].get_picker_by_id.return_value = picker
+    subscription = websub_service.get_active_subscription.return_value
+
+    # WHEN
+    job_service.process(picker_id=1)
+
+    # THEN
+    mock_parse.assert_not_called()
+    websub_service.renew_if_due.assert_called_once_with(subscription)
+    mock_services["feed_service"].create_feed_item.assert_not_called()
+
+
+@patch("src.domain.services.job_service.feedparser.parse")
+def test_process_updates_subscription_when_polling(mock_parse, mock_services):
+    # GIVEN
+    websub_service = MagicMock()
+    websub_service.get_active_subscription.return_value = None
+    job_service = JobService(**mock_services, websub_service=websub_service)
+    picker = Picker(
+        id=1, cronjob="*/5 * * * *", source_id=10, feed_id=20,
+        external_id=uuid4(), created_at=datetime(2025, 1, 1, 13, 0, 0)
+    )
+    mock_services["picker_service"].get_picker_by_id.return_value = picker
+    mock_services["filter_service"].get_filters_by_picker_id.return_value = []
+    mock_services["feed_service"].get_feed_items.return_value = []
+    source = mock_services["source_service"].get_source_by_id.return_value
+    mock_parse.return_value.entries = []
+
+    # WHEN
+    job_service.process(picker_id=1)
+
+    # THEN
+    mock_services["source_fetcher"].fetch.assert_called_once_with(source.url)
+    response = mock_services["source_fetcher"].fetch.return_value
+    mock_parse.assert_called_once_with(response.content, response_headers=response.headers)
+    websub_service.update_subscription.assert_called_once_with(
+        source, mock_parse.return_value.feed
+    )
+
+
+@patch("src.domain.services.job_service.feedparser.parse")
+def test_process_pushed_entries(mock_parse, job_service, mock_services):
+    # GIVEN
+    pickers = [
+        Picker(
+            id=picker_id, cronjob="*/5 * * * *", source_id=10, feed_id=picker_id * 10,
+            external_id=uuid4(), created_at=datetime(2025, 1, 1, 13, 0, 0)
+        )
+        for picker_id in (1, 2)
+    ]
+    mock_services["picker_service"].get_pickers_by_source_id.return_value = pickers
+    mock_services["picker_service"].get_picker_by_id.side_effect = lambda picker_id: (
+        pickers[picker_id - 1]
+    )
+    mock_services["filter_service"].get_filters_by_picker_id.return_value = []
+    mock_services["feed_service"].get_feed_items.return_value = []
+    mock_services["source_service"].get_source_by_id.return_value = SimpleNamespace(
+        id=10, url="http://example.com/feed", name="Example Source"
+    )
+    entries = [
+        AttrDict(link="http://example.com/article1", title="Article 1", description="Desc 1")
+    ]
+
+    # WHEN
+    job_service.process_pushed_entries(10, entries)
+
+    # THEN
+    mock_parse.assert_not_called()
+    feed_items = [
+        call[0][0] for call in mock_services["feed_service"].create_feed_item.call_args_list
+    ]
+    assert [item.feed_id for item in feed_items] == [10, 20]
+    assert {item.link for item in feed_items} == {"http://example.com/article1"}
+
+
+@patch("src.domain.services.job_service.feedparser.parse")
+def test_process_skips_seen_entries(mock_parse, job_service, mock_services):
+    # GIVEN
+    picker = Picker(
+        id=1, cronjob="*/5 * * * *", source_id=10, feed_id=20,
+        external_id=uuid4(), created_at=datetime(2025, 1, 1, 13, 0, 0)
+    )
+    mock_services["picker_service"].get_picker_by_id.return_value = picker
+    filter_mock = MagicMock(operation=Operation.title_contains)
+    filter_mock.args = "['python', 1]"
+    mock_services["filter_service"].get_filters_by_picker_id.return_value = [filter_mock]
+    mock_services["feed_service"].get_feed_items.return_value = []
+    mock_services["source_service"].get_source_by_id.return_value = SimpleNamespace(
+        url="http://example.com/feed", name="Example Source"
+    )
+    mock_parse.return_value.entries = [
+        AttrDict(link="http://example.com/article1", title="Rust", description="Desc 1")
+    ]
+    job_service.process(picker_id=1)
+    mock_parse.return_value.entries.append(
+        AttrDict(link="http://example.com/article2", title="Python", description="Desc 2")
+    )
+
+    # WHEN
+    with patch("src.domain.services.job_service.title_contains") as mock_title_contains:
+        mock_title_contains.return_value = True
+        job_service.process(picker_id=1)
+
+    # THEN
+    assert [call.args[1] for call in mock_title_contains.call_args_list] == ["Python"]
+
+
+@patch("src.domain.services.job_service.feedparser.parse")
+def test_process_retries_entries_whose_insert_failed(mock_parse, job_service, mock_services):
+    # GIVEN
+    picker = Picker(
+        id=1, cronjob="*/5 * * * *", source_id=10, feed_id=20,
+        external_id=uuid4(), created_at=datetime(2025, 1, 1, 13, 0, 0)
+    )
+    mock_services["picker_service"].get_picker_by_id.return_value = picker
+    filter_mock = MagicMock(operation=Operation.title_contains)
+    filter_mock.args = "['python', 1]"
+    mock_services["filter_service"].get_filters_by_picker_id.return_value = [filter_mock]
+    mock_services["feed_service"].get_feed_items.return_value = []
+    mock_services["source_service"].get_source_by_id.return_value = SimpleNamespace(
+        url="http://example.com/feed", name="Example Source"
+    )
+    mock_parse.return_value.entries = [
+        AttrDict(link="http://example.com/article1", title="Rust", description="Desc 1"),
+        AttrDict(link="http://example.com/article2", title="Python", description="Desc 2"),
+    ]
+    mock_services["feed_service"].create_feed_item.return_value = None
+    job_service.process(picker_id=1)
+    mock_services["feed_service"].create_feed_item.return_value = MagicMock()
+
+    # WHEN
+    with patch("src.domain.services.job_service.title_contains") as mock_title_contains:
+        mock_title_contains.return_value = True
+        job_service.process(picker_id=1)
+
+    # THEN
+    # the rejected entry stays seen, the one that failed to insert is evaluated again
+    assert [call.args[1] for call in mock_title_contains.call_args_list] == ["Python"]
+    feed_items = [
+        call[0][0] for call in mock_services["feed_service"].create_feed_item.call_args_list
+    ]
+    assert [item.link for item in feed_items] == ["http://example.com/article2"] * 2
+
+
+@patch("src.domain.services.job_service.feedparser.parse")
+def test_process_reevaluates_seen_entries_when_filters_change(
+    mock_parse,
+    job_service,
+    mock_services
+):
+    # GIVEN
+    picker = Picker(
+        id=1, cronjob="*/5 * * * *", source_id=10, feed_id=20,
+        external_id=uuid4(), created_at=datetime(2025, 1, 1, 13, 0, 0)
+    )
+    mock_services["picker_service"].get_picker_by_id.return_value = picker
+    filter_mock = MagicMock(operation=Operation.title_contains)
+    filter_mock.args = "['python', 1]"
+    mock_services["filter_service"].get_filters_by_picker_id.return_value = [filter_mock]
+    mock_services["feed_service"].get_feed_items.return_value = []
+    mock_services["source_service"].get_source_by_id.return_value = SimpleNamespace(
+        url="http://example.com/feed", name="Example Source"
+    )
+    mock_parse.return_value.entries = [
+        AttrDict(link="http://example.com/article1", title="Rust", description="Desc 1")
+    ]
+    job_service.process(picker_id=1)
+    filter_mock.args = "['rust', 1]"
+
+    # WHEN
+    job_service.process(picker_id=1)
+
+    # THEN
+    assert mock_services["feed_service"].create_feed_item.call_count == 1
+    assert mock_services["feed_service"].create_feed_item.call_args[0][0].title == "Rust"
+
+
+@patch("src.domain.services.job_service.feedparser.parse")
+def test_process_reports_run_stats(mock_parse, mock_services):
+    # GIVEN
+    metrics = MagicMock()
+    job_service = JobService(**mock_services, metrics=metrics)
+    picker = Picker(
+        id=1, cronjob="*/5 * * * *", source_id=10, feed_id=20,
+        external_id=uuid4(), created_at=datetime(2025, 1, 1, 13, 0, 0)
+    )
+    mock_services["picker_service"].get_picker_by_id.return_value = picker
+    filter_mock = MagicMock(operation=Operation.title_contains)
+    filter_mock.args = "['python', 1]"
+    mock_services["filter_service"].get_filters_by_picker_id.return_value = [filter_mock]
+    mock_services["feed_service"].get_feed_items.return_value = []
+    source = mock_services["source_service"].get_source_by_id.return_value
+    source.name = "Example Source"
+    response = mock_services["source_fetcher"].fetch.return_value
+    response.status_code = 200
+    response.content = b"<rss/>"
+    mock_parse.return_value.entries = [
+        AttrDict(link="http://example.com/article1", title="Python", description="Desc 1"),
+        AttrDict(link="http://example.com/article2", title="Rust", description="Desc 2"),
+    ]
+
+    # WHEN
+    job_service.process(picker_id=1)
+
+    # THEN
+    observed_picker, observed_source, stats = metrics.observe_picker_run.call_args[0]
+    assert observed_picker == picker
+    assert observed_source == source
+    assert set(stats.durations) == {"fetch", "parse", "dedup", "filter", "insert"}
+    assert stats.status_code == 200
+    assert stats.bytes_downloaded == 6
+    assert stats.entries_fetched == 2
+    assert stats.entries_new == 2
+    assert stats.entries_filtered == 1
+    assert stats.entries_inserted == 1
+
+
+@patch("src.domain.services.job_service.feedparser.parse")
+def test_process_counts_only_created_feed_items(mock_parse, mock_services):
+    # GIVEN
+    metrics = MagicMock()
+    job_service = JobService(**mock_services, metrics=metrics)
+    mock_services["picker_service"].get_picker_by_id.return_value = Picker(
+        id=1, cronjob="*/5 * * * *", source_id=10, feed_id=20,
+        external_id=uuid4(), created_at=datetime(2025, 1, 1, 13, 0, 0)
+    )
+    mock_services["filter_service"].get_filters_by_picker_id.return_value = []
+    mock_services["feed_service"].get_feed_items.return_value = []
+    mock_services["feed_service"].create_feed_item.side_effect = [None, MagicMock()]
+    mock_services["source_service"].get_source_by_id.return_value.name = "Example Source"
+    mock_parse.return_value.entries = [
+        AttrDict(link="http://example.com/article1", title="Python", description="Desc 1"),
+        AttrDict(link="http://example.com/article2", title="Rust", description="Desc 2"),
+    ]
+
+    # WHEN
+    job_service.process(picker_id=1)
+
+    # THEN
+    stats = metrics.observe_picker_run.call_args[0][2]
+    assert stats.entries_new == 2
+    assert stats.entries_inserted == 1
+    mock_services["feeds_port"].set_updated_at.assert_not_called()
+
+
+@patch("src.domain.services.job_service.feedparser.parse")
+def test_process_reports_run_stats_when_it_fails(mock_parse, mock_services):
+    # GIVEN
+    metrics = MagicMock()
+    job_service = JobService(**mock_services, metrics=metrics)
+    mock_services["picker_service"].get_picker_by_id.return_value = Picker(
+        id=1, cronjob="*/5 * * * *", source_id=10, feed_id=20,
+        external_id=uuid4(), created_at=datetime(2025, 1, 1, 13, 0, 0)
+    )
+    mock_parse.side_effect = ValueError("broken feed")
+
+    # WHEN
+    with pytest.raises(ValueError, match="broken feed"):
+        job_service.process(picker_id=1)
+
+    # THEN
+    stats = metrics.observe_picker_run.call_args[0][2]
+    assert set(stats.durations) == {"fetch", "parse"}
+
+
+def test_process_without_source_response(job_service, mock_services):
+    # GIVEN
+    mock_services["picker_service"].get_picker_by_id.return_value = Picker(
+        id=1, cronjob="*/5 * * * *", source_id=10, feed_id=20,
+        external_id=uuid4(), created_at=datetime(2025, 1, 1, 13, 0, 0)
+    )
+    mock_services["filter_service"].get_filters_by_picker_id.return_value = []
+    mock_services["source_fetcher"].fetch.return_value = None
+
+    # WHEN
+    job_service.process(picker_id=1)
+
+    # THEN
+    mock_services["feed_service"].create_feed_item.assert_not_called()
+
+
+def test_load_all_schedules_the_picker_runs_pruning(mock_services):
+    # GIVEN
+    job_service = JobService(**mock_services, picker_run_service=MagicMock())
+    mock_services["picker_service"].get_all_pickers.return_value = []
+
+    # WHEN
+    job_service.load_all()
+
+    # THEN
+    jobs_arg = mock_services["scheduler"].load_jobs.call_args[0][0]
+    assert [job.func_name for job in jobs_arg] == ["prune_picker_runs"]
+    assert jobs_arg[0].schedule == settings.PICKER_RUNS_PRUNE_SCHEDULE
+
+
+def test_process_skips_a_picker_that_is_already_running(mock_services):
+    # GIVEN
+    picker_locks = MagicMock()
+    picker_locks.hold.return_value = nullcontext(False)
+    picker_run_service = MagicMock()
+    job_service = JobService(
+        **mock_services, picker_locks=picker_locks, picker_run_service=picker_run_service
+    )
+
+    # WHEN
+    stats = job_service.process(picker_id=1, skip_if_running=True)
+
+    # THEN
+    assert stats.skipped is True
+    picker_locks.hold.assert_called_once_with(1, wait=False)
+    mock_services["source_fetcher"].fetch.assert_not_called()
+    picker_run_service.record_run.assert_not_called()
+
+
+def test_process_waits_for_a_running_picker_by_default(mock_services):
+    # GIVEN
+    picker_locks = MagicMock()
+    picker_locks.hold.return_value = nullcontext(True)
+    job_service = JobService(**mock_services, picker_locks=picker_locks)
+    mock_services["picker_service"].get_picker_by_id.return_value = Picker(
+        id=1, cronjob="*/5 * * * *", source_id=10, feed_id=20,
+        external_id=uuid4(), created_at=datetime(2025, 1, 1, 13, 0, 0)
+    )
+    mock_services["source_fetcher"].fetch.return_value = None
+
+    # WHEN
+    stats = job_service.process(picker_id=1)
+
+    # THEN
+    assert stats.skipped is False
+    picker_locks.hold.assert_called_once_with(1, wait=True)
+    mock_services["source_fetcher"].fetch.assert_called_once()
+
+
+@patch("src.domain.services.job_service.feedparser.parse")
+def test_process_records_the_run(mock_parse, mock_services):
+    # GIVEN
+    picker_run_service = MagicMock()
+    job_service = JobService(**mock_services, picker_run_service=picker_run_service)
+    picker = Picker(
+        id=1, cronjob="*/5 * * * *", source_id=10, feed_id=20,
+        external_id=uuid4(), created_at=datetime(2025, 1, 1, 13, 0, 0)
+    )
+    mock_services["picker_service"].get_picker_by_id.return_value = picker
+    mock_services["filter_service"].get_filters_by_picker_id.return_value = []
+    mock_services["feed_service"].get_feed_items.return_value = []
+    response = mock_services["source_fetcher"].fetch.return_value
+    response.status_code = 200
+    response.content = b"<rss/>"
+    mock_parse.return_value.entries = []
+
+    # WHEN
+    job_service.process(picker_id=1)
+
+    # THEN
+    recorded_picker, _, stats = picker_run_service.record_run.call_args[0]
+    assert recorded_picker == picker
+    assert stats.status_code == 200
+    assert stats.started_at <= stats.finished_at
+    assert stats.error is None
+
+
+@patch("src.domain.services.job_service.feedparser.parse")
+def test_process_records_only_created_feed_items(mock_parse, mock_services):
+    # GIVEN
+    picker_runs_port = MagicMock()
+    job_service = JobService(
+        **mock_services, picker_run_service=PickerRunService(picker_runs_port=picker_runs_port)
+    )
+    mock_services["picker_service"].get_picker_by_id.return_value = Picker(
+        id=1, cronjob="*/5 * * * *", source_id=10, feed_id=20,
+        external_id=uuid4(), created_at=datetime(2025, 1, 1, 13, 0, 0)
+    )
+    mock_services["filter_service"].get_filters_by_picker_id.return_value = []
+    mock_services["feed_service"].get_feed_items.return_value = []
+    mock_services["feed_service"].create_feed_item.side_effect = [MagicMock(), None]
+    mock_services["source_service"].get_source_by_id.return_value = Source(
+        id=10, external_id=uuid4(), url="http://example.com/feed", name="Example Source",
+        created_at=datetime(2025, 1, 1, 13, 0, 0)
+    )
+    mock_parse.return_value.entries = [
+        AttrDict(link="http://example.com/article1", title="Python", description="Desc 1"),
+        AttrDict(link="http://example.com/article2", title="Rust", description="Desc 2"),
+    ]
+
+    # WHEN
+    job_service.process(picker_id=1)
+
+    # THEN
+    picker_run_request = picker_runs_port.create_picker_run.call_args[0][0]
+    assert picker_run_request.entries_new == 2
+    assert picker_run_request.entries_inserted == 1
+
+
+@patch("src.domain.services.job_service.feedparser.parse")
+def test_process_records_the_error_of_a_failed_run(mock_parse, mock_services):
+    # GIVEN
+    picker_run_service = MagicMock()
+    job_service = JobService(**mock_services, picker_run_service=picker_run_service)
+    mock_services["picker_service"].get_picker_by_id.return_value = Picker(
+        id=1, cronjob="*/5 * * * *", source_id=10, feed_id=20,
+        external_id=uuid4(), created_at=datetime(2025, 1, 1, 13, 0, 0)
+    )
+    mock_parse.side_effect = ValueError("broken feed")
+
+    # WHEN
+    with pytest.raises(ValueError, match="broken feed"):
+        job_service.process(picker_id=1)
+
+    # THEN
+    stats = picker_run_service.record_run.call_args[0][2]
+    assert stats.error == "ValueError: broken feed"
+    assert stats.finished_at is not None
+
+
+def test_process_records_a_failed_fetch(mock_services):
+    # GIVEN
+    picker_run_service = MagicMock()
+    job_service = JobService(**mock_services, picker_run_service=picker_run_service)
+    mock_services["picker_service"].get_picker_by_id.return_value = Picker(
+        id=1, cronjob="*/5 * * * *", source_id=10, feed_id=20,
+        external_id=uuid4(), created_at=datetime(2025, 1, 1, 13, 0, 0)
+    )
+    mock_services["filter_service"].get_filters_by_picker_id.return_value = []
+    mock_services["source_fetcher"].fetch.return_value = None
+
+    # WHEN
+    job_service.process(picker_id=1)
+
+    # THEN
+    stats = picker_run_service.record_run.call_args[0][2]
+    assert stats.error == "Fetching the source failed"
+    assert stats.status_code is None
+
+
+@patch("src.domain.services.job_service.feedparser.parse")
+def test_process_backfill_inserts_in_batches_and_extracts_afterwards(
+    mock_parse, job_service, mock_services, monkeypatch
+):
+    # GIVEN
+    monkeypatch.setattr(settings, "WALLABAG_ENABLED", True)
+    monkeypatch.setattr(settings, "PICKER_BACKFILL_BATCH_SIZE", 2)
+    mock_services["picker_service"].get_picker_by_id.return_value = Picker(
+        id=1, cronjob="*/5 * * * *", source_id=10, feed_id=20,
+        external_id=uuid4(), created_at=datetime(2025, 1, 1, 13, 0, 0)
+    )
+    mock_services["source_service"].get_source_by_id.return_value.name = "Example Source"
+    filter_mock = MagicMock(operation=Operation.title_does_not_contain)
+    filter_mock.args = "['sponsored', 1]"
+    mock_services["filter_service"].get_filters_by_picker_id.return_value = [filter_mock]
+    mock_services["feed_service"].get_feed_items.return_value = [
+        FeedItem(
+            id=1, external_id=uuid4(), link="http://example.com/known", title="Known",
+            description="Desc", created_at=datetime.now(), feed_id=20
+        )
+    ]
+    response = mock_services["source_fetcher"].fetch.return_value
+    response.status_code = 200
+    response.content = b"<rss/>"
+    mock_parse.return_value.entries = [
+        AttrDict(link=f"http://example.com/article{index}", title=f"Article {index}",
+                 description="Desc")
+        for index in range(3)
+    ] + [
+        AttrDict(link="http://example.com/known", title="Known", description="Desc"),
+        AttrDict(link="http://example.com/ad", title="Sponsored post", description="Desc"),
+        AttrDict(link="http://example.com/copy", title="Article 0", description="Desc"),
+    ]
+    mock_services["feeds_port"].create_feed_items.side_effect = [[101, 102], [103]]
+    mock_services["extractor_service"].extract_feed_item_content.side_effect = [
+        FeedItemContent(title="Article 0", content="<p>Article</p>", reading_time=3),
+        None,
+        FeedItemContent(title="Article 2", content="<p>Article</p>", image_url="img.png"),
+    ]
+
+    # WHEN
+    stats = job_service.process(picker_id=1, backfill=True)
+
+    # THEN
+    batches = [
+        [request.link for request in call.args[0]]
+        for call in mock_services["feeds_port"].create_feed_items.call_args_list
+    ]
+    assert batches == [
+        ["http://example.com/article0", "http://example.com/article1"],
+        ["http://example.com/article2"],
+    ]
+    first_request = mock_services["feeds_port"].create_feed_items.call_args_list[0].args[0][0]
+    assert first_request.author == "Example Source"
+    assert first_request.reading_time == 0
+    mock_services["feed_service"].create_feed_item.assert_not_called()
+    mock_services["feed_service"].get_feed_items.assert_called_once_with(20, all_items=True)
+    updates = mock_services["feeds_port"].update_feed_item_content.call_args_list
+    assert [update.args for update in updates] == [
+        (101, "<p>Article</p>", 3, None),
+        (103, "<p>Article</p>", 0, "img.png"),
+    ]
+    mock_services["extractor_service"].extract_feed_item_image.assert_not_called()
+    assert stats.entries_fetched == 6
+    assert stats.entries_new == 5
+    assert stats.entries_filtered == 1
+    assert stats.entries_inserted == 3
+    assert stats.entries_extracted == 2
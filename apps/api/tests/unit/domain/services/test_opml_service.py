@@ -0,0 +1,283 @@
+import threading
+import time
+from datetime import datetime
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from src.domain.models.filter import Operation
+from src.domain.models.opml import OpmlOutline, OpmlOutlineStatus
+from src.domain.models.picker import PickerDetails
+from src.domain.models.source import Source, SourceResponse
+from src.domain.services.opml_service import OpmlService, parse_opml, render_opml, settings
+
+RSS = (
+    b'<?xml version="1.0"?><rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom">'
+    b'<channel><title>Example</title>'
+    b'<atom:link rel="hub" href="https://hub.example.com/"/>'
+    b"<item><title>Entry</title><link>https://example.com/1</link></item>"
+    b"</channel></rss>"
+)
+
+OPML = b"""<?xml version="1.0" encoding="utf-8"?>
+<opml version="2.0">
+<head><title>Subscriptions</title></head>
+<body>
+<outline text="Tech" title="Tech">
+    <outline type="rss" text="Example" xmlUrl="https://example.com/feed.xml"/>
+    <outline type="rss" text="Other" title="Other blog" xmlUrl=" https://other.com/rss "/>
+</outline>
+<outline type="rss" text="News" xmlUrl="https://news.com/rss" category="/World/Europe,/Daily"/>
+<outline type="rss" text="Without feed url" htmlUrl="https://example.com"/>
+<outline type="rss" xmlUrl="https://untitled.com/atom"/>
+</body>
+</opml>"""
+
+
+def build_source(url: str, id: int = 1) -> Source:
+    return Source(
+        id=id, external_id=uuid4(), url=url, name="Source",
+        created_at=datetime(2025, 1, 1, 13, 0, 0)
+    )
+
+
+@pytest.fixture
+def mock_services():
+    source_service = MagicMock()
+    source_service.get_sources_by_urls.return_value = {}
+    return {
+        "source_service": source_service,
+        "picker_service": MagicMock(),
+        "source_fetcher": MagicMock(),
+    }
+
+
+@pytest.fixture
+def opml_service(mock_services):
+    return OpmlService(
+        source_service=mock_services["source_service"],
+        picker_service=mock_services["picker_service"],
+        source_fetcher=mock_services["source_fetcher"]
+    )
+
+
+def test_parse_opml():
+    # WHEN
+    outlines = parse_opml(OPML)
+
+    # THEN
+    assert outlines == [
+        OpmlOutline(url="https://example.com/feed.xml", title="Example", category="Tech"),
+        OpmlOutline(url="https://other.com/rss", title="Other blog", category="Tech"),
+        OpmlOutline(url="https://news.com/rss", title="News", category="World/Europe"),
+        OpmlOutline(url="https://untitled.com/atom"),
+    ]
+
+
+@pytest.mark.parametrize("content", [
+    b"",
+    b"not xml",
+    b"<rss><channel/></rss>",
+    b"<opml version='2.0'><head/></opml>",
+])
+def test_parse_opml_rejects_other_documents(content):
+    # WHEN / THEN
+    assert parse_opml(content) is None
+
+
+def test_render_opml_in_chunks(monkeypatch):
+    # GIVEN
+    monkeypatch.setattr(settings, "EXPORT_CHUNK_SIZE", 200)
+    outlines = [
+        OpmlOutline(url="https://example.com/feed.xml?a=1&b=2", title="Tom & Jerry"),
+        OpmlOutline(url="https://untitled.com/atom"),
+        OpmlOutline(url="https://news.com/rss", title='"News"', category="Daily"),
+        OpmlOutline(url="https://other.com/rss", title="Other", category="Tech <3"),
+        OpmlOutline(url="https://more.com/rss", title="More", category="Tech <3"),
+    ]
+
+    # WHEN
+    chunks = list(render_opml(outlines, "nebulapicker"))
+
+    # THEN
+    assert len(chunks) > 1
+    assert parse_opml(b"".join(chunks)) == [
+        outlines[0],
+        outlines[1].model_copy(update={"title": "https://untitled.com/atom"}),
+        *outlines[2:],
+    ]
+
+
+def test_probe_source(opml_service, mock_services):
+    # GIVEN
+    mock_services["source_fetcher"].fetch.return_value = SourceResponse(
+        status_code=200, content=RSS, headers={"content-type": "application/rss+xml"}
+    )
+
+    # WHEN
+    source_probe = opml_service.probe_source("https://example.com/feed.xml")
+
+    # THEN
+    assert source_probe.status_code == 200
+    assert source_probe.feed_type == "rss20"
+    assert source_probe.hub_url == "https://hub.example.com/"
+    assert source_probe.error is None
+
+
+@pytest.mark.parametrize(("url", "response", "error"), [
+    ("ftp://example.com/feed.xml", None, "Invalid url"),
+    ("https://example.com/feed.xml", None, "Source is unreachable"),
+    (
+        "https://example.com/feed.xml",
+        SourceResponse(status_code=404, content=b""),
+        "Source responded with status 404"
+    ),
+    (
+        "https://example.com/feed.xml",
+        SourceResponse(status_code=200, content=b"<html><body>Hello</body></html>"),
+        "Not a feed"
+    ),
+])
+def test_probe_source_with_invalid_source(opml_service, mock_services, url, response, error):
+    # GIVEN
+    mock_services["source_fetcher"].fetch.return_value = response
+
+    # WHEN
+    source_probe = opml_service.probe_source(url)
+
+    # THEN
+    assert source_probe.error == error
+    assert source_probe.feed_type is None
+
+
+def test_probe_sources_in_parallel_up_to_the_worker_limit(
+    opml_service, mock_services, monkeypatch
+):
+    # GIVEN
+    monkeypatch.setattr(settings, "OPML_PROBE_WORKERS", 3)
+    lock = threading.Lock()
+    running = []
+    max_running = []
+
+    def fetch(url):
+        with lock:
+            running.append(url)
+            max_running.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.remove(url)
+        return SourceResponse(status_code=200, content=RSS)
+
+    mock_services["source_fetcher"].fetch.side_effect = fetch
+    urls = [f"https://example.com/{index}.xml" for index in range(9)]
+
+    # WHEN
+    probes = opml_service.probe_sources(urls)
+
+    # THEN
+    assert list(probes) == urls
+    assert all(probe.feed_type == "rss20" for probe in probes.values())
+    assert max(max_running) == 3
+
+
+def test_probe_sources_without_probing(opml_service, mock_services):
+    # WHEN
+    probes = opml_service.probe_sources(["https://example.com/feed.xml", "example.com"], False)
+
+    # THEN
+    assert probes["https://example.com/feed.xml"].error is None
+    assert probes["example.com"].error == "Invalid url"
+    mock_services["source_fetcher"].fetch.assert_not_called()
+
+
+def test_import_outlines(opml_service, mock_services):
+    # GIVEN
+    existing_source = build_source("https://existing.com/rss")
+    created_source = build_source("https://example.com/feed.xml", id=2)
+    mock_services["source_service"].get_sources_by_urls.return_value = {
+        existing_source.url: existing_source
+    }
+    mock_services["source_service"].create_sources.return_value = [created_source]
+    mock_services["source_fetcher"].fetch.side_effect = lambda url: (
+        SourceResponse(status_code=200, content=RSS) if "example" in url else None
+    )
+    outlines = [
+        OpmlOutline(url="https://example.com/feed.xml", category="Tech"),
+        OpmlOutline(url="https://existing.com/rss", title="Existing"),
+        OpmlOutline(url="https://down.com/rss", title="Down"),
+        OpmlOutline(url="https://example.com/feed.xml", title="Duplicate"),
+    ]
+
+    # WHEN
+    opml_import = opml_service.import_outlines(outlines, probe=True, cronjob=None)
+
+    # THEN
+    assert [
+        (outline.url, outline.status, outline.source_external_id)
+        for outline in opml_import.outlines
+    ] == [
+        ("https://example.com/feed.xml", OpmlOutlineStatus.created, created_source.external_id),
+        ("https://existing.com/rss", OpmlOutlineStatus.existing, existing_source.external_id),
+        ("https://down.com/rss", OpmlOutlineStatus.invalid, None),
+    ]
+    assert opml_import.outlines[0].hub_url == "https://hub.example.com/"
+    assert opml_import.outlines[2].error == "Source is unreachable"
+    source_requests = mock_services["source_service"].create_sources.call_args[0][0]
+    assert [(request.url, request.name) for request in source_requests] == [
+        ("https://example.com/feed.xml", "example.com")
+    ]
+    assert mock_services["source_fetcher"].fetch.call_count == 2
+    mock_services["picker_service"].create_pickers.assert_not_called()
+
+
+def test_import_outlines_with_pickers(opml_service, mock_services):
+    # GIVEN
+    outlines = [
+        OpmlOutline(url="https://example.com/feed.xml", title="Example", category="Tech"),
+        OpmlOutline(url="https://other.com/rss", title="Other"),
+        OpmlOutline(url="not a url"),
+    ]
+    created_pickers = [
+        PickerDetails(
+            id=1, external_id=uuid4(), cronjob="0 * * * *", source_id=1, feed_id=1,
+            created_at=datetime(2025, 1, 1, 13, 0, 0), source_url=outlines[0].url,
+            feed_external_id=uuid4(), filters=[]
+        )
+    ]
+    mock_services["picker_service"].create_pickers.return_value = created_pickers
+
+    # WHEN
+    opml_import = opml_service.import_outlines(outlines, probe=False, cronjob="0 * * * *")
+
+    # THEN
+    picker_definitions = mock_services["picker_service"].create_pickers.call_args[0][0]
+    assert [
+        (definition.source_url, definition.source_name, definition.feed_name)
+        for definition in picker_definitions
+    ] == [
+        ("https://example.com/feed.xml", "Example", "Tech"),
+        ("https://other.com/rss", "Other", "Other"),
+    ]
+    assert all(definition.cronjob == "0 * * * *" for definition in picker_definitions)
+    assert picker_definitions[0].filters[0].operation is Operation.identity
+    assert opml_import.pickers == created_pickers
+    assert opml_import.outlines[2].status is OpmlOutlineStatus.invalid
+    mock_services["source_service"].create_sources.assert_not_called()
+    mock_services["source_fetcher"].fetch.assert_not_called()
+
+
+def test_import_outlines_without_new_sources(opml_service, mock_services):
+    # GIVEN
+    source = build_source("https://existing.com/rss")
+    mock_services["source_service"].get_sources_by_urls.return_value = {source.url: source}
+
+    # WHEN
+    opml_import = opml_service.import_outlines(
+        [OpmlOutline(url=source.url)], probe=True, cronjob="0 * * * *"
+    )
+
+    # THEN
+    assert opml_import.outlines[0].status is OpmlOutlineStatus.existing
+    assert opml_import.pickers == []
+    mock_services["source_service"].create_sources.assert_not_called()
+    mock_services["picker_service"].create_pickers.assert_not_called()
@@ -0,0 +1,106 @@
+import threading
+from contextlib import contextmanager
+from unittest.mock import MagicMock, call
+
+import pytest
+from src.domain.models.job import PickerRunStats
+from src.domain.models.picker_run import PickerRunJobStatus
+from src.domain.services.picker_run_job_service import PickerRunJobService, settings
+
+
+@pytest.fixture
+def job_service_mock():
+    job_service = MagicMock()
+    job_service.process.return_value = PickerRunStats(entries_inserted=3, entries_extracted=2)
+    return job_service
+
+
+@pytest.fixture
+def picker_run_job_service(job_service_mock, monkeypatch):
+    monkeypatch.setattr(settings, "PICKER_RUN_JOB_WORKERS", 1)
+
+    @contextmanager
+    def job_service_factory():
+        yield job_service_mock
+
+    picker_run_job_service = PickerRunJobService(job_service_factory=job_service_factory)
+    yield picker_run_job_service
+    picker_run_job_service.shutdown()
+
+
+def _wait_for_jobs(picker_run_job_service):
+    picker_run_job_service.executor.shutdown(wait=True)
+
+
+def test_create_picker_run_job_runs_every_picker(picker_run_job_service, job_service_mock):
+    # WHEN
+    job = picker_run_job_service.create_picker_run_job([1, 2], backfill=True)
+    _wait_for_jobs(picker_run_job_service)
+
+    # THEN
+    assert job.status == PickerRunJobStatus.completed
+    assert job.pickers_completed == 2
+    assert job.entries_inserted == 6
+    assert job.entries_extracted == 4
+    assert job.completed_at is not None
+    job_service_mock.process.assert_has_calls([call(1, backfill=True), call(2, backfill=True)])
+    assert picker_run_job_service.get_picker_run_job(job.external_id) == job
+
+
+def test_picker_run_job_keeps_running_after_a_failed_picker(
+    picker_run_job_service, job_service_mock
+):
+    # GIVEN
+    job_service_mock.process.side_effect = [
+        ValueError("broken feed"),
+        PickerRunStats(error="Fetching the source failed"),
+        PickerRunStats(entries_inserted=1),
+    ]
+
+    # WHEN
+    job = picker_run_job_service.create_picker_run_job([1, 2, 3], backfill=False)
+    _wait_for_jobs(picker_run_job_service)
+
+    # THEN
+    assert job.status == PickerRunJobStatus.failed
+    assert job.pickers_failed == 2
+    assert job.pickers_completed == 1
+    assert job.entries_inserted == 1
+    assert job.error == "ValueError: broken feed"
+
+
+def test_create_picker_run_job_reuses_an_unfinished_job(
+    picker_run_job_service, job_service_mock
+):
+    # GIVEN
+    released = threading.Event()
+    job_service_mock.process.side_effect = lambda *args, **kwargs: (
+        released.wait(5) and PickerRunStats()
+    )
+    running_job = picker_run_job_service.create_picker_run_job([1], backfill=False)
+
+    # WHEN
+    job = picker_run_job_service.create_picker_run_job([1], backfill=False)
+    backfill_job = picker_run_job_service.create_picker_run_job([1], backfill=True)
+    released.set()
+    _wait_for_jobs(picker_run_job_service)
+
+    # THEN
+    assert job is running_job
+    assert backfill_job is not running_job
+    assert job_service_mock.process.call_count == 2
+
+
+def test_finished_picker_run_jobs_are_evicted(picker_run_job_service, monkeypatch):
+    # GIVEN
+    monkeypatch.setattr(settings, "PICKER_RUN_JOBS_MAX_ENTRIES", 1)
+    first_job = picker_run_job_service.create_picker_run_job([1], backfill=False)
+    _wait_for_jobs(picker_run_job_service)
+    picker_run_job_service.executor = MagicMock()
+
+    # WHEN
+    second_job = picker_run_job_service.create_picker_run_job([1], backfill=False)
+
+    # THEN
+    assert picker_run_job_service.get_picker_run_job(first_job.external_id) is None
+    assert picker_run_job_service.get_picker_run_job(second_job.external_id) == second_job
@@ -0,0 +1,115 @@
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from src.domain.models.job import PickerRunStats
+from src.domain.models.picker import Picker
+from src.domain.models.source import Source
+from src.domain.services.picker_run_service import PickerRunService, settings
+
+NOW = datetime(2025, 1, 31, 12, 0, 0)
+
+
+@pytest.fixture
+def picker_runs_port_mock():
+    return MagicMock()
+
+
+@pytest.fixture
+def picker_run_service(picker_runs_port_mock):
+    return PickerRunService(picker_runs_port=picker_runs_port_mock)
+
+
+@pytest.fixture
+def picker():
+    return Picker(
+        id=1, cronjob="*/5 * * * *", source_id=10, feed_id=20, external_id=uuid4(),
+        created_at=datetime(2025, 1, 1, 13, 0, 0)
+    )
+
+
+@pytest.fixture
+def source():
+    return Source(
+        id=10, external_id=uuid4(), url="http://example.com/feed", name="Example Source",
+        created_at=datetime(2025, 1, 1, 13, 0, 0)
+    )
+
+
+def test_record_run(picker_run_service, picker_runs_port_mock, picker, source):
+    # GIVEN
+    stats = PickerRunStats(
+        started_at=NOW - timedelta(seconds=2),
+        finished_at=NOW,
+        status_code=200,
+        bytes_downloaded=1024,
+        entries_fetched=10,
+        entries_new=4,
+        entries_filtered=1,
+        entries_inserted=3
+    )
+
+    # WHEN
+    picker_run_service.record_run(picker, source, stats)
+
+    # THEN
+    picker_run_request = picker_runs_port_mock.create_picker_run.call_args[0][0]
+    assert picker_run_request.picker_id == 1
+    assert picker_run_request.source_id == 10
+    assert picker_run_request.started_at == NOW - timedelta(seconds=2)
+    assert picker_run_request.finished_at == NOW
+    assert picker_run_request.status_code == 200
+    assert picker_run_request.bytes_downloaded == 1024
+    assert picker_run_request.entries_inserted == 3
+    assert picker_run_request.error is None
+
+
+def test_record_run_truncates_the_error(picker_run_service, picker_runs_port_mock, picker, source):
+    # GIVEN
+    stats = PickerRunStats(started_at=NOW, finished_at=NOW, error="x" * 5000)
+
+    # WHEN
+    picker_run_service.record_run(picker, source, stats)
+
+    # THEN
+    assert len(picker_runs_port_mock.create_picker_run.call_args[0][0].error) == 2000
+
+
+def test_record_run_does_not_raise_when_it_fails(
+    picker_run_service, picker_runs_port_mock, picker, source
+):
+    # GIVEN
+    picker_runs_port_mock.create_picker_run.side_effect = RuntimeError("database is down")
+
+    # WHEN
+    with patch("src.domain.services.picker_run_service.logger") as logger:
+        picker_run_service.record_run(picker, source, PickerRunStats(started_at=NOW))
+
+    # THEN
+    logger.exception.assert_called_once_with("Recording the run of picker %s failed", 1)
+
+
+def test_get_source_run_stats(picker_run_service, picker_runs_port_mock):
+    # WHEN
+    with patch("src.domain.services.picker_run_service._now", return_value=NOW):
+        picker_run_service.get_source_run_stats(hours=6)
+
+    # THEN
+    picker_runs_port_mock.get_source_run_stats.assert_called_once_with(NOW - timedelta(hours=6))
+
+
+def test_prune(picker_run_service, picker_runs_port_mock, monkeypatch):
+    # GIVEN
+    monkeypatch.setattr(settings, "PICKER_RUNS_RETENTION_DAYS", 7)
+    picker_runs_port_mock.delete_picker_runs_before.return_value = 42
+
+    # WHEN
+    with patch("src.domain.services.picker_run_service._now", return_value=NOW):
+        deleted = picker_run_service.prune()
+
+    # THEN
+    assert deleted == 42
+    picker_runs_port_mock.delete_picker_runs_before.assert_called_once_with(
+        NOW - timedelta(days=7)
+    )
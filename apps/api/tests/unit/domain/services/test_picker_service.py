@@ -3,7 +3,8 @@ from unittest.mock import MagicMock
 from uuid import uuid4
 
 import pytest
-from src.domain.models.picker import Picker, PickerRequest
+from src.domain.models.filter import FilterDefinition, Operation
+from src.domain.models.picker import Picker, PickerDefinition, PickerRequest
 from src.domain.services.picker_service import PickerService
 
 
@@ -199,3 +200,35 @@ def test_get_all_pickers_delegates_to_port(picker_service, pickers_port_mock):
     pickers_port_mock.get_all_pickers.assert_called_once()
     assert result == pickers_list
     assert all(isinstance(p, Picker) for p in result)
+
+
+def test_delete_pickers_by_feed_id(picker_service, pickers_port_mock):
+    # GIVEN
+    pickers_port_mock.delete_pickers_by_feed_id.return_value = 2
+
+    # WHEN
+    result = picker_service.delete_pickers_by_feed_id(10)
+
+    # THEN
+    pickers_port_mock.delete_pickers_by_feed_id.assert_called_once_with(10)
+    assert result == 2
+
+
+def test_create_pickers(picker_service, pickers_port_mock):
+    # GIVEN
+    picker_definitions = [
+        PickerDefinition(
+            cronjob="30 * * * *",
+            source_url="https://example.com/feed.xml",
+            source_name="example.com",
+            filters=[FilterDefinition(operation=Operation.identity, args="['a']")],
+            feed_name="news"
+        )
+    ]
+
+    # WHEN
+    result = picker_service.create_pickers(picker_definitions)
+
+    # THEN
+    pickers_port_mock.create_pickers.assert_called_once_with(picker_definitions)
+    assert result == pickers_port_mock.create_pickers.return_value
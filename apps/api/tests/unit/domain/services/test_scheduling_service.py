@@ -0,0 +1,156 @@
+from unittest.mock import MagicMock
+
+import pytest
+from src.domain.services.scheduling_service import SchedulingService
+
+
+@pytest.fixture
+def mock_ports():
+    return {
+        "job_service_factory": MagicMock(),
+        "scheduler": MagicMock(),
+        "picker_changes": MagicMock(),
+        "leader_election": MagicMock(),
+    }
+
+
+def get_job_service(mock_ports) -> MagicMock:
+    return mock_ports["job_service_factory"].return_value.__enter__.return_value
+
+
+def test_start_without_leader_election(mock_ports):
+    # GIVEN
+    scheduling_service = SchedulingService(
+        job_service_factory=mock_ports["job_service_factory"],
+        scheduler=mock_ports["scheduler"],
+        picker_changes=mock_ports["picker_changes"],
+    )
+
+    # WHEN
+    scheduling_service.start()
+
+    # THEN
+    mock_ports["scheduler"].set_handler_dependencies.assert_called_once_with(
+        job_service_factory=mock_ports["job_service_factory"]
+    )
+    mock_ports["scheduler"].start.assert_called_once_with(paused=True)
+    get_job_service(mock_ports).load_all.assert_called_once()
+    mock_ports["scheduler"].resume.assert_called_once()
+    mock_ports["picker_changes"].start.assert_called_once_with(
+        on_change=scheduling_service._load_all
+    )
+
+
+def test_picker_changes_reload_jobs_with_a_new_job_service(mock_ports):
+    # GIVEN
+    scheduling_service = SchedulingService(**mock_ports)
+    scheduling_service.start()
+    on_change = mock_ports["picker_changes"].start.call_args.kwargs["on_change"]
+
+    # WHEN
+    on_change()
+
+    # THEN
+    assert mock_ports["job_service_factory"].call_count == 2
+    assert mock_ports["job_service_factory"].return_value.__exit__.call_count == 2
+    assert get_job_service(mock_ports).load_all.call_count == 2
+
+
+def test_start_with_leader_election_waits_paused(mock_ports):
+    # GIVEN
+    scheduling_service = SchedulingService(**mock_ports)
+
+    # WHEN
+    scheduling_service.start()
+
+    # THEN
+    mock_ports["scheduler"].start.assert_called_once_with(paused=True)
+    mock_ports["scheduler"].resume.assert_not_called()
+    mock_ports["leader_election"].start.assert_called_once_with(
+        on_elected=scheduling_service._on_elected,
+        on_revoked=mock_ports["scheduler"].pause
+    )
+
+
+def test_elected_reloads_and_resumes_jobs(mock_ports):
+    # GIVEN
+    scheduling_service = SchedulingService(**mock_ports)
+    scheduling_service.start()
+    on_elected = mock_ports["leader_election"].start.call_args.kwargs["on_elected"]
+
+    # WHEN
+    on_elected()
+
+    # THEN
+    assert get_job_service(mock_ports).load_all.call_count == 2
+    mock_ports["scheduler"].resume.assert_called_once()
+
+
+def test_stop(mock_ports):
+    # GIVEN
+    scheduling_service = SchedulingService(**mock_ports)
+
+    # WHEN
+    scheduling_service.stop()
+
+    # THEN
+    mock_ports["leader_election"].stop.assert_called_once()
+    mock_ports["picker_changes"].stop.assert_called_once()
+    mock_ports["scheduler"].shutdown.assert_called_once()
+
+
+def test_get_metrics(mock_ports):
+    # GIVEN
+    scheduling_service = SchedulingService(**mock_ports)
+
+    # WHEN
+    result = scheduling_service.get_metrics()
+
+    # THEN
+    assert result == mock_ports["scheduler"].get_metrics.return_value
+
+
+def test_start_reports_ready_status(mock_ports):
+    # GIVEN
+    scheduling_service = SchedulingService(**mock_ports)
+    mock_ports["scheduler"].get_job_count.return_value = 3
+
+    # WHEN
+    before = scheduling_service.get_status()
+    scheduling_service.start()
+
+    # THEN
+    assert before.state == "stopped"
+    status = scheduling_service.get_status()
+    assert status.state == "ready"
+    assert status.scheduled_jobs == 3
+    assert status.started_at <= status.ready_at
+
+
+def test_start_reports_loading_status_while_loading_jobs(mock_ports):
+    # GIVEN
+    scheduling_service = SchedulingService(**mock_ports)
+    statuses = []
+    get_job_service(mock_ports).load_all.side_effect = (
+        lambda: statuses.append(scheduling_service.get_status())
+    )
+
+    # WHEN
+    scheduling_service.start()
+
+    # THEN
+    assert statuses[0].state == "loading"
+    assert statuses[0].ready_at is None
+
+
+def test_start_reports_failed_status(mock_ports):
+    # GIVEN
+    scheduling_service = SchedulingService(**mock_ports)
+    get_job_service(mock_ports).load_all.side_effect = RuntimeError("database unavailable")
+
+    # WHEN
+    with pytest.raises(RuntimeError):
+        scheduling_service.start()
+
+    # THEN
+    assert scheduling_service.get_status().state == "failed"
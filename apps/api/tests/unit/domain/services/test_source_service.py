@@ -103,3 +103,25 @@ def test_update_source_returns_none_when_source_not_found(source_service, mock_s
     assert result is None
     mock_source_port.get_source_by_external_id.assert_called_once_with(non_existent_external_id)
     mock_source_port.update_source.assert_not_called()
+
+
+def test_get_sources_by_ids(source_service, mock_source_port):
+    # GIVEN
+    sources = [
+        Source(
+            id=source_id,
+            external_id=uuid4(),
+            url=f"https://example.com/{source_id}",
+            name=None,
+            created_at=datetime(2025, 1, 1, 12, 0, 0)
+        )
+        for source_id in [3, 7]
+    ]
+    mock_source_port.get_sources_by_ids.return_value = sources
+
+    # WHEN
+    result = source_service.get_sources_by_ids([3, 7])
+
+    # THEN
+    mock_source_port.get_sources_by_ids.assert_called_once_with([3, 7])
+    assert result == {3: sources[0], 7: sources[1]}
@@ -0,0 +1,207 @@
+import hashlib
+import hmac
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from src.domain.models.source import Source
+from src.domain.models.websub import WebSubSubscription
+from src.domain.services.websub_service import WebSubService, settings
+
+FEED = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Pushed</title>
+  <entry><title>Article 1</title><link href="http://example.com/article1"/></entry>
+</feed>"""
+
+
+@pytest.fixture(autouse=True)
+def callback_url(monkeypatch):
+    monkeypatch.setattr(settings, "WEBSUB_CALLBACK_URL", "https://nebula.example.com/")
+
+
+@pytest.fixture
+def mock_ports():
+    return {"websub_port": MagicMock(), "hub_port": MagicMock()}
+
+
+@pytest.fixture
+def websub_service(mock_ports):
+    return WebSubService(**mock_ports)
+
+
+def build_source() -> Source:
+    return Source(
+        id=1, external_id=uuid4(), url="http://example.com/feed", name="Example",
+        created_at=datetime(2025, 1, 1)
+    )
+
+
+def build_subscription(**fields) -> WebSubSubscription:
+    return WebSubSubscription(
+        **{
+            "id": 1,
+            "external_id": uuid4(),
+            "source_id": 1,
+            "hub_url": "http://hub.example.com",
+            "topic_url": "http://example.com/feed.atom",
+            "secret": "secret",
+            "lease_expires_at": None,
+            "requested_at": datetime.utcnow() - timedelta(days=2),
+            "created_at": datetime(2025, 1, 1),
+            **fields,
+        }
+    )
+
+
+def test_update_subscription_subscribes_to_advertised_hub(websub_service, mock_ports):
+    # GIVEN
+    feed = {
+        "links": [
+            {"rel": "alternate", "href": "http://example.com"},
+            {"rel": "hub", "href": "http://hub.example.com"},
+            {"rel": "self", "href": "http://example.com/feed.atom"},
+        ]
+    }
+    mock_ports["websub_port"].get_subscription_by_source_id.return_value = None
+    subscription = build_subscription()
+    mock_ports["websub_port"].save_subscription.return_value = subscription
+
+    # WHEN
+    websub_service.update_subscription(build_source(), feed)
+
+    # THEN
+    request = mock_ports["websub_port"].save_subscription.call_args[0][0]
+    assert request.hub_url == "http://hub.example.com"
+    assert request.topic_url == "http://example.com/feed.atom"
+    mock_ports["hub_port"].subscribe.assert_called_once_with(
+        hub_url="http://hub.example.com",
+        topic_url="http://example.com/feed.atom",
+        callback_url=f"https://nebula.example.com/v1/websub/{subscription.external_id}",
+        secret=request.secret,
+        lease_seconds=settings.WEBSUB_LEASE_SECONDS
+    )
+
+
+def test_update_subscription_without_hub(websub_service, mock_ports):
+    # WHEN
+    websub_service.update_subscription(build_source(), {"links": []})
+
+    # THEN
+    mock_ports["websub_port"].save_subscription.assert_not_called()
+    mock_ports["hub_port"].subscribe.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("lease_expires_in", "requested_ago", "renewed"),
+    [
+        (timedelta(days=5), timedelta(days=2), False),
+        (timedelta(hours=2), timedelta(days=2), True),
+        (None, timedelta(days=2), True),
+        (None, timedelta(minutes=5), False),
+    ]
+)
+def test_renew_if_due(websub_service, mock_ports, lease_expires_in, requested_ago, renewed):
+    # GIVEN
+    now = datetime.utcnow()
+    subscription = build_subscription(
+        lease_expires_at=now + lease_expires_in if lease_expires_in else None,
+        requested_at=now - requested_ago
+    )
+    mock_ports["websub_port"].save_subscription.return_value = subscription
+
+    # WHEN
+    websub_service.renew_if_due(subscription)
+
+    # THEN
+    assert mock_ports["hub_port"].subscribe.called is renewed
+
+
+def test_get_active_subscription(websub_service, mock_ports):
+    # GIVEN
+    active = build_subscription(lease_expires_at=datetime.utcnow() + timedelta(days=1))
+    expired = build_subscription(lease_expires_at=datetime.utcnow() - timedelta(seconds=1))
+
+    # WHEN / THEN
+    mock_ports["websub_port"].get_subscription_by_source_id.return_value = active
+    assert websub_service.get_active_subscription(1) == active
+    mock_ports["websub_port"].get_subscription_by_source_id.return_value = expired
+    assert websub_service.get_active_subscription(1) is None
+
+
+def test_verify_intent_subscribe(websub_service, mock_ports):
+    # GIVEN
+    subscription = build_subscription()
+    mock_ports["websub_port"].get_subscription_by_external_id.return_value = subscription
+
+    # WHEN
+    result = websub_service.verify_intent(
+        subscription.external_id, "subscribe", subscription.topic_url, "challenge", 3600
+    )
+
+    # THEN
+    assert result == "challenge"
+    subscription_id, lease_expires_at = (
+        mock_ports["websub_port"].set_lease_expires_at.call_args[0]
+    )
+    assert subscription_id == subscription.id
+    expected = datetime.utcnow() + timedelta(seconds=3600)
+    assert abs(lease_expires_at - expected) < timedelta(seconds=5)
+
+
+def test_verify_intent_with_unknown_topic(websub_service, mock_ports):
+    # GIVEN
+    subscription = build_subscription()
+    mock_ports["websub_port"].get_subscription_by_external_id.return_value = subscription
+
+    # WHEN
+    result = websub_service.verify_intent(
+        subscription.external_id, "subscribe", "http://other.com/feed", "challenge", 3600
+    )
+
+    # THEN
+    assert result is None
+    mock_ports["websub_port"].set_lease_expires_at.assert_not_called()
+
+
+def test_verify_intent_denied_falls_back_to_polling(websub_service, mock_ports):
+    # GIVEN
+    subscription = build_subscription(lease_expires_at=datetime.utcnow() + timedelta(days=1))
+    mock_ports["websub_port"].get_subscription_by_external_id.return_value = subscription
+
+    # WHEN
+    result = websub_service.verify_intent(
+        subscription.external_id, "denied", subscription.topic_url, None, None
+    )
+
+    # THEN
+    assert result == ""
+    mock_ports["websub_port"].set_lease_expires_at.assert_called_once_with(subscription.id, None)
+
+
+def test_get_pushed_entries(websub_service, mock_ports):
+    # GIVEN
+    subscription = build_subscription()
+    mock_ports["websub_port"].get_subscription_by_external_id.return_value = subscription
+    signature = hmac.new(b"secret", FEED, hashlib.sha256).hexdigest()
+
+    # WHEN
+    result = websub_service.get_pushed_entries(
+        subscription.external_id, FEED, f"sha256={signature}"
+    )
+
+    # THEN
+    source_id, entries = result
+    assert source_id == 1
+    assert [entry.link for entry in entries] == ["http://example.com/article1"]
+
+
+@pytest.mark.parametrize("signature", [None, "sha256=invalid", "md5=abc", "invalid"])
+def test_get_pushed_entries_with_invalid_signature(websub_service, mock_ports, signature):
+    # GIVEN
+    subscription = build_subscription()
+    mock_ports["websub_port"].get_subscription_by_external_id.return_value = subscription
+
+    # WHEN / THEN
+    assert websub_service.get_pushed_entries(subscription.external_id, FEED, signature) is None